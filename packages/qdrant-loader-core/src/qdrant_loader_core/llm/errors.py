@@ -7,7 +7,10 @@ class TimeoutError(LLMError):
 
 
 class RateLimitedError(LLMError):
-    pass
+    def __init__(self, message: str = "", retry_after: float | None = None):
+        super().__init__(message)
+        # Seconds the provider asked us to wait, when known
+        self.retry_after = retry_after
 
 
 class InvalidRequestError(LLMError):
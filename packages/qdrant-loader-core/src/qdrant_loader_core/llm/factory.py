@@ -53,7 +53,11 @@ def create_provider(settings: LLMSettings) -> LLMProvider:
     """Create a provider by settings.
 
     Phase 0: route OpenAI/OpenAI-compatible to OpenAIProvider when available; otherwise return a noop provider.
-    Ollama returns a stub provider for now.
+
+    Providers that keep pooled connections (Ollama, OpenAI, Azure OpenAI)
+    expose ``aclose()`` and can be used as
+    ``async with create_provider(settings) as provider``; every client
+    obtained from one provider shares its connection pool.
     """
     provider_name = (settings.provider or "").lower()
     base_url = settings.base_url or ""
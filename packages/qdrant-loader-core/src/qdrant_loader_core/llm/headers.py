@@ -0,0 +1,71 @@
+"""Parsing helpers for rate-limit related HTTP response headers."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def header_value(headers: Mapping[str, str] | None, name: str) -> str | None:
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        # Plain dicts are case-sensitive; HTTP client header maps are not
+        lowered = name.lower()
+        for key, candidate in headers.items():
+            if str(key).lower() == lowered:
+                return candidate
+    return value
+
+
+def parse_duration(value: str | None) -> float | None:
+    """Parse reset durations such as ``"1s"``, ``"6m0s"``, ``"20ms"`` or ``"0.5"``."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Return the delay requested by ``Retry-After``/``retry-after-ms`` in seconds."""
+    retry_after_ms = header_value(headers, "retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = header_value(headers, "retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,64 @@
+"""Long-lived, pooled HTTP clients for providers talking to LLM servers over httpx."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from .settings import RequestPolicy
+
+
+def http2_available() -> bool:
+    """Whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def client_options(httpx_module: Any, policy: RequestPolicy | None) -> dict[str, Any]:
+    """Build ``httpx.AsyncClient`` keyword arguments from a request policy."""
+    policy = policy or RequestPolicy()
+    return {
+        "timeout": policy.timeout_s,
+        "limits": httpx_module.Limits(
+            max_connections=policy.max_connections,
+            max_keepalive_connections=policy.max_keepalive_connections,
+            keepalive_expiry=policy.keepalive_expiry_s,
+        ),
+        "http2": bool(policy.http2) and http2_available(),
+    }
+
+
+class AsyncClientPool:
+    """Keeps one HTTP client (and its connection pool) per event loop.
+
+    Connections are bound to the loop that opened them, so each running loop
+    gets its own client; clients are created on first use and reused until
+    :meth:`aclose`.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> Any:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._factory()
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the current loop's client; clients of other loops are dropped."""
+        current = asyncio.get_running_loop()
+        clients = list(self._clients.items())
+        self._clients.clear()
+        for loop, client in clients:
+            if loop is current:
+                # httpx clients use aclose(); the async OpenAI SDK clients close()
+                close = getattr(client, "aclose", None) or client.close
+                await close()
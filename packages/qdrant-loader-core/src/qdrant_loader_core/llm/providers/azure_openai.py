@@ -8,10 +8,17 @@ try:
 except Exception:  # pragma: no cover - optional dependency surface
     AzureOpenAI = None  # type: ignore
 
+try:
+    from openai import AsyncAzureOpenAI  # type: ignore
+except Exception:  # pragma: no cover - optional dependency surface
+    AsyncAzureOpenAI = None  # type: ignore
+
 from ...logging import LoggingConfig
+from ..ratelimit import get_rate_limiter
 from ..settings import LLMSettings
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
 from .openai import OpenAIChat, OpenAIEmbeddings, _OpenAITokenCounter
+from .openai_common import async_client_pool, embedding_encoding
 
 logger = LoggingConfig.get_logger(__name__)
 
@@ -43,33 +50,52 @@ class AzureOpenAIProvider(LLMProvider):
         _validate_azure_settings(settings)
 
         self._base_host = _host_of(settings.base_url)
-        if AzureOpenAI is None:
-            self._client = None
-        else:
-            # Prefer explicit azure_endpoint in provider_options; fallback to base_url
-            provider_opts = settings.provider_options or {}
-            endpoint = provider_opts.get("azure_endpoint") or settings.base_url
-            kwargs: dict[str, Any] = {
-                "api_key": settings.api_key,
-                "api_version": settings.api_version,
-            }
-            if endpoint:
-                kwargs["azure_endpoint"] = endpoint
-            self._client = AzureOpenAI(
-                **{k: v for k, v in kwargs.items() if v is not None}
-            )
+        # Prefer explicit azure_endpoint in provider_options; fallback to base_url
+        provider_opts = settings.provider_options or {}
+        endpoint = provider_opts.get("azure_endpoint") or settings.base_url
+        kwargs: dict[str, Any] = {
+            "api_key": settings.api_key,
+            "api_version": settings.api_version,
+        }
+        if endpoint:
+            kwargs["azure_endpoint"] = endpoint
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        self._client = AzureOpenAI(**kwargs) if AzureOpenAI is not None else None
+        self._async_clients = async_client_pool(AsyncAzureOpenAI, kwargs, settings)
+        self._rate_limiter = get_rate_limiter(settings)
+        self._encoding_format = embedding_encoding(settings, "base64")
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        return {
+            "provider_label": "azure_openai",
+            "rate_limiter": self._rate_limiter,
+            "async_clients": self._async_clients,
+        }
 
     def embeddings(self) -> EmbeddingsClient:
         model = self._settings.models.get("embeddings", "")
         return OpenAIEmbeddings(
-            self._client, model, self._base_host, provider_label="azure_openai"
+            self._client,
+            model,
+            self._base_host,
+            encoding_format=self._encoding_format,
+            **self._client_kwargs(),
         )
 
     def chat(self) -> ChatClient:
         model = self._settings.models.get("chat", "")
-        return OpenAIChat(
-            self._client, model, self._base_host, provider_label="azure_openai"
-        )
+        return OpenAIChat(self._client, model, self._base_host, **self._client_kwargs())
 
     def tokenizer(self) -> TokenCounter:
         return _OpenAITokenCounter(self._settings.tokenizer)
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP connections."""
+        if self._async_clients is not None:
+            await self._async_clients.aclose()
+
+    async def __aenter__(self) -> AzureOpenAIProvider:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        await self.aclose()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import Any
 
 try:
@@ -11,11 +12,20 @@ from ...logging import LoggingConfig
 from ..errors import (
     AuthError,
     InvalidRequestError,
+    LLMError,
     RateLimitedError,
     ServerError,
 )
 from ..errors import TimeoutError as LLMTimeoutError
-from ..settings import LLMSettings
+from ..http_pool import AsyncClientPool, client_options
+from ..ratelimit import (
+    AsyncRateLimiter,
+    estimate_chat_tokens,
+    estimate_tokens,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from ..settings import LLMSettings, RequestPolicy
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
 
 logger = LoggingConfig.get_logger(__name__)
@@ -27,6 +37,30 @@ def _join_url(base: str | None, path: str) -> str:
     return f"{base}/{path}" if base else f"/{path}"
 
 
+def _client_pool(request: RequestPolicy | None = None) -> AsyncClientPool:
+    return AsyncClientPool(lambda: httpx.AsyncClient(**client_options(httpx, request)))
+
+
+def _observe(rate_limiter: AsyncRateLimiter, resp: Any) -> None:
+    rate_limiter.update_from_headers(getattr(resp, "headers", None))
+
+
+def _map_status_error(exc: Any, rate_limiter: AsyncRateLimiter) -> LLMError:
+    response = exc.response
+    status = response.status_code if response else None
+    if status == 401:
+        return AuthError(str(exc))
+    if status == 429:
+        headers = getattr(response, "headers", None)
+        retry_after = parse_retry_after(headers)
+        rate_limiter.update_from_headers(headers)
+        rate_limiter.on_rate_limited(retry_after)
+        return RateLimitedError(str(exc), retry_after=retry_after)
+    if status and 400 <= status < 500:
+        return InvalidRequestError(str(exc))
+    return ServerError(str(exc))
+
+
 class OllamaEmbeddings(EmbeddingsClient):
     def __init__(
         self,
@@ -36,140 +70,128 @@ class OllamaEmbeddings(EmbeddingsClient):
         *,
         timeout_s: float | None = None,
         provider_options: dict[str, Any] | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+        client_pool: AsyncClientPool | None = None,
     ):
         self._base_url = (base_url or "http://localhost:11434").rstrip("/")
         self._model = model
         self._headers = headers or {}
         self._timeout_s = float(timeout_s) if timeout_s is not None else 30.0
         self._provider_options = provider_options or {}
+        self._rate_limiter = rate_limiter or AsyncRateLimiter()
+        self._client_pool = client_pool or _client_pool()
 
     async def embed(self, inputs: list[str]) -> list[list[float]]:
+        async with self._rate_limiter.limit(tokens=estimate_tokens(inputs)):
+            vectors = await self._embed(inputs)
+        self._rate_limiter.on_success()
+        logger.info(
+            "LLM request",
+            provider="ollama",
+            operation="embeddings",
+            model=self._model,
+            base_host=self._base_url,
+            inputs=len(inputs),
+        )
+        return vectors
+
+    async def _post(self, client: Any, path: str, payload: dict[str, Any]) -> Any:
+        resp = await client.post(
+            _join_url(self._base_url, path),
+            json=payload,
+            headers=self._headers,
+            timeout=self._timeout_s,
+        )
+        resp.raise_for_status()
+        _observe(self._rate_limiter, resp)
+        return resp.json()
+
+    async def _embed(self, inputs: list[str]) -> list[list[float]]:
         if httpx is None:
             raise NotImplementedError("httpx not available for Ollama embeddings")
 
-        # Prefer OpenAI-compatible if base_url seems to expose /v1
-        use_v1 = "/v1" in (self._base_url or "")
-        async with httpx.AsyncClient(timeout=self._timeout_s) as client:
-            try:
-                if use_v1:
-                    # OpenAI-compatible embeddings endpoint
-                    url = _join_url(self._base_url, "/embeddings")
-                    payload = {"model": self._model, "input": inputs}
-                    resp = await client.post(url, json=payload, headers=self._headers)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    logger.info(
-                        "LLM request",
-                        provider="ollama",
-                        operation="embeddings",
-                        model=self._model,
-                        base_host=self._base_url,
-                        inputs=len(inputs),
-                        # latency for v1 path hard to compute here; omitted for now
-                    )
-                    return [item["embedding"] for item in data.get("data", [])]
-                else:
-                    # Determine native endpoint preference: embed | embeddings | auto (default)
-                    native_pref = str(
-                        self._provider_options.get("native_endpoint", "auto")
-                    ).lower()
-                    prefer_embed = native_pref != "embeddings"
-
-                    # Try batch embed first when preferred
-                    if prefer_embed:
-                        url = _join_url(self._base_url, "/api/embed")
-                        payload = {"model": self._model, "input": inputs}
-                        try:
-                            resp = await client.post(
-                                url, json=payload, headers=self._headers
-                            )
-                            resp.raise_for_status()
-                            data = resp.json()
-                            vectors = data.get("embeddings")
-                            if not isinstance(vectors, list) or (
-                                len(vectors) != len(inputs)
-                            ):
-                                raise ValueError(
-                                    "Invalid embeddings response from /api/embed"
-                                )
-                            # Normalize to list[list[float]]
-                            norm = [list(vec) for vec in vectors]
-                            logger.info(
-                                "LLM request",
-                                provider="ollama",
-                                operation="embeddings",
-                                model=self._model,
-                                base_host=self._base_url,
-                                inputs=len(inputs),
-                                # latency for native batch path not measured in this stub
-                            )
-                            return norm
-                        except httpx.HTTPStatusError as exc:
-                            status = exc.response.status_code if exc.response else None
-                            # Fallback for servers that don't support /api/embed
-                            if status not in (404, 405, 501):
-                                raise
-
-                    # Per-item embeddings endpoint fallback or preference
-                    url = _join_url(self._base_url, "/api/embeddings")
-                    vectors2: list[list[float]] = []
-                    for text in inputs:
-                        payload = {"model": self._model, "input": text}
-                        resp = await client.post(
-                            url, json=payload, headers=self._headers
-                        )
-                        resp.raise_for_status()
-                        data = resp.json()
-                        emb = data.get("embedding")
-                        if emb is None and isinstance(data.get("data"), dict):
-                            emb = data["data"].get("embedding")
-                        if emb is None:
-                            raise ValueError(
-                                "Invalid embedding response from /api/embeddings"
-                            )
-                        vectors2.append(list(emb))
-                    logger.info(
-                        "LLM request",
-                        provider="ollama",
-                        operation="embeddings",
-                        model=self._model,
-                        base_host=self._base_url,
-                        inputs=len(inputs),
-                        # latency for per-item path not measured in this stub
-                    )
-                    return vectors2
-            except httpx.TimeoutException as exc:
-                raise LLMTimeoutError(str(exc))
-            except httpx.HTTPStatusError as exc:
-                status = exc.response.status_code if exc.response else None
-                if status == 401:
-                    raise AuthError(str(exc))
-                if status == 429:
-                    raise RateLimitedError(str(exc))
-                if status and 400 <= status < 500:
-                    raise InvalidRequestError(str(exc))
-                raise ServerError(str(exc))
-            except httpx.HTTPError as exc:
-                raise ServerError(str(exc))
+        client = self._client_pool.get()
+        try:
+            # Prefer OpenAI-compatible if base_url seems to expose /v1
+            if "/v1" in (self._base_url or ""):
+                payload = {"model": self._model, "input": inputs}
+                data = await self._post(client, "/embeddings", payload)
+                return [item["embedding"] for item in data.get("data", [])]
+
+            # Determine native endpoint preference: embed | embeddings | auto (default)
+            native_pref = str(
+                self._provider_options.get("native_endpoint", "auto")
+            ).lower()
+
+            # Try batch embed first when preferred
+            if native_pref != "embeddings":
+                payload = {"model": self._model, "input": inputs}
+                try:
+                    data = await self._post(client, "/api/embed", payload)
+                    vectors = data.get("embeddings")
+                    if not isinstance(vectors, list) or len(vectors) != len(inputs):
+                        raise ValueError("Invalid embeddings response from /api/embed")
+                    # Normalize to list[list[float]]
+                    return [list(vec) for vec in vectors]
+                except httpx.HTTPStatusError as exc:
+                    status = exc.response.status_code if exc.response else None
+                    # Fallback for servers that don't support /api/embed
+                    if status not in (404, 405, 501):
+                        raise
+
+            # Per-item embeddings endpoint fallback or preference
+            vectors2: list[list[float]] = []
+            for text in inputs:
+                payload = {"model": self._model, "input": text}
+                data = await self._post(client, "/api/embeddings", payload)
+                emb = data.get("embedding")
+                if emb is None and isinstance(data.get("data"), dict):
+                    emb = data["data"].get("embedding")
+                if emb is None:
+                    raise ValueError("Invalid embedding response from /api/embeddings")
+                vectors2.append(list(emb))
+            return vectors2
+        except httpx.TimeoutException as exc:
+            raise LLMTimeoutError(str(exc))
+        except httpx.HTTPStatusError as exc:
+            raise _map_status_error(exc, self._rate_limiter)
+        except httpx.HTTPError as exc:
+            raise ServerError(str(exc))
 
 
 class OllamaChat(ChatClient):
     def __init__(
-        self, base_url: str | None, model: str, headers: dict[str, str] | None
+        self,
+        base_url: str | None,
+        model: str,
+        headers: dict[str, str] | None,
+        *,
+        rate_limiter: AsyncRateLimiter | None = None,
+        client_pool: AsyncClientPool | None = None,
     ):
         self._base_url = base_url or "http://localhost:11434"
         self._model = model
         self._headers = headers or {}
+        self._rate_limiter = rate_limiter or AsyncRateLimiter()
+        self._client_pool = client_pool or _client_pool()
 
     async def chat(
         self, messages: list[dict[str, Any]], **kwargs: Any
+    ) -> dict[str, Any]:
+        tokens = estimate_chat_tokens(messages, kwargs.get("max_tokens"))
+        async with self._rate_limiter.limit(tokens=tokens):
+            response = await self._chat(messages, **kwargs)
+        self._rate_limiter.on_success()
+        return response
+
+    async def _chat(
+        self, messages: list[dict[str, Any]], **kwargs: Any
     ) -> dict[str, Any]:
         if httpx is None:
             raise NotImplementedError("httpx not available for Ollama chat")
 
         # Prefer OpenAI-compatible if base_url exposes /v1
         use_v1 = "/v1" in (self._base_url or "")
-        # Flatten messages to a single prompt for native API; preserve roles when possible
         if use_v1:
             url = _join_url(self._base_url, "/chat/completions")
             payload = {"model": self._model, "messages": messages}
@@ -177,103 +199,56 @@ class OllamaChat(ChatClient):
             for k in ("temperature", "max_tokens", "top_p", "stop"):
                 if k in kwargs and kwargs[k] is not None:
                     payload[k] = kwargs[k]
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                try:
-                    from datetime import UTC, datetime
-
-                    started = datetime.now(UTC)
-                    resp = await client.post(url, json=payload, headers=self._headers)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    text = ""
-                    choices = data.get("choices") or []
-                    if choices:
-                        msg = (choices[0] or {}).get("message") or {}
-                        text = msg.get("content", "") or ""
-                    duration_ms = int(
-                        (datetime.now(UTC) - started).total_seconds() * 1000
-                    )
-                    logger.info(
-                        "LLM request",
-                        provider="ollama",
-                        operation="chat",
-                        model=self._model,
-                        base_host=self._base_url,
-                        messages=len(messages),
-                        latency_ms=duration_ms,
-                    )
-                    return {
-                        "text": text,
-                        "raw": data,
-                        "usage": data.get("usage"),
-                        "model": data.get("model", self._model),
-                    }
-                except httpx.TimeoutException as exc:
-                    raise LLMTimeoutError(str(exc))
-                except httpx.HTTPStatusError as exc:
-                    status = exc.response.status_code if exc.response else None
-                    if status == 401:
-                        raise AuthError(str(exc))
-                    if status == 429:
-                        raise RateLimitedError(str(exc))
-                    if status and 400 <= status < 500:
-                        raise InvalidRequestError(str(exc))
-                    raise ServerError(str(exc))
-                except httpx.HTTPError as exc:
-                    raise ServerError(str(exc))
         else:
             # Native API
             url = _join_url(self._base_url, "/api/chat")
-            payload = {
-                "model": self._model,
-                "messages": messages,
-                "stream": False,
-            }
+            payload = {"model": self._model, "messages": messages, "stream": False}
             if "temperature" in kwargs and kwargs["temperature"] is not None:
                 payload["options"] = {"temperature": kwargs["temperature"]}
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                try:
-                    from datetime import UTC, datetime
-
-                    started = datetime.now(UTC)
-                    resp = await client.post(url, json=payload, headers=self._headers)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    # Ollama native returns {"message": {"content": "..."}, ...}
-                    text = ""
-                    if isinstance(data.get("message"), dict):
-                        text = data["message"].get("content", "") or ""
-                    duration_ms = int(
-                        (datetime.now(UTC) - started).total_seconds() * 1000
-                    )
-                    logger.info(
-                        "LLM request",
-                        provider="ollama",
-                        operation="chat",
-                        model=self._model,
-                        base_host=self._base_url,
-                        messages=len(messages),
-                        latency_ms=duration_ms,
-                    )
-                    return {
-                        "text": text,
-                        "raw": data,
-                        "usage": None,
-                        "model": self._model,
-                    }
-                except httpx.TimeoutException as exc:
-                    raise LLMTimeoutError(str(exc))
-                except httpx.HTTPStatusError as exc:
-                    status = exc.response.status_code if exc.response else None
-                    if status == 401:
-                        raise AuthError(str(exc))
-                    if status == 429:
-                        raise RateLimitedError(str(exc))
-                    if status and 400 <= status < 500:
-                        raise InvalidRequestError(str(exc))
-                    raise ServerError(str(exc))
-                except httpx.HTTPError as exc:
-                    raise ServerError(str(exc))
+
+        client = self._client_pool.get()
+        started = datetime.now(UTC)
+        try:
+            resp = await client.post(
+                url, json=payload, headers=self._headers, timeout=60.0
+            )
+            resp.raise_for_status()
+            _observe(self._rate_limiter, resp)
+            data = resp.json()
+        except httpx.TimeoutException as exc:
+            raise LLMTimeoutError(str(exc))
+        except httpx.HTTPStatusError as exc:
+            raise _map_status_error(exc, self._rate_limiter)
+        except httpx.HTTPError as exc:
+            raise ServerError(str(exc))
+
+        duration_ms = int((datetime.now(UTC) - started).total_seconds() * 1000)
+        logger.info(
+            "LLM request",
+            provider="ollama",
+            operation="chat",
+            model=self._model,
+            base_host=self._base_url,
+            messages=len(messages),
+            latency_ms=duration_ms,
+        )
+
+        text = ""
+        if use_v1:
+            choices = data.get("choices") or []
+            if choices:
+                msg = (choices[0] or {}).get("message") or {}
+                text = msg.get("content", "") or ""
+            return {
+                "text": text,
+                "raw": data,
+                "usage": data.get("usage"),
+                "model": data.get("model", self._model),
+            }
+        # Ollama native returns {"message": {"content": "..."}, ...}
+        if isinstance(data.get("message"), dict):
+            text = data["message"].get("content", "") or ""
+        return {"text": text, "raw": data, "usage": None, "model": self._model}
 
 
 class OllamaTokenizer(TokenCounter):
@@ -282,8 +257,15 @@ class OllamaTokenizer(TokenCounter):
 
 
 class OllamaProvider(LLMProvider):
+    """Ollama provider owning a pooled HTTP client shared by its clients.
+
+    Call :meth:`aclose` (or use ``async with``) to release the connections.
+    """
+
     def __init__(self, settings: LLMSettings):
         self._settings = settings
+        self._rate_limiter = get_rate_limiter(settings)
+        self._client_pool = _client_pool(settings.request)
 
     def embeddings(self) -> EmbeddingsClient:
         model = self._settings.models.get("embeddings", "")
@@ -298,11 +280,28 @@ class OllamaProvider(LLMProvider):
             self._settings.headers,
             timeout_s=timeout,
             provider_options=self._settings.provider_options,
+            rate_limiter=self._rate_limiter,
+            client_pool=self._client_pool,
         )
 
     def chat(self) -> ChatClient:
         model = self._settings.models.get("chat", "")
-        return OllamaChat(self._settings.base_url, model, self._settings.headers)
+        return OllamaChat(
+            self._settings.base_url,
+            model,
+            self._settings.headers,
+            rate_limiter=self._rate_limiter,
+            client_pool=self._client_pool,
+        )
 
     def tokenizer(self) -> TokenCounter:
         return OllamaTokenizer()
+
+    async def aclose(self) -> None:
+        await self._client_pool.aclose()
+
+    async def __aenter__(self) -> OllamaProvider:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        await self.aclose()
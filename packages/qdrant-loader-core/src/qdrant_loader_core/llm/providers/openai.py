@@ -19,8 +19,13 @@ try:
         )
     except Exception:  # pragma: no cover - optional dependency surface
         APIConnectionError = APIStatusError = APITimeoutError = AuthenticationError = BadRequestError = RateLimitError = ()  # type: ignore
+    try:
+        from openai import AsyncOpenAI  # type: ignore
+    except Exception:  # pragma: no cover - clients without native async support
+        AsyncOpenAI = None  # type: ignore
 except Exception:  # pragma: no cover - optional dependency at this phase
     OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
     APIConnectionError = APIStatusError = APITimeoutError = AuthenticationError = BadRequestError = RateLimitError = ()  # type: ignore
 
 from ...logging import LoggingConfig
@@ -32,8 +37,17 @@ from ..errors import (
     ServerError,
 )
 from ..errors import TimeoutError as LLMTimeoutError
+from ..ratelimit import (
+    AsyncRateLimiter,
+    estimate_chat_tokens,
+    estimate_tokens,
+    get_rate_limiter,
+    parse_retry_after,
+)
 from ..settings import LLMSettings
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
+from ..vectors import EmbeddingVector, decode_embedding
+from .openai_common import _OpenAIClientBase, async_client_pool, embedding_encoding
 
 logger = LoggingConfig.get_logger(__name__)
 
@@ -47,11 +61,25 @@ def _safe_host(url: str | None) -> str | None:
         return None
 
 
-def _map_openai_exception(exc: Exception) -> LLMError:
+def _rate_limited(
+    exc: Exception, rate_limiter: AsyncRateLimiter | None
+) -> RateLimitedError:
+    """Build a RateLimitedError, pausing the shared limiter for Retry-After."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    retry_after = parse_retry_after(headers)
+    if rate_limiter is not None:
+        rate_limiter.update_from_headers(headers)
+        rate_limiter.on_rate_limited(retry_after)
+    return RateLimitedError(str(exc), retry_after=retry_after)
+
+
+def _map_openai_exception(
+    exc: Exception, rate_limiter: AsyncRateLimiter | None = None
+) -> LLMError:
     try:
         # Rate limit
         if RateLimitError and isinstance(exc, RateLimitError):  # type: ignore[arg-type]
-            return RateLimitedError(str(exc))
+            return _rate_limited(exc, rate_limiter)
         # Timeout
         if APITimeoutError and isinstance(exc, APITimeoutError):  # type: ignore[arg-type]
             return LLMTimeoutError(str(exc))
@@ -69,7 +97,7 @@ def _map_openai_exception(exc: Exception) -> LLMError:
             )
             if isinstance(status_code, int) and 400 <= status_code < 500:
                 if status_code == 429:
-                    return RateLimitedError(str(exc))
+                    return _rate_limited(exc, rate_limiter)
                 if status_code in (401, 403):
                     return AuthError(str(exc))
                 return InvalidRequestError(str(exc))
@@ -92,31 +120,32 @@ class _OpenAITokenCounter(TokenCounter):
         return len(text)
 
 
-class OpenAIEmbeddings(EmbeddingsClient):
+class OpenAIEmbeddings(_OpenAIClientBase, EmbeddingsClient):
     def __init__(
         self,
         client: Any,
         model: str,
         base_host: str | None,
         *,
-        provider_label: str = "openai",
+        encoding_format: str = "float",
+        **kwargs: Any,
     ):
-        self._client = client
-        self._model = model
-        self._base_host = base_host
-        self._provider_label = provider_label
+        super().__init__(client, model, base_host, **kwargs)
+        self._encoding_format = encoding_format
 
-    async def embed(self, inputs: list[str]) -> list[list[float]]:
-        if not self._client:
+    async def embed(self, inputs: list[str]) -> list[EmbeddingVector]:
+        if not self.available:
             raise NotImplementedError("OpenAI client not available")
-        # Use thread offloading to keep async interface consistent with sync client
-        import asyncio
 
+        create_kwargs: dict[str, Any] = {"model": self._model, "input": inputs}
+        # base64 float32 payloads are ~4x smaller than JSON float lists
+        if self._async_clients is not None and self._encoding_format == "base64":
+            create_kwargs["encoding_format"] = "base64"
         started = datetime.now(UTC)
         try:
-            response = await asyncio.to_thread(
-                self._client.embeddings.create, model=self._model, input=inputs
-            )
+            async with self._rate_limiter.limit(tokens=estimate_tokens(inputs)):
+                response = await self._create("embeddings", **create_kwargs)
+            self._rate_limiter.on_success()
             duration_ms = int((datetime.now(UTC) - started).total_seconds() * 1000)
             try:
                 logger.info(
@@ -130,9 +159,9 @@ class OpenAIEmbeddings(EmbeddingsClient):
                 )
             except Exception:
                 pass
-            return [item.embedding for item in response.data]
+            return [decode_embedding(item.embedding) for item in response.data]
         except Exception as exc:  # Normalize errors
-            mapped = _map_openai_exception(exc)
+            mapped = _map_openai_exception(exc, self._rate_limiter)
             try:
                 logger.warning(
                     "LLM error",
@@ -147,24 +176,11 @@ class OpenAIEmbeddings(EmbeddingsClient):
             raise mapped
 
 
-class OpenAIChat(ChatClient):
-    def __init__(
-        self,
-        client: Any,
-        model: str,
-        base_host: str | None,
-        *,
-        provider_label: str = "openai",
-    ):
-        self._client = client
-        self._model = model
-        self._base_host = base_host
-        self._provider_label = provider_label
-
+class OpenAIChat(_OpenAIClientBase, ChatClient):
     async def chat(
         self, messages: list[dict[str, Any]], **kwargs: Any
     ) -> dict[str, Any]:
-        if not self._client:
+        if not self.available:
             raise NotImplementedError("OpenAI client not available")
 
         # Normalize kwargs to OpenAI python client parameters
@@ -185,17 +201,18 @@ class OpenAIChat(ChatClient):
         # Allow model override per-call
         model_name = kwargs.pop("model", self._model)
 
-        import asyncio
-
-        # The OpenAI python client call is sync for chat.completions
+        # Prompt plus the completion budget count towards TPM
+        tokens = estimate_chat_tokens(messages, create_kwargs.get("max_tokens"))
         started = datetime.now(UTC)
         try:
-            response = await asyncio.to_thread(
-                self._client.chat.completions.create,
-                model=model_name,
-                messages=messages,
-                **create_kwargs,
-            )
+            async with self._rate_limiter.limit(tokens=tokens):
+                response = await self._create(
+                    "chat.completions",
+                    model=model_name,
+                    messages=messages,
+                    **create_kwargs,
+                )
+            self._rate_limiter.on_success()
             duration_ms = int((datetime.now(UTC) - started).total_seconds() * 1000)
             try:
                 logger.info(
@@ -236,7 +253,7 @@ class OpenAIChat(ChatClient):
                 "model": getattr(response, "model", model_name),
             }
         except Exception as exc:
-            mapped = _map_openai_exception(exc)
+            mapped = _map_openai_exception(exc, self._rate_limiter)
             try:
                 logger.warning(
                     "LLM error",
@@ -255,25 +272,49 @@ class OpenAIProvider(LLMProvider):
     def __init__(self, settings: LLMSettings):
         self._settings = settings
         self._base_host = _safe_host(settings.base_url)
-        if OpenAI is None:
-            self._client = None
-        else:
-            kwargs: dict[str, Any] = {}
-            if settings.base_url:
-                kwargs["base_url"] = settings.base_url
-            if settings.api_key:
-                kwargs["api_key"] = settings.api_key
-            self._client = OpenAI(**kwargs)
+        kwargs: dict[str, Any] = {}
+        if settings.base_url:
+            kwargs["base_url"] = settings.base_url
+        if settings.api_key:
+            kwargs["api_key"] = settings.api_key
+        self._client = OpenAI(**kwargs) if OpenAI is not None else None
+        self._async_clients = async_client_pool(AsyncOpenAI, kwargs, settings)
+        self._rate_limiter = get_rate_limiter(settings)
+        # OpenAI-compatible servers do not all support base64 embeddings
+        default = "base64" if self._base_host in (None, "api.openai.com") else "float"
+        self._encoding_format = embedding_encoding(settings, default)
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        return {
+            "provider_label": "openai",
+            "rate_limiter": self._rate_limiter,
+            "async_clients": self._async_clients,
+        }
 
     def embeddings(self) -> EmbeddingsClient:
         model = self._settings.models.get("embeddings", "")
         return OpenAIEmbeddings(
-            self._client, model, self._base_host, provider_label="openai"
+            self._client,
+            model,
+            self._base_host,
+            encoding_format=self._encoding_format,
+            **self._client_kwargs(),
         )
 
     def chat(self) -> ChatClient:
         model = self._settings.models.get("chat", "")
-        return OpenAIChat(self._client, model, self._base_host, provider_label="openai")
+        return OpenAIChat(self._client, model, self._base_host, **self._client_kwargs())
 
     def tokenizer(self) -> TokenCounter:
         return _OpenAITokenCounter(self._settings.tokenizer)
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP connections."""
+        if self._async_clients is not None:
+            await self._async_clients.aclose()
+
+    async def __aenter__(self) -> OpenAIProvider:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        await self.aclose()
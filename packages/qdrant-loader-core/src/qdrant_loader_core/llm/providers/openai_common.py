@@ -0,0 +1,83 @@
+"""Client plumbing shared by the OpenAI and Azure OpenAI providers."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import reduce
+from typing import Any
+
+try:
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - installed alongside the openai client
+    httpx = None  # type: ignore
+
+from ..http_pool import AsyncClientPool, client_options
+from ..ratelimit import AsyncRateLimiter
+from ..settings import LLMSettings
+from ..vectors import EMBEDDING_ENCODINGS
+
+
+def embedding_encoding(settings: LLMSettings, default: str = "float") -> str:
+    """Wire format for embedding vectors (``provider_options.embeddings_encoding``)."""
+    options = settings.provider_options or {}
+    value = str(options.get("embeddings_encoding") or default).lower()
+    if value not in EMBEDDING_ENCODINGS:
+        raise ValueError(
+            f"Unsupported embeddings_encoding '{value}'; expected one of {', '.join(EMBEDDING_ENCODINGS)}"
+        )
+    return value
+
+
+def async_client_pool(
+    client_cls: Any, kwargs: dict[str, Any], settings: LLMSettings
+) -> AsyncClientPool | None:
+    """Pool of native async SDK clients, each on a pooled ``httpx.AsyncClient``.
+
+    Returns ``None`` when the installed client has no async support, in which
+    case requests fall back to the sync client in a worker thread.
+    """
+    if client_cls is None or httpx is None:
+        return None
+    options = client_options(httpx, settings.request)
+    # Keep the SDK's own request timeouts, as with the sync client
+    options.pop("timeout", None)
+
+    def _create() -> Any:
+        return client_cls(**kwargs, http_client=httpx.AsyncClient(**options))
+
+    return AsyncClientPool(_create)
+
+
+class _OpenAIClientBase:
+    def __init__(
+        self,
+        client: Any,
+        model: str,
+        base_host: str | None,
+        *,
+        provider_label: str = "openai",
+        rate_limiter: AsyncRateLimiter | None = None,
+        async_clients: AsyncClientPool | None = None,
+    ):
+        self._client = client
+        self._model = model
+        self._base_host = base_host
+        self._provider_label = provider_label
+        self._rate_limiter = rate_limiter or AsyncRateLimiter()
+        self._async_clients = async_clients
+
+    @property
+    def available(self) -> bool:
+        return self._client is not None or self._async_clients is not None
+
+    async def _create(self, resource: str, **kwargs: Any) -> Any:
+        """Call ``<resource>.create`` natively async, or in a worker thread."""
+        path = resource.split(".")
+        if self._async_clients is not None:
+            api = reduce(getattr, path, self._async_clients.get())
+            # The raw response carries the x-ratelimit-* headers
+            raw = await api.with_raw_response.create(**kwargs)
+            self._rate_limiter.update_from_headers(getattr(raw, "headers", None))
+            return raw.parse()
+        api = reduce(getattr, path, self._client)
+        return await asyncio.to_thread(api.create, **kwargs)
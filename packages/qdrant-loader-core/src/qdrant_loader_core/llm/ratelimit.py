@@ -1,20 +1,307 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import math
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Mapping
+from types import TracebackType
+from typing import Any
+
+from .headers import (
+    header_value,
+    parse_duration,
+    parse_int,
+    parse_retry_after,
+)
+from .settings import LLMSettings, RateLimitPolicy
+
+__all__ = [
+    "AsyncRateLimiter",
+    "TokenBucket",
+    "estimate_chat_tokens",
+    "estimate_tokens",
+    "get_rate_limiter",
+    "parse_retry_after",
+    "reset_rate_limiters",
+]
+
+# Backoff applied after a 429 without a usable Retry-After header
+_MIN_RATE_LIMIT_BACKOFF_S = 1.0
+_MAX_RATE_LIMIT_BACKOFF_S = 60.0
+
+
+def estimate_tokens(texts: Iterable[str]) -> int:
+    """Cheap token estimate (~4 characters per token) used for TPM accounting."""
+    return sum(math.ceil(len(text) / 4) for text in texts if text)
+
+
+def estimate_chat_tokens(
+    messages: Iterable[Mapping[str, Any]], max_tokens: int | None = None
+) -> int:
+    """Estimate the TPM cost of a chat request: prompt plus completion budget."""
+    prompt = estimate_tokens(str(message.get("content") or "") for message in messages)
+    return prompt + int(max_tokens or 0)
+
+
+class TokenBucket:
+    """Token bucket holding up to ``capacity`` units, refilled over ``period_s``.
+
+    Acquisitions reserve capacity immediately and report how long the caller
+    must wait for the reservation to be covered, so waiters are served in
+    arrival order without holding a lock while sleeping.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        period_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self._period_s = period_s
+        self.capacity = float(capacity)
+        self._level = float(capacity)
+        self._updated = clock()
+
+    @property
+    def rate(self) -> float:
+        """Refill rate in units per second."""
+        return self.capacity / self._period_s
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._level = min(self.capacity, self._level + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Reserve ``amount`` units and return the seconds to wait before using them."""
+        now = self._clock()
+        self._refill(now)
+        # Requests larger than the bucket can never fit; let them through at
+        # the cost of a full bucket instead of blocking forever.
+        self._level -= min(float(amount), self.capacity)
+        if self._level >= 0:
+            return 0.0
+        return -self._level / self.rate
+
+    def limit_remaining(self, remaining: float) -> None:
+        """Lower the available units to what the server reports as remaining."""
+        self._refill(self._clock())
+        self._level = min(self._level, float(remaining))
+
+    def resize(self, capacity: float) -> None:
+        """Change the bucket capacity, keeping the current level within bounds."""
+        self._refill(self._clock())
+        self.capacity = float(capacity)
+        self._level = min(self._level, self.capacity)
 
 
 class AsyncRateLimiter:
-    """Minimal async rate limiter placeholder.
+    """Async limiter enforcing concurrency, requests/minute and tokens/minute.
 
-    In later phases, enforce RPM/TPM and concurrency.
+    RPM and TPM are token buckets shared by every caller in the process,
+    whichever thread or event loop they run on. The limiter adapts to the
+    provider: ``x-ratelimit-*`` response headers tighten the buckets (and fill
+    in limits that were not configured), and 429 responses pause all callers
+    for the ``Retry-After`` delay or an exponential backoff.
+
+    ``async with limiter:`` holds a concurrency permit and one request;
+    ``async with limiter.limit(tokens=n):`` additionally accounts ``n`` tokens.
     """
 
-    def __init__(self, max_concurrency: int = 5):
-        self._semaphore = asyncio.Semaphore(max_concurrency)
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(rpm, clock=clock) if rpm else None
+        self._tokens = TokenBucket(tpm, clock=clock) if tpm else None
+        self._blocked_until = 0.0
+        self._backoff_s = _MIN_RATE_LIMIT_BACKOFF_S
+        # asyncio primitives are bound to one event loop
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def from_policy(cls, policy: RateLimitPolicy | None) -> AsyncRateLimiter:
+        policy = policy or RateLimitPolicy()
+        return cls(max_concurrency=policy.concurrency, rpm=policy.rpm, tpm=policy.tpm)
+
+    @property
+    def rpm(self) -> int | None:
+        return int(self._requests.capacity) if self._requests else None
+
+    @property
+    def tpm(self) -> int | None:
+        return int(self._tokens.capacity) if self._tokens else None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
 
-    async def __aenter__(self):
-        await self._semaphore.acquire()
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            delay = max(0.0, self._blocked_until - self._clock())
+            if self._requests is not None:
+                delay = max(delay, self._requests.reserve(1))
+            if self._tokens is not None and tokens > 0:
+                delay = max(delay, self._tokens.reserve(tokens))
+            return delay
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request using ``tokens`` tokens fits within the limits."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # A 429 may have paused callers while we were waiting
+        while True:
+            with self._lock:
+                remaining = self._blocked_until - self._clock()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
+
+    def limit(self, tokens: int = 0) -> _Permit:
+        """Async context manager holding a concurrency permit for one request."""
+        return _Permit(self, tokens)
+
+    async def __aenter__(self) -> AsyncRateLimiter:
+        await self._semaphore().acquire()
+        try:
+            await self.acquire()
+        except BaseException:
+            self._semaphore().release()
+            raise
         return self
 
-    async def __aexit__(self, exc_type, exc, tb):
-        self._semaphore.release()
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        self._semaphore().release()
+
+    def update_from_headers(self, headers: Mapping[str, str] | None) -> None:
+        """Align the buckets with ``x-ratelimit-*`` headers from a response."""
+        if not headers:
+            return
+        now = self._clock()
+        with self._lock:
+            for kind in ("requests", "tokens"):
+                limit = parse_int(header_value(headers, f"x-ratelimit-limit-{kind}"))
+                remaining = parse_int(
+                    header_value(headers, f"x-ratelimit-remaining-{kind}")
+                )
+                reset = parse_duration(
+                    header_value(headers, f"x-ratelimit-reset-{kind}")
+                )
+
+                bucket = self._requests if kind == "requests" else self._tokens
+                if limit and limit > 0:
+                    if bucket is None:
+                        bucket = TokenBucket(limit, clock=self._clock)
+                        if kind == "requests":
+                            self._requests = bucket
+                        else:
+                            self._tokens = bucket
+                    elif limit < bucket.capacity:
+                        bucket.resize(limit)
+                if bucket is not None and remaining is not None:
+                    bucket.limit_remaining(remaining)
+                if remaining is not None and remaining <= 0 and reset:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> float:
+        """Pause all callers after a 429 response.
+
+        Args:
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            The applied pause in seconds
+        """
+        with self._lock:
+            if retry_after is None:
+                delay = self._backoff_s
+                self._backoff_s = min(self._backoff_s * 2, _MAX_RATE_LIMIT_BACKOFF_S)
+            else:
+                delay = retry_after
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+            return delay
+
+    def on_success(self) -> None:
+        """Reset the 429 backoff after a successful request."""
+        self._backoff_s = _MIN_RATE_LIMIT_BACKOFF_S
+
+
+class _Permit:
+    def __init__(self, limiter: AsyncRateLimiter, tokens: int):
+        self._limiter = limiter
+        self._tokens = tokens
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> AsyncRateLimiter:
+        semaphore = self._limiter._semaphore()
+        await semaphore.acquire()
+        try:
+            await self._limiter.acquire(self._tokens)
+        except BaseException:
+            semaphore.release()
+            raise
+        self._semaphore = semaphore
+        return self._limiter
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+            self._semaphore = None
+
+
+_registry_lock = threading.Lock()
+_registry: dict[tuple, AsyncRateLimiter] = {}
+
+
+def get_rate_limiter(settings: LLMSettings) -> AsyncRateLimiter:
+    """Return the process-wide limiter for a provider endpoint and credentials.
+
+    Every provider, client and service built from equivalent settings shares
+    one limiter, so the configured RPM/TPM budget applies to their combined
+    traffic.
+    """
+    policy = getattr(settings, "rate_limits", None) or RateLimitPolicy()
+    api_key = getattr(settings, "api_key", None) or ""
+    key = (
+        str(getattr(settings, "provider", "") or "").lower(),
+        getattr(settings, "base_url", None) or "",
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest(),
+        policy.rpm,
+        policy.tpm,
+        policy.concurrency,
+    )
+    with _registry_lock:
+        limiter = _registry.get(key)
+        if limiter is None:
+            limiter = AsyncRateLimiter.from_policy(policy)
+            _registry[key] = limiter
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget all shared limiters (mainly for tests)."""
+    with _registry_lock:
+        _registry.clear()
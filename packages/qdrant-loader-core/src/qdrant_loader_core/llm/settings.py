@@ -13,6 +13,11 @@ class RequestPolicy:
     max_retries: int = 3
     backoff_s_min: float = 1.0
     backoff_s_max: float = 30.0
+    # Connection pooling for providers using a shared HTTP client
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 30.0
+    http2: bool = True
 
 
 @dataclass
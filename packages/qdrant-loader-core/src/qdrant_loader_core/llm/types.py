@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, Protocol, runtime_checkable
 
+from .vectors import EmbeddingVector
+
 
 @runtime_checkable
 class EmbeddingsClient(Protocol):
-    async def embed(self, inputs: list[str]) -> list[list[float]]: ...
+    async def embed(self, inputs: list[str]) -> Sequence[EmbeddingVector]: ...
 
 
 @runtime_checkable
@@ -0,0 +1,51 @@
+"""Decoding of embedding vectors returned by providers."""
+
+from __future__ import annotations
+
+import base64
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency surface
+    np = None  # type: ignore
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+EMBEDDING_ENCODINGS = ("float", "base64")
+
+# Decoded base64 payloads stay float32 arrays; JSON payloads are float lists
+EmbeddingVector: TypeAlias = (  # noqa: UP040
+    "Sequence[float] | NDArray[np.float32] | array[float]"
+)
+
+
+def decode_base64_array(data: str | bytes) -> Any:
+    """Decode a base64 payload of little-endian float32 values.
+
+    Returns a NumPy ``float32`` array when NumPy is installed, otherwise an
+    ``array('f')``.
+    """
+    raw = base64.b64decode(data)
+    if np is not None:
+        return np.frombuffer(raw, dtype="<f4")
+    values = array("f", raw)
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        values.byteswap()
+    return values
+
+
+def decode_embedding(value: Any) -> EmbeddingVector:
+    """Return an embedding, decoding base64 payloads into float32 arrays.
+
+    Decoded arrays are returned as is rather than converted to Python floats;
+    consumers that need a list, such as Qdrant point payloads, convert with
+    ``tolist()``.
+    """
+    if isinstance(value, str | bytes):
+        return decode_base64_array(value)
+    return value
@@ -4,3 +4,15 @@ from pathlib import Path
 # Ensure the core src directory is importable when running tests from the monorepo root
 core_src = Path(__file__).resolve().parent.parent / "src"
 sys.path.insert(0, str(core_src))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiters():
+    """Keep 429 pauses recorded by one test from delaying the next."""
+    from qdrant_loader_core.llm.ratelimit import reset_rate_limiters
+
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
@@ -0,0 +1,127 @@
+from importlib import import_module
+
+import pytest
+
+
+class _Resp:
+    status_code = 200
+    headers: dict[str, str] = {}
+
+    def __init__(self, json_data):
+        self._json = json_data
+
+    def raise_for_status(self):  # type: ignore[no-untyped-def]
+        return None
+
+    def json(self):  # type: ignore[no-untyped-def]
+        return self._json
+
+
+class _Client:
+    def __init__(self, **kwargs):  # type: ignore[no-untyped-def]
+        self.kwargs = kwargs
+        self.posts = 0
+        self.closed = False
+
+    async def post(self, url, json=None, headers=None, **kwargs):  # type: ignore[no-untyped-def]
+        self.posts += 1
+        return _Resp({"embeddings": [[0.5] for _ in json["input"]]})
+
+    async def aclose(self):  # type: ignore[no-untyped-def]
+        self.closed = True
+
+
+def _stub_httpx(created):  # type: ignore[no-untyped-def]
+    class _HTTPX:
+        class HTTPStatusError(Exception):
+            pass
+
+        class TimeoutException(Exception):
+            pass
+
+        class HTTPError(Exception):
+            pass
+
+        @staticmethod
+        def Limits(**kwargs):  # type: ignore[no-untyped-def]
+            return kwargs
+
+        @staticmethod
+        def AsyncClient(**kwargs):  # type: ignore[no-untyped-def]
+            client = _Client(**kwargs)
+            created.append(client)
+            return client
+
+    return _HTTPX
+
+
+def _settings(**request):  # type: ignore[no-untyped-def]
+    settings_mod = import_module("qdrant_loader_core.llm.settings")
+    return settings_mod.LLMSettings.from_global_config(
+        {
+            "llm": {
+                "provider": "ollama",
+                "base_url": "http://ollama:11434",
+                "models": {"embeddings": "m", "chat": "c"},
+                "request": request,
+                "provider_options": {"native_endpoint": "embed"},
+            }
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_ollama_provider_reuses_one_pooled_client(monkeypatch):
+    mod = import_module("qdrant_loader_core.llm.providers.ollama")
+    created: list[_Client] = []
+    monkeypatch.setattr(mod, "httpx", _stub_httpx(created))
+
+    provider = mod.OllamaProvider(
+        _settings(max_connections=4, max_keepalive_connections=2, http2=False)
+    )
+    for _ in range(3):
+        await provider.embeddings().embed(["a", "b"])
+
+    assert len(created) == 1
+    assert created[0].posts == 3
+    assert created[0].kwargs["limits"] == {
+        "max_connections": 4,
+        "max_keepalive_connections": 2,
+        "keepalive_expiry": 30.0,
+    }
+    assert created[0].kwargs["http2"] is False
+
+    await provider.aclose()
+    assert created[0].closed
+
+    # A closed provider transparently opens a new client if used again
+    await provider.embeddings().embed(["c"])
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_ollama_provider_async_context_manager_closes_client(monkeypatch):
+    mod = import_module("qdrant_loader_core.llm.providers.ollama")
+    created: list[_Client] = []
+    monkeypatch.setattr(mod, "httpx", _stub_httpx(created))
+
+    async with mod.OllamaProvider(_settings()) as provider:
+        await provider.embeddings().embed(["a"])
+
+    assert created[0].closed
+
+
+def test_client_options_enable_http2_only_when_available(monkeypatch):
+    pool_mod = import_module("qdrant_loader_core.llm.http_pool")
+    settings_mod = import_module("qdrant_loader_core.llm.settings")
+    httpx_stub = _stub_httpx([])
+
+    monkeypatch.setattr(pool_mod, "http2_available", lambda: False)
+    options = pool_mod.client_options(httpx_stub, settings_mod.RequestPolicy())
+    assert options["http2"] is False
+    assert options["timeout"] == 30.0
+
+    monkeypatch.setattr(pool_mod, "http2_available", lambda: True)
+    assert pool_mod.client_options(httpx_stub, settings_mod.RequestPolicy())["http2"]
+    disabled = settings_mod.RequestPolicy(http2=False)
+    assert pool_mod.client_options(httpx_stub, disabled)["http2"] is False
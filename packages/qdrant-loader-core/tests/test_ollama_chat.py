@@ -30,7 +30,7 @@ class _Client:
     async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
         return False
 
-    async def post(self, url, json=None, headers=None):  # type: ignore[no-untyped-def]
+    async def post(self, url, json=None, headers=None, **kwargs):  # type: ignore[no-untyped-def]
         if self._post_exc is not None:
             raise self._post_exc
         if not self._responses:
@@ -53,7 +53,11 @@ def _stub_httpx(*, responses=None, post_exc=None):
             pass
 
         @staticmethod
-        def AsyncClient(timeout):  # type: ignore[no-untyped-def]
+        def Limits(**kwargs):  # type: ignore[no-untyped-def]
+            return kwargs
+
+        @staticmethod
+        def AsyncClient(timeout=None, **kwargs):  # type: ignore[no-untyped-def]
             return _Client(responses=responses, post_exc=post_exc)
 
     return _HTTPX
@@ -98,7 +102,7 @@ async def test_chat_v1_timeout(monkeypatch):
     monkeypatch.setattr(
         stub,
         "AsyncClient",
-        staticmethod(lambda timeout: _Client(post_exc=stub.TimeoutException("to"))),
+        staticmethod(lambda **kwargs: _Client(post_exc=stub.TimeoutException("to"))),
     )
     chat = mod.OllamaChat("http://localhost:11434/v1", "m", None)
     with pytest.raises(Exception) as ei:
@@ -114,7 +118,7 @@ async def test_chat_v1_http_error(monkeypatch):
     monkeypatch.setattr(
         stub,
         "AsyncClient",
-        staticmethod(lambda timeout: _Client(post_exc=stub.HTTPError("err"))),
+        staticmethod(lambda **kwargs: _Client(post_exc=stub.HTTPError("err"))),
     )
     chat = mod.OllamaChat("http://localhost:11434/v1", "m", None)
     with pytest.raises(Exception) as ei:
@@ -159,7 +163,7 @@ async def test_chat_native_timeout(monkeypatch):
     monkeypatch.setattr(
         stub,
         "AsyncClient",
-        staticmethod(lambda timeout: _Client(post_exc=stub.TimeoutException("to"))),
+        staticmethod(lambda **kwargs: _Client(post_exc=stub.TimeoutException("to"))),
     )
     chat = mod.OllamaChat("http://localhost:11434", "m", None)
     with pytest.raises(Exception) as ei:
@@ -175,7 +179,7 @@ async def test_chat_native_http_error(monkeypatch):
     monkeypatch.setattr(
         stub,
         "AsyncClient",
-        staticmethod(lambda timeout: _Client(post_exc=stub.HTTPError("err"))),
+        staticmethod(lambda **kwargs: _Client(post_exc=stub.HTTPError("err"))),
     )
     chat = mod.OllamaChat("http://localhost:11434", "m", None)
     with pytest.raises(Exception) as ei:
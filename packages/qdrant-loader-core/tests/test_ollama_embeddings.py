@@ -30,7 +30,7 @@ class _Client:
     async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
         return False
 
-    async def post(self, url, json=None, headers=None):  # type: ignore[no-untyped-def]
+    async def post(self, url, json=None, headers=None, **kwargs):  # type: ignore[no-untyped-def]
         if not self._responses:
             raise AssertionError("No more responses queued")
         return self._responses.pop(0)
@@ -67,7 +67,11 @@ async def test_v1_openai_compatible_parsing(monkeypatch):
             pass
 
         @staticmethod
-        def AsyncClient(timeout):  # type: ignore[no-untyped-def]
+        def Limits(**kwargs):  # type: ignore[no-untyped-def]
+            return kwargs
+
+        @staticmethod
+        def AsyncClient(timeout=None, **kwargs):  # type: ignore[no-untyped-def]
             return _Client([_Resp(200, data)])
 
     monkeypatch.setattr(ollama_mod, "httpx", _HTTPX)
@@ -95,7 +99,11 @@ async def test_native_batch_embed_then_ok(monkeypatch):
             pass
 
         @staticmethod
-        def AsyncClient(timeout):  # type: ignore[no-untyped-def]
+        def Limits(**kwargs):  # type: ignore[no-untyped-def]
+            return kwargs
+
+        @staticmethod
+        def AsyncClient(timeout=None, **kwargs):  # type: ignore[no-untyped-def]
             return _Client([_Resp(200, batch)])
 
     monkeypatch.setattr(ollama_mod, "httpx", _HTTPX2)
@@ -128,7 +136,11 @@ async def test_native_embed_404_fallback_to_embeddings(monkeypatch):
             pass
 
         @staticmethod
-        def AsyncClient(timeout):  # type: ignore[no-untyped-def]
+        def Limits(**kwargs):  # type: ignore[no-untyped-def]
+            return kwargs
+
+        @staticmethod
+        def AsyncClient(timeout=None, **kwargs):  # type: ignore[no-untyped-def]
             return _Client([resp404, item1, item2])
 
     monkeypatch.setattr(ollama_mod, "httpx", _HTTPX3)
@@ -158,7 +170,11 @@ async def test_invalid_batch_response_raises(monkeypatch):
             pass
 
         @staticmethod
-        def AsyncClient(timeout):  # type: ignore[no-untyped-def]
+        def Limits(**kwargs):  # type: ignore[no-untyped-def]
+            return kwargs
+
+        @staticmethod
+        def AsyncClient(timeout=None, **kwargs):  # type: ignore[no-untyped-def]
             return _Client([_Resp(200, bad)])
 
     monkeypatch.setattr(ollama_mod, "httpx", _HTTPX4)
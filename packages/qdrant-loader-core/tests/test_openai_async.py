@@ -0,0 +1,133 @@
+import base64
+from array import array
+from importlib import import_module
+
+import pytest
+
+
+def _make_settings(*, base_url="https://api.openai.com/v1", provider_options=None):
+    settings_mod = import_module("qdrant_loader_core.llm.settings")
+    return settings_mod.LLMSettings(
+        provider="openai",
+        base_url=base_url,
+        api_key="sk-123",
+        headers=None,
+        models={"embeddings": "text-embedding-3-small", "chat": "gpt-4o-mini"},
+        tokenizer="none",
+        request=settings_mod.RequestPolicy(),
+        rate_limits=settings_mod.RateLimitPolicy(),
+        embeddings=settings_mod.EmbeddingPolicy(vector_size=3),
+        provider_options=provider_options,
+    )
+
+
+def _b64(values):  # type: ignore[no-untyped-def]
+    return base64.b64encode(array("f", values).tobytes()).decode("ascii")
+
+
+class _Item:
+    def __init__(self, embedding):  # type: ignore[no-untyped-def]
+        self.embedding = embedding
+
+
+class _Raw:
+    headers = {"x-ratelimit-limit-requests": "500"}
+
+    def __init__(self, data):  # type: ignore[no-untyped-def]
+        self._data = data
+
+    def parse(self):  # type: ignore[no-untyped-def]
+        return self._data
+
+
+class _AsyncOpenAI:
+    instances: list = []
+
+    def __init__(self, **kwargs):  # type: ignore[no-untyped-def]
+        self.kwargs = kwargs
+        self.calls: list[dict] = []
+        self.closed = False
+        client = self
+
+        class _Create:
+            async def create(self, **create_kwargs):  # type: ignore[no-untyped-def]
+                client.calls.append(create_kwargs)
+                base64_wanted = create_kwargs.get("encoding_format") == "base64"
+                data = [
+                    _Item(_b64([0.5, 1.5, -2.0]) if base64_wanted else [0.5, 1.5, -2.0])
+                    for _ in create_kwargs["input"]
+                ]
+                return _Raw(type("_Resp", (), {"data": data})())
+
+        class _Embeddings:
+            with_raw_response = _Create()
+
+        self.embeddings = _Embeddings()
+        _AsyncOpenAI.instances.append(self)
+
+    async def close(self):  # type: ignore[no-untyped-def]
+        self.closed = True
+
+
+@pytest.fixture
+def openai_mod(monkeypatch):  # type: ignore[no-untyped-def]
+    mod = import_module("qdrant_loader_core.llm.providers.openai")
+    _AsyncOpenAI.instances = []
+    monkeypatch.setattr(mod, "OpenAI", None)
+    monkeypatch.setattr(mod, "AsyncOpenAI", _AsyncOpenAI)
+    return mod
+
+
+def test_decode_embedding_handles_base64_and_floats():
+    vectors = import_module("qdrant_loader_core.llm.vectors")
+
+    decoded = vectors.decode_embedding(_b64([1.0, -0.25]))
+    assert str(decoded.dtype) == "float32"
+    assert decoded.tolist() == [1.0, -0.25]
+    assert vectors.decode_embedding([1.0, 2.0]) == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_embeddings_use_async_client_with_base64(openai_mod):
+    provider = openai_mod.OpenAIProvider(_make_settings())
+
+    vectors = await provider.embeddings().embed(["a", "b"])
+
+    assert [str(vector.dtype) for vector in vectors] == ["float32", "float32"]
+    assert [vector.tolist() for vector in vectors] == [[0.5, 1.5, -2.0]] * 2
+    (client,) = _AsyncOpenAI.instances
+    assert client.calls[0]["encoding_format"] == "base64"
+    assert client.kwargs["api_key"] == "sk-123"
+    assert "http_client" in client.kwargs
+    # Rate-limit headers of successful responses feed the shared limiter
+    assert provider._rate_limiter.rpm == 500
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_reused_and_closed(openai_mod):
+    async with openai_mod.OpenAIProvider(_make_settings()) as provider:
+        await provider.embeddings().embed(["a"])
+        await provider.embeddings().embed(["b"])
+
+    (client,) = _AsyncOpenAI.instances
+    assert len(client.calls) == 2
+    assert client.closed
+
+
+@pytest.mark.asyncio
+async def test_compatible_endpoints_default_to_float_encoding(openai_mod):
+    provider = openai_mod.OpenAIProvider(
+        _make_settings(base_url="http://localhost:8000/v1")
+    )
+
+    vectors = await provider.embeddings().embed(["a"])
+
+    assert vectors == [[0.5, 1.5, -2.0]]
+    assert "encoding_format" not in _AsyncOpenAI.instances[0].calls[0]
+
+
+def test_unknown_embeddings_encoding_is_rejected(openai_mod):
+    with pytest.raises(ValueError):
+        openai_mod.OpenAIProvider(
+            _make_settings(provider_options={"embeddings_encoding": "int8"})
+        )
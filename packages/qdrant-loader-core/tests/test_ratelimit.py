@@ -54,3 +54,179 @@ async def test_rate_limiter_releases_permit():
     # With concurrency=1, we should never see more than 1 in the critical section
     await asyncio.gather(work(), work(), work())
     assert max_seen == 1
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):  # type: ignore[no-untyped-def]
+        return self.now
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    """Fake monotonic clock whose asyncio.sleep advances time instantly."""
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    clock = _FakeClock()
+    sleeps: list[float] = []
+
+    async def _sleep(delay):  # type: ignore[no-untyped-def]
+        sleeps.append(delay)
+        clock.now += delay
+
+    monkeypatch.setattr(mod.asyncio, "sleep", _sleep)
+    return clock, sleeps
+
+
+def test_token_bucket_reserve_and_refill():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    clock = _FakeClock()
+    bucket = mod.TokenBucket(60, clock=clock)  # 1 unit per second
+
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(2) == pytest.approx(2.0)
+    clock.now += 2
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+
+def test_token_bucket_oversized_request_does_not_block_forever():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    clock = _FakeClock()
+    bucket = mod.TokenBucket(10, clock=clock)
+
+    assert bucket.reserve(1000) == 0.0
+    assert bucket.reserve(1) == pytest.approx(6.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_enforces_rpm(fake_time):
+    clock, sleeps = fake_time
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    limiter = mod.AsyncRateLimiter(max_concurrency=10, rpm=120, clock=clock)
+
+    start = clock.now
+    for _ in range(122):
+        async with limiter:
+            pass
+
+    # The burst of 120 is free; the next two wait 0.5s each
+    assert clock.now - start == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_enforces_tpm(fake_time):
+    clock, sleeps = fake_time
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    limiter = mod.AsyncRateLimiter(tpm=6000, clock=clock)  # 100 tokens/s
+
+    async with limiter.limit(tokens=6000):
+        pass
+    async with limiter.limit(tokens=300):
+        pass
+
+    assert sleeps == [pytest.approx(3.0)]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_pauses_after_429(fake_time):
+    clock, sleeps = fake_time
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    limiter = mod.AsyncRateLimiter(clock=clock)
+
+    assert limiter.on_rate_limited(retry_after=7) == 7
+    await limiter.acquire()
+    assert sum(sleeps) == pytest.approx(7.0)
+
+    # Without Retry-After the pause backs off exponentially until a success
+    assert limiter.on_rate_limited() == 1.0
+    assert limiter.on_rate_limited() == 2.0
+    limiter.on_success()
+    assert limiter.on_rate_limited() == 1.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_adapts_to_ratelimit_headers(fake_time):
+    clock, sleeps = fake_time
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    limiter = mod.AsyncRateLimiter(clock=clock)
+
+    limiter.update_from_headers(
+        {
+            "X-RateLimit-Limit-Requests": "60",
+            "X-RateLimit-Remaining-Requests": "0",
+            "X-RateLimit-Reset-Requests": "1s",
+            "x-ratelimit-limit-tokens": "150000",
+            "x-ratelimit-remaining-tokens": "149000",
+        }
+    )
+
+    assert limiter.rpm == 60
+    assert limiter.tpm == 150000
+    await limiter.acquire()
+    assert sum(sleeps) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("1s", 1.0), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m3s", 3723.0), ("0.5", 0.5)],
+)
+def test_parse_duration(value, expected):
+    mod = import_module("qdrant_loader_core.llm.headers")
+    assert mod.parse_duration(value) == pytest.approx(expected)
+
+
+def test_parse_retry_after():
+    mod = import_module("qdrant_loader_core.llm.headers")
+    assert mod.parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert mod.parse_retry_after({"retry-after-ms": "250"}) == 0.25
+    assert mod.parse_retry_after({"retry-after": "soon"}) is None
+    assert mod.parse_retry_after(None) is None
+
+
+def test_get_rate_limiter_is_shared_per_endpoint():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    settings_mod = import_module("qdrant_loader_core.llm.settings")
+
+    def _settings(base_url):  # type: ignore[no-untyped-def]
+        return settings_mod.LLMSettings.from_global_config(
+            {
+                "llm": {
+                    "provider": "openai",
+                    "base_url": base_url,
+                    "api_key": "k",
+                    "rate_limits": {"rpm": 100, "tpm": 1000, "concurrency": 3},
+                }
+            }
+        )
+
+    first = mod.get_rate_limiter(_settings("https://api.openai.com/v1"))
+    second = mod.get_rate_limiter(_settings("https://api.openai.com/v1"))
+    other = mod.get_rate_limiter(_settings("http://localhost:11434/v1"))
+
+    assert first is second
+    assert first is not other
+    assert (first.rpm, first.tpm, first.max_concurrency) == (100, 1000, 3)
+
+
+@pytest.mark.asyncio
+async def test_ollama_429_sets_retry_after(monkeypatch):
+    ollama = import_module("qdrant_loader_core.llm.providers.ollama")
+    errors = import_module("qdrant_loader_core.llm.errors")
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+
+    class _HTTPStatusError(Exception):
+        def __init__(self, response):  # type: ignore[no-untyped-def]
+            super().__init__("429")
+            self.response = response
+
+    response = type(
+        "_Resp", (), {"status_code": 429, "headers": {"Retry-After": "12"}}
+    )()
+    limiter = mod.AsyncRateLimiter()
+
+    mapped = ollama._map_status_error(_HTTPStatusError(response), limiter)
+
+    assert isinstance(mapped, errors.RateLimitedError)
+    assert mapped.retry_after == 12.0
+    assert limiter._blocked_until > 0
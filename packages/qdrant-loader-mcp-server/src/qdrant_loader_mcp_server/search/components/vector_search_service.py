@@ -140,7 +140,9 @@ class VectorSearchService:
                     else self.embeddings_provider
                 )
                 vectors = await client.embed([text])
-                return vectors[0]
+                # Providers may return float32 arrays; callers here take lists
+                vector = vectors[0]
+                return vector.tolist() if hasattr(vector, "tolist") else vector
             except Exception as e:
                 self.logger.error("Provider embeddings failed", error=str(e))
                 raise
@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 from qdrant_loader_mcp_server.search.components.vector_search_service import (
     VectorSearchService,
@@ -51,6 +52,21 @@ async def test_get_embedding_uses_provider_first(mock_qdrant_client):
     openai_client.embeddings.create.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_get_embedding_returns_list_for_array_vectors(mock_qdrant_client):
+    provider = _Provider(np.array([0.5, 0.25], dtype=np.float32))
+
+    svc = VectorSearchService(
+        qdrant_client=mock_qdrant_client,
+        collection_name="test_collection",
+        embeddings_provider=provider,
+    )
+
+    vec = await svc.get_embedding("hello")
+    assert type(vec) is list
+    assert vec == [0.5, 0.25]
+
+
 @pytest.mark.asyncio
 async def test_get_embedding_falls_back_to_openai_when_no_provider(mock_qdrant_client):
     # Mock OpenAI response shape: response.data[0].embedding
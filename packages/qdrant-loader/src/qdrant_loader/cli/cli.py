@@ -370,6 +370,55 @@ async def ingest(
     )
 
 
+@cli.command()
+@option(
+    "--workspace",
+    type=ClickPath(path_type=Path),
+    help="Workspace directory containing config.yaml and .env files. All output will be stored here.",
+)
+@option(
+    "--config", type=ClickPath(exists=True, path_type=Path), help="Path to config file."
+)
+@option("--env", type=ClickPath(exists=True, path_type=Path), help="Path to .env file.")
+@option(
+    "--log-level",
+    type=Choice(
+        ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False
+    ),
+    default="INFO",
+    help="Set the logging level.",
+)
+@option(
+    "--dry-run",
+    is_flag=True,
+    help="Report orphaned points without deleting them.",
+)
+@async_command
+async def gc(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    log_level: str,
+    dry_run: bool,
+):
+    """Remove orphaned points from the QDrant collection.
+
+    A point is orphaned when the state database has no live document for its
+    source and URL, e.g. after a source was removed from the configuration.
+    Do not run this while an ingestion is in progress.
+
+    Examples:
+      # Show how many orphaned points would be removed
+      qdrant-loader gc --dry-run
+
+      # Remove orphaned points
+      qdrant-loader gc
+    """
+    from qdrant_loader.cli.commands.gc_cmd import run_gc_command
+
+    await run_gc_command(workspace, config, env, log_level, dry_run)
+
+
 @cli.command()
 @option(
     "--workspace",
@@ -1,7 +1,9 @@
+from .gc import run_garbage_collection
 from .ingest import run_pipeline_ingestion
 from .init import run_init
 
 __all__ = [
+    "run_garbage_collection",
     "run_init",
     "run_pipeline_ingestion",
 ]
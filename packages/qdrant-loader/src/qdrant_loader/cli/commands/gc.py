@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from qdrant_loader.utils.logging import LoggingConfig
+
+
+async def run_garbage_collection(
+    settings: Any,
+    qdrant_manager: Any,
+    *,
+    dry_run: bool,
+    batch_size: int = 1000,
+) -> tuple[int, int, int]:
+    """Remove points whose document no longer has a live state.
+
+    Points are matched to document states by source type, source and URL;
+    points missing any of these payload fields are left alone.
+
+    Points written before the ``document_id`` payload field held the id of
+    the source document are migrated. When the document was ingested again
+    since, its current chunks were all rewritten with the new field, so the
+    points still carrying another id are stale and deleted. Otherwise the
+    field is set on the document's points, so later updates of the document
+    remove its stale chunks.
+
+    Returns:
+        The number of points scanned, the number of orphaned or stale points
+        found and the number of points whose document ID was set
+    """
+    from qdrant_loader.core.state.state_manager import StateManager
+
+    logger = LoggingConfig.get_logger(__name__)
+    state_manager = StateManager(settings.global_config.state_management)
+    await state_manager.initialize()
+    scanned = 0
+    orphaned = 0
+    migrated = 0
+    # Documents whose points were migrated, so later pages skip them
+    migrated_documents: set[str] = set()
+    try:
+        async for page in qdrant_manager.iter_point_sources(batch_size=batch_size):
+            scanned += len(page)
+            points_by_source: dict[
+                tuple[str, str], list[tuple[str, str, str | None]]
+            ] = defaultdict(list)
+            for point_id, source_type, source, url, document_id in page:
+                if source_type and source and url:
+                    points_by_source[(source_type, source)].append(
+                        (point_id, url, document_id)
+                    )
+
+            orphans: list[str] = []
+            legacy_documents: dict[str, tuple[str, str, str]] = {}
+            for (source_type, source), points in points_by_source.items():
+                live_ids = await state_manager.get_live_document_ids(
+                    source_type, source, sorted({url for _, url, _ in points})
+                )
+                for point_id, url, document_id in points:
+                    live_id = live_ids.get(url)
+                    if live_id is None:
+                        orphans.append(point_id)
+                    elif document_id != live_id and live_id not in migrated_documents:
+                        legacy_documents[live_id] = (source_type, source, url)
+
+            for live_id, (source_type, source, url) in legacy_documents.items():
+                migrated_documents.add(live_id)
+                document_points = await qdrant_manager.get_document_points(
+                    source_type, source, url
+                )
+                legacy = [
+                    point_id
+                    for point_id, document_id in document_points
+                    if document_id != live_id
+                ]
+                if len(legacy) < len(document_points):
+                    orphans.extend(legacy)
+                    continue
+                migrated += len(legacy)
+                if dry_run:
+                    logger.info("Found points to migrate", count=len(legacy))
+                else:
+                    await qdrant_manager.set_document_id(legacy, live_id)
+                    logger.info("Set the document ID of points", count=len(legacy))
+
+            if not orphans:
+                continue
+            orphaned += len(orphans)
+            if dry_run:
+                logger.info("Found orphaned points", count=len(orphans))
+            else:
+                await qdrant_manager.delete_points(orphans)
+                logger.info("Deleted orphaned points", count=len(orphans))
+    finally:
+        await state_manager.dispose()
+    return scanned, orphaned, migrated
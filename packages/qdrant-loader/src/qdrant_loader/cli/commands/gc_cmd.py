@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from click.exceptions import ClickException
+
+from qdrant_loader.cli.config_loader import (
+    load_config_with_workspace as _load_config_with_workspace,
+)
+from qdrant_loader.cli.config_loader import setup_workspace as _setup_workspace_impl
+from qdrant_loader.config.workspace import validate_workspace_flags
+from qdrant_loader.utils.logging import LoggingConfig
+
+from . import run_garbage_collection as _run_garbage_collection
+
+
+async def run_gc_command(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    log_level: str,
+    dry_run: bool,
+) -> None:
+    """Implementation for the `gc` CLI command."""
+    try:
+        # Validate flag combinations
+        validate_workspace_flags(workspace, config, env)
+
+        # Setup workspace if provided
+        workspace_config = None
+        if workspace:
+            workspace_config = _setup_workspace_impl(workspace)
+
+        # Setup/reconfigure logging with workspace support
+        log_file = (
+            str(workspace_config.logs_path) if workspace_config else "qdrant-loader.log"
+        )
+        if getattr(LoggingConfig, "reconfigure", None):  # type: ignore[attr-defined]
+            if getattr(LoggingConfig, "_initialized", False):  # type: ignore[attr-defined]
+                LoggingConfig.reconfigure(file=log_file, level=log_level)  # type: ignore[attr-defined]
+            else:
+                LoggingConfig.setup(level=log_level, format="console", file=log_file)
+        else:
+            import logging as _py_logging
+
+            _py_logging.getLogger().handlers = []
+            LoggingConfig.setup(level=log_level, format="console", file=log_file)
+        logger = LoggingConfig.get_logger(__name__)
+
+        # Load configuration
+        _load_config_with_workspace(workspace_config, config, env)
+        from qdrant_loader.config import get_settings
+
+        settings = get_settings()
+        if settings is None:
+            logger.error("settings_not_available")
+            raise ClickException("Settings not available")
+
+        # Lazy import to avoid slow startup
+        from qdrant_loader.core.qdrant_manager import QdrantManager
+
+        qdrant_manager = QdrantManager(settings)
+        try:
+            scanned, orphaned, migrated = await _run_garbage_collection(
+                settings, qdrant_manager, dry_run=dry_run
+            )
+        finally:
+            await qdrant_manager.close()
+
+        logger.info(
+            (
+                "Garbage collection dry run completed"
+                if dry_run
+                else "Garbage collection completed"
+            ),
+            collection=settings.qdrant_collection_name,
+            points_scanned=scanned,
+            orphaned_points=orphaned,
+            migrated_points=migrated,
+        )
+
+    except ClickException:
+        raise
+    except Exception as e:
+        logger = LoggingConfig.get_logger(__name__)
+        error_msg = str(e) if str(e) else f"Empty exception of type: {type(e).__name__}"
+        logger.error("gc_failed", error=error_msg, exc_info=True)
+        raise ClickException(f"Failed to run garbage collection: {error_msg}") from e
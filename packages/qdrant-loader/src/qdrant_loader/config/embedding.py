@@ -1,10 +1,83 @@
 """Configuration for embedding generation."""
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
 from qdrant_loader.config.base import BaseConfig
 
 
+class EmbeddingCacheConfig(BaseConfig):
+    """Configuration for the persistent chunk embedding cache."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Reuse embeddings of unchanged chunks instead of re-embedding them",
+    )
+    path: str | None = Field(
+        default=None,
+        description="Cache database file (defaults to embedding_cache.db next to the state database)",
+    )
+    max_entries: int | None = Field(
+        default=None, description="Maximum number of cached embeddings"
+    )
+    max_size_mb: float | None = Field(
+        default=1024.0,
+        description="Maximum total size of cached vectors in megabytes",
+    )
+
+
+class AdaptiveBatchingConfig(BaseConfig):
+    """Limits for adaptive embedding batch sizing and concurrency."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Tune batch size and in-flight batches from observed latency, errors and throughput",
+    )
+    min_batch_size: int = Field(
+        default=1, description="Smallest number of texts per batch", gt=0
+    )
+    max_batch_size: int = Field(
+        default=512, description="Largest number of texts per batch", gt=0
+    )
+    min_concurrency: int = Field(
+        default=1, description="Fewest embedding batches in flight", gt=0
+    )
+    max_concurrency: int = Field(
+        default=16, description="Most embedding batches in flight", gt=0
+    )
+    target_latency_s: float = Field(
+        default=10.0,
+        description="Request latency above which the batch size is reduced",
+        gt=0,
+    )
+    max_error_rate: float = Field(
+        default=0.1,
+        description="Failed request ratio above which batch size and concurrency are cut",
+        ge=0,
+        le=1,
+    )
+    batch_size_step: int = Field(
+        default=8, description="Additive batch size increase per healthy window", gt=0
+    )
+    decrease_factor: float = Field(
+        default=0.5,
+        description="Multiplicative decrease applied on errors, 429s and slow requests",
+        gt=0,
+        lt=1,
+    )
+    window: int = Field(
+        default=5, description="Requests observed between adjustments", gt=0
+    )
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "AdaptiveBatchingConfig":
+        """Validate that the lower limits do not exceed the upper limits."""
+        if self.min_batch_size > self.max_batch_size:
+            raise ValueError("min_batch_size must not exceed max_batch_size")
+        if self.min_concurrency > self.max_concurrency:
+            raise ValueError("min_concurrency must not exceed max_concurrency")
+        return self
+
+
 class EmbeddingConfig(BaseConfig):
     """Configuration for embedding generation."""
 
@@ -37,3 +110,11 @@ class EmbeddingConfig(BaseConfig):
         default=8000,
         description="Maximum tokens allowed for a single chunk (should match or be below model's context limit)",
     )
+    cache: EmbeddingCacheConfig = Field(
+        default_factory=EmbeddingCacheConfig,
+        description="Persistent embedding cache configuration",
+    )
+    adaptive_batching: AdaptiveBatchingConfig = Field(
+        default_factory=AdaptiveBatchingConfig,
+        description="Adaptive batch sizing and concurrency for embedding requests",
+    )
@@ -14,6 +14,17 @@ class QdrantConfig(BaseConfig):
     url: str = Field(..., description="Qdrant server URL")
     api_key: str | None = Field(default=None, description="Qdrant API key")
     collection_name: str = Field(..., description="Qdrant collection name")
+    upsert_wait: bool = Field(
+        default=True,
+        description="Wait for Qdrant to apply each upsert before acknowledging it. "
+        "When disabled, upserts are confirmed every few batches and at the end of "
+        "the run",
+    )
+    use_async_client: bool = Field(
+        default=False,
+        description="Use the native AsyncQdrantClient for upserts instead of "
+        "running the synchronous client in worker threads",
+    )
 
     def to_dict(self) -> dict[str, str | None]:
         """Convert the configuration to a dictionary."""
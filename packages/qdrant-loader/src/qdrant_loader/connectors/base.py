@@ -1,9 +1,88 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Sequence
+from datetime import datetime
+from typing import Protocol, TypeVar
 
 from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import FileConversionConfig
 
+T = TypeVar("T")
+
+# (url, fingerprint, parent_id) of an item checked by a fetch filter
+FetchItem = tuple[str, str, str | None]
+
+# Items whose fingerprints are checked in one fetch filter call
+_FETCH_FILTER_BATCH_SIZE = 500
+
+
+class FetchFilter(Protocol):
+    """Decides from cheap fingerprints whether source items must be fetched.
+
+    Fingerprints are values a source exposes without returning the item body,
+    such as a page version, an issue ``updated`` timestamp, a git blob SHA or
+    a file's mtime and size. ``parent_id`` is the id the connector stores as
+    ``parent_document_id`` on the item's attachments, so that the attachments
+    of a skipped item are known to still exist.
+
+    Items are checked in batches, so that their stored states can be looked
+    up together. The result holds one decision per item, in order.
+    """
+
+    async def __call__(
+        self, source_type: str, source: str, items: Sequence[FetchItem]
+    ) -> list[bool]: ...
+
+
+class SyncTracker(Protocol):
+    """Lets connectors list only the items changed since a source's last run.
+
+    ``last_synced_at`` returns the start of the last run whose items were all
+    ingested successfully, or None. A connector that then lists only the items
+    changed since that time calls ``keep_unlisted``, so the items it did not
+    list are not reported as deleted, and ``mark_synced`` once it has listed
+    everything, so the start of this run becomes the next starting point.
+    Connectors that can cheaply list which items still exist call
+    ``mark_listed`` for each of them instead of ``keep_unlisted``, so items
+    deleted at the source are still detected.
+
+    Sources that expose a position rather than a time, such as a commit SHA,
+    start from ``last_sync_cursor`` instead and pass their new position to
+    ``mark_synced``. Items they report with ``mark_deleted`` are removed even
+    though ``keep_unlisted`` was called.
+
+    Items that fail to be fetched or processed are reported with
+    ``mark_failed``: they are kept like listed items, and the source is not
+    recorded as synced, so the next run tries them again. A failure that
+    cannot be tied to an item keeps every unlisted item of the source.
+    """
+
+    async def last_synced_at(
+        self, source_type: str, source: str
+    ) -> datetime | None: ...
+
+    async def last_sync_cursor(self, source_type: str, source: str) -> str | None: ...
+
+    def keep_unlisted(self, source_type: str, source: str) -> None: ...
+
+    async def mark_listed(
+        self, source_type: str, source: str, url: str, parent_id: str | None = None
+    ) -> None: ...
+
+    async def mark_failed(
+        self,
+        source_type: str,
+        source: str,
+        url: str | None = None,
+        parent_id: str | None = None,
+    ) -> None: ...
+
+    def mark_deleted(self, source_type: str, source: str, url: str) -> None: ...
+
+    def mark_synced(
+        self, source_type: str, source: str, cursor: str | None = None
+    ) -> None: ...
+
 
 class BaseConnector(ABC):
     """Base class for all connectors."""
@@ -11,6 +90,8 @@ class BaseConnector(ABC):
     def __init__(self, config: SourceConfig):
         self.config = config
         self._initialized = False
+        self._fetch_filter: FetchFilter | None = None
+        self._sync_tracker: SyncTracker | None = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -35,6 +116,183 @@ class BaseConnector(ABC):
         # Store on the instance so connectors that opt-in can access it.
         self._file_conversion_config = file_conversion_config
 
+    def set_fetch_filter(self, fetch_filter: FetchFilter | None) -> None:
+        """Set the filter consulted before fetching an item in full.
+
+        Connectors that can list cheap fingerprints pass the listed items
+        through :meth:`_iter_to_fetch`, or :meth:`_should_fetch` for single
+        items, before downloading bodies and attachments; items the filter
+        reports as unchanged are not fetched or yielded. Other connectors
+        ignore it.
+
+        Args:
+            fetch_filter: Filter to consult, or None to fetch everything
+        """
+        self._fetch_filter = fetch_filter
+
+    async def _should_fetch(
+        self, url: str, fingerprint: str | None, parent_id: str | None = None
+    ) -> bool:
+        """Whether the item at ``url`` must be fetched in full."""
+        fetch_filter = getattr(self, "_fetch_filter", None)
+        if fetch_filter is None or fingerprint is None:
+            return True
+        (fetch,) = await fetch_filter(
+            self.config.source_type, self.config.source, [(url, fingerprint, parent_id)]
+        )
+        return fetch
+
+    async def _iter_to_fetch(
+        self,
+        candidates: AsyncIterable[tuple[T, str, str | None, str | None]],
+        on_error: Callable[[Exception, list[T]], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[T]:
+        """Yield the listed items that must be fetched in full.
+
+        The fetch filter is consulted once per batch of candidates rather than
+        once per item. Items without a fingerprint are always fetched.
+
+        Args:
+            candidates: Tuples of (item, url, fingerprint or None, parent_id)
+            on_error: Called with the error and the items of a batch the filter
+                failed on, which are then skipped; errors are raised without it
+
+        Yields:
+            The items of new or changed candidates, in listing order
+        """
+        batch: list[tuple[T, str, str | None, str | None]] = []
+        async for candidate in candidates:
+            batch.append(candidate)
+            if len(batch) >= _FETCH_FILTER_BATCH_SIZE:
+                for item in await self._filter_batch(batch, on_error):
+                    yield item
+                batch = []
+        if batch:
+            for item in await self._filter_batch(batch, on_error):
+                yield item
+
+    async def _filter_batch(
+        self,
+        batch: list[tuple[T, str, str | None, str | None]],
+        on_error: Callable[[Exception, list[T]], Awaitable[None]] | None,
+    ) -> list[T]:
+        """Items of a batch of candidates that must be fetched in full."""
+        fetch_filter = getattr(self, "_fetch_filter", None)
+        # Positions of the candidates with a fingerprint to check
+        checked = [i for i, candidate in enumerate(batch) if candidate[2] is not None]
+        if fetch_filter is None or not checked:
+            return [candidate[0] for candidate in batch]
+        try:
+            decisions = await fetch_filter(
+                self.config.source_type,
+                self.config.source,
+                [(batch[i][1], batch[i][2], batch[i][3]) for i in checked],  # type: ignore[misc]
+            )
+        except Exception as e:
+            if on_error is None:
+                raise
+            await on_error(e, [batch[i][0] for i in checked])
+            skipped = set(checked)
+        else:
+            skipped = {
+                i for i, fetch in zip(checked, decisions, strict=True) if not fetch
+            }
+        return [candidate[0] for i, candidate in enumerate(batch) if i not in skipped]
+
+    def set_sync_tracker(self, sync_tracker: SyncTracker | None) -> None:
+        """Set the tracker of incremental runs.
+
+        Connectors that can query the items changed since a point in time ask
+        it where to start listing. Other connectors ignore it.
+
+        Args:
+            sync_tracker: Tracker to consult, or None to always list everything
+        """
+        self._sync_tracker = sync_tracker
+
+    async def _last_synced_at(self) -> datetime | None:
+        """Start of the last fully ingested run of this source, if known."""
+        sync_tracker = getattr(self, "_sync_tracker", None)
+        if sync_tracker is None:
+            return None
+        return await sync_tracker.last_synced_at(
+            self.config.source_type, self.config.source
+        )
+
+    async def _last_sync_cursor(self) -> str | None:
+        """Source position recorded by the last fully ingested run, if known."""
+        sync_tracker = getattr(self, "_sync_tracker", None)
+        if sync_tracker is None:
+            return None
+        return await sync_tracker.last_sync_cursor(
+            self.config.source_type, self.config.source
+        )
+
+    def _keep_unlisted(self) -> None:
+        """Report that items not listed in this run still exist."""
+        sync_tracker = getattr(self, "_sync_tracker", None)
+        if sync_tracker is not None:
+            sync_tracker.keep_unlisted(self.config.source_type, self.config.source)
+
+    async def _mark_listed(self, url: str, parent_id: str | None = None) -> None:
+        """Report that the item at ``url`` still exists, changed or not."""
+        sync_tracker = getattr(self, "_sync_tracker", None)
+        if sync_tracker is not None:
+            await sync_tracker.mark_listed(
+                self.config.source_type, self.config.source, url, parent_id
+            )
+
+    async def _mark_failed(
+        self, url: str | None = None, parent_id: str | None = None
+    ) -> None:
+        """Report that an item failed to be fetched or processed.
+
+        The stored document of the item at ``url`` and the attachments stored
+        under it are kept, and the source is tried again on the next run.
+
+        Args:
+            url: URL of the item, or None if the failed item is not known
+            parent_id: Source id the item's attachments are stored under
+        """
+        sync_tracker = getattr(self, "_sync_tracker", None)
+        if sync_tracker is not None:
+            await sync_tracker.mark_failed(
+                self.config.source_type, self.config.source, url, parent_id
+            )
+
+    def _mark_deleted(self, url: str) -> None:
+        """Report that the item at ``url`` was deleted at the source."""
+        sync_tracker = getattr(self, "_sync_tracker", None)
+        if sync_tracker is not None:
+            sync_tracker.mark_deleted(self.config.source_type, self.config.source, url)
+
+    def _mark_synced(self, cursor: str | None = None) -> None:
+        """Report that every new or changed item of this source was listed.
+
+        Args:
+            cursor: Position of the source the next run starts from, if any
+        """
+        sync_tracker = getattr(self, "_sync_tracker", None)
+        if sync_tracker is None:
+            return
+        if cursor is None:
+            sync_tracker.mark_synced(self.config.source_type, self.config.source)
+        else:
+            sync_tracker.mark_synced(
+                self.config.source_type, self.config.source, cursor=cursor
+            )
+
     @abstractmethod
     async def get_documents(self) -> list[Document]:
         """Get documents from the source."""
+
+    async def iter_documents(self) -> AsyncIterator[Document]:
+        """Yield documents from the source as they become available.
+
+        Connectors that page through their source should override this so the
+        ingestion pipeline can start processing before the whole source has
+        been fetched. The default implementation falls back to
+        :meth:`get_documents`.
+        """
+        for document in await self.get_documents():
+            yield document
@@ -44,6 +44,23 @@ class ConfluenceSpaceConfig(SourceConfig):
         ge=1,
         le=1000,
     )
+    max_concurrent_requests: int = Field(
+        default=4,
+        description="Maximum number of content items processed concurrently, and of connections to the Confluence host",
+        ge=1,
+        le=32,
+    )
+
+    # Incremental sync
+    track_last_sync: bool = Field(
+        default=False,
+        description="Only list the content modified since the last successful run. The ids of all content are still listed to detect deletions.",
+    )
+    sync_overlap_minutes: int = Field(
+        default=10,
+        description="Minutes subtracted from the last sync time, to allow for clock skew between Confluence and the loader",
+        ge=0,
+    )
 
     include_labels: list[str] = Field(
         default=[],
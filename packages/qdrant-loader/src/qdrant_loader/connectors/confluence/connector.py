@@ -1,8 +1,14 @@
+import asyncio
+import math
 import re
-from datetime import datetime
-from urllib.parse import quote, urljoin
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from urllib.parse import parse_qs, quote, urljoin, urlparse
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from qdrant_loader.config.types import SourceType
 from qdrant_loader.connectors.base import BaseConnector
@@ -17,12 +23,24 @@ from qdrant_loader.connectors.confluence.config import (
 from qdrant_loader.connectors.confluence.mappers import (
     extract_hierarchy_info as _extract_hierarchy_info_helper,
 )
+from qdrant_loader.connectors.confluence.pagination import (
+    CONTENT_EXPAND as _CONTENT_EXPAND,
+)
+from qdrant_loader.connectors.confluence.pagination import (
+    LISTING_EXPAND as _LISTING_EXPAND,
+)
+from qdrant_loader.connectors.confluence.pagination import (
+    PAGE_SIZE as _PAGE_SIZE,
+)
 from qdrant_loader.connectors.confluence.pagination import (
     build_cloud_search_params as _build_cloud_params,
 )
 from qdrant_loader.connectors.confluence.pagination import (
     build_dc_search_params as _build_dc_params,
 )
+from qdrant_loader.connectors.confluence.pagination import (
+    build_id_search_params as _build_id_params,
+)
 from qdrant_loader.connectors.shared.attachments import AttachmentReader
 from qdrant_loader.connectors.shared.attachments.metadata import (
     confluence_attachment_to_metadata,
@@ -31,7 +49,10 @@ from qdrant_loader.connectors.shared.http import (
     RateLimiter,
 )
 from qdrant_loader.connectors.shared.http import (
-    request_with_policy as _http_request_with_policy,
+    create_async_client_for_session as _create_client,
+)
+from qdrant_loader.connectors.shared.http import (
+    httpx_request_with_policy as _http_request_with_policy,
 )
 from qdrant_loader.core.attachment_downloader import AttachmentMetadata
 from qdrant_loader.core.document import Document
@@ -44,6 +65,11 @@ from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Changed content items fetched in full per request after a listing
+_FETCH_BATCH_SIZE = 25
+# Content ids listed per request when looking for deleted content
+_ID_LISTING_PAGE_SIZE = 200
+
 
 class ConfluenceConnector(BaseConnector):
     """Connector for Atlassian Confluence."""
@@ -58,8 +84,15 @@ class ConfluenceConnector(BaseConnector):
         self.config = config
         self.base_url = config.base_url
 
-        # Initialize session
+        # The session holds the credentials and downloads attachments; API
+        # requests go through a pooled async client created on first use
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=config.max_concurrent_requests, pool_block=True
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._client: httpx.AsyncClient | None = None
         # Rate limiter (configurable RPM)
         self._rate_limiter = RateLimiter.per_minute(
             getattr(self.config, "requests_per_minute", 60)
@@ -131,8 +164,19 @@ class ConfluenceConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         self._initialized = False
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled async client of the Confluence host, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = _create_client(
+                self.session, max_connections=self.config.max_concurrent_requests
+            )
+        return self._client
+
     def _get_api_url(self, endpoint: str) -> str:
         """Construct the full API URL for an endpoint.
 
@@ -156,15 +200,12 @@ class ConfluenceConnector(BaseConnector):
             dict: Response data
 
         Raises:
-            requests.exceptions.RequestException: If the request fails
+            httpx.HTTPError: If the request fails
         """
         url = self._get_api_url(endpoint)
         try:
-            if not self.session.headers.get("Authorization"):
-                kwargs["auth"] = self.session.auth
-
             response = await _http_request_with_policy(
-                self.session,
+                self._get_client(),
                 method,
                 url,
                 rate_limiter=self._rate_limiter,
@@ -176,7 +217,7 @@ class ConfluenceConnector(BaseConnector):
             )
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to make request to {url}: {e}")
             logger.error(
                 "Request details",
@@ -188,18 +229,32 @@ class ConfluenceConnector(BaseConnector):
             )
             raise
 
-    async def _get_space_content_cloud(self, cursor: str | None = None) -> dict:
+    async def _get_space_content_cloud(
+        self,
+        cursor: str | None = None,
+        expand: str = _CONTENT_EXPAND,
+        limit: int = _PAGE_SIZE,
+        modified_within_minutes: int | None = None,
+    ) -> dict:
         """Fetch content from a Confluence Cloud space using cursor-based pagination.
 
         Args:
             cursor: Cursor for pagination. If None, starts from the beginning.
+            expand: Fields to expand on each content item
+            limit: Maximum number of results per page
+            modified_within_minutes: Only return content modified this recently
 
         Returns:
             dict: Response containing space content
         """
         # Build params via helper
         params = _build_cloud_params(
-            self.config.space_key, self.config.content_types, cursor
+            self.config.space_key,
+            self.config.content_types,
+            cursor,
+            expand,
+            limit,
+            modified_within_minutes,
         )
 
         logger.debug(
@@ -218,17 +273,31 @@ class ConfluenceConnector(BaseConnector):
                 )
         return response
 
-    async def _get_space_content_datacenter(self, start: int = 0) -> dict:
+    async def _get_space_content_datacenter(
+        self,
+        start: int = 0,
+        expand: str = _CONTENT_EXPAND,
+        limit: int = _PAGE_SIZE,
+        modified_within_minutes: int | None = None,
+    ) -> dict:
         """Fetch content from a Confluence Data Center space using start/limit pagination.
 
         Args:
             start: Starting index for pagination. Defaults to 0.
+            expand: Fields to expand on each content item
+            limit: Maximum number of results per page
+            modified_within_minutes: Only return content modified this recently
 
         Returns:
             dict: Response containing space content
         """
         params = _build_dc_params(
-            self.config.space_key, self.config.content_types, start
+            self.config.space_key,
+            self.config.content_types,
+            start,
+            expand,
+            limit,
+            modified_within_minutes,
         )
 
         logger.debug(
@@ -239,7 +308,7 @@ class ConfluenceConnector(BaseConnector):
         response = await self._make_request("GET", "content/search", params=params)
         if response and "results" in response:
             # Only log every 10th page to reduce verbosity
-            page_num = start // 25 + 1
+            page_num = start // limit + 1
             if page_num == 1 or page_num % 10 == 0:
                 logger.debug(
                     f"Fetching Confluence Data Center documents (page {page_num}): {len(response['results'])} found",
@@ -275,6 +344,9 @@ class ConfluenceConnector(BaseConnector):
 
         Returns:
             List of attachment metadata
+
+        Raises:
+            Exception: If the attachments could not be listed
         """
         if not self.config.download_attachments:
             return []
@@ -343,6 +415,38 @@ class ConfluenceConnector(BaseConnector):
                 deployment_type=self.config.deployment_type,
                 error=str(e),
             )
+            raise
+
+    async def _process_content_item(self, content: dict) -> list[Document]:
+        """Turn a content item into its document followed by its attachments.
+
+        A failed item is reported to the sync tracker, so its stored document
+        and attachments are kept.
+
+        Returns:
+            The documents, or an empty list if the item failed
+        """
+        try:
+            document = self._process_content(content, clean_html=True)
+            if not document:
+                return []
+            attachment_docs = await self._process_attachments_for_document(
+                content, document
+            )
+            logger.debug(
+                f"Processed {content['type']} '{content['title']}' "
+                f"(ID: {content['id']}) from space {self.config.space_key}"
+            )
+            return [document, *attachment_docs]
+        except Exception as e:
+            logger.error(
+                f"Failed to process {content.get('type')} '{content.get('title')}' "
+                f"(ID: {content.get('id')}): {e!s}"
+            )
+            await self._mark_failed(
+                self._content_url(content) if content.get("id") else None,
+                content.get("id"),
+            )
             return []
 
     async def _process_attachments_for_document(
@@ -357,6 +461,10 @@ class ConfluenceConnector(BaseConnector):
             content: Confluence content item
             document: Parent document corresponding to the content item
 
+        If the attachments cannot be listed or fetched, the stored ones are
+        kept and the document loses its fingerprint, so that the next run
+        fetches the item and its attachments again.
+
         Returns:
             List of generated attachment documents (may be empty)
         """
@@ -381,6 +489,8 @@ class ConfluenceConnector(BaseConnector):
             logger.error(
                 f"Failed to process attachments for {content.get('type')} '{content.get('title')}' (ID: {content.get('id')}): {e!s}"
             )
+            document.fingerprint = None
+            await self._mark_failed(document.url, content.get("id"))
             return []
 
     def _should_process_content(self, content: dict) -> bool:
@@ -663,6 +773,7 @@ class ConfluenceConnector(BaseConnector):
                 is_deleted=False,
                 updated_at=parsed_updated_at,
                 created_at=parsed_created_at,
+                fingerprint=self._content_fingerprint(content),
             )
 
             return document
@@ -792,162 +903,264 @@ class ConfluenceConnector(BaseConnector):
         text = re.sub(r"\s+", " ", text)
         return text.strip()
 
-    async def get_documents(self) -> list[Document]:
-        """Fetch and process documents from Confluence.
+    async def _iter_content_to_fetch(self) -> AsyncIterator[dict]:
+        """Yield the content items to turn into documents.
 
-        Returns:
-            list[Document]: List of processed documents
+        Without a fetch filter the space is paged through with full bodies.
+        Otherwise the space is first listed without bodies, and only items
+        whose version changed are fetched in full, a page of ids at a time.
+        With ``track_last_sync`` only the content modified since the last
+        successful run, less the overlap, is listed with versions; the ids
+        of all content are then listed so deleted content is still detected.
         """
-        documents = []
-        page_count = 0
-        total_documents = 0
-
-        if self.config.deployment_type == ConfluenceDeploymentType.CLOUD:
-            # Cloud uses cursor-based pagination
-            cursor = None
+        if self._fetch_filter is None:
+            async for content in self._iter_space_content():
+                yield content
+            return
+
+        modified_after = None
+        last_synced_at = await self._last_synced_at()
+        if self.config.track_last_sync and last_synced_at is not None:
+            modified_after = last_synced_at - timedelta(
+                minutes=self.config.sync_overlap_minutes
+            )
+            logger.info(
+                "Listing Confluence content modified since the last sync",
+                space_key=self.config.space_key,
+                modified_after=modified_after.isoformat(),
+            )
 
-            while True:
-                try:
-                    page_count += 1
-                    logger.debug(
-                        f"Fetching page {page_count} of Confluence content (cursor={cursor})"
+        async def _candidates():
+            async for content in self._iter_space_content(
+                expand=_LISTING_EXPAND, modified_after=modified_after
+            ):
+                if self._should_process_content(content):
+                    yield (
+                        content,
+                        self._content_url(content),
+                        self._content_fingerprint(content),
+                        content.get("id"),
                     )
-                    response = await self._get_space_content_cloud(cursor)
-                    results = response.get("results", [])
 
-                    if not results:
-                        logger.debug("No more results found, ending pagination")
-                        break
+        pending: list[dict] = []
+        async for content in self._iter_to_fetch(_candidates()):
+            pending.append(content)
+            if len(pending) >= _FETCH_BATCH_SIZE:
+                for full_content in await self._get_contents_by_id(pending):
+                    yield full_content
+                pending = []
+        if pending:
+            for full_content in await self._get_contents_by_id(pending):
+                yield full_content
+
+        if modified_after is not None:
+            # Content not modified since the last sync was not listed above
+            async for content in self._iter_space_content(
+                expand="", limit=_ID_LISTING_PAGE_SIZE
+            ):
+                await self._mark_listed(self._content_url(content), content.get("id"))
+        self._mark_synced()
 
-                    total_documents += len(results)
-                    logger.debug(
-                        f"Processing {len(results)} documents from page {page_count}"
-                    )
+    async def _iter_space_content(
+        self,
+        expand: str | None = None,
+        limit: int | None = None,
+        modified_after: datetime | None = None,
+    ) -> AsyncIterator[dict]:
+        """Page through the content of the space.
 
-                    # Process each content item
-                    for content in results:
-                        if self._should_process_content(content):
-                            try:
-                                document = self._process_content(
-                                    content, clean_html=True
-                                )
-                                if document:
-                                    documents.append(document)
-
-                                    attachment_docs = (
-                                        await self._process_attachments_for_document(
-                                            content, document
-                                        )
-                                    )
-                                    documents.extend(attachment_docs)
-
-                                    logger.debug(
-                                        f"Processed {content['type']} '{content['title']}' "
-                                        f"(ID: {content['id']}) from space {self.config.space_key}"
-                                    )
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to process {content['type']} '{content['title']}' "
-                                    f"(ID: {content['id']}): {e!s}"
-                                )
-
-                    # Get the next cursor from the response
-                    next_url = response.get("_links", {}).get("next")
-                    if not next_url:
-                        logger.debug("No next page link found, ending pagination")
-                        break
-
-                    # Extract just the cursor value from the URL
-                    try:
-                        from urllib.parse import parse_qs, urlparse
-
-                        parsed_url = urlparse(next_url)
-                        query_params = parse_qs(parsed_url.query)
-                        cursor = query_params.get("cursor", [None])[0]
-                        if not cursor:
-                            logger.debug(
-                                "No cursor found in next URL, ending pagination"
-                            )
-                            break
-                        logger.debug(f"Found next cursor: {cursor}")
-                    except Exception as e:
-                        logger.error(f"Failed to parse next URL: {e!s}")
-                        break
+        The next page is requested before the items of the current one are
+        handed to the consumer.
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to fetch content from space {self.config.space_key}: {e!s}"
-                    )
-                    raise
-        else:
-            # Data Center/Server uses start/limit pagination
-            start = 0
-            limit = 25
+        Args:
+            expand: Fields to expand instead of the full content, or an empty
+                string to list ids only
+            limit: Number of results per page instead of the default
+            modified_after: Only list the content modified since this time
 
-            while True:
-                try:
+        Yields:
+            Content items from the search results
+        """
+        # Only pass custom arguments, keeping the default request unchanged
+        kwargs: dict = {}
+        if expand is not None:
+            kwargs["expand"] = expand
+        if limit is not None:
+            kwargs["limit"] = limit
+        if modified_after is not None:
+            kwargs["modified_within_minutes"] = self._minutes_since(modified_after)
+        is_cloud = self.config.deployment_type == ConfluenceDeploymentType.CLOUD
+        # Data Center/Server uses start/limit pagination, Cloud uses cursors
+        page_size = limit or _PAGE_SIZE
+
+        async def _fetch_page(position: str | int | None) -> dict:
+            try:
+                if is_cloud:
+                    return await self._get_space_content_cloud(position, **kwargs)  # type: ignore[arg-type]
+                return await self._get_space_content_datacenter(position, **kwargs)  # type: ignore[arg-type]
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch content from space {self.config.space_key}: {e!s}"
+                )
+                raise
+
+        page_count = 1
+        logger.debug("Fetching page 1 of Confluence content")
+        next_page: asyncio.Task | None = asyncio.create_task(
+            _fetch_page(None if is_cloud else 0)
+        )
+        start = 0
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
+                results = response.get("results", [])
+                if not results:
+                    logger.debug("No more results found, ending pagination")
+                    break
+                logger.debug(
+                    f"Processing {len(results)} documents from page {page_count}"
+                )
+
+                if is_cloud:
+                    position: str | int | None = self._next_cursor(response)
+                else:
+                    # The server may cap the limit
+                    step = response.get("limit") or page_size
+                    total_size = response.get("totalSize", response.get("size", 0))
+                    position = start + step if start + step < total_size else None
+                    if position is None:
+                        logger.debug(
+                            f"Reached end of results: {start + step} >= {total_size}"
+                        )
+                    else:
+                        start = position
+
+                # Request the next page while this one is being processed
+                if position is not None:
                     page_count += 1
                     logger.debug(
-                        f"Fetching page {page_count} of Confluence content (start={start})"
+                        f"Fetching page {page_count} of Confluence content (position={position})"
                     )
-                    response = await self._get_space_content_datacenter(start)
-                    results = response.get("results", [])
+                    next_page = asyncio.create_task(_fetch_page(position))
+
+                for content in results:
+                    yield content
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    @staticmethod
+    def _next_cursor(response: dict) -> str | None:
+        """Cursor of the next page of a Cloud search, or None on the last page."""
+        next_url = response.get("_links", {}).get("next")
+        if not next_url:
+            logger.debug("No next page link found, ending pagination")
+            return None
 
-                    if not results:
-                        logger.debug("No more results found, ending pagination")
-                        break
+        try:
+            query_params = parse_qs(urlparse(next_url).query)
+        except Exception as e:
+            logger.error(f"Failed to parse next URL: {e!s}")
+            return None
+        cursor = query_params.get("cursor", [None])[0]
+        if not cursor:
+            logger.debug("No cursor found in next URL, ending pagination")
+            return None
+        logger.debug(f"Found next cursor: {cursor}")
+        return cursor
 
-                    total_documents += len(results)
-                    logger.debug(
-                        f"Processing {len(results)} documents from page {page_count}"
-                    )
+    async def _get_contents_by_id(self, listed: list[dict]) -> list[dict]:
+        """Fetch listed content items in full by id.
 
-                    # Process each content item
-                    for content in results:
-                        if self._should_process_content(content):
-                            try:
-                                document = self._process_content(
-                                    content, clean_html=True
-                                )
-                                if document:
-                                    documents.append(document)
-
-                                    attachment_docs = (
-                                        await self._process_attachments_for_document(
-                                            content, document
-                                        )
-                                    )
-                                    documents.extend(attachment_docs)
-
-                                    logger.debug(
-                                        f"Processed {content['type']} '{content['title']}' "
-                                        f"(ID: {content['id']}) from space {self.config.space_key}"
-                                    )
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to process {content['type']} '{content['title']}' "
-                                    f"(ID: {content['id']}): {e!s}"
-                                )
-
-                    # Check if there are more pages
-                    total_size = response.get("totalSize", response.get("size", 0))
-                    if start + limit >= total_size:
-                        logger.debug(
-                            f"Reached end of results: {start + limit} >= {total_size}"
-                        )
-                        break
+        Items that do not come back, for instance because they were deleted
+        since they were listed, are reported to the sync tracker as failed.
 
-                    # Move to next page
-                    start += limit
-                    logger.debug(f"Moving to next page with start={start}")
+        Args:
+            listed: Content items as listed, without bodies
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to fetch content from space {self.config.space_key}: {e!s}"
-                    )
-                    raise
+        Returns:
+            list[dict]: Content items with bodies, comments and hierarchy
+        """
+        content_ids = [str(content["id"]) for content in listed]
+        response = await self._make_request(
+            "GET", "content/search", params=_build_id_params(content_ids)
+        )
+        results = response.get("results", []) if response else []
+        returned = {str(content.get("id")) for content in results}
+        for content in listed:
+            if str(content["id"]) not in returned:
+                logger.warning(
+                    "Confluence content was not returned by id",
+                    content_id=content["id"],
+                    space_key=self.config.space_key,
+                )
+                await self._mark_failed(self._content_url(content), content["id"])
+        return results
+
+    @staticmethod
+    def _minutes_since(moment: datetime) -> int:
+        """Whole minutes elapsed since a time, rounded up."""
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+        elapsed = (datetime.now(UTC) - moment).total_seconds()
+        return max(math.ceil(elapsed / 60), 0)
+
+    def _content_url(self, content: dict) -> str:
+        """Canonical document URL of a content item."""
+        return self._construct_canonical_page_url(
+            content.get("space", {}).get("key") or self.config.space_key,
+            content.get("id") or "",
+            content.get("type", "page"),
+        )
+
+    @staticmethod
+    def _content_fingerprint(content: dict) -> str | None:
+        """Version number of a content item, which changes on every edit."""
+        version = content.get("version")
+        number = version.get("number") if isinstance(version, dict) else None
+        return str(number) if number is not None else None
+
+    async def get_documents(self) -> list[Document]:
+        """Fetch and process documents from Confluence.
+
+        Returns:
+            list[Document]: List of processed documents
+        """
+        return [document async for document in self.iter_documents()]
+
+    async def iter_documents(self) -> AsyncIterator[Document]:
+        """Fetch and process documents from Confluence one page at a time.
+
+        Up to ``max_concurrent_requests`` content items are processed
+        concurrently, each with its attachments, while the next page of
+        results is fetched. Documents are yielded in listing order as soon as
+        their item is done, so only about a page of content is held in memory.
+
+        Yields:
+            Document: Processed pages, blog posts and their attachments
+        """
+        document_count = 0
+        # Items being processed, in listing order; the next result page is
+        # prefetched by the listing meanwhile
+        pending: deque[asyncio.Task] = deque()
+        try:
+            async for content in self._iter_content_to_fetch():
+                if not self._should_process_content(content):
+                    continue
+                pending.append(asyncio.create_task(self._process_content_item(content)))
+                if len(pending) >= self.config.max_concurrent_requests:
+                    for document in await pending.popleft():
+                        document_count += 1
+                        yield document
+            while pending:
+                for document in await pending.popleft():
+                    document_count += 1
+                    yield document
+        finally:
+            for task in pending:
+                task.cancel()
 
         logger.info(
-            f"📄 Confluence: {len(documents)} documents from space {self.config.space_key}"
+            f"📄 Confluence: {document_count} documents from space {self.config.space_key}"
         )
-        return documents
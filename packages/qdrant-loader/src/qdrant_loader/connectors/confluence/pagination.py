@@ -4,6 +4,14 @@ import re
 from typing import Any
 
 _ALLOWED_TOKEN_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+_CONTENT_ID_RE = re.compile(r"^[0-9]+$")
+
+# Everything needed to turn a content item into a document
+CONTENT_EXPAND = "body.storage,version,metadata.labels,history,space,extensions.position,children.comment.body.storage,ancestors,children.page"
+# Enough to decide whether a content item changed, without bodies
+LISTING_EXPAND = "version,space,metadata.labels"
+# Default number of results per search page
+PAGE_SIZE = 25
 
 
 def _quote_cql_literal(value: str) -> str:
@@ -31,34 +39,61 @@ def _sanitize_content_types(content_types: list[str]) -> list[str]:
     return sanitized
 
 
-def build_cloud_search_params(
-    space_key: str, content_types: list[str] | None, cursor: str | None
-) -> dict[str, Any]:
-    params: dict[str, Any] = {
-        "expand": "body.storage,version,metadata.labels,history,space,extensions.position,children.comment.body.storage,ancestors,children.page",
-        "limit": 25,
-    }
+def _build_space_cql(
+    space_key: str,
+    content_types: list[str] | None,
+    modified_within_minutes: int | None,
+) -> str:
     cql = f"space = {_sanitize_space_key(space_key)}"
     if content_types:
         safe_types = _sanitize_content_types(content_types)
         cql += f" and type in ({','.join(safe_types)})"
-    params["cql"] = cql
+    if modified_within_minutes is not None:
+        # Relative to the server clock, as absolute CQL dates are read in the
+        # user's time zone
+        cql += f' and lastmodified >= now("-{int(modified_within_minutes)}m")'
+    return cql
+
+
+def build_cloud_search_params(
+    space_key: str,
+    content_types: list[str] | None,
+    cursor: str | None,
+    expand: str = CONTENT_EXPAND,
+    limit: int = PAGE_SIZE,
+    modified_within_minutes: int | None = None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"limit": limit}
+    if expand:
+        params["expand"] = expand
+    params["cql"] = _build_space_cql(space_key, content_types, modified_within_minutes)
     if cursor is not None:
         params["cursor"] = cursor
     return params
 
 
 def build_dc_search_params(
-    space_key: str, content_types: list[str] | None, start: int
+    space_key: str,
+    content_types: list[str] | None,
+    start: int,
+    expand: str = CONTENT_EXPAND,
+    limit: int = PAGE_SIZE,
+    modified_within_minutes: int | None = None,
 ) -> dict[str, Any]:
-    params: dict[str, Any] = {
-        "expand": "body.storage,version,metadata.labels,history,space,extensions.position,children.comment.body.storage,ancestors,children.page",
-        "limit": 25,
-        "start": start,
-    }
-    cql = f"space = {_sanitize_space_key(space_key)}"
-    if content_types:
-        safe_types = _sanitize_content_types(content_types)
-        cql += f" and type in ({','.join(safe_types)})"
-    params["cql"] = cql
+    params: dict[str, Any] = {"limit": limit, "start": start}
+    if expand:
+        params["expand"] = expand
+    params["cql"] = _build_space_cql(space_key, content_types, modified_within_minutes)
     return params
+
+
+def build_id_search_params(content_ids: list[str]) -> dict[str, Any]:
+    """Search parameters fetching the given content items in full."""
+    for content_id in content_ids:
+        if not _CONTENT_ID_RE.fullmatch(content_id):
+            raise ValueError(f"Invalid Confluence content id: {content_id!r}")
+    return {
+        "cql": f"id in ({','.join(content_ids)})",
+        "expand": CONTENT_EXPAND,
+        "limit": len(content_ids),
+    }
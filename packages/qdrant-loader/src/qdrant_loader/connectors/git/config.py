@@ -32,11 +32,24 @@ class GitRepoConfig(SourceConfig):
         default=1048576, description="Maximum file size in bytes"
     )  # 1MB
     depth: int = Field(default=1, description="Depth of the repository to clone")
+    max_concurrent_files: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum number of files read and processed concurrently",
+    )
     token: str = Field(..., description="Authentication token for the repository")
 
     temp_dir: str | None = Field(
         None, description="Temporary directory where the repository is cloned"
     )
+    mirror_dir: str | None = Field(
+        None,
+        description=(
+            "Directory keeping a persistent clone of the repository, fetched into "
+            "on each run instead of cloning again"
+        ),
+    )
 
     @field_validator("base_url")
     @classmethod
@@ -1,8 +1,14 @@
 """Git repository connector implementation."""
 
+import asyncio
+import hashlib
+import json
 import os
 import shutil
 import tempfile
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 
 from qdrant_loader.config.types import SourceType
 from qdrant_loader.connectors.base import BaseConnector
@@ -34,8 +40,10 @@ class GitConnector(BaseConnector):
         super().__init__(config)
         self.config = config
         self.temp_dir = None  # Will be set in __enter__
-        self.metadata_extractor = GitMetadataExtractor(config=self.config)
         self.git_ops = GitOperations()
+        self.metadata_extractor = GitMetadataExtractor(
+            config=self.config, git_ops=self.git_ops
+        )
         self.file_processor = None  # Will be initialized in __enter__
         self.logger = LoggingConfig.get_logger(__name__)
         self.logger.debug("Initializing GitConnector")
@@ -65,8 +73,8 @@ class GitConnector(BaseConnector):
     async def __aenter__(self):
         """Async context manager entry."""
         try:
-            # Create temporary directory
-            self.temp_dir = tempfile.mkdtemp()
+            # Create temporary directory, or reuse the persistent mirror
+            self.temp_dir = self._create_working_dir()
             self.config.temp_dir = (
                 self.temp_dir
             )  # Update config with the actual temp dir
@@ -97,13 +105,7 @@ class GitConnector(BaseConnector):
             )
 
             try:
-                self.git_ops.clone(
-                    url=str(self.config.base_url),
-                    to_path=self.temp_dir,
-                    branch=self.config.branch,
-                    depth=self.config.depth,
-                    auth_token=auth_token,
-                )
+                self._clone_or_fetch(auth_token)
             except Exception as clone_error:
                 self.logger.error(
                     "Failed to clone repository",
@@ -166,8 +168,8 @@ class GitConnector(BaseConnector):
         """Synchronous context manager entry."""
         if not self._initialized:
             self._initialized = True
-            # Create temporary directory
-            self.temp_dir = tempfile.mkdtemp()
+            # Create temporary directory, or reuse the persistent mirror
+            self.temp_dir = self._create_working_dir()
             self.config.temp_dir = (
                 self.temp_dir
             )  # Update config with the actual temp dir
@@ -198,13 +200,7 @@ class GitConnector(BaseConnector):
             )
 
             try:
-                self.git_ops.clone(
-                    url=str(self.config.base_url),
-                    to_path=self.temp_dir,
-                    branch=self.config.branch,
-                    depth=self.config.depth,
-                    auth_token=auth_token,
-                )
+                self._clone_or_fetch(auth_token)
             except Exception as clone_error:
                 self.logger.error(
                     "Failed to clone repository",
@@ -248,8 +244,65 @@ class GitConnector(BaseConnector):
         """Clean up resources."""
         self._cleanup()
 
+    def _mirror_path(self) -> str | None:
+        """Directory of the persistent clone of this repository, if configured."""
+        if not self.config.mirror_dir:
+            return None
+        url_hash = hashlib.sha256(str(self.config.base_url).encode()).hexdigest()
+        return os.path.join(
+            self.config.mirror_dir, f"{self.config.source}-{url_hash[:12]}"
+        )
+
+    def _create_working_dir(self) -> str:
+        """Create the directory the repository is checked out in."""
+        mirror_path = self._mirror_path()
+        if mirror_path is None:
+            return tempfile.mkdtemp()
+        os.makedirs(mirror_path, exist_ok=True)
+        return mirror_path
+
+    def _clone_or_fetch(self, auth_token: str | None) -> None:
+        """Fetch into the persistent mirror if it exists, else clone."""
+        url = str(self.config.base_url)
+        mirror_path = self._mirror_path()
+        if mirror_path and os.path.isdir(os.path.join(mirror_path, ".git")):
+            try:
+                self.git_ops.fetch(
+                    url=url,
+                    to_path=mirror_path,
+                    branch=self.config.branch,
+                    depth=self.config.depth,
+                    auth_token=auth_token,
+                )
+                return
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to update repository mirror, cloning it again",
+                    mirror_path=mirror_path,
+                    error=str(e),
+                )
+                shutil.rmtree(mirror_path, ignore_errors=True)
+                os.makedirs(mirror_path, exist_ok=True)
+
+        self.git_ops.clone(
+            url=url,
+            to_path=self.temp_dir,
+            branch=self.config.branch,
+            depth=self.config.depth,
+            auth_token=auth_token,
+        )
+        if mirror_path and auth_token and self.git_ops.repo:
+            # Do not keep the token in the mirror's config; fetches pass it again
+            try:
+                self.git_ops.repo.git.remote("set-url", "origin", url)
+            except Exception as e:
+                self.logger.debug(f"Failed to reset the mirror's remote URL: {e}")
+
     def _cleanup(self):
         """Clean up temporary directory."""
+        if self._mirror_path() is not None:
+            # The mirror is kept for the next run
+            return
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
                 shutil.rmtree(self.temp_dir)
@@ -257,11 +310,40 @@ class GitConnector(BaseConnector):
             except Exception as e:
                 self.logger.error(f"Failed to clean up temporary directory: {e}")
 
-    def _process_file(self, file_path: str) -> Document:
+    def _relative_path(self, file_path: str) -> str:
+        """Get the path of a file relative to the repository root."""
+        rel_path = os.path.relpath(file_path, self.temp_dir)
+
+        # Fix cross-platform path issues: ensure we get a proper relative path
+        # If relpath returns a path that goes up directories (contains ..),
+        # it means the path calculation failed (common with mixed path styles)
+        if rel_path.startswith("..") and self.temp_dir:
+            # Fallback: try to extract relative path manually
+            if file_path.startswith(self.temp_dir):
+                # Remove temp_dir prefix and any leading separators
+                rel_path = (
+                    file_path[len(self.temp_dir) :]
+                    .lstrip(os.sep)
+                    .lstrip("/")
+                    .lstrip("\\")
+                )
+            else:
+                # Last resort: use basename
+                rel_path = os.path.basename(file_path)
+        return rel_path
+
+    def _document_url(self, rel_path: str) -> str:
+        """Build the URL of the document for a repository file."""
+        # Normalize path separators for URL (use forward slashes on all platforms)
+        normalized_rel_path = rel_path.replace(os.sep, "/").replace("\\", "/")
+        return f"{str(self.config.base_url).replace('.git', '')}/blob/{self.config.branch}/{normalized_rel_path}"
+
+    def _process_file(self, file_path: str, fingerprint: str | None = None) -> Document:
         """Process a single file.
 
         Args:
             file_path: Path to the file
+            fingerprint: Blob SHA of the file, stored with its state
 
         Returns:
             Document instance with file content and metadata
@@ -271,32 +353,10 @@ class GitConnector(BaseConnector):
         """
         try:
             # Get relative path from repository root
-            rel_path = os.path.relpath(file_path, self.temp_dir)
-
-            # Fix cross-platform path issues: ensure we get a proper relative path
-            # If relpath returns a path that goes up directories (contains ..),
-            # it means the path calculation failed (common with mixed path styles)
-            if rel_path.startswith("..") and self.temp_dir:
-                # Fallback: try to extract relative path manually
-                if file_path.startswith(self.temp_dir):
-                    # Remove temp_dir prefix and any leading separators
-                    rel_path = (
-                        file_path[len(self.temp_dir) :]
-                        .lstrip(os.sep)
-                        .lstrip("/")
-                        .lstrip("\\")
-                    )
-                else:
-                    # Last resort: use basename
-                    rel_path = os.path.basename(file_path)
+            rel_path = self._relative_path(file_path)
 
             # Check if file needs conversion
-            needs_conversion = (
-                self.config.enable_file_conversion
-                and self.file_detector
-                and self.file_converter
-                and self.file_detector.is_supported_for_conversion(file_path)
-            )
+            needs_conversion = self._needs_conversion(file_path)
 
             if needs_conversion:
                 self.logger.debug("File needs conversion", file_path=rel_path)
@@ -364,8 +424,6 @@ class GitConnector(BaseConnector):
             self.logger.debug(f"Processed Git file: /{rel_path!s}")
 
             # Create document
-            # Normalize path separators for URL (use forward slashes on all platforms)
-            normalized_rel_path = rel_path.replace(os.sep, "/").replace("\\", "/")
             git_document = Document(
                 title=os.path.basename(file_path),
                 content=content,
@@ -373,10 +431,11 @@ class GitConnector(BaseConnector):
                 metadata=metadata,
                 source_type=SourceType.GIT,
                 source=self.config.source,
-                url=f"{str(self.config.base_url).replace('.git', '')}/blob/{self.config.branch}/{normalized_rel_path}",
+                url=self._document_url(rel_path),
                 is_deleted=False,
                 created_at=first_commit_date,
                 updated_at=last_commit_date,
+                fingerprint=fingerprint,
             )
 
             return git_document
@@ -395,34 +454,99 @@ class GitConnector(BaseConnector):
         Raises:
             Exception: If document retrieval fails
         """
-        try:
-            self._ensure_initialized()
-            try:
-                files = (
-                    self.git_ops.list_files()
-                )  # This will raise ValueError if not initialized
-            except ValueError as e:
-                self.logger.error("Failed to list files", error=str(e))
-                raise ValueError("Repository not initialized") from e
+        return [document async for document in self.iter_documents()]
 
-            documents = []
+    async def iter_documents(self) -> AsyncIterator[Document]:
+        """Yield documents from the repository as files are processed.
 
-            for file_path in files:
-                if not self.file_processor.should_process_file(file_path):  # type: ignore
-                    continue
+        When the commit indexed by the last successful run is known and in
+        the clone, only the files changed since that commit are read, and
+        the files deleted or renamed since are reported as deleted.
 
-                try:
-                    document = self._process_file(file_path)
-                    documents.append(document)
+        Up to ``max_concurrent_files`` files are read and have their metadata
+        extracted concurrently in a thread pool. Documents are yielded in
+        listing order.
 
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to process file", file_path=file_path, error=str(e)
+        Yields:
+            Document: Processed repository files
+
+        Raises:
+            Exception: If document retrieval fails
+        """
+        try:
+            self._ensure_initialized()
+            head_commit = self.git_ops.get_head_commit()
+            changes = self._changed_files_since(
+                await self._last_sync_cursor(), head_commit
+            )
+            if changes is None:
+                try:
+                    files = (
+                        self.git_ops.list_files()
+                    )  # This will raise ValueError if not initialized
+                except ValueError as e:
+                    self.logger.error("Failed to list files", error=str(e))
+                    raise ValueError("Repository not initialized") from e
+            else:
+                files, deleted_files = changes
+                self.logger.info(
+                    "Listing files changed since the last indexed commit",
+                    changed=len(files),
+                    deleted=len(deleted_files),
+                )
+                self._keep_unlisted()
+                for file_path in deleted_files:
+                    self._mark_deleted(
+                        self._document_url(self._relative_path(file_path))
                     )
-                    continue
 
-            # Return all documents that need to be processed
-            return documents
+            blob_shas = self.git_ops.list_blob_shas()
+            failed = False
+            executor = ThreadPoolExecutor(
+                max_workers=self.config.max_concurrent_files,
+                thread_name_prefix="git-files",
+            )
+
+            async def _candidates():
+                for file_path in files:
+                    url = self._document_url(self._relative_path(file_path))
+                    if not self.file_processor.should_process_file(file_path):  # type: ignore
+                        if changes is not None:
+                            # A changed file may no longer qualify, e.g. grown too large
+                            self._mark_deleted(url)
+                        continue
+                    yield file_path, url, blob_shas.get(file_path), None
+
+            pending: deque[asyncio.Task] = deque()
+            try:
+                # Unchanged blobs are skipped before reading content and history
+                async for file_path in self._iter_to_fetch(_candidates()):
+                    blob_sha = blob_shas.get(file_path)
+                    pending.append(
+                        asyncio.create_task(
+                            self._read_file(executor, file_path, blob_sha)
+                        )
+                    )
+                    if len(pending) >= self.config.max_concurrent_files:
+                        document = await pending.popleft()
+                        if document is None:
+                            failed = True
+                        else:
+                            yield document
+                while pending:
+                    document = await pending.popleft()
+                    if document is None:
+                        failed = True
+                    else:
+                        yield document
+            finally:
+                for task in pending:
+                    task.cancel()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            # Files that failed are listed again by the next run
+            if not failed:
+                self._mark_synced(self._sync_cursor(head_commit))
 
         except ValueError as e:
             # Re-raise ValueError to maintain the error type
@@ -432,6 +556,90 @@ class GitConnector(BaseConnector):
             self.logger.error("Failed to get documents", error=str(e))
             raise
 
+    def _needs_conversion(self, file_path: str) -> bool:
+        """Whether a file is converted to markdown rather than read as text."""
+        return bool(
+            self.config.enable_file_conversion
+            and self.file_detector
+            and self.file_converter
+            and self.file_detector.is_supported_for_conversion(file_path)
+        )
+
+    async def _read_file(
+        self, executor: ThreadPoolExecutor, file_path: str, blob_sha: str | None
+    ) -> Document | None:
+        """Process a file in the file pool.
+
+        In-process conversions run on the event loop thread, as their timeout
+        relies on ``SIGALRM``, which only the main thread can receive.
+        Conversions in worker processes are waited for in the pool.
+
+        A file that fails is reported to the sync tracker, so its stored
+        document is kept.
+
+        Returns:
+            The document, or None if the file could not be processed
+        """
+        try:
+            if self._needs_conversion(file_path) and not (
+                self.file_converter and self.file_converter.uses_worker_processes
+            ):
+                return self._process_file(file_path, blob_sha)
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, self._process_file, file_path, blob_sha
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to process file", file_path=file_path, error=str(e)
+            )
+            await self._mark_failed(self._document_url(self._relative_path(file_path)))
+            return None
+
+    def _listing_fingerprint(self) -> str:
+        """Hash of the settings that decide which files are listed and how."""
+        settings = self.config.model_dump(
+            mode="json",
+            include={
+                "base_url",
+                "branch",
+                "include_paths",
+                "exclude_paths",
+                "file_types",
+                "max_file_size",
+                "enable_file_conversion",
+            },
+        )
+        encoded = json.dumps(settings, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:12]
+
+    def _sync_cursor(self, commit: str) -> str:
+        """Position stored for the next run: the commit and listing settings."""
+        return f"{commit}:{self._listing_fingerprint()}"
+
+    def _changed_files_since(
+        self, cursor: str | None, head_commit: str
+    ) -> tuple[list[str], list[str]] | None:
+        """Files changed and deleted since the commit of the last run.
+
+        Returns:
+            Changed and deleted file paths, or None if every file must be listed
+        """
+        if not cursor:
+            return None
+        commit, _, fingerprint = cursor.partition(":")
+        if fingerprint != self._listing_fingerprint():
+            self.logger.info("Git source settings changed, listing all files")
+            return None
+        try:
+            return self.git_ops.diff_files(commit, head_commit)
+        except Exception as e:
+            self.logger.warning(
+                "Cannot compare with the last indexed commit, listing all files",
+                commit=commit,
+                error=str(e),
+            )
+            return None
+
     def _ensure_initialized(self):
         """Ensure the repository is initialized before performing operations."""
         if not self._initialized:
@@ -1,9 +1,9 @@
 """File processing and filtering logic for Git connector."""
 
-import fnmatch
 import os
 from typing import TYPE_CHECKING, Optional
 
+from qdrant_loader.connectors.shared.paths import PathMatcher, compile_path_matcher
 from qdrant_loader.utils.logging import LoggingConfig
 
 if TYPE_CHECKING:
@@ -34,6 +34,12 @@ class FileProcessor:
         self.file_detector = file_detector
         self.logger = LoggingConfig.get_logger(__name__)
 
+    def _matcher(self) -> PathMatcher:
+        """Include/exclude patterns of the current configuration, compiled."""
+        return compile_path_matcher(
+            tuple(self.config.include_paths), tuple(self.config.exclude_paths)
+        )
+
     def should_process_file(self, file_path: str) -> bool:
         """Check if a file should be processed based on configuration.
 
@@ -91,32 +97,9 @@ class FileProcessor:
                 return False
 
             # Check if file matches any exclude patterns first
-            for pattern in self.config.exclude_paths:
-                pattern = pattern.lstrip("/")
-                self.logger.debug(f"Checking exclude pattern: {pattern}")
-                if pattern.endswith("/**"):
-                    dir_pattern = pattern[:-3]  # Remove /** suffix
-                    if dir_pattern == os.path.dirname(rel_path) or os.path.dirname(
-                        rel_path
-                    ).startswith(dir_pattern + "/"):
-                        self.logger.debug(
-                            f"Skipping {rel_path}: matches exclude directory pattern {pattern}"
-                        )
-                        return False
-                elif pattern.endswith("/"):
-                    dir_pattern = pattern[:-1]  # Remove trailing slash
-                    if os.path.dirname(rel_path) == dir_pattern or os.path.dirname(
-                        rel_path
-                    ).startswith(dir_pattern + "/"):
-                        self.logger.debug(
-                            f"Skipping {rel_path}: matches exclude directory pattern {pattern}"
-                        )
-                        return False
-                elif fnmatch.fnmatch(rel_path, pattern):
-                    self.logger.debug(
-                        f"Skipping {rel_path}: matches exclude pattern {pattern}"
-                    )
-                    return False
+            if self._matcher().is_excluded(rel_path):
+                self.logger.debug(f"Skipping {rel_path}: matches exclude pattern")
+                return False
 
             # Check if file matches any file type patterns (case-insensitive)
             file_type_match = False
@@ -175,58 +158,10 @@ class FileProcessor:
                 return False
 
             # Check if file matches any include patterns
-            if not self.config.include_paths:
-                # If no include paths specified, include everything
-                self.logger.debug("No include paths specified, including all files")
-                return True
-
-            # Get the file's directory relative to repo root
-            rel_dir = os.path.dirname(rel_path)
-            self.logger.debug(f"Checking include patterns for directory: {rel_dir}")
-
-            for pattern in self.config.include_paths:
-                pattern = pattern.lstrip("/")
-                self.logger.debug(f"Checking include pattern: {pattern}")
-                if pattern == "" or pattern == "/":
-                    # Root pattern means include only files in root directory
-                    if rel_dir == "":
-                        self.logger.debug(f"Including {rel_path}: matches root pattern")
-                        return True
-                if pattern.endswith("/**/*"):
-                    dir_pattern = pattern[:-5]  # Remove /**/* suffix
-                    if dir_pattern == "" or dir_pattern == "/":
-                        self.logger.debug(
-                            f"Including {rel_path}: matches root /**/* pattern"
-                        )
-                        return True  # Root pattern with /**/* means include everything
-                    if dir_pattern == rel_dir or rel_dir.startswith(dir_pattern + "/"):
-                        self.logger.debug(
-                            f"Including {rel_path}: matches directory pattern {pattern}"
-                        )
-                        return True
-                elif pattern.endswith("/"):
-                    dir_pattern = pattern[:-1]  # Remove trailing slash
-                    if dir_pattern == "" or dir_pattern == "/":
-                        # Root pattern with / means include only files in root directory
-                        if rel_dir == "":
-                            self.logger.debug(
-                                f"Including {rel_path}: matches root pattern"
-                            )
-                            return True
-                    if dir_pattern == rel_dir or rel_dir.startswith(dir_pattern + "/"):
-                        self.logger.debug(
-                            f"Including {rel_path}: matches directory pattern {pattern}"
-                        )
-                        return True
-                elif fnmatch.fnmatch(rel_path, pattern):
-                    self.logger.debug(
-                        f"Including {rel_path}: matches exact pattern {pattern}"
-                    )
-                    return True
-
-            # If we have include patterns but none matched, exclude the file
-            self.logger.debug(f"Skipping {rel_path}: not in include paths")
-            return False
+            if not self._matcher().is_included(rel_path):
+                self.logger.debug(f"Skipping {rel_path}: not in include paths")
+                return False
+            return True
 
         except Exception as e:
             self.logger.error(f"Error checking if file should be processed: {e}")
@@ -1,5 +1,6 @@
 import os
 import re
+import threading
 from typing import Any
 from urllib.parse import urlparse
 
@@ -7,6 +8,7 @@ import chardet
 import git
 
 from qdrant_loader.connectors.git.config import GitRepoConfig
+from qdrant_loader.connectors.git.operations import GitOperations
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -15,14 +17,29 @@ logger = LoggingConfig.get_logger(__name__)
 class GitMetadataExtractor:
     """Extract metadata from Git repository files."""
 
-    def __init__(self, config: GitRepoConfig):
+    def __init__(self, config: GitRepoConfig, git_ops: GitOperations | None = None):
         """Initialize the Git metadata extractor.
 
         Args:
             config (GitRepoConfig): Configuration for the Git repository.
+            git_ops (GitOperations | None): Operations on the cloned repository,
+                shared so file history is only read once.
         """
         self.config = config
         self.logger = logger
+        self.git_ops = git_ops or GitOperations()
+        # Repository metadata is the same for every file, keyed by clone dir
+        self._repo_metadata: dict[str, dict[str, Any]] = {}
+        # Files are processed in a thread pool, while GitPython reads objects
+        # through a single persistent process per repository
+        self._repo_lock = threading.Lock()
+
+    def _open_repo(self) -> git.Repo:
+        """Open the cloned repository once and reuse it for every file."""
+        with self._repo_lock:
+            if self.git_ops.repo is None:
+                self.git_ops.repo = git.Repo(self.config.temp_dir)
+            return self.git_ops.repo
 
     def extract_all_metadata(self, file_path: str, content: str) -> dict[str, Any]:
         """Extract all metadata for a file.
@@ -110,6 +127,15 @@ class GitMetadataExtractor:
         Returns:
             dict[str, Any]: Dictionary containing repository metadata.
         """
+        cache_key = str(self.config.temp_dir)
+        if cache_key not in self._repo_metadata:
+            metadata = self._read_repo_metadata()
+            with self._repo_lock:
+                self._repo_metadata.setdefault(cache_key, metadata)
+        return dict(self._repo_metadata[cache_key])
+
+    def _read_repo_metadata(self) -> dict[str, Any]:
+        """Read repository metadata from the URL and Git config."""
         try:
             # Get repository URL from config
             repo_url = str(self.config.base_url)
@@ -164,7 +190,7 @@ class GitMetadataExtractor:
             }
 
             try:
-                repo = git.Repo(self.config.temp_dir)
+                repo = self._open_repo()
                 if repo and not repo.bare:
                     config = repo.config_reader()
                     # Try to get description from github section first
@@ -198,44 +224,27 @@ class GitMetadataExtractor:
     def _extract_git_metadata(self, file_path: str) -> dict[str, Any]:
         """Extract Git-specific metadata."""
         try:
-            repo = git.Repo(self.config.temp_dir)
+            repo = self._open_repo()
             metadata = {}
 
             try:
-                # Get the relative path from the repository root
-                rel_path = os.path.relpath(file_path, repo.working_dir)
-
-                # Try to get commits for the file
-                commits = list(repo.iter_commits(paths=rel_path, max_count=1))
-                if commits:
-                    last_commit = commits[0]
+                # Looked up in the file history indexed once per HEAD
+                last_commit = self.git_ops.get_last_commit(file_path)
+                if last_commit:
                     metadata.update(
                         {
                             "last_commit_date": last_commit.committed_datetime.isoformat(),
-                            "last_commit_author": last_commit.author.name,
-                            "last_commit_message": last_commit.message.strip().split(
-                                "\n"
-                            )[0],
+                            "last_commit_author": last_commit.author,
+                            "last_commit_message": last_commit.summary,
                         }
                     )
-                else:
-                    # If no commits found for the file, try getting the latest commit
-                    commits = list(repo.iter_commits(max_count=1))
-                    if commits:
-                        last_commit = commits[0]
-                        metadata.update(
-                            {
-                                "last_commit_date": last_commit.committed_datetime.isoformat(),
-                                "last_commit_author": last_commit.author.name,
-                                "last_commit_message": last_commit.message.strip().split(
-                                    "\n"
-                                )[
-                                    0
-                                ],
-                            }
-                        )
-                    else:
-                        # If still no commits found, use repository's HEAD commit
+            except Exception as e:
+                self.logger.debug(f"Failed to get commits: {e}")
+
+            if not metadata:
+                # Fall back to the repository's HEAD commit
+                try:
+                    with self._repo_lock:
                         head_commit = repo.head.commit
                         metadata.update(
                             {
@@ -248,20 +257,6 @@ class GitMetadataExtractor:
                                 ],
                             }
                         )
-            except Exception as e:
-                self.logger.debug(f"Failed to get commits: {e}")
-                # Try one last time with HEAD commit
-                try:
-                    head_commit = repo.head.commit
-                    metadata.update(
-                        {
-                            "last_commit_date": head_commit.committed_datetime.isoformat(),
-                            "last_commit_author": head_commit.author.name,
-                            "last_commit_message": head_commit.message.strip().split(
-                                "\n"
-                            )[0],
-                        }
-                    )
                 except Exception as e:
                     self.logger.debug(f"Failed to get HEAD commit: {e}")
 
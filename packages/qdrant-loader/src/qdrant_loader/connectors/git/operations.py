@@ -2,7 +2,9 @@
 
 import os
 import shutil
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime
 
 import git
@@ -12,6 +14,58 @@ from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Each commit starts with a record separator; its fields are unit-separated
+_LOG_FORMAT = "%x1e%H%x1f%cI%x1f%an%x1f%s"
+
+
+@dataclass(frozen=True)
+class CommitInfo:
+    """Summary of a commit as reported by ``git log``."""
+
+    hexsha: str
+    committed_datetime: datetime
+    author: str
+    summary: str
+
+
+@dataclass(frozen=True)
+class FileHistory:
+    """Oldest and newest commits touching a file."""
+
+    first_commit: CommitInfo
+    last_commit: CommitInfo
+
+
+def _parse_file_history(output: str) -> dict[str, FileHistory]:
+    """Parse ``git log -z --name-only`` output into per-file history.
+
+    Commits are listed newest first, so the first commit seen for a path is
+    its last commit and the final one seen is its first commit.
+    """
+    last_commits: dict[str, CommitInfo] = {}
+    first_commits: dict[str, CommitInfo] = {}
+    for record in output.split("\x1e"):
+        header, _, names = record.partition("\0")
+        fields = header.split("\x1f")
+        if len(fields) != 4:
+            continue
+        hexsha, committed, author, summary = fields
+        commit = CommitInfo(
+            hexsha=hexsha,
+            committed_datetime=datetime.fromisoformat(committed),
+            author=author,
+            summary=summary,
+        )
+        for name in names.split("\0"):
+            path = name.lstrip("\n")
+            if path:
+                last_commits.setdefault(path, commit)
+                first_commits[path] = commit
+    return {
+        path: FileHistory(first_commit=first_commits[path], last_commit=commit)
+        for path, commit in last_commits.items()
+    }
+
 
 class GitOperations:
     """Git operations wrapper."""
@@ -20,6 +74,10 @@ class GitOperations:
         """Initialize Git operations."""
         self.repo = None
         self.logger = LoggingConfig.get_logger(__name__)
+        self._file_history: dict[str, FileHistory] = {}
+        self._file_history_key: tuple[str, str] | None = None
+        # Files are processed in a thread pool; history is read by one of them
+        self._file_history_lock = threading.Lock()
         self.logger.info("Initializing GitOperations")
 
     def clone(
@@ -135,6 +193,108 @@ class GitOperations:
                     self.logger.error("All clone attempts failed", error=str(e))
                     raise
 
+    def fetch(
+        self,
+        url: str,
+        to_path: str,
+        branch: str,
+        depth: int,
+        auth_token: str | None = None,
+    ) -> None:
+        """Update an existing clone to the tip of a branch.
+
+        Only the objects missing from the clone are transferred. The working
+        tree is then checked out at the fetched commit.
+
+        Args:
+            url (str): Repository URL or local path
+            to_path (str): Path of the existing clone
+            branch (str): Branch to fetch
+            depth (int): Fetch depth (use 0 for full history)
+            auth_token (Optional[str], optional): Authentication token. Defaults to None.
+        """
+        if os.path.exists(url):
+            url = os.path.abspath(url)
+
+        fetch_url = url
+        if auth_token and url.startswith("https://"):
+            fetch_url = url.replace("https://", f"https://{auth_token}@")
+
+        remote_ref = f"refs/remotes/origin/{branch}"
+        fetch_args = [fetch_url, f"+refs/heads/{branch}:{remote_ref}"]
+        if depth > 0:
+            fetch_args.append(f"--depth={depth}")
+
+        self.logger.info(f"Fetching repository : {url} | branch: {branch}")
+        self.repo = git.Repo(to_path)
+        with self.repo.git.custom_environment(GIT_TERMINAL_PROMPT="0"):
+            self.repo.git.fetch(*fetch_args)
+        self.repo.git.checkout("--force", "-B", branch, remote_ref)
+        self.logger.info(
+            "Successfully fetched repository", commit=self.repo.head.commit.hexsha
+        )
+
+    def get_head_commit(self) -> str:
+        """Get the SHA of the checked out commit.
+
+        Raises:
+            ValueError: If repository is not initialized
+        """
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+        return self.repo.head.commit.hexsha
+
+    def diff_files(
+        self, old_commit: str, new_commit: str
+    ) -> tuple[list[str], list[str]]:
+        """List the files changed between two commits.
+
+        Renames are detected, so a renamed file is reported as deleted at its
+        old path and changed at its new path.
+
+        Args:
+            old_commit: Commit the previous state corresponds to
+            new_commit: Commit to compare it with
+
+        Returns:
+            Absolute paths of the added or modified files, and of the deleted files
+
+        Raises:
+            ValueError: If repository is not initialized
+            GitCommandError: If a commit is not in the repository
+        """
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+
+        # Entries look like "<status>\0<path>\0", or for renames and copies
+        # "<status><score>\0<old path>\0<new path>\0"
+        output = self.repo.git.diff("--name-status", "-z", "-M", old_commit, new_commit)
+        tokens = output.split("\0") if output else []
+        changed: list[str] = []
+        deleted: list[str] = []
+        index = 0
+        while index < len(tokens):
+            status = tokens[index].strip()
+            index += 1
+            if not status:
+                continue
+            if status[0] in "RC":
+                old_path, new_path = tokens[index], tokens[index + 1]
+                index += 2
+                if status[0] == "R":
+                    deleted.append(old_path)
+                changed.append(new_path)
+            else:
+                path = tokens[index]
+                index += 1
+                (deleted if status[0] == "D" else changed).append(path)
+
+        working_dir = self.repo.working_dir
+        return (
+            [os.path.join(working_dir, path) for path in changed],
+            [os.path.join(working_dir, path) for path in deleted],
+        )
+
     def get_file_content(self, file_path: str) -> str:
         """Get file content.
 
@@ -179,6 +339,73 @@ class GitOperations:
             self.logger.error(f"Failed to read file {file_path}: {e}")
             raise
 
+    def get_file_history(self) -> dict[str, FileHistory]:
+        """Map every path in the history of HEAD to its first and last commits.
+
+        A single ``git log`` walk covers all files, instead of one history
+        walk per file. The result is cached per repository and HEAD commit.
+
+        Returns:
+            Mapping of repository-relative POSIX path to its history
+
+        Raises:
+            ValueError: If repository is not initialized
+        """
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+
+        with self._file_history_lock:
+            key = (self.repo.working_dir, self.repo.head.commit.hexsha)
+            if self._file_history_key != key:
+                output = self.repo.git.log(
+                    "-z",
+                    "--name-only",
+                    "--no-renames",
+                    f"--format={_LOG_FORMAT}",
+                    "HEAD",
+                )
+                self._file_history = _parse_file_history(output)
+                self._file_history_key = key
+                self.logger.debug(
+                    "Indexed file history", files=len(self._file_history), head=key[1]
+                )
+            return self._file_history
+
+    def get_last_commit(self, file_path: str) -> CommitInfo | None:
+        """Get the last commit touching a file.
+
+        Args:
+            file_path: Absolute path, or path relative to the repository root
+
+        Returns:
+            Last commit or None if the file has no history
+        """
+        history = self.get_file_history().get(self._history_path(file_path))
+        return history.last_commit if history else None
+
+    def get_first_commit(self, file_path: str) -> CommitInfo | None:
+        """Get the commit that added a file.
+
+        Args:
+            file_path: Absolute path, or path relative to the repository root
+
+        Returns:
+            First commit or None if the file has no history
+        """
+        history = self.get_file_history().get(self._history_path(file_path))
+        return history.first_commit if history else None
+
+    def _history_path(self, file_path: str) -> str:
+        """Convert a file path to the form used by ``git log`` output."""
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+        rel_path = (
+            os.path.relpath(file_path, self.repo.working_dir)
+            if os.path.isabs(file_path)
+            else file_path
+        )
+        return rel_path.replace(os.sep, "/")
+
     def get_last_commit_date(self, file_path: str) -> datetime | None:
         """Get the last commit date for a file.
 
@@ -189,52 +416,19 @@ class GitOperations:
             Last commit date or None if not found
         """
         try:
-            if not self.repo:
-                raise ValueError("Repository not initialized")
-
-            # Get the relative path from the repository root
-            rel_path = os.path.relpath(file_path, self.repo.working_dir)
-            self.logger.debug("Getting last commit date", file_path=rel_path)
-
-            # Get the last commit for the file
-            try:
-                commits = list(self.repo.iter_commits(paths=rel_path, max_count=1))
-                if commits:
-                    last_commit = commits[0]
-                    self.logger.debug(
-                        "Found last commit",
-                        file_path=rel_path,
-                        commit_date=last_commit.committed_datetime,
-                        commit_hash=last_commit.hexsha,
-                    )
-                    return last_commit.committed_datetime
-                self.logger.debug("No commits found for file", file_path=rel_path)
-                return None
-            except GitCommandError as e:
-                self.logger.warning(
-                    "Failed to get commits for file",
-                    file_path=rel_path,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                return None
-            except BrokenPipeError as e:
-                self.logger.warning(
-                    "Git process terminated unexpectedly",
-                    file_path=rel_path,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                return None
-            except Exception as e:
-                self.logger.warning(
-                    "Unexpected error getting commits",
-                    file_path=rel_path,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                return None
-
+            last_commit = self.get_last_commit(file_path)
+            if last_commit:
+                return last_commit.committed_datetime
+            self.logger.debug("No commits found for file", file_path=file_path)
+            return None
+        except (GitCommandError, BrokenPipeError) as e:
+            self.logger.warning(
+                "Failed to get commits for file",
+                file_path=file_path,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
         except Exception as e:
             self.logger.error(
                 "Failed to get last commit date",
@@ -254,55 +448,19 @@ class GitOperations:
             Creation date or None if not found
         """
         try:
-            if not self.repo:
-                raise ValueError("Repository not initialized")
-
-            # Get the relative path from the repository root
-            rel_path = os.path.relpath(file_path, self.repo.working_dir)
-            self.logger.debug("Getting creation date", file_path=rel_path)
-
-            # Get the first commit for the file
-            try:
-                # Use git log with --reverse to get commits in chronological order
-                commits = list(
-                    self.repo.iter_commits(paths=rel_path, reverse=True, max_count=1)
-                )
-                if commits:
-                    first_commit = commits[0]
-                    self.logger.debug(
-                        "Found first commit",
-                        file_path=rel_path,
-                        commit_date=first_commit.committed_datetime,
-                        commit_hash=first_commit.hexsha,
-                    )
-                    return first_commit.committed_datetime
-                self.logger.debug("No commits found for file", file_path=rel_path)
-                return None
-            except GitCommandError as e:
-                self.logger.warning(
-                    "Failed to get commits for file",
-                    file_path=rel_path,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                return None
-            except BrokenPipeError as e:
-                self.logger.warning(
-                    "Git process terminated unexpectedly",
-                    file_path=rel_path,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                return None
-            except Exception as e:
-                self.logger.warning(
-                    "Unexpected error getting commits",
-                    file_path=rel_path,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                return None
-
+            first_commit = self.get_first_commit(file_path)
+            if first_commit:
+                return first_commit.committed_datetime
+            self.logger.debug("No commits found for file", file_path=file_path)
+            return None
+        except (GitCommandError, BrokenPipeError) as e:
+            self.logger.warning(
+                "Failed to get commits for file",
+                file_path=file_path,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
         except Exception as e:
             self.logger.error(
                 "Failed to get creation date",
@@ -331,3 +489,29 @@ class GitOperations:
         except Exception as e:
             self.logger.error("Failed to list files", error=str(e))
             raise
+
+    def list_blob_shas(self) -> dict[str, str]:
+        """Map every file in HEAD to its blob SHA.
+
+        A file's blob SHA changes exactly when its content changes, so it can
+        be compared with stored state without reading the file.
+
+        Returns:
+            Mapping of absolute file path to blob SHA
+        """
+        try:
+            if not self.repo:
+                raise ValueError("Repository not initialized")
+
+            # Lines look like "<mode> blob <sha>\t<path>"
+            output = self.repo.git.ls_tree("-r", "HEAD")
+            blob_shas: dict[str, str] = {}
+            for line in output.splitlines() if output else []:
+                info, _, path = line.partition("\t")
+                parts = info.split()
+                if len(parts) == 3 and parts[1] == "blob":
+                    blob_shas[os.path.join(self.repo.working_dir, path)] = parts[2]
+            return blob_shas
+        except Exception as e:
+            self.logger.error("Failed to list blob SHAs", error=str(e))
+            raise
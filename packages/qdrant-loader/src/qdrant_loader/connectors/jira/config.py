@@ -55,6 +55,52 @@ class JiraProjectConfig(SourceConfig):
         le=100,
     )
 
+    max_concurrent_requests: int = Field(
+        default=4,
+        description="Maximum number of search pages requested concurrently",
+        ge=1,
+        le=32,
+    )
+    enhanced_search: bool = Field(
+        default=False,
+        description="Use the token-paginated enhanced JQL search (/search/jql) of Jira Cloud instead of the offset-paginated /search",
+    )
+
+    # Issue fields requested from the search API
+    issue_fields: list[str] = Field(
+        default=[
+            "summary",
+            "description",
+            "issuetype",
+            "status",
+            "priority",
+            "project",
+            "created",
+            "updated",
+            "reporter",
+            "assignee",
+            "labels",
+            "attachment",
+            "comment",
+            "parent",
+            "subtasks",
+            "issuelinks",
+        ],
+        description="Issue fields requested from the search API. The defaults are the fields that get indexed; use ['*all'] to request every field.",
+        min_length=1,
+    )
+
+    # Incremental sync
+    track_last_sync: bool = Field(
+        default=False,
+        description="Only list the issues updated since the last successful run. Issues deleted in Jira are not detected while enabled.",
+    )
+    sync_overlap_minutes: int = Field(
+        default=10,
+        description="Minutes subtracted from the last sync time, to allow for clock skew between Jira and the loader",
+        ge=0,
+    )
+
     # Attachment handling
     download_attachments: bool = Field(
         default=False, description="Whether to download and process issue attachments"
@@ -112,7 +158,7 @@ class JiraProjectConfig(SourceConfig):
 
         return self
 
-    @field_validator("issue_types", "include_statuses")
+    @field_validator("issue_types", "include_statuses", "issue_fields")
     @classmethod
     def validate_list_items(cls, v: list[str]) -> list[str]:
         """Validate that list items are not empty strings."""
@@ -1,10 +1,14 @@
 """Jira connector implementation."""
 
 import asyncio
+import math
+from collections import deque
 from collections.abc import AsyncGenerator
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from urllib.parse import urlparse  # noqa: F401 - may be used in URL handling
 
+import httpx
 import requests
 from requests.auth import HTTPBasicAuth  # noqa: F401 - compatibility
 
@@ -35,7 +39,10 @@ from qdrant_loader.connectors.shared.http import (
     RateLimiter,
 )
 from qdrant_loader.connectors.shared.http import (
-    request_with_policy as _http_request_with_policy,
+    create_async_client_for_session as _create_client,
+)
+from qdrant_loader.connectors.shared.http import (
+    httpx_request_with_policy as _http_request_with_policy,
 )
 from qdrant_loader.core.attachment_downloader import (
     AttachmentDownloader,
@@ -68,8 +75,10 @@ class JiraConnector(BaseConnector):
         self.config = config
         self.base_url = str(config.base_url).rstrip("/")
 
-        # Initialize session
+        # The session holds the credentials and downloads attachments; API
+        # requests go through a pooled async client created on first use
         self.session = requests.Session()
+        self._client: httpx.AsyncClient | None = None
 
         # Set up authentication based on deployment type
         self._setup_authentication()
@@ -168,8 +177,19 @@ class JiraConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         self._initialized = False
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled async client of the Jira host, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = _create_client(
+                self.session, max_connections=self.config.max_concurrent_requests
+            )
+        return self._client
+
     def _get_api_url(self, endpoint: str) -> str:
         """Construct the full API URL for an endpoint.
 
@@ -193,7 +213,7 @@ class JiraConnector(BaseConnector):
             dict: Response data
 
         Raises:
-            requests.exceptions.RequestException: If the request fails
+            httpx.HTTPError: If the request fails
         """
         url = self._get_api_url(endpoint)
 
@@ -209,11 +229,8 @@ class JiraConnector(BaseConnector):
                 timeout=kwargs.get("timeout"),
             )
 
-            if not self.session.headers.get("Authorization"):
-                kwargs["auth"] = self.session.auth
-
             response = await _http_request_with_policy(
-                self.session,
+                self._get_client(),
                 method,
                 url,
                 rate_limiter=self._rate_limiter,
@@ -245,11 +262,11 @@ class JiraConnector(BaseConnector):
                 url=url,
                 timeout=kwargs.get("timeout"),
             )
-            raise requests.exceptions.Timeout(
+            raise httpx.TimeoutException(
                 f"Request to {url} timed out after {kwargs.get('timeout')} seconds"
             )
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(
                 "Failed to make request to JIRA API",
                 method=method,
@@ -281,118 +298,301 @@ class JiraConnector(BaseConnector):
             "jql": jql,
             "startAt": kwargs.get("start", 0),
             "maxResults": kwargs.get("limit", self.config.page_size),
-            "expand": "changelog",
-            "fields": "*all",
+            "fields": self._search_fields(),
         }
 
         return asyncio.run(self._make_request("GET", "search", params=params))
 
     async def get_issues(
-        self, updated_after: datetime | None = None
+        self,
+        updated_after: datetime | None = None,
+        issue_ids: list[str] | None = None,
     ) -> AsyncGenerator[JiraIssue, None]:
         """
         Get all issues from Jira.
 
+        Pages are fetched ahead of the consumer (see :meth:`_iter_search_pages`),
+        so issues are parsed while later pages are still arriving.
+
         Args:
             updated_after: Optional datetime to filter issues updated after this time
+            issue_ids: Optional ids restricting the query to these issues
 
         Yields:
             JiraIssue objects
         """
-        start_at = 0
-        page_size = self.config.page_size
-        total_issues = 0
-
         logger.info(
             "🎫 Starting JIRA issue retrieval",
             project_key=self.config.project_key,
-            page_size=page_size,
+            page_size=self.config.page_size,
             updated_after=updated_after.isoformat() if updated_after else None,
         )
 
-        while True:
-            jql = f'project = "{self.config.project_key}"'
-            if updated_after:
-                jql += f" AND updated >= '{updated_after.strftime('%Y-%m-%d %H:%M')}'"
+        jql = f'project = "{self.config.project_key}"'
+        if updated_after:
+            jql += self._updated_since_clause(updated_after)
+        if issue_ids:
+            jql += f" AND id in ({','.join(issue_ids)})"
 
-            params = {
-                "jql": jql,
-                "startAt": start_at,
-                "maxResults": page_size,
-                "expand": "changelog",
-                "fields": "*all",
-            }
+        processed = 0
+        total_issues = 0
+        # Log progress every 100 issues instead of every 50
+        progress_log_interval = 100
+        try:
+            async for response in self._iter_search_pages(
+                {"jql": jql, "fields": self._search_fields()}
+            ):
+                if not response or not response.get("issues"):
+                    continue
 
-            logger.debug(
-                "Fetching JIRA issues page",
-                start_at=start_at,
-                page_size=page_size,
-                jql=jql,
+                # Update total count if not set; token-based search has none
+                if total_issues == 0 and response.get("total"):
+                    total_issues = response["total"]
+                    logger.info(f"🎫 Found {total_issues} JIRA issues to process")
+
+                for issue in response["issues"]:
+                    processed += 1
+                    try:
+                        yield self._parse_issue(issue)
+                    except Exception as e:
+                        logger.error(
+                            "Failed to parse JIRA issue",
+                            issue_id=issue.get("id"),
+                            issue_key=issue.get("key"),
+                            error=str(e),
+                            error_type=type(e).__name__,
+                        )
+                        # Keep the stored issue and try it again on the next run
+                        await self._mark_failed(
+                            self._issue_url(issue["key"]) if issue.get("key") else None,
+                            issue.get("id"),
+                        )
+                        # Continue processing other issues instead of failing completely
+                        continue
+
+                    if processed % progress_log_interval == 0:
+                        progress_percent = (
+                            round(processed / total_issues * 100, 1)
+                            if total_issues > 0
+                            else 0
+                        )
+                        logger.info(
+                            f"🎫 Progress: {processed}/{total_issues} issues ({progress_percent}%)"
+                        )
+        except Exception as e:
+            logger.error(
+                "Failed to fetch JIRA issues page",
+                processed=processed,
+                page_size=self.config.page_size,
+                error=str(e),
+                error_type=type(e).__name__,
             )
+            raise
 
-            try:
-                response = await self._make_request("GET", "search", params=params)
-            except Exception as e:
-                logger.error(
-                    "Failed to fetch JIRA issues page",
-                    start_at=start_at,
-                    page_size=page_size,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                raise
+        logger.info(f"✅ Completed JIRA issue retrieval: {processed} issues processed")
+
+    async def _iter_search_pages(
+        self, params: dict[str, Any]
+    ) -> AsyncGenerator[dict, None]:
+        """Yield the pages of a JQL search in order, fetching ahead of the consumer.
+
+        Offset-based search reports ``total`` with the first page, so the
+        remaining pages are requested concurrently, at most
+        ``max_concurrent_requests`` at a time and spaced by the rate limiter.
+        The token-based enhanced search returns each page's successor token
+        only with the page itself; there the next page is requested before the
+        current one is handed to the consumer.
+
+        Args:
+            params: Search parameters other than the paging ones
+
+        Yields:
+            Search responses, in result order
+        """
+        if self.config.enhanced_search:
+            async for page in self._iter_token_search_pages(params):
+                yield page
+            return
 
-            if not response or not response.get("issues"):
-                logger.debug(
-                    "No more JIRA issues found, stopping pagination",
-                    start_at=start_at,
-                    total_processed=start_at,
+        page_size = self.config.page_size
+        first = await self._make_request(
+            "GET",
+            "search",
+            params={**params, "startAt": 0, "maxResults": page_size},
+        )
+        yield first
+        issues = first.get("issues") if first else None
+        if not issues:
+            return
+
+        # The server may return fewer issues per page than requested
+        step = first.get("maxResults") or len(issues)
+        pending: deque[asyncio.Task] = deque()
+        try:
+            for start_at in range(step, first.get("total", 0), step):
+                pending.append(
+                    asyncio.create_task(
+                        self._make_request(
+                            "GET",
+                            "search",
+                            params={**params, "startAt": start_at, "maxResults": step},
+                        )
+                    )
                 )
-                break
+                if len(pending) >= self.config.max_concurrent_requests:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _iter_token_search_pages(
+        self, params: dict[str, Any]
+    ) -> AsyncGenerator[dict, None]:
+        """Yield the pages of an enhanced JQL search, prefetching the next page."""
+
+        def _request(page_token: str | None) -> asyncio.Task:
+            page_params = {**params, "maxResults": self.config.page_size}
+            if page_token:
+                page_params["nextPageToken"] = page_token
+            return asyncio.create_task(
+                self._make_request("GET", "search/jql", params=page_params)
+            )
+
+        next_page: asyncio.Task | None = _request(None)
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                page_token = page.get("nextPageToken") if page else None
+                if page_token and not page.get("isLast", False):
+                    next_page = _request(page_token)
+                yield page
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def _search_fields(self) -> str:
+        return ",".join(self.config.issue_fields)
+
+    @staticmethod
+    def _updated_since_clause(updated_after: datetime) -> str:
+        """JQL restricting a search to the issues updated since a time.
+
+        Absolute JQL dates are read in the Jira user's time zone, so the time
+        is expressed relative to now, in whole minutes rounded up.
+        """
+        if updated_after.tzinfo is None:
+            updated_after = updated_after.replace(tzinfo=UTC)
+        elapsed = (datetime.now(UTC) - updated_after).total_seconds()
+        return f' AND updated >= "-{max(math.ceil(elapsed / 60), 0)}m"'
 
-            issues = response["issues"]
+    async def _list_issue_fingerprints(
+        self, updated_after: datetime | None = None
+    ) -> AsyncGenerator[tuple[str, str, str | None], None]:
+        """List the id, key and fingerprint of the issues in the project.
 
-            # Update total count if not set
-            if total_issues == 0:
-                total_issues = response.get("total", 0)
-                logger.info(f"🎫 Found {total_issues} JIRA issues to process")
+        Only the ``updated`` field is requested, so listing is cheap compared
+        to fetching issues with all their fields.
 
-            # Log progress every 100 issues instead of every 50
-            progress_log_interval = 100
+        Args:
+            updated_after: Optional time restricting the listing to the issues
+                updated since then
 
-            for i, issue in enumerate(issues):
+        Yields:
+            Tuples of (issue id, issue key, fingerprint or None)
+        """
+        jql = f'project = "{self.config.project_key}"'
+        if updated_after:
+            jql += self._updated_since_clause(updated_after)
+        async for response in self._iter_search_pages(
+            {"jql": jql, "fields": "updated"}
+        ):
+            for issue in (response or {}).get("issues") or []:
+                updated = issue.get("fields", {}).get("updated")
                 try:
-                    parsed_issue = self._parse_issue(issue)
-                    yield parsed_issue
+                    fingerprint = self._issue_fingerprint(
+                        datetime.fromisoformat(updated.replace("Z", "+00:00"))
+                    )
+                except (AttributeError, ValueError):
+                    fingerprint = None
+                yield str(issue["id"]), issue["key"], fingerprint
+
+    async def _iter_issues_to_fetch(self) -> AsyncGenerator[JiraIssue, None]:
+        """Yield the issues to turn into documents.
+
+        Without a fetch filter every issue is fetched. Otherwise issue
+        fingerprints are listed first and only new or changed issues are
+        fetched in full, one page of ids at a time. With ``track_last_sync``
+        only the issues updated since the last successful run, less the
+        overlap, are listed.
+        """
+        if self._fetch_filter is None:
+            async for issue in self.get_issues():
+                yield issue
+            return
+
+        updated_after = None
+        last_synced_at = await self._last_synced_at()
+        if self.config.track_last_sync and last_synced_at is not None:
+            updated_after = last_synced_at - timedelta(
+                minutes=self.config.sync_overlap_minutes
+            )
+            # Issues not updated since then are unchanged, not deleted
+            self._keep_unlisted()
+            logger.info(
+                "🎫 Listing JIRA issues updated since the last sync",
+                project_key=self.config.project_key,
+                updated_after=updated_after.isoformat(),
+            )
 
-                    if (start_at + i + 1) % progress_log_interval == 0:
-                        progress_percent = (
-                            round((start_at + i + 1) / total_issues * 100, 1)
-                            if total_issues > 0
-                            else 0
-                        )
-                        logger.info(
-                            f"🎫 Progress: {start_at + i + 1}/{total_issues} issues ({progress_percent}%)"
-                        )
+        async def _candidates():
+            async for issue_id, key, fingerprint in self._list_issue_fingerprints(
+                updated_after
+            ):
+                yield (issue_id, key), self._issue_url(key), fingerprint, issue_id
+
+        # Keys of the issues to fetch, by id
+        pending: dict[str, str] = {}
+        async for issue_id, key in self._iter_to_fetch(_candidates()):
+            pending[issue_id] = key
+            if len(pending) >= self.config.page_size:
+                async for issue in self._get_issues_by_id(pending):
+                    yield issue
+                pending = {}
+        if pending:
+            async for issue in self._get_issues_by_id(pending):
+                yield issue
+        self._mark_synced()
+
+    async def _get_issues_by_id(
+        self, keys: dict[str, str]
+    ) -> AsyncGenerator[JiraIssue, None]:
+        """Fetch listed issues in full by id.
 
-                except Exception as e:
-                    logger.error(
-                        "Failed to parse JIRA issue",
-                        issue_id=issue.get("id"),
-                        issue_key=issue.get("key"),
-                        error=str(e),
-                        error_type=type(e).__name__,
-                    )
-                    # Continue processing other issues instead of failing completely
-                    continue
+        Issues that do not come back, for instance because they were deleted
+        since they were listed, are reported to the sync tracker as failed.
 
-            # Check if we've processed all issues
-            start_at += len(issues)
-            if start_at >= total_issues:
-                logger.info(
-                    f"✅ Completed JIRA issue retrieval: {start_at} issues processed"
-                )
-                break
+        Args:
+            keys: Keys of the issues to fetch, by issue id
+        """
+        missing = dict(keys)
+        async for issue in self.get_issues(issue_ids=list(keys)):
+            missing.pop(str(issue.id), None)
+            yield issue
+        for issue_id, key in missing.items():
+            logger.warning(
+                "JIRA issue was not returned by id", issue_id=issue_id, issue_key=key
+            )
+            await self._mark_failed(self._issue_url(key), issue_id)
+
+    def _issue_url(self, key: str) -> str:
+        return f"{str(self.config.base_url).rstrip('/')}/browse/{key}"
+
+    @staticmethod
+    def _issue_fingerprint(updated: datetime) -> str:
+        return updated.isoformat()
 
     def _parse_issue(self, raw_issue: dict) -> JiraIssue:
         return _parse_issue_helper(raw_issue)
@@ -433,15 +633,16 @@ class JiraConnector(BaseConnector):
         Returns:
             List[Document]: List of processed documents
         """
-        documents = []
+        return [document async for document in self.iter_documents()]
 
-        # Collect all issues
-        issues = []
-        async for issue in self.get_issues():
-            issues.append(issue)
+    async def iter_documents(self) -> AsyncGenerator[Document, None]:
+        """Fetch and process documents from Jira as issues are paged in.
 
-        # Convert issues to documents
-        for issue in issues:
+        Yields:
+            Document: Issue documents followed by their attachment documents
+        """
+        # Convert issues to documents as they are fetched
+        async for issue in self._iter_issues_to_fetch():
             # Build content including comments
             content_parts = [issue.summary]
             if issue.description:
@@ -456,7 +657,6 @@ class JiraConnector(BaseConnector):
 
             content = "\n\n".join(content_parts)
 
-            base_url = str(self.config.base_url).rstrip("/")
             document = Document(
                 id=issue.id,
                 content=content,
@@ -464,10 +664,11 @@ class JiraConnector(BaseConnector):
                 source=self.config.source,
                 source_type=SourceType.JIRA,
                 created_at=issue.created,
-                url=f"{base_url}/browse/{issue.key}",
+                url=self._issue_url(issue.key),
                 title=issue.summary,
                 updated_at=issue.updated,
                 is_deleted=False,
+                fingerprint=self._issue_fingerprint(issue.updated),
                 metadata={
                     "project": self.config.project_key,
                     "issue_type": issue.issue_type,
@@ -515,7 +716,7 @@ class JiraConnector(BaseConnector):
                     ),
                 },
             )
-            documents.append(document)
+            yield document
             logger.debug(
                 "Jira document created",
                 document_id=document.id,
@@ -539,12 +740,11 @@ class JiraConnector(BaseConnector):
                             attachment_metadata, document
                         )
                     )
-                    documents.extend(attachment_documents)
+                    for attachment_document in attachment_documents:
+                        yield attachment_document
 
                     logger.debug(
                         "Processed attachments for JIRA issue",
                         issue_key=issue.key,
                         processed_count=len(attachment_documents),
                     )
-
-        return documents
@@ -22,6 +22,12 @@ class LocalFileConfig(SourceConfig):
     max_file_size: int = Field(
         default=1048576, description="Maximum file size in bytes"
     )
+    max_concurrent_files: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum number of files read and processed concurrently",
+    )
 
     @field_validator("base_url")
     @classmethod
@@ -1,8 +1,13 @@
+import asyncio
 import os
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from urllib.parse import unquote, urlparse
 
 from qdrant_loader.connectors.base import BaseConnector
+from qdrant_loader.connectors.shared.paths import walk_files
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import (
     FileConversionConfig,
@@ -80,106 +85,195 @@ class LocalFileConnector(BaseConnector):
 
     async def get_documents(self) -> list[Document]:
         """Get all documents from the local file source."""
-        documents = []
-        for root, _, files in os.walk(self.base_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if not self.file_processor.should_process_file(file_path):
+        return [document async for document in self.iter_documents()]
+
+    async def iter_documents(self) -> AsyncIterator[Document]:
+        """Yield documents from the local file source as files are processed.
+
+        Up to ``max_concurrent_files`` files are read, decoded and have their
+        metadata extracted concurrently in a thread pool, so file I/O does
+        not block the event loop. Documents are yielded in walk order.
+
+        Directories that no file of the source can be in, such as excluded
+        ones, are not walked, and each file is stat-ed once while scanning.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_files,
+            thread_name_prefix="localfile",
+        )
+
+        async def _candidates():
+            for file_path, stat in walk_files(
+                self.base_path, self.file_processor.should_prune_directory
+            ):
+                if not self.file_processor.should_process_file(file_path, stat):
                     continue
-                try:
-                    # Get relative path from base directory
-                    rel_path = os.path.relpath(file_path, self.base_path)
-
-                    # Check if file needs conversion
-                    needs_conversion = (
-                        self.config.enable_file_conversion
-                        and self.file_detector
-                        and self.file_converter
-                        and self.file_detector.is_supported_for_conversion(file_path)
-                    )
+                # Create consistent URL with forward slashes for cross-platform compatibility
+                normalized_path = os.path.realpath(file_path).replace("\\", "/")
+                url = f"file://{normalized_path}"
+                # Modification time and size change whenever the file is rewritten
+                fingerprint = f"{stat.st_mtime_ns}:{stat.st_size}"
+                listed = (file_path, url, stat.st_mtime, fingerprint)
+                yield listed, url, fingerprint, None
 
-                    if needs_conversion:
-                        self.logger.debug(
-                            "File needs conversion",
-                            file_path=rel_path.replace("\\", "/"),
-                        )
-                        try:
-                            # Convert file to markdown
-                            assert self.file_converter is not None  # Type checker hint
-                            content = self.file_converter.convert_file(file_path)
-                            content_type = "md"  # Converted files are markdown
-                            conversion_method = "markitdown"
-                            conversion_failed = False
-                            self.logger.info(
-                                "File conversion successful",
-                                file_path=rel_path.replace("\\", "/"),
-                            )
-                        except FileConversionError as e:
-                            self.logger.warning(
-                                "File conversion failed, creating fallback document",
-                                file_path=rel_path.replace("\\", "/"),
-                                error=str(e),
-                            )
-                            # Create fallback document
-                            assert self.file_converter is not None  # Type checker hint
-                            content = self.file_converter.create_fallback_document(
-                                file_path, e
-                            )
-                            content_type = "md"  # Fallback is also markdown
-                            conversion_method = "markitdown_fallback"
-                            conversion_failed = True
-                    else:
-                        # Read file content normally
-                        with open(file_path, encoding="utf-8", errors="ignore") as f:
-                            content = f.read()
-                        # Get file extension without the dot
-                        content_type = os.path.splitext(file)[1].lower().lstrip(".")
-                        conversion_method = None
-                        conversion_failed = False
-
-                    # Get file modification time
-                    file_mtime = os.path.getmtime(file_path)
-                    updated_at = datetime.fromtimestamp(file_mtime, tz=UTC)
-
-                    metadata = self.metadata_extractor.extract_all_metadata(
-                        file_path, content
-                    )
+        async def _on_filter_error(
+            error: Exception, files: list[tuple[str, str, float, str]]
+        ) -> None:
+            for file_path, url, _, _ in files:
+                self.logger.error(
+                    "Failed to process file",
+                    file_path=file_path.replace("\\", "/"),
+                    error=str(error),
+                )
+                await self._mark_failed(url)
 
-                    # Add file conversion metadata if applicable
-                    if needs_conversion:
-                        metadata.update(
-                            {
-                                "conversion_method": conversion_method,
-                                "conversion_failed": conversion_failed,
-                                "original_file_type": os.path.splitext(file)[1]
-                                .lower()
-                                .lstrip("."),
-                            }
-                        )
-
-                    self.logger.debug(
-                        f"Processed local file: {rel_path.replace('\\', '/')}"
+        pending: deque[asyncio.Task] = deque()
+        try:
+            async for file_path, url, mtime, fingerprint in self._iter_to_fetch(
+                _candidates(), on_error=_on_filter_error
+            ):
+                pending.append(
+                    asyncio.create_task(
+                        self._read_file(executor, file_path, url, mtime, fingerprint)
                     )
+                )
+                if len(pending) >= self.config.max_concurrent_files:
+                    document = await pending.popleft()
+                    if document is not None:
+                        yield document
+            while pending:
+                document = await pending.popleft()
+                if document is not None:
+                    yield document
+        finally:
+            for task in pending:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _needs_conversion(self, file_path: str) -> bool:
+        """Whether a file is converted to markdown rather than read as text."""
+        return bool(
+            self.config.enable_file_conversion
+            and self.file_detector
+            and self.file_converter
+            and self.file_detector.is_supported_for_conversion(file_path)
+        )
+
+    async def _read_file(
+        self,
+        executor: ThreadPoolExecutor,
+        file_path: str,
+        url: str,
+        mtime: float,
+        fingerprint: str,
+    ) -> Document | None:
+        """Process a file in the file pool.
+
+        In-process conversions run on the event loop thread, as their timeout
+        relies on ``SIGALRM``, which only the main thread can receive.
+        Conversions in worker processes are waited for in the pool. A file
+        that fails is reported to the sync tracker, so its stored document is
+        kept.
+        """
+        if self._needs_conversion(file_path) and not (
+            self.file_converter and self.file_converter.uses_worker_processes
+        ):
+            document = self._process_file(file_path, url, mtime, fingerprint)
+        else:
+            document = await asyncio.get_running_loop().run_in_executor(
+                executor, self._process_file, file_path, url, mtime, fingerprint
+            )
+        if document is None:
+            await self._mark_failed(url)
+        return document
 
-                    # Create consistent URL with forward slashes for cross-platform compatibility
-                    normalized_path = os.path.realpath(file_path).replace("\\", "/")
-                    doc = Document(
-                        title=os.path.basename(file_path),
-                        content=content,
-                        content_type=content_type,
-                        metadata=metadata,
-                        source_type="localfile",
-                        source=self.config.source,
-                        url=f"file://{normalized_path}",
-                        is_deleted=False,
-                        updated_at=updated_at,
+    def _process_file(
+        self, file_path: str, url: str, mtime: float, fingerprint: str
+    ) -> Document | None:
+        """Read a file and build its document.
+
+        Returns:
+            The document, or None if the file could not be processed
+        """
+        file = os.path.basename(file_path)
+        try:
+            # Get relative path from base directory
+            rel_path = os.path.relpath(file_path, self.base_path)
+
+            # Check if file needs conversion
+            needs_conversion = self._needs_conversion(file_path)
+
+            if needs_conversion:
+                self.logger.debug(
+                    "File needs conversion",
+                    file_path=rel_path.replace("\\", "/"),
+                )
+                try:
+                    # Convert file to markdown
+                    assert self.file_converter is not None  # Type checker hint
+                    content = self.file_converter.convert_file(file_path)
+                    content_type = "md"  # Converted files are markdown
+                    conversion_method = "markitdown"
+                    conversion_failed = False
+                    self.logger.info(
+                        "File conversion successful",
+                        file_path=rel_path.replace("\\", "/"),
                     )
-                    documents.append(doc)
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to process file",
-                        file_path=file_path.replace("\\", "/"),
+                except FileConversionError as e:
+                    self.logger.warning(
+                        "File conversion failed, creating fallback document",
+                        file_path=rel_path.replace("\\", "/"),
                         error=str(e),
                     )
-                    continue
-        return documents
+                    # Create fallback document
+                    assert self.file_converter is not None  # Type checker hint
+                    content = self.file_converter.create_fallback_document(file_path, e)
+                    content_type = "md"  # Fallback is also markdown
+                    conversion_method = "markitdown_fallback"
+                    conversion_failed = True
+            else:
+                # Read file content normally
+                with open(file_path, encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+                # Get file extension without the dot
+                content_type = os.path.splitext(file)[1].lower().lstrip(".")
+                conversion_method = None
+                conversion_failed = False
+
+            updated_at = datetime.fromtimestamp(mtime, tz=UTC)
+
+            metadata = self.metadata_extractor.extract_all_metadata(file_path, content)
+
+            # Add file conversion metadata if applicable
+            if needs_conversion:
+                metadata.update(
+                    {
+                        "conversion_method": conversion_method,
+                        "conversion_failed": conversion_failed,
+                        "original_file_type": os.path.splitext(file)[1]
+                        .lower()
+                        .lstrip("."),
+                    }
+                )
+
+            self.logger.debug(f"Processed local file: {rel_path.replace('\\', '/')}")
+
+            return Document(
+                title=file,
+                content=content,
+                content_type=content_type,
+                metadata=metadata,
+                source_type="localfile",
+                source=self.config.source,
+                url=url,
+                is_deleted=False,
+                updated_at=updated_at,
+                fingerprint=fingerprint,
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to process file",
+                file_path=file_path.replace("\\", "/"),
+                error=str(e),
+            )
+            return None
@@ -1,9 +1,9 @@
 """File processing and filtering logic for LocalFile connector."""
 
-import fnmatch
 import os
 from typing import TYPE_CHECKING, Optional
 
+from qdrant_loader.connectors.shared.paths import PathMatcher, compile_path_matcher
 from qdrant_loader.utils.logging import LoggingConfig
 
 if TYPE_CHECKING:
@@ -33,7 +33,39 @@ class LocalFileFileProcessor:
         self.file_detector = file_detector
         self.logger = LoggingConfig.get_logger(__name__)
 
-    def should_process_file(self, file_path: str) -> bool:
+    def _matcher(self) -> PathMatcher:
+        """Include/exclude patterns of the current configuration, compiled."""
+        return compile_path_matcher(
+            tuple(self.config.include_paths), tuple(self.config.exclude_paths)
+        )
+
+    def should_prune_directory(self, rel_dir: str) -> bool:
+        """Check if no file below a directory can be processed.
+
+        Args:
+            rel_dir: Directory path relative to the base path, with forward slashes
+
+        Returns:
+            True if the directory need not be walked, False otherwise
+        """
+        if self._matcher().prunes(rel_dir):
+            self.logger.debug(f"Skipping directory {rel_dir}: excluded by paths")
+            return True
+        return False
+
+    def should_process_file(
+        self, file_path: str, stat_result: os.stat_result | None = None
+    ) -> bool:
+        """Check if a file should be processed based on configuration.
+
+        Args:
+            file_path: Path to the file
+            stat_result: Stat result of the file, if already known from a
+                directory scan; it also vouches that the file is a regular file
+
+        Returns:
+            True if the file should be processed, False otherwise
+        """
         try:
             self.logger.debug(
                 "Checking if file should be processed",
@@ -47,7 +79,7 @@ class LocalFileFileProcessor:
                 max_file_size=self.config.max_file_size,
             )
 
-            if not os.path.isfile(file_path):
+            if stat_result is None and not os.path.isfile(file_path):
                 self.logger.debug(f"Skipping {file_path}: file does not exist")
                 return False
             if not os.access(file_path, os.R_OK):
@@ -77,31 +109,9 @@ class LocalFileFileProcessor:
                 )
                 return False
 
-            for pattern in self.config.exclude_paths:
-                pattern = pattern.lstrip("/")
-                if pattern.endswith("/**"):
-                    dir_pattern = pattern[:-3]
-                    if dir_pattern == os.path.dirname(rel_path) or os.path.dirname(
-                        rel_path
-                    ).startswith(dir_pattern + "/"):
-                        self.logger.debug(
-                            f"Skipping {rel_path}: matches exclude directory pattern {pattern}"
-                        )
-                        return False
-                elif pattern.endswith("/"):
-                    dir_pattern = pattern[:-1]
-                    if os.path.dirname(rel_path) == dir_pattern or os.path.dirname(
-                        rel_path
-                    ).startswith(dir_pattern + "/"):
-                        self.logger.debug(
-                            f"Skipping {rel_path}: matches exclude directory pattern {pattern}"
-                        )
-                        return False
-                elif fnmatch.fnmatch(rel_path, pattern):
-                    self.logger.debug(
-                        f"Skipping {rel_path}: matches exclude pattern {pattern}"
-                    )
-                    return False
+            if self._matcher().is_excluded(rel_path):
+                self.logger.debug(f"Skipping {rel_path}: matches exclude pattern")
+                return False
 
             file_type_match = False
             file_ext = os.path.splitext(file_basename)[1].lower()
@@ -147,36 +157,19 @@ class LocalFileFileProcessor:
                 )
                 return False
 
-            file_size = os.path.getsize(file_path)
+            file_size = (
+                stat_result.st_size
+                if stat_result is not None
+                else os.path.getsize(file_path)
+            )
             if file_size > self.config.max_file_size:
                 self.logger.debug(f"Skipping {rel_path}: exceeds max file size")
                 return False
 
-            if not self.config.include_paths:
-                return True
-
-            rel_dir = os.path.dirname(rel_path)
-            for pattern in self.config.include_paths:
-                pattern = pattern.lstrip("/")
-                if pattern == "" or pattern == "/":
-                    if rel_dir == "":
-                        return True
-                if pattern.endswith("/**/*"):
-                    dir_pattern = pattern[:-5]
-                    if dir_pattern == "" or dir_pattern == "/":
-                        return True
-                    if dir_pattern == rel_dir or rel_dir.startswith(dir_pattern + "/"):
-                        return True
-                elif pattern.endswith("/"):
-                    dir_pattern = pattern[:-1]
-                    if dir_pattern == "" or dir_pattern == "/":
-                        if rel_dir == "":
-                            return True
-                    if dir_pattern == rel_dir or rel_dir.startswith(dir_pattern + "/"):
-                        return True
-                elif fnmatch.fnmatch(rel_path, pattern):
-                    return True
-            return False
+            if not self._matcher().is_included(rel_path):
+                self.logger.debug(f"Skipping {rel_path}: not in include paths")
+                return False
+            return True
         except Exception as e:
             self.logger.error(f"Error checking if file should be processed: {e}")
             return False
@@ -63,6 +63,12 @@ class PublicDocsSourceConfig(SourceConfig):
         ge=1,
         le=2000,
     )
+    max_concurrent_requests: int = Field(
+        default=4,
+        description="Maximum number of pages processed concurrently, and of connections per host",
+        ge=1,
+        le=32,
+    )
 
     @field_validator("content_type")
     @classmethod
@@ -1,9 +1,12 @@
 """Public documentation connector implementation."""
 
+import asyncio
 import fnmatch
 import logging
 import warnings
 from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import cast
 from urllib.parse import urljoin, urlparse
@@ -24,7 +27,7 @@ from qdrant_loader.connectors.publicdocs.crawler import (
 )
 
 # Local HTTP helper for safe text reading
-from qdrant_loader.connectors.publicdocs.http import read_text_response as _read_text
+from qdrant_loader.connectors.publicdocs.parsers import parse_html
 from qdrant_loader.connectors.shared.http import (
     RateLimiter,
 )
@@ -50,6 +53,15 @@ warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 logger = LoggingConfig.get_logger(__name__)
 
 
+@dataclass
+class _FetchedPage:
+    """A downloaded page with its single parse tree."""
+
+    html: str
+    soup: BeautifulSoup
+    headers: Mapping[str, str]
+
+
 class PublicDocsConnector(BaseConnector):
     """Connector for public documentation sources."""
 
@@ -67,6 +79,8 @@ class PublicDocsConnector(BaseConnector):
         self.base_url = str(config.base_url)
         self.url_queue = deque()
         self.visited_urls = set()
+        # Pages downloaded during discovery, handed over to processing
+        self._prefetched: dict[str, _FetchedPage] = {}
         self.version = config.version
         self.logger.debug(
             "Initialized PublicDocsConnector",
@@ -88,7 +102,12 @@ class PublicDocsConnector(BaseConnector):
     async def __aenter__(self):
         """Async context manager entry."""
         if not self._initialized:
-            self._client = aiohttp.ClientSession()
+            # Politeness: a bounded number of connections to each host
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.config.max_concurrent_requests
+                )
+            )
             self._initialized = True
 
             # Initialize attachment downloader with aiohttp session if needed
@@ -186,135 +205,276 @@ class PublicDocsConnector(BaseConnector):
             RuntimeError: If connector is not initialized
             RuntimeError: If change detector is not initialized
         """
+        return [document async for document in self.iter_documents()]
+
+    async def iter_documents(self) -> AsyncIterator[Document]:
+        """Yield documentation pages from the source as they are processed.
+
+        Up to ``max_concurrent_requests`` pages are fetched and processed
+        concurrently. Each page is downloaded once and parsed once; its
+        links, title, attachments and content all come from that parse, and
+        the base page fetched during discovery is not downloaded again.
+        Documents are yielded in discovery order.
+
+        Yields:
+            Document: Page documents followed by their attachment documents
+
+        Raises:
+            RuntimeError: If connector is not initialized
+        """
         if not self._initialized:
             raise RuntimeError(
                 "Connector not initialized. Use the connector as an async context manager."
             )
 
+        pending: deque[asyncio.Task] = deque()
         try:
             # Get all pages
             pages = await self._get_all_pages()
             self.logger.debug(f"Found {len(pages)} pages to process", pages=pages)
-            documents = []
+            document_count = 0
 
             for page in pages:
-                try:
-                    if not self._should_process_url(page):
-                        self.logger.debug("Skipping URL", url=page)
-                        continue
-
-                    self.logger.debug("Processing URL", url=page)
-
-                    content, title = await self._process_page(page)
-                    if (
-                        content and content.strip()
-                    ):  # Only add documents with non-empty content
-                        # Generate a consistent document ID based on the URL
-                        doc_id = str(hash(page))  # Use URL hash as document ID
-                        doc = Document(
-                            id=doc_id,
-                            title=title,
-                            content=content,
-                            content_type="html",
-                            metadata={
-                                "title": title,
-                                "url": page,
-                                "version": self.version,
-                            },
-                            source_type=self.config.source_type,
-                            source=self.config.source,
-                            url=page,
-                            # For public docs, we don't have a created or updated date. So we use a very old date.
-                            # The content hash will be the same for the same page, so it will be update if the hash changes.
-                            created_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
-                            updated_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
-                        )
-                        self.logger.debug(
-                            "Created document",
-                            url=page,
-                            content_length=len(content),
-                            title=title,
-                            doc_id=doc_id,
-                        )
-                        documents.append(doc)
-                        self.logger.debug(
-                            "Document created",
-                            url=page,
-                            content_length=len(content),
-                            title=title,
-                            doc_id=doc_id,
-                        )
-
-                        # Process attachments if enabled
-                        if (
-                            self.config.download_attachments
-                            and self.attachment_downloader
-                        ):
-                            # We need to get the HTML again to extract attachments
-                            try:
-                                try:
-                                    response = await _aiohttp_request(
-                                        self.client,
-                                        "GET",
-                                        page,
-                                        rate_limiter=self._rate_limiter,
-                                        retries=3,
-                                        backoff_factor=0.5,
-                                        overall_timeout=60.0,
-                                    )
-                                    # Ensure HTTP errors are surfaced consistently
-                                    response.raise_for_status()
-                                except aiohttp.ClientError as e:
-                                    raise HTTPRequestError(
-                                        url=page, message=str(e)
-                                    ) from e
-
-                                html = await _read_text(response)
-                                attachment_metadata = self._extract_attachments(
-                                    html, page, doc_id
-                                )
-
-                                if attachment_metadata:
-                                    self.logger.info(
-                                        "Processing attachments for PublicDocs page",
-                                        page_url=page,
-                                        attachment_count=len(attachment_metadata),
-                                    )
-
-                                    attachment_documents = await self.attachment_downloader.download_and_process_attachments(
-                                        attachment_metadata, doc
-                                    )
-                                    documents.extend(attachment_documents)
-
-                                    self.logger.debug(
-                                        "Processed attachments for PublicDocs page",
-                                        page_url=page,
-                                        processed_count=len(attachment_documents),
-                                    )
-                            except Exception as e:
-                                self.logger.error(
-                                    f"Failed to process attachments for page {page}: {e}"
-                                )
-                                # Continue processing even if attachment processing fails
-                    else:
-                        self.logger.warning(
-                            "Skipping page with empty content",
-                            url=page,
-                            title=title,
-                        )
-                except Exception as e:
-                    self.logger.error(f"Failed to process page {page}: {e}")
+                if not self._should_process_url(page):
+                    self.logger.debug("Skipping URL", url=page)
                     continue
-
-            if not documents:
+                pending.append(asyncio.create_task(self._crawl_page(page)))
+                if len(pending) >= self.config.max_concurrent_requests:
+                    for document in await pending.popleft():
+                        document_count += 1
+                        yield document
+            while pending:
+                for document in await pending.popleft():
+                    document_count += 1
+                    yield document
+
+            if not document_count:
                 self.logger.warning("No valid documents found to process")
+
+        except Exception as e:
+            self.logger.error("Failed to get documentation", error=str(e))
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+            self._prefetched.clear()
+
+    async def _crawl_page(self, page: str) -> list[Document]:
+        """Turn a page into its document followed by its attachment documents.
+
+        A failed page is reported to the sync tracker, so its stored document
+        and attachments are kept.
+
+        Returns:
+            The documents, or an empty list if the page is unchanged, empty
+            or failed
+        """
+        # Generate a consistent document ID based on the URL
+        doc_id = Document.generate_id(self.config.source_type, self.config.source, page)
+        try:
+            fetched = self._prefetched.pop(page, None)
+
+            # HTTP validators are only requested during change detection
+            fingerprint = None
+            if self._fetch_filter is not None:
+                fingerprint = (
+                    self._headers_fingerprint(fetched.headers)
+                    if fetched is not None
+                    else await self._page_fingerprint(page)
+                )
+            if not await self._should_fetch(page, fingerprint, doc_id):
+                self.logger.debug("Skipping unchanged URL", url=page)
                 return []
 
+            self.logger.debug("Processing URL", url=page)
+            if fetched is None:
+                fetched = await self._fetch_page(page)
+            try:
+                content, title, attachment_metadata = self._parse_page(
+                    fetched, page, doc_id
+                )
+            except Exception as e:
+                raise DocumentProcessingError(
+                    f"Failed to process page {page}: {e!s}"
+                ) from e
+
+            if not (content and content.strip()):
+                # Only add documents with non-empty content
+                self.logger.warning(
+                    "Skipping page with empty content", url=page, title=title
+                )
+                return []
+
+            doc = Document(
+                id=doc_id,
+                title=title,
+                content=content,
+                content_type="html",
+                metadata={
+                    "title": title,
+                    "url": page,
+                    "version": self.version,
+                },
+                source_type=self.config.source_type,
+                source=self.config.source,
+                url=page,
+                # For public docs, we don't have a created or updated date. So we use a very old date.
+                # The content hash will be the same for the same page, so it will be update if the hash changes.
+                created_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
+                updated_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
+                fingerprint=fingerprint,
+            )
+            self.logger.debug(
+                "Created document",
+                url=page,
+                content_length=len(content),
+                title=title,
+                doc_id=doc_id,
+            )
+            documents = [doc]
+
+            # Attachments come from the same parse as the page content
+            if attachment_metadata and self.attachment_downloader:
+                try:
+                    self.logger.info(
+                        "Processing attachments for PublicDocs page",
+                        page_url=page,
+                        attachment_count=len(attachment_metadata),
+                    )
+                    attachment_documents = await self.attachment_downloader.download_and_process_attachments(
+                        attachment_metadata, doc
+                    )
+                    documents.extend(attachment_documents)
+                    self.logger.debug(
+                        "Processed attachments for PublicDocs page",
+                        page_url=page,
+                        processed_count=len(attachment_documents),
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to process attachments for page {page}: {e}"
+                    )
+                    # Continue processing even if attachment processing fails,
+                    # keeping the stored attachments and fetching the page
+                    # again on the next run
+                    doc.fingerprint = None
+                    await self._mark_failed(page, doc_id)
             return documents
+        except Exception as e:
+            self.logger.error(f"Failed to process page {page}: {e}")
+            await self._mark_failed(page, doc_id)
+            return []
 
+    async def _page_fingerprint(self, url: str) -> str | None:
+        """Get the ETag or Last-Modified validator of a page with a HEAD request.
+
+        Returns:
+            The validator, or None when the server sends neither or the
+            request fails (the page is then fetched)
+        """
+        try:
+            response = await _aiohttp_request(
+                self.client,
+                "HEAD",
+                url,
+                rate_limiter=self._rate_limiter,
+                retries=3,
+                backoff_factor=0.5,
+                overall_timeout=60.0,
+                allow_redirects=True,
+            )
         except Exception as e:
-            self.logger.error("Failed to get documentation", error=str(e))
-            raise
+            self.logger.debug("HEAD request failed", url=url, error=str(e))
+            return None
+        try:
+            if response.status >= 400:
+                return None
+            return self._headers_fingerprint(response.headers)
+        finally:
+            await response.release()
+
+    @staticmethod
+    def _headers_fingerprint(headers: Mapping[str, str]) -> str | None:
+        """The ETag or Last-Modified validator among response headers."""
+        etag = headers.get("ETag")
+        if etag:
+            return f"etag:{etag}"
+        last_modified = headers.get("Last-Modified")
+        return f"last-modified:{last_modified}" if last_modified else None
+
+    async def _fetch_page(self, url: str) -> _FetchedPage:
+        """Download a page and parse it once.
+
+        Raises:
+            HTTPRequestError: If HTTP request fails
+        """
+        self.logger.debug("Making HTTP request", url=url)
+        try:
+            response = await _aiohttp_request(
+                self.client,
+                "GET",
+                url,
+                rate_limiter=self._rate_limiter,
+                retries=3,
+                backoff_factor=0.5,
+                overall_timeout=60.0,
+            )
+            response.raise_for_status()  # This is a synchronous method, no need to await
+            html = await response.text()
+        except aiohttp.ClientError as e:
+            raise HTTPRequestError(url=url, message=str(e)) from e
+
+        self.logger.debug(
+            "HTTP request successful", url=url, status_code=response.status
+        )
+        return _FetchedPage(html=html, soup=parse_html(html), headers=response.headers)
+
+    def _parse_page(
+        self, fetched: _FetchedPage, url: str, document_id: str | None = None
+    ) -> tuple[str | None, str | None, list[AttachmentMetadata]]:
+        """Extract content, title and attachments from a page's parse tree.
+
+        Content extraction modifies the tree, so it runs last.
+
+        Returns:
+            A tuple containing (content, title, attachments)
+        """
+        soup = fetched.soup
+
+        # Extract links for crawling
+        self.logger.debug("Extracting links from page", url=url)
+        links = self._extract_links(soup, url)
+        self.logger.info("Adding new links to queue", url=url, new_links=len(links))
+        for link in links:
+            if link not in self.visited_urls:
+                self.url_queue.append(link)
+
+        title = self._extract_title(soup)
+        self.logger.debug("Extracted title", url=url, title=title)
+
+        attachments = (
+            self._extract_attachments(soup, url, document_id)
+            if document_id is not None
+            else []
+        )
+
+        if self.config.content_type == "html":
+            self.logger.debug("Processing Page", url=url)
+            content = self._extract_content(soup)
+            self.logger.debug(
+                "HTML content processed",
+                url=url,
+                content_length=len(content) if content else 0,
+            )
+            return content, title, attachments
+
+        self.logger.debug("Processing raw content", url=url)
+        self.logger.debug(
+            "Raw content length",
+            url=url,
+            content_length=len(fetched.html) if fetched.html else 0,
+        )
+        return fetched.html, title, attachments
 
     async def _process_page(self, url: str) -> tuple[str | None, str | None]:
         """Process a single documentation page.
@@ -334,58 +494,10 @@ class PublicDocsConnector(BaseConnector):
                     "Connector not initialized. Use async context manager."
                 )
 
-            self.logger.debug("Making HTTP request", url=url)
+            fetched = await self._fetch_page(url)
             try:
-                response = await _aiohttp_request(
-                    self.client,
-                    "GET",
-                    url,
-                    rate_limiter=self._rate_limiter,
-                    retries=3,
-                    backoff_factor=0.5,
-                    overall_timeout=60.0,
-                )
-                response.raise_for_status()  # This is a synchronous method, no need to await
-            except aiohttp.ClientError as e:
-                raise HTTPRequestError(url=url, message=str(e)) from e
-
-            self.logger.debug(
-                "HTTP request successful", url=url, status_code=response.status
-            )
-
-            try:
-                # Extract links for crawling
-                self.logger.debug("Extracting links from page", url=url)
-                html = await response.text()
-                links = self._extract_links(html, url)
-                self.logger.info(
-                    "Adding new links to queue", url=url, new_links=len(links)
-                )
-                for link in links:
-                    if link not in self.visited_urls:
-                        self.url_queue.append(link)
-
-                # Extract title from raw HTML
-                title = self._extract_title(html)
-                self.logger.debug("Extracted title", url=url, title=title)
-
-                if self.config.content_type == "html":
-                    self.logger.debug("Processing Page", url=url)
-                    content = self._extract_content(html)
-                    self.logger.debug(
-                        "HTML content processed",
-                        url=url,
-                        content_length=len(content) if content else 0,
-                    )
-                    return content, title
-                else:
-                    self.logger.debug("Processing raw content", url=url)
-                    self.logger.debug(
-                        "Raw content length",
-                        url=url,
-                        content_length=len(html) if html else 0,
-                    )
-                    return html, title
+                content, title, _ = self._parse_page(fetched, url)
+                return content, title
             except Exception as e:
                 raise DocumentProcessingError(
                     f"Failed to process page {url}: {e!s}"
@@ -402,12 +514,10 @@ class PublicDocsConnector(BaseConnector):
                 f"Unexpected error processing page {url}: {e!s}"
             ) from e
 
-    def _extract_links(self, html: str, current_url: str) -> list[str]:
-        """Extract all links from the HTML content."""
-        self.logger.debug(
-            "Starting link extraction", current_url=current_url, html_length=len(html)
-        )
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_links(self, html: str | BeautifulSoup, current_url: str) -> list[str]:
+        """Extract all links from the HTML content or its parse tree."""
+        self.logger.debug("Starting link extraction", current_url=current_url)
+        soup = parse_html(html)
         links = []
 
         for link in soup.find_all("a", href=True):
@@ -427,12 +537,14 @@ class PublicDocsConnector(BaseConnector):
         self.logger.debug("Link extraction completed", total_links=len(links))
         return links
 
-    def _extract_content(self, html: str) -> str:
-        """Extract the main content from HTML using configured selectors."""
-        self.logger.debug("Starting content extraction", html_length=len(html))
-        self.logger.debug("HTML content preview", preview=html[:1000])
-        soup = BeautifulSoup(html, "html.parser")
-        self.logger.debug("HTML parsed successfully")
+    def _extract_content(self, html: str | BeautifulSoup) -> str:
+        """Extract the main content from HTML using configured selectors.
+
+        A parse tree passed in is modified: unwanted elements are removed and
+        code blocks are replaced.
+        """
+        self.logger.debug("Starting content extraction")
+        soup = parse_html(html)
 
         # Log the selectors being used
         self.logger.debug(
@@ -463,7 +575,7 @@ class PublicDocsConnector(BaseConnector):
                 selector=self.config.selectors.content,
             )
             # Log the first 1000 characters of the HTML to help debug
-            self.logger.debug("HTML content preview", preview=html[:1000])
+            self.logger.debug("HTML content preview", preview=str(soup)[:1000])
             return ""
 
         self.logger.debug(
@@ -492,18 +604,16 @@ class PublicDocsConnector(BaseConnector):
         )
         return extracted_text
 
-    def _extract_title(self, html: str) -> str:
-        """Extract the title from HTML content."""
-        self.logger.debug("Starting title extraction", html_length=len(html))
-        soup = BeautifulSoup(html, "html.parser")
+    def _extract_title(self, html: str | BeautifulSoup) -> str:
+        """Extract the title from HTML content or its parse tree."""
+        self.logger.debug("Starting title extraction")
+        soup = parse_html(html)
 
         # Production logging: Log title extraction process without verbose HTML content
-        title_tags = soup.find_all("title")
         if logging.getLogger().isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 "Found title tags during HTML parsing",
-                count=len(title_tags),
-                html_length=len(html),
+                count=len(soup.find_all("title")),
             )
 
         # First try to find the title in head/title
@@ -538,12 +648,12 @@ class PublicDocsConnector(BaseConnector):
         return default_title
 
     def _extract_attachments(
-        self, html: str, page_url: str, document_id: str
+        self, html: str | BeautifulSoup, page_url: str, document_id: str
     ) -> list[AttachmentMetadata]:
         """Extract attachment links from HTML content.
 
         Args:
-            html: HTML content to parse
+            html: HTML content to parse, or its parse tree
             page_url: URL of the current page
             document_id: ID of the parent document
 
@@ -554,7 +664,7 @@ class PublicDocsConnector(BaseConnector):
             return []
 
         self.logger.debug("Starting attachment extraction", page_url=page_url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
         attachments = []
 
         # Use configured selectors to find attachment links
@@ -655,13 +765,24 @@ class PublicDocsConnector(BaseConnector):
             # Reuse existing client if available; otherwise, create a temporary session
             if getattr(self, "_client", None):
                 client = self.client
+                base_url = str(self.config.base_url)
+                try:
+                    # The base page is kept so that it is not downloaded again
+                    fetched = await self._fetch_page(base_url)
+                except HTTPRequestError as e:
+                    self.logger.warning(
+                        "HTTP request failed", url=base_url, error=str(e)
+                    )
+                    return []
+                self._prefetched[base_url] = fetched
                 try:
                     return await _discover_pages(
                         client,
-                        str(self.config.base_url),
+                        base_url,
                         path_pattern=self.config.path_pattern,
                         exclude_paths=self.config.exclude_paths,
                         logger=self.logger,
+                        soup=fetched.soup,
                     )
                 except aiohttp.ClientError as e:
                     raise HTTPRequestError(
@@ -7,6 +7,7 @@ from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 
 from qdrant_loader.connectors.publicdocs.http import read_text_response as _read_text
+from qdrant_loader.connectors.publicdocs.parsers import parse_html
 
 
 async def discover_pages(
@@ -16,8 +17,30 @@ async def discover_pages(
     path_pattern: str | None,
     exclude_paths: list[str],
     logger: Any,
+    soup: BeautifulSoup | None = None,
 ) -> list[str]:
-    """Fetch the base URL and discover matching pages under it."""
+    """Fetch the base URL and discover matching pages under it.
+
+    Args:
+        soup: Already parsed base page; it is then not fetched again
+    """
+    if soup is None:
+        soup = await _fetch_base_page(session, base_url, logger=logger)
+        if soup is None:
+            return []
+    return _collect_pages(
+        soup,
+        base_url,
+        path_pattern=path_pattern,
+        exclude_paths=exclude_paths,
+        logger=logger,
+    )
+
+
+async def _fetch_base_page(
+    session: Any, base_url: str, *, logger: Any
+) -> BeautifulSoup | None:
+    """Fetch and parse the base URL, or return None if it cannot be read."""
     # Support both aiohttp-style context manager and direct-await mocks
     status_code = None
     response = None
@@ -39,14 +62,14 @@ async def discover_pages(
                         url=base_url,
                         status_code=status,
                     )
-                    return []
+                    return None
                 try:
                     html = await _read_text(response)
                 except Exception as e:
                     logger.warning(
                         "Failed to read HTTP response body", url=base_url, error=str(e)
                     )
-                    return []
+                    return None
         else:
             # Otherwise await if it's awaitable, or use it directly
             if hasattr(get_result, "__await__"):
@@ -62,17 +85,17 @@ async def discover_pages(
                     url=base_url,
                     status_code=status,
                 )
-                return []
+                return None
             try:
                 html = await _read_text(response)
             except Exception as e:
                 logger.warning(
                     "Failed to read HTTP response body", url=base_url, error=str(e)
                 )
-                return []
+                return None
     except Exception as e:
         logger.warning("HTTP request failed", url=base_url, error=str(e))
-        return []
+        return None
     finally:
         # Best-effort close for non-context-managed responses
         if response is not None and not context_managed:
@@ -91,7 +114,18 @@ async def discover_pages(
         content_length=len(html),
     )
 
-    soup = BeautifulSoup(html, "html.parser")
+    return parse_html(html)
+
+
+def _collect_pages(
+    soup: BeautifulSoup,
+    base_url: str,
+    *,
+    path_pattern: str | None,
+    exclude_paths: list[str],
+    logger: Any,
+) -> list[str]:
+    """The base URL followed by the matching pages it links to."""
     pages = [base_url]
     seen: set[str] = {base_url}
     base_parsed = urlparse(base_url)
@@ -6,9 +6,28 @@ from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup, NavigableString
 
+try:  # Faster parser backend, used when installed
+    import lxml  # noqa: F401
 
-def extract_links(html: str, current_url: str, base_url: str) -> list[str]:
-    soup = BeautifulSoup(html, "html.parser")
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - depends on the environment
+    HTML_PARSER = "html.parser"
+
+
+def parse_html(html: str | BeautifulSoup) -> BeautifulSoup:
+    """Parse HTML with the fastest available backend, once.
+
+    An already parsed tree is returned as is, so extractors can share it.
+    """
+    if isinstance(html, BeautifulSoup):
+        return html
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def extract_links(
+    html: str | BeautifulSoup, current_url: str, base_url: str
+) -> list[str]:
+    soup = parse_html(html)
     links: list[str] = []
     for link in soup.find_all("a", href=True):
         href = str(link["href"])  # type: ignore[index]
@@ -19,8 +38,8 @@ def extract_links(html: str, current_url: str, base_url: str) -> list[str]:
     return links
 
 
-def extract_title(html: str, content_selector: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+def extract_title(html: str | BeautifulSoup, content_selector: str) -> str:
+    soup = parse_html(html)
     title_tag = soup.find("title")
     if title_tag:
         return title_tag.get_text(strip=True)
@@ -36,9 +55,12 @@ def extract_title(html: str, content_selector: str) -> str:
 
 
 def extract_content(
-    html: str, content_selector: str, remove: list[str], code_blocks_selector: str
+    html: str | BeautifulSoup,
+    content_selector: str,
+    remove: list[str],
+    code_blocks_selector: str,
 ) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     for selector in remove:
         for element in soup.select(selector):
             element.decompose()
@@ -70,9 +92,9 @@ def should_process_url(
 
 
 def extract_attachments(
-    html: str, page_url: str, document_id: str, selectors: list[str]
+    html: str | BeautifulSoup, page_url: str, document_id: str, selectors: list[str]
 ) -> list[dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     attachments: list[dict[str, Any]] = []
     seen_urls: set[str] = set()
 
@@ -6,12 +6,16 @@ Prefer importing from this package instead of legacy
 
 from .client import (
     aiohttp_request_with_retries,
+    create_async_client,
+    create_async_client_for_session,
+    httpx_request_with_retries,
     make_request_async,
     make_request_with_retries_async,
 )
 from .errors import HTTPRequestError
 from .policy import (
     aiohttp_request_with_policy,
+    httpx_request_with_policy,
     request_with_policy,
 )
 from .rate_limit import RateLimiter
@@ -20,8 +24,12 @@ __all__ = [
     "make_request_async",
     "make_request_with_retries_async",
     "aiohttp_request_with_retries",
+    "create_async_client",
+    "create_async_client_for_session",
+    "httpx_request_with_retries",
     "HTTPRequestError",
     "RateLimiter",
     "request_with_policy",
     "aiohttp_request_with_policy",
+    "httpx_request_with_policy",
 ]
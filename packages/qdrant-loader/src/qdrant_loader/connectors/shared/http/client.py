@@ -4,7 +4,9 @@ import asyncio
 import random
 from typing import Any
 
+import httpx
 import requests
+from requests.auth import HTTPBasicAuth
 
 try:  # Optional import for async HTTP client
     import aiohttp  # type: ignore
@@ -106,3 +108,98 @@ async def aiohttp_request_with_retries(
             await asyncio.sleep(sleep_s)
     if last_exc:
         raise last_exc
+
+
+def create_async_client(
+    *,
+    max_connections: int = 10,
+    headers: dict[str, str] | None = None,
+    auth: httpx.Auth | tuple[str, str] | None = None,
+    timeout: float = 60.0,
+    keepalive_expiry: float = 30.0,
+) -> httpx.AsyncClient:
+    """Create a pooled, natively async client for a single host.
+
+    Requests wait for one of ``max_connections`` kept-alive connections
+    instead of occupying a worker thread each, which caps the concurrency
+    against the host. Responses are decompressed transparently; gzip and
+    deflate are always accepted, brotli when the ``brotli`` package is
+    installed.
+
+    Args:
+        max_connections: Maximum number of open connections to the host
+        headers: Headers sent with every request
+        auth: Authentication applied to every request
+        timeout: Connect, read and write timeout in seconds; waiting for a
+            pooled connection is not bounded
+        keepalive_expiry: Seconds an idle connection is kept open
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        auth=auth,
+        timeout=httpx.Timeout(timeout, pool=None),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        follow_redirects=True,
+    )
+
+
+def create_async_client_for_session(
+    session: requests.Session, **kwargs: Any
+) -> httpx.AsyncClient:
+    """Create an async client sending the credentials of a `requests` session.
+
+    Basic auth and the ``Authorization`` header configured on the session are
+    carried over, so connectors set up authentication in a single place while
+    attachment downloads keep using the session.
+
+    Args:
+        session: Session whose authentication is reused
+        **kwargs: Forwarded to :func:`create_async_client`
+    """
+    auth = session.auth
+    if isinstance(auth, HTTPBasicAuth):
+        auth = (auth.username, auth.password)
+    elif not isinstance(auth, tuple):
+        auth = None
+    authorization = session.headers.get("Authorization")
+    headers = {"Authorization": authorization} if authorization else None
+    return create_async_client(headers=headers, auth=auth, **kwargs)
+
+
+async def httpx_request_with_retries(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+    **kwargs: Any,
+) -> httpx.Response:
+    """Issue an `httpx` request with exponential backoff and jitter.
+
+    Retries only on listed status codes and `httpx.TransportError`.
+    """
+    attempt = 0
+    while True:
+        try:
+            response = await client.request(method, url, **kwargs)
+            if response.status_code in status_forcelist and attempt < retries:
+                await response.aclose()
+                attempt += 1
+                sleep_s = backoff_factor * (2 ** (attempt - 1)) + random.uniform(
+                    0, 0.25
+                )
+                await asyncio.sleep(sleep_s)
+                continue
+            return response
+        except httpx.TransportError:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            sleep_s = backoff_factor * (2 ** (attempt - 1)) + random.uniform(0, 0.25)
+            await asyncio.sleep(sleep_s)
@@ -3,10 +3,12 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
+import httpx
 import requests
 
 from .client import (
     aiohttp_request_with_retries,
+    httpx_request_with_retries,
     make_request_with_retries_async,
 )
 from .rate_limit import RateLimiter
@@ -107,3 +109,43 @@ async def aiohttp_request_with_policy(
     if overall_timeout is not None:
         return await asyncio.wait_for(_do_call(), timeout=overall_timeout)
     return await _do_call()
+
+
+async def httpx_request_with_policy(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    rate_limiter: RateLimiter | None = None,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    status_forcelist: tuple[int, ...] = DEFAULT_STATUS_FORCELIST,
+    overall_timeout: float | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Perform an httpx-based HTTP call with optional rate limiting and retries.
+
+    Args mirror request_with_policy but operate on an httpx.AsyncClient, so
+    no worker thread is held while the request is in flight.
+    """
+
+    async def _do_call() -> httpx.Response:
+        return await httpx_request_with_retries(
+            client,
+            method,
+            url,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            **kwargs,
+        )
+
+    if rate_limiter is not None:
+        async with rate_limiter:
+            if overall_timeout is not None:
+                return await asyncio.wait_for(_do_call(), timeout=overall_timeout)
+            return await _do_call()
+
+    if overall_timeout is not None:
+        return await asyncio.wait_for(_do_call(), timeout=overall_timeout)
+    return await _do_call()
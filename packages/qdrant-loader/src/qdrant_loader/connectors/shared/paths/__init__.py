@@ -0,0 +1,10 @@
+"""Shared path matching and directory walking for file-based connectors."""
+
+from .matcher import PathMatcher, compile_path_matcher
+from .walk import walk_files
+
+__all__ = [
+    "PathMatcher",
+    "compile_path_matcher",
+    "walk_files",
+]
@@ -0,0 +1,148 @@
+"""Compiled include/exclude path matching for file-based connectors.
+
+Patterns keep the connectors' established semantics:
+
+- ``dir/**`` and ``dir/`` match every path below ``dir``
+- ``dir/**/*`` includes every path below ``dir``, and ``""`` or ``/`` only
+  the files at the root
+- any other pattern is an ``fnmatch`` glob over the whole relative path,
+  where ``*`` also matches ``/``
+
+All patterns of a kind are compiled into a single regular expression, so a
+path is checked with one match instead of one ``fnmatch`` call per pattern.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from functools import lru_cache
+
+_WILDCARD = re.compile(r"[*?\[]")
+
+
+def _glob(pattern: str) -> str:
+    """Regex body of an ``fnmatch`` glob, without its anchors."""
+    translated = fnmatch.translate(pattern)
+    return translated[len("(?s:") : translated.rindex(")")]
+
+
+def _dir_glob(dir_pattern: str) -> str:
+    """Regex body of a directory glob.
+
+    A leading ``**/`` also matches no directory at all, so ``**/build``
+    matches a top-level ``build`` directory as well as nested ones.
+    """
+    bodies = [_glob(dir_pattern)]
+    if dir_pattern.startswith("**/"):
+        bodies.append(_glob(dir_pattern[3:]))
+    return "|".join(bodies)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Part of a glob before its first wildcard."""
+    match = _WILDCARD.search(pattern)
+    return pattern[: match.start()] if match else pattern
+
+
+def _compile(bodies: list[str]) -> re.Pattern[str] | None:
+    if not bodies:
+        return None
+    return re.compile("|".join(f"(?:{body})" for body in bodies), re.DOTALL)
+
+
+class PathMatcher:
+    """Include/exclude globs compiled once for repeated matching.
+
+    Paths are relative to the source root and use forward slashes.
+    """
+
+    def __init__(self, include_paths: tuple[str, ...], exclude_paths: tuple[str, ...]):
+        """Compile the include and exclude patterns.
+
+        Args:
+            include_paths: Patterns of the paths to include, all if empty
+            exclude_paths: Patterns of the paths to exclude
+        """
+        exclude: list[str] = []
+        # Patterns that exclude everything below a matching directory
+        dir_exclude: list[str] = []
+        for pattern in exclude_paths:
+            pattern = pattern.lstrip("/")
+            if pattern.endswith("/**") or pattern.endswith("/"):
+                dir_pattern = pattern[:-3] if pattern.endswith("/**") else pattern[:-1]
+                body = f"(?:{_dir_glob(dir_pattern)})/.*"
+                exclude.append(body)
+                dir_exclude.append(body)
+            else:
+                body = _glob(pattern)
+                exclude.append(body)
+                # A trailing "*" matches any remainder, so a directory whose
+                # path with a trailing slash matches has every file excluded
+                if pattern.endswith("*"):
+                    dir_exclude.append(body)
+
+        include: list[str] = []
+        # Literal path prefixes under which an include pattern can match
+        include_prefixes: list[str] = []
+        for pattern in include_paths:
+            pattern = pattern.lstrip("/")
+            if pattern == "":
+                include.append("[^/]*")
+                continue
+            if pattern.endswith("/**/*") or pattern.endswith("/"):
+                dir_pattern = (
+                    pattern[:-5] if pattern.endswith("/**/*") else pattern[:-1]
+                )
+                if dir_pattern == "":
+                    include.append(".*")
+                    include_prefixes.append("")
+                    continue
+                include.append(f"(?:{_dir_glob(dir_pattern)})/.*")
+                prefix = _literal_prefix(dir_pattern)
+                include_prefixes.append(
+                    prefix + "/" if prefix == dir_pattern else prefix
+                )
+            else:
+                include.append(_glob(pattern))
+                include_prefixes.append(_literal_prefix(pattern))
+
+        self._include_all = not include_paths
+        self._exclude = _compile(exclude)
+        self._dir_exclude = _compile(dir_exclude)
+        self._include = _compile(include)
+        self._include_prefixes = tuple(include_prefixes)
+
+    def is_excluded(self, rel_path: str) -> bool:
+        """Whether a file matches an exclude pattern."""
+        return bool(self._exclude and self._exclude.fullmatch(rel_path))
+
+    def is_included(self, rel_path: str) -> bool:
+        """Whether a file matches an include pattern, or none are configured."""
+        if self._include_all:
+            return True
+        return bool(self._include and self._include.fullmatch(rel_path))
+
+    def prunes(self, rel_dir: str) -> bool:
+        """Whether no file below a directory can be included.
+
+        Pruned directories need not be read at all. The check is conservative:
+        a directory that is not pruned may still contain no matching file.
+        """
+        dir_prefix = rel_dir + "/"
+        if self._dir_exclude and self._dir_exclude.fullmatch(dir_prefix):
+            return True
+        if self._include_all:
+            return False
+        return not any(
+            dir_prefix.startswith(prefix) or prefix.startswith(dir_prefix)
+            for prefix in self._include_prefixes
+        )
+
+
+@lru_cache(maxsize=64)
+def compile_path_matcher(
+    include_paths: tuple[str, ...], exclude_paths: tuple[str, ...]
+) -> PathMatcher:
+    """Compiled matcher for a set of patterns, shared across callers."""
+    return PathMatcher(include_paths, exclude_paths)
@@ -0,0 +1,54 @@
+"""Directory walking that skips pruned directories."""
+
+from __future__ import annotations
+
+import os
+import stat
+from collections.abc import Callable, Iterator
+
+
+def walk_files(
+    base_path: str, prune: Callable[[str], bool] | None = None
+) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield the regular files below a directory with their stat results.
+
+    Files are yielded in the order ``os.walk`` lists them. The stat results
+    come from ``os.scandir``, so callers need not stat files again. As with
+    ``os.walk``, symbolic links to directories are not followed and
+    unreadable directories are skipped.
+
+    Args:
+        base_path: Directory to walk
+        prune: Called with each directory's path relative to ``base_path``,
+            using forward slashes; directories it returns True for are not
+            descended into
+
+    Yields:
+        The path of each file and its stat result
+    """
+    stack = [(base_path, "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        subdirs: list[tuple[str, str]] = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if entry.is_symlink():
+                                continue
+                            rel_path = (
+                                f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                            )
+                            if prune is None or not prune(rel_path):
+                                subdirs.append((entry.path, rel_path))
+                            continue
+                        entry_stat = entry.stat()
+                    except OSError:
+                        # Broken links and files removed while walking
+                        continue
+                    if stat.S_ISREG(entry_stat.st_mode):
+                        yield entry.path, entry_stat
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
@@ -3,7 +3,6 @@
 from pathlib import Path
 
 from qdrant_loader.config import Settings, SourcesConfig
-from qdrant_loader.core.document import Document
 from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.core.monitoring.ingestion_metrics import IngestionMonitor
 from qdrant_loader.core.project_manager import ProjectManager
@@ -35,6 +34,7 @@ class AsyncIngestionPipeline:
         state_manager: StateManager | None = None,
         max_chunk_workers: int = 10,
         max_embed_workers: int = 4,
+        preserve_embedding_order: bool = True,
         max_upsert_workers: int = 4,
         queue_size: int = 1000,
         upsert_batch_size: int | None = None,
@@ -49,7 +49,9 @@ class AsyncIngestionPipeline:
             state_manager: Optional state manager
 
             max_chunk_workers: Maximum number of chunking workers
-            max_embed_workers: Maximum number of embedding workers
+            max_embed_workers: Maximum number of embedding batches in flight
+            preserve_embedding_order: Yield embeddings in input order instead of
+                completion order
             max_upsert_workers: Maximum number of upsert workers
             queue_size: Queue size for workers
             upsert_batch_size: Batch size for upserts
@@ -69,6 +71,7 @@ class AsyncIngestionPipeline:
         self.pipeline_config = PipelineConfig(
             max_chunk_workers=max_chunk_workers,
             max_embed_workers=max_embed_workers,
+            preserve_embedding_order=preserve_embedding_order,
             max_upsert_workers=max_upsert_workers,
             queue_size=queue_size,
             upsert_batch_size=upsert_batch_size,
@@ -188,7 +191,7 @@ class AsyncIngestionPipeline:
         source: str | None = None,
         project_id: str | None = None,
         force: bool = False,
-    ) -> list[Document]:
+    ) -> int:
         """Process documents from all configured sources.
 
         Args:
@@ -199,7 +202,7 @@ class AsyncIngestionPipeline:
             force: Force processing of all documents, bypassing change detection
 
         Returns:
-            List of processed documents
+            Number of processed documents
         """
         # Ensure the pipeline is initialized
         await self.initialize()
@@ -217,12 +220,12 @@ class AsyncIngestionPipeline:
             },
         )
 
-        documents = []  # Initialize to avoid UnboundLocalError in exception handler
+        document_count = 0  # Initialize to avoid UnboundLocalError in exception handler
         try:
             logger.debug("Starting document processing with new pipeline architecture")
 
             # Use the orchestrator to process documents with project support
-            documents = await self.orchestrator.process_documents(
+            document_count = await self.orchestrator.process_documents(
                 sources_config=sources_config,
                 source_type=source_type,
                 source=source,
@@ -231,10 +234,10 @@ class AsyncIngestionPipeline:
             )
 
             # Update metrics
-            if documents:
+            if document_count:
                 self.monitor.start_batch(
                     "document_batch",
-                    batch_size=len(documents),
+                    batch_size=document_count,
                     metadata={
                         "source_type": source_type,
                         "source": source,
@@ -243,14 +246,14 @@ class AsyncIngestionPipeline:
                     },
                 )
                 # Note: Success/error counts are handled internally by the new architecture
-                self.monitor.end_batch("document_batch", len(documents), 0, [])
+                self.monitor.end_batch("document_batch", document_count, 0, [])
 
             self.monitor.end_operation("ingestion_process")
 
             logger.debug(
-                f"Document processing completed. Processed {len(documents)} documents"
+                f"Document processing completed. Processed {document_count} documents"
             )
-            return documents
+            return document_count
 
         except Exception as e:
             # Standardized error logging: user-friendly message + technical details + stack trace
@@ -258,7 +261,7 @@ class AsyncIngestionPipeline:
                 "Document processing pipeline failed during ingestion",
                 error=str(e),
                 error_type=type(e).__name__,
-                documents_attempted=len(documents),
+                documents_processed=document_count,
                 suggestion="Check data source connectivity, document formats, and system resources",
                 exc_info=True,
             )
@@ -284,6 +287,18 @@ class AsyncIngestionPipeline:
             except Exception as e:
                 logger.warning(f"Error stopping metrics server: {e}")
 
+            # Close the native async Qdrant client, if one was opened
+            try:
+                await self.qdrant_manager.close()
+            except Exception as e:
+                logger.warning(f"Error closing Qdrant client: {e}")
+
+            # Close the embedding cache and the provider's HTTP connections
+            try:
+                await self.components.document_pipeline.embedding_worker.embedding_service.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing embedding service: {e}")
+
             # Use resource manager for cleanup
             if hasattr(self, "resource_manager"):
                 await self.resource_manager.cleanup()
@@ -1,7 +1,9 @@
 """Generic attachment downloader for connectors that support file attachments."""
 
+import asyncio
 import os
 import tempfile
+from collections import deque
 from pathlib import Path
 
 import requests
@@ -425,6 +427,14 @@ class AttachmentDownloader:
         """
         attachment_documents = []
         temp_files = []
+        # Attachments converted in worker processes are processed in threads,
+        # up to one per worker, while the next ones download
+        max_concurrent = (
+            self.file_converter.config.worker_processes
+            if self.file_converter and self.file_converter.uses_worker_processes
+            else 0
+        )
+        pending: deque[asyncio.Task] = deque()
 
         try:
             for attachment in attachments:
@@ -435,14 +445,39 @@ class AttachmentDownloader:
 
                 temp_files.append(temp_file_path)
 
-                # Process attachment
-                attachment_doc = self.process_attachment(
-                    attachment, temp_file_path, parent_document
+                if not max_concurrent:
+                    # Process attachment
+                    attachment_doc = self.process_attachment(
+                        attachment, temp_file_path, parent_document
+                    )
+                    if attachment_doc:
+                        attachment_documents.append(attachment_doc)
+                    continue
+
+                pending.append(
+                    asyncio.create_task(
+                        asyncio.to_thread(
+                            self.process_attachment,
+                            attachment,
+                            temp_file_path,
+                            parent_document,
+                        )
+                    )
                 )
+                if len(pending) >= max_concurrent:
+                    attachment_doc = await pending.popleft()
+                    if attachment_doc:
+                        attachment_documents.append(attachment_doc)
+            while pending:
+                attachment_doc = await pending.popleft()
                 if attachment_doc:
                     attachment_documents.append(attachment_doc)
 
         finally:
+            # Cancelling does not stop a thread, so wait for the attachments
+            # still being processed before deleting the files they read
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
             # Clean up all temporary files
             for temp_file in temp_files:
                 self.cleanup_temp_file(temp_file)
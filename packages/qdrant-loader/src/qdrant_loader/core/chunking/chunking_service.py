@@ -1,6 +1,7 @@
 """Service for chunking documents."""
 
 import logging
+import threading
 from pathlib import Path
 
 from qdrant_loader.config import GlobalConfig, Settings
@@ -75,6 +76,11 @@ class ChunkingService:
         # Default strategy for unknown file types
         self.default_strategy = DefaultChunkingStrategy(settings=self.settings)
 
+        # Strategy instances are reused across documents. Each chunking thread
+        # gets its own instances since strategies keep per-document state; the
+        # heavy NLP models behind them are shared process-wide.
+        self._local_strategies = threading.local()
+
     def validate_config(self) -> None:
         """Validate the configuration.
 
@@ -108,7 +114,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return MarkdownChunkingStrategy(self.settings)
+            return self._get_cached_strategy(MarkdownChunkingStrategy)
         elif conversion_method == "markitdown_fallback":
             # Fallback documents are also in markdown format
             self.logger.info(
@@ -119,7 +125,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return MarkdownChunkingStrategy(self.settings)
+            return self._get_cached_strategy(MarkdownChunkingStrategy)
 
         # Get file extension from the document content type
         file_type = document.content_type.lower()
@@ -145,7 +151,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return strategy_class(self.settings)
+            return self._get_cached_strategy(strategy_class)
 
         self.logger.debug(
             "No specific strategy found for this file type, using default text chunking strategy",
@@ -155,6 +161,28 @@ class ChunkingService:
         )
         return self.default_strategy
 
+    def _get_cached_strategy(
+        self, strategy_class: type[BaseChunkingStrategy]
+    ) -> BaseChunkingStrategy:
+        """Get the calling thread's instance of a strategy, creating it on first use.
+
+        Args:
+            strategy_class: The strategy class to instantiate
+
+        Returns:
+            The strategy instance for the current thread
+        """
+        strategies = getattr(self._local_strategies, "strategies", None)
+        if strategies is None:
+            strategies = {}
+            self._local_strategies.strategies = strategies
+
+        strategy = strategies.get(strategy_class)
+        if strategy is None:
+            strategy = strategy_class(self.settings)
+            strategies[strategy_class] = strategy
+        return strategy
+
     def chunk_document(self, document: Document) -> list[Document]:
         """Chunk a document into smaller pieces.
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 import tiktoken
 
 from qdrant_loader.core.document import Document
+from qdrant_loader.core.text_processing.resource_cache import get_shared_resource
 from qdrant_loader.core.text_processing.text_processor import TextProcessor
 from qdrant_loader.utils.logging import LoggingConfig
 
@@ -51,7 +52,10 @@ class BaseChunkingStrategy(ABC):
             self.encoding = None
         else:
             try:
-                self.encoding = tiktoken.get_encoding(self.tokenizer)
+                self.encoding = get_shared_resource(
+                    ("tiktoken", self.tokenizer),
+                    lambda: tiktoken.get_encoding(self.tokenizer),
+                )
             except Exception as e:
                 logger.warning(
                     "Failed to initialize tokenizer, falling back to simple character counting",
@@ -21,6 +21,9 @@ from qdrant_loader.core.chunking.strategy.code.parser.python_ast import parse_py
 from qdrant_loader.core.chunking.strategy.code.parser.tree_sitter import (
     extract_tree_sitter_elements,
 )
+from qdrant_loader.core.text_processing.resource_cache import (
+    get_thread_local_resource,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -154,7 +157,10 @@ class CodeDocumentParser(BaseDocumentParser):
         if language in self._parsers:
             return self._parsers[language]
         try:
-            parser = get_parser(language)
+            # Parsers hold per-parse state, so share them per thread only
+            parser = get_thread_local_resource(
+                ("tree_sitter", language), lambda: get_parser(language)
+            )
             self._parsers[language] = parser
             return parser
         except Exception as e:
@@ -39,6 +39,11 @@ class ChunkProcessor:
         max_workers = settings.global_config.chunking.strategies.markdown.max_workers
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
 
+    def reset_document_state(self) -> None:
+        """Clear per-document analysis caches before chunking a new document."""
+        self._processed_chunks.clear()
+        self.semantic_analyzer.clear_cache()
+
     def process_chunk(
         self, chunk: str, chunk_index: int, total_chunks: int
     ) -> dict[str, Any]:
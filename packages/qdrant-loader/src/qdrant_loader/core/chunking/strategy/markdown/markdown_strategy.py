@@ -71,6 +71,9 @@ class MarkdownChunkingStrategy(BaseChunkingStrategy):
             or f"{document.source_type}:{document.source}"
         )
 
+        # Strategy instances are reused, so drop analysis from previous documents
+        self.chunk_processor.reset_document_state()
+
         # Start progress tracking
         self.progress_tracker.start_chunking(
             document.id,
@@ -25,6 +25,9 @@ class Document(BaseModel):
     is_deleted: bool = False
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # Cheap source-side change marker (version, blob SHA, ETag...); not part
+    # of the content hash
+    fingerprint: str | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
 
@@ -0,0 +1,202 @@
+"""Adaptive (AIMD) batch sizing for embedding requests.
+
+The batcher observes every embedding request (latency, tokens, failures) and
+adjusts two knobs used by the embedding worker: the number of texts per batch
+and the number of batches in flight. Healthy windows grow the batch size
+additively and add a batch in flight while token throughput keeps improving;
+errors, rate limiting and slow requests shrink them multiplicatively. All
+decisions stay within the limits of ``AdaptiveBatchingConfig``.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from qdrant_loader.config.embedding import AdaptiveBatchingConfig
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+# Weight of the latest request in the tokens-per-text average
+_TOKENS_PER_ITEM_SMOOTHING = 0.2
+
+# Throughput drop tolerated before an extra batch in flight is considered useless
+_THROUGHPUT_TOLERANCE = 0.05
+
+
+@dataclass
+class _Observation:
+    items: int
+    tokens: int
+    latency_s: float
+    failed: bool
+    started: float
+
+
+class AdaptiveBatcher:
+    """AIMD controller for embedding batch size and concurrency."""
+
+    def __init__(
+        self,
+        config: AdaptiveBatchingConfig,
+        batch_size: int,
+        max_tokens_per_request: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            config: Adaptive batching limits
+            batch_size: Initial number of texts per batch
+            max_tokens_per_request: Token limit of a single provider request
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.config = config
+        self.max_tokens_per_request = max_tokens_per_request
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._tokens_per_item: float | None = None
+        self.batch_size = self._clamp_batch_size(batch_size)
+        self.concurrency = config.min_concurrency
+        self._last_throughput: float | None = None
+        self._window: list[_Observation] = []
+        self._publish()
+
+    @property
+    def max_concurrency(self) -> int:
+        """Upper bound of batches in flight."""
+        return self.config.max_concurrency
+
+    def reset(self, concurrency: int) -> None:
+        """Restart from ``concurrency`` batches in flight (clamped to the limits)."""
+        with self._lock:
+            self.concurrency = self._clamp_concurrency(concurrency)
+            self._last_throughput = None
+            self._start_window()
+            self._publish()
+
+    def record(
+        self,
+        items: int,
+        tokens: int,
+        latency_s: float,
+        *,
+        failed: bool = False,
+        rate_limited: bool = False,
+    ) -> None:
+        """Record the outcome of one embedding request.
+
+        Args:
+            items: Number of texts in the request
+            tokens: Token count of the request
+            latency_s: Request duration in seconds
+            failed: Whether the request failed
+            rate_limited: Whether the provider rejected it with a rate limit
+        """
+        with self._lock:
+            if rate_limited:
+                # The provider is saturated: back off right away
+                self._decrease("rate_limited")
+                self._last_throughput = None
+                self._start_window()
+                self._publish()
+                return
+
+            if not failed and items > 0:
+                per_item = tokens / items
+                self._tokens_per_item = (
+                    per_item
+                    if self._tokens_per_item is None
+                    else self._tokens_per_item
+                    + _TOKENS_PER_ITEM_SMOOTHING * (per_item - self._tokens_per_item)
+                )
+
+            self._window.append(
+                _Observation(
+                    items, tokens, latency_s, failed, self._clock() - latency_s
+                )
+            )
+            if len(self._window) >= self.config.window:
+                self._evaluate()
+
+    def _evaluate(self) -> None:
+        """Adjust batch size and concurrency from the completed window."""
+        window = self._window
+        # Measured from the first request of the window, so idle time spent
+        # waiting for chunks does not count against throughput
+        first_started = min(obs.started for obs in window)
+        elapsed = max(self._clock() - first_started, 1e-6)
+        succeeded = [obs for obs in window if not obs.failed]
+        error_rate = 1 - len(succeeded) / len(window)
+        latency = (
+            sum(obs.latency_s for obs in succeeded) / len(succeeded)
+            if succeeded
+            else 0.0
+        )
+        throughput = sum(obs.tokens for obs in succeeded) / elapsed
+
+        if error_rate > self.config.max_error_rate:
+            self._decrease("errors")
+            self._last_throughput = None
+        elif latency > self.config.target_latency_s:
+            self.batch_size = self._clamp_batch_size(
+                int(self.batch_size * self.config.decrease_factor)
+            )
+            self._last_throughput = throughput
+        else:
+            self.batch_size = self._clamp_batch_size(
+                self.batch_size + self.config.batch_size_step
+            )
+            if self._last_throughput is None or throughput >= self._last_throughput * (
+                1 - _THROUGHPUT_TOLERANCE
+            ):
+                self.concurrency = self._clamp_concurrency(self.concurrency + 1)
+            else:
+                # More batches in flight stopped paying off
+                self.concurrency = self._clamp_concurrency(self.concurrency - 1)
+            self._last_throughput = throughput
+
+        prometheus_metrics.EMBEDDING_REQUEST_LATENCY.set(latency)
+        prometheus_metrics.EMBEDDING_ERROR_RATE.set(error_rate)
+        prometheus_metrics.EMBEDDING_THROUGHPUT.set(throughput)
+        logger.debug(
+            "Adaptive embedding batching adjusted",
+            batch_size=self.batch_size,
+            concurrency=self.concurrency,
+            latency_s=round(latency, 3),
+            error_rate=round(error_rate, 3),
+            tokens_per_second=round(throughput, 1),
+        )
+        self._start_window()
+        self._publish()
+
+    def _decrease(self, reason: str) -> None:
+        factor = self.config.decrease_factor
+        self.batch_size = self._clamp_batch_size(int(self.batch_size * factor))
+        self.concurrency = self._clamp_concurrency(int(self.concurrency * factor))
+        logger.debug(
+            "Adaptive embedding batching backed off",
+            reason=reason,
+            batch_size=self.batch_size,
+            concurrency=self.concurrency,
+        )
+
+    def _clamp_batch_size(self, value: int) -> int:
+        upper = self.config.max_batch_size
+        # Keep a batch within one provider request once text sizes are known
+        if self.max_tokens_per_request and self._tokens_per_item:
+            upper = min(upper, int(self.max_tokens_per_request / self._tokens_per_item))
+        return max(self.config.min_batch_size, min(upper, value))
+
+    def _clamp_concurrency(self, value: int) -> int:
+        return max(self.config.min_concurrency, min(self.config.max_concurrency, value))
+
+    def _start_window(self) -> None:
+        self._window = []
+
+    def _publish(self) -> None:
+        prometheus_metrics.EMBEDDING_BATCH_SIZE.set(self.batch_size)
+        prometheus_metrics.EMBEDDING_CONCURRENCY.set(self.concurrency)
@@ -0,0 +1,283 @@
+"""Persistent content-addressed cache for chunk embeddings.
+
+Embeddings are keyed by a hash of the embedding provider and endpoint, model,
+tokenizer, vector size and the normalised chunk text, so unchanged chunks of an
+updated document are served from disk instead of being sent to the provider
+again. Vectors are stored as float32 blobs in a local SQLite database, and least
+recently used entries are evicted once the configured entry or size limits are
+exceeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+
+from qdrant_loader_core.llm.vectors import EmbeddingVector
+
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+DEFAULT_CACHE_FILENAME = "embedding_cache.db"
+
+# Keep SQLite's bound-parameter count well below its limit
+_QUERY_CHUNK_SIZE = 500
+
+# Evict down to this fraction of the limits so eviction does not run on every write
+_EVICTION_TARGET_RATIO = 0.9
+
+
+def default_cache_path(state_database_path: str) -> str:
+    """Derive the embedding cache location from the state database path.
+
+    The cache lives next to the state database. In-memory state databases
+    get an in-memory cache.
+
+    Args:
+        state_database_path: Configured path of the state database
+
+    Returns:
+        Path of the cache database, or ``":memory:"``
+    """
+    if state_database_path in (":memory:", "sqlite:///:memory:", "sqlite://:memory:"):
+        return ":memory:"
+
+    db_path = state_database_path
+    if db_path.startswith("sqlite:///"):
+        db_path = db_path[len("sqlite:///") :]
+    elif db_path.startswith("sqlite://"):
+        db_path = db_path[len("sqlite://") :]
+
+    path = Path(os.path.expanduser(os.path.expandvars(db_path)))
+    return str(path.parent / DEFAULT_CACHE_FILENAME)
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache with LRU eviction.
+
+    All methods are synchronous and thread-safe; async callers should run them
+    in a worker thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: str,
+        tokenizer: str,
+        vector_size: int | None = None,
+        max_entries: int | None = None,
+        max_size_mb: float | None = None,
+        provider: str | None = None,
+        endpoint: str | None = None,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: Cache database file, or ``":memory:"``
+            model: Embedding model name
+            tokenizer: Tokenizer name
+            vector_size: Expected embedding dimension
+            max_entries: Maximum number of cached embeddings
+            max_size_mb: Maximum total size of cached vectors in megabytes
+            provider: Embedding provider name
+            endpoint: Base URL of the embedding API; endpoints serving the same
+                model name may serve different weights
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self._namespace = (
+            f"{provider or ''}\0{(endpoint or '').rstrip('/')}\0"
+            f"{model}\0{tokenizer}\0{vector_size or ''}\0"
+        )
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_embeddings_last_used ON embeddings (last_used)"
+        )
+        self._conn.commit()
+
+        self._entries, self._bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM embeddings"
+        ).fetchone()
+
+        logger.debug(
+            "Embedding cache opened",
+            path=path,
+            entries=self._entries,
+            size_bytes=self._bytes,
+        )
+
+    @property
+    def entry_count(self) -> int:
+        """Number of cached embeddings."""
+        return self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of cached vectors in bytes."""
+        return self._bytes
+
+    def make_key(self, text: str) -> str:
+        """Build the cache key for a chunk text."""
+        normalized = unicodedata.normalize(
+            "NFC", text.replace("\r\n", "\n").replace("\r", "\n")
+        ).strip()
+        return hashlib.sha256(
+            (self._namespace + normalized).encode("utf-8")
+        ).hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> list[list[float] | None]:
+        """Look up embeddings for texts.
+
+        Args:
+            texts: Chunk texts to look up
+
+        Returns:
+            One embedding per text, or ``None`` for cache misses
+        """
+        if not texts:
+            return []
+
+        keys = [self.make_key(text) for text in texts]
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, list[float]] = {}
+
+        with self._lock:
+            for start in range(0, len(unique_keys), _QUERY_CHUNK_SIZE):
+                chunk = unique_keys[start : start + _QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+
+        results = [found.get(key) for key in keys]
+        hits = sum(1 for result in results if result is not None)
+        misses = len(results) - hits
+        self.hits += hits
+        self.misses += misses
+        prometheus_metrics.EMBEDDING_CACHE_HITS.inc(hits)
+        prometheus_metrics.EMBEDDING_CACHE_MISSES.inc(misses)
+        return results
+
+    def put_many(
+        self, texts: Sequence[str], embeddings: Sequence[EmbeddingVector]
+    ) -> None:
+        """Store embeddings for texts, evicting old entries if over the limits.
+
+        Args:
+            texts: Chunk texts
+            embeddings: Embedding for each text
+        """
+        if not texts:
+            return
+
+        now = time.time()
+        with self._lock:
+            for text, embedding in zip(texts, embeddings, strict=True):
+                blob = array("f", embedding).tobytes()
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO embeddings (key, vector, size, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self.make_key(text), blob, len(blob), now),
+                )
+                if cursor.rowcount > 0:
+                    self._entries += 1
+                    self._bytes += len(blob)
+            self._conn.commit()
+
+            if self._over_limits(self._entries, self._bytes):
+                self._evict()
+
+    def _over_limits(self, entries: int, size: int, ratio: float = 1.0) -> bool:
+        """Check whether the cache exceeds its limits scaled by ``ratio``."""
+        return bool(
+            (self.max_entries is not None and entries > self.max_entries * ratio)
+            or (self.max_bytes is not None and size > self.max_bytes * ratio)
+        )
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the eviction target."""
+        entries, size = self._entries, self._bytes
+        victims: list[str] = []
+        evicted_bytes = 0
+
+        cursor = self._conn.execute(
+            "SELECT key, size FROM embeddings ORDER BY last_used"
+        )
+        for key, entry_size in cursor:
+            if not self._over_limits(entries, size, _EVICTION_TARGET_RATIO):
+                break
+            victims.append(key)
+            entries -= 1
+            size -= entry_size
+            evicted_bytes += entry_size
+        cursor.close()
+
+        for start in range(0, len(victims), _QUERY_CHUNK_SIZE):
+            chunk = victims[start : start + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(
+                f"DELETE FROM embeddings WHERE key IN ({placeholders})", chunk
+            )
+        self._conn.commit()
+
+        self._entries, self._bytes = entries, size
+        self.evictions += len(victims)
+        prometheus_metrics.EMBEDDING_CACHE_EVICTIONS.inc(len(victims))
+        logger.debug(
+            "Evicted embeddings from cache",
+            evicted=len(victims),
+            evicted_bytes=evicted_bytes,
+            entries=entries,
+        )
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+        logger.info(
+            "Embedding cache closed",
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=self._entries,
+        )
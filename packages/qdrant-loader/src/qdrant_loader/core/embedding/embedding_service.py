@@ -1,18 +1,33 @@
+from __future__ import annotations
+
 import asyncio
 import logging
+import os
 import time
 from collections.abc import Sequence
 from importlib import import_module
 
 import requests
 import tiktoken
+from qdrant_loader_core.llm.errors import RateLimitedError
+from qdrant_loader_core.llm.vectors import EmbeddingVector
 
 from qdrant_loader.config import Settings
+from qdrant_loader.config.embedding import AdaptiveBatchingConfig, EmbeddingCacheConfig
 from qdrant_loader.core.document import Document
+from qdrant_loader.core.embedding.adaptive_batcher import AdaptiveBatcher
+from qdrant_loader.core.embedding.embedding_cache import (
+    EmbeddingCache,
+    default_cache_path,
+)
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Batches at least this large are tokenized in parallel with tiktoken
+_PARALLEL_TOKENIZE_THRESHOLD = 32
+_TOKENIZER_THREADS = min(8, os.cpu_count() or 1)
+
 
 class EmbeddingService:
     """Service for generating embeddings using provider-agnostic API (via core)."""
@@ -51,21 +66,63 @@ class EmbeddingService:
                 )
                 self.encoding = None
 
-        self.last_request_time = 0
-        self.min_request_interval = 0.5  # 500ms between requests
+        # Persistent cache of chunk embeddings keyed by content hash
+        self.cache = self._create_cache()
+
+        # Adaptive batch sizing and concurrency, when enabled
+        self.batcher = self._create_batcher()
 
         # Retry configuration for network resilience
         self.max_retries = 3
         self.base_retry_delay = 1.0  # Start with 1 second
         self.max_retry_delay = 30.0  # Cap at 30 seconds
 
-    async def _apply_rate_limit(self):
-        """Apply rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.min_request_interval:
-            await asyncio.sleep(self.min_request_interval - time_since_last_request)
-        self.last_request_time = time.time()
+    def _create_cache(self) -> EmbeddingCache | None:
+        """Open the embedding cache if it is enabled in the configuration."""
+        cache_config = getattr(self.settings.global_config.embedding, "cache", None)
+        if (
+            not isinstance(cache_config, EmbeddingCacheConfig)
+            or not cache_config.enabled
+        ):
+            return None
+
+        path = cache_config.path or default_cache_path(
+            self.settings.global_config.state_management.database_path
+        )
+        llm_settings = self.settings.llm_settings
+        try:
+            return EmbeddingCache(
+                path=os.path.expanduser(os.path.expandvars(path)),
+                model=self.model,
+                tokenizer=self.tokenizer,
+                vector_size=self.get_embedding_dimension(),
+                max_entries=cache_config.max_entries,
+                max_size_mb=cache_config.max_size_mb,
+                provider=llm_settings.provider,
+                endpoint=llm_settings.base_url,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to open embedding cache, embeddings will not be cached",
+                path=path,
+                error=str(e),
+            )
+            return None
+
+    def _create_batcher(self) -> AdaptiveBatcher | None:
+        """Create the adaptive batcher if it is enabled in the configuration."""
+        embedding_config = self.settings.global_config.embedding
+        adaptive_config = getattr(embedding_config, "adaptive_batching", None)
+        if (
+            not isinstance(adaptive_config, AdaptiveBatchingConfig)
+            or not adaptive_config.enabled
+        ):
+            return None
+        return AdaptiveBatcher(
+            adaptive_config,
+            batch_size=self.batch_size,
+            max_tokens_per_request=embedding_config.max_tokens_per_request,
+        )
 
     async def _retry_with_backoff(self, operation, operation_name: str, **kwargs):
         """Execute an operation with exponential backoff retry logic.
@@ -86,11 +143,15 @@ class EmbeddingService:
         for attempt in range(self.max_retries + 1):  # +1 for initial attempt
             try:
                 if attempt > 0:
-                    # Calculate exponential backoff delay
+                    # Calculate exponential backoff delay, unless the provider
+                    # told us how long to wait after a 429
                     delay = min(
                         self.base_retry_delay * (2 ** (attempt - 1)),
                         self.max_retry_delay,
                     )
+                    retry_after = getattr(last_exception, "retry_after", None)
+                    if retry_after is not None:
+                        delay = retry_after
                     logger.warning(
                         f"Retrying {operation_name} after network error",
                         attempt=attempt,
@@ -119,6 +180,7 @@ class EmbeddingService:
                 requests.exceptions.HTTPError,
                 ConnectionError,
                 OSError,
+                RateLimitedError,
             ) as e:
                 last_exception = e
 
@@ -155,7 +217,7 @@ class EmbeddingService:
 
     async def get_embeddings(
         self, texts: Sequence[str | Document]
-    ) -> list[list[float]]:
+    ) -> list[EmbeddingVector]:
         """Get embeddings for a list of texts."""
         if not texts:
             return []
@@ -190,8 +252,7 @@ class EmbeddingService:
             filtered_out=len(contents) - len(valid_contents),
         )
 
-        # Validate and split content based on token limits
-        # Use configurable token limits from settings
+        # Token limits from settings
         MAX_TOKENS_PER_REQUEST = (
             self.settings.global_config.embedding.max_tokens_per_request
         )
@@ -199,36 +260,48 @@ class EmbeddingService:
             self.settings.global_config.embedding.max_tokens_per_chunk
         )
 
-        validated_contents = []
-        truncated_count = 0
-        for content in valid_contents:
-            token_count = self.count_tokens(content)
+        # Serve unchanged chunks from the cache; only misses are tokenized and
+        # sent to the provider
+        results = await self._get_cached_embeddings(valid_contents)
+        miss_indices = [i for i, embedding in enumerate(results) if embedding is None]
+        uncached_contents = [valid_contents[i] for i in miss_indices]
+
+        # Tokenize each text once; the token arrays drive truncation and the
+        # counts drive batching
+        token_arrays = await self._tokenize(uncached_contents)
+        if token_arrays is None:
+            # No tokenizer: fall back to character counts
+            token_counts = [len(content) for content in uncached_contents]
+        else:
+            token_counts = [len(tokens) for tokens in token_arrays]
+
+        truncated = set()
+        for i, token_count in enumerate(token_counts):
             if token_count > MAX_TOKENS_PER_CHUNK:
-                truncated_count += 1
+                truncated.add(i)
                 logger.warning(
                     "Content exceeds maximum token limit, truncating",
-                    content_length=len(content),
+                    content_length=len(uncached_contents[i]),
                     token_count=token_count,
                     max_tokens=MAX_TOKENS_PER_CHUNK,
                 )
-                # Truncate content to fit within token limit
-                if self.encoding is not None:
-                    # Use tokenizer to truncate precisely
-                    tokens = self.encoding.encode(content)
-                    truncated_tokens = tokens[:MAX_TOKENS_PER_CHUNK]
-                    truncated_content = self.encoding.decode(truncated_tokens)
-                    validated_contents.append(truncated_content)
+                if token_arrays is not None:
+                    # Decode the already computed tokens to truncate precisely
+                    truncated_tokens = token_arrays[i][:MAX_TOKENS_PER_CHUNK]
+                    uncached_contents[i] = self.encoding.decode(truncated_tokens)
+                    token_counts[i] = len(truncated_tokens)
                 else:
                     # Fallback to character-based truncation (rough estimate)
                     # Assume ~4 characters per token on average
-                    max_chars = MAX_TOKENS_PER_CHUNK * 4
-                    validated_contents.append(content[:max_chars])
-            else:
-                validated_contents.append(content)
+                    uncached_contents[i] = uncached_contents[i][
+                        : MAX_TOKENS_PER_CHUNK * 4
+                    ]
+                    token_counts[i] = len(uncached_contents[i])
+        del token_arrays
 
-        if truncated_count > 0:
+        if truncated:
             logger.info(
-                f"⚠️ Truncated {truncated_count} content items due to token limits. You might want to adjust chunk size and/or max tokens settings in config.yaml"
+                f"⚠️ Truncated {len(truncated)} content items due to token limits. You might want to adjust chunk size and/or max tokens settings in config.yaml"
             )
 
         # Create smart batches that respect token limits
@@ -237,16 +310,18 @@ class EmbeddingService:
         current_batch_tokens = 0
         batch_count = 0
 
-        for content in validated_contents:
-            content_tokens = self.count_tokens(content)
-
+        for content, content_tokens in zip(
+            uncached_contents, token_counts, strict=True
+        ):
             # Check if adding this content would exceed the token limit
             if current_batch and (
                 current_batch_tokens + content_tokens > MAX_TOKENS_PER_REQUEST
             ):
                 # Process current batch
                 batch_count += 1
-                batch_embeddings = await self._process_batch(current_batch)
+                batch_embeddings = await self._process_batch(
+                    current_batch, current_batch_tokens
+                )
                 embeddings.extend(batch_embeddings)
 
                 # Start new batch
@@ -260,19 +335,62 @@ class EmbeddingService:
         # Process final batch if it exists
         if current_batch:
             batch_count += 1
-            batch_embeddings = await self._process_batch(current_batch)
+            batch_embeddings = await self._process_batch(
+                current_batch, current_batch_tokens
+            )
             embeddings.extend(batch_embeddings)
 
+        # Truncated texts are not cached: their embedding depends on the
+        # configured chunk token limit, not just on the text
+        if len(embeddings) == len(uncached_contents):
+            cacheable = [i for i in range(len(embeddings)) if i not in truncated]
+            if cacheable:
+                await self._cache_embeddings(
+                    [uncached_contents[i] for i in cacheable],
+                    [embeddings[i] for i in cacheable],
+                )
+
+        for index, embedding in zip(miss_indices, embeddings, strict=False):
+            results[index] = embedding
+
+        cache_hits = len(valid_contents) - len(miss_indices)
         logger.info(
             f"🔗 Generated embeddings: {len(embeddings)} items in {batch_count} batches"
+            + (f", {cache_hits} from cache" if cache_hits else "")
         )
-        return embeddings
+        return [embedding for embedding in results if embedding is not None]
+
+    async def _get_cached_embeddings(
+        self, contents: list[str]
+    ) -> list[EmbeddingVector | None]:
+        """Look up cached embeddings, treating cache failures as misses."""
+        if self.cache is None:
+            return [None] * len(contents)
+        try:
+            return await asyncio.to_thread(self.cache.get_many, contents)
+        except Exception as e:
+            logger.warning("Embedding cache lookup failed", error=str(e))
+            return [None] * len(contents)
+
+    async def _cache_embeddings(
+        self, contents: list[str], embeddings: Sequence[EmbeddingVector]
+    ) -> None:
+        """Store freshly generated embeddings, ignoring cache failures."""
+        if self.cache is None:
+            return
+        try:
+            await asyncio.to_thread(self.cache.put_many, contents, embeddings)
+        except Exception as e:
+            logger.warning("Failed to store embeddings in cache", error=str(e))
 
-    async def _process_batch(self, batch: list[str]) -> list[list[float]]:
+    async def _process_batch(
+        self, batch: list[str], total_tokens: int | None = None
+    ) -> Sequence[EmbeddingVector]:
         """Process a single batch of content for embeddings.
 
         Args:
             batch: List of content strings to embed
+            total_tokens: Token count of the batch, if already known
 
         Returns:
             List of embedding vectors
@@ -285,39 +403,44 @@ class EmbeddingService:
 
         # Optimized: Only calculate tokens for debug when debug logging is enabled
         if logging.getLogger().isEnabledFor(logging.DEBUG):
+            if total_tokens is None:
+                total_tokens = sum(self.count_tokens_batch(batch))
             logger.debug(
                 "Processing embedding batch",
                 batch_num=batch_num,
                 batch_size=len(batch),
-                total_tokens=sum(self.count_tokens(content) for content in batch),
+                total_tokens=total_tokens,
             )
 
-        await self._apply_rate_limit()
-
-        # Use retry logic for network resilience
+        # Request pacing (RPM/TPM) is enforced by the provider's shared rate
+        # limiter; use retry logic for network resilience and 429 responses
         return await self._retry_with_backoff(
             self._execute_embedding_request,
             f"embedding batch {batch_num}",
             batch=batch,
             batch_num=batch_num,
+            total_tokens=total_tokens,
         )
 
     async def _execute_embedding_request(
-        self, batch: list[str], batch_num: int
-    ) -> list[list[float]]:
+        self, batch: list[str], batch_num: int, total_tokens: int | None = None
+    ) -> Sequence[EmbeddingVector]:
         """Execute the actual embedding request (used by retry logic).
 
         Args:
             batch: List of content strings to embed
             batch_num: Batch number for logging
+            total_tokens: Token count of the batch, if already known
 
         Returns:
             List of embedding vectors
         """
+        started = time.monotonic()
         try:
             # Use core provider for embeddings
             embeddings_client = self.provider.embeddings()
             batch_embeddings = await embeddings_client.embed(batch)
+            self._record_request(batch, total_tokens, started)
 
             logger.debug(
                 "Completed batch processing",
@@ -328,6 +451,7 @@ class EmbeddingService:
             return batch_embeddings
 
         except Exception as e:
+            self._record_request(batch, total_tokens, started, error=e)
             logger.debug(
                 "Embedding request failed",
                 batch_num=batch_num,
@@ -336,7 +460,28 @@ class EmbeddingService:
             )
             raise  # Let the retry logic handle it
 
-    async def get_embedding(self, text: str) -> list[float]:
+    def _record_request(
+        self,
+        batch: list[str],
+        total_tokens: int | None,
+        started: float,
+        error: Exception | None = None,
+    ) -> None:
+        """Feed the outcome of an embedding request to the adaptive batcher."""
+        if self.batcher is None:
+            return
+        if total_tokens is None:
+            # Rough estimate (~4 characters per token) when tokens were not counted
+            total_tokens = sum(len(text) for text in batch) // 4
+        self.batcher.record(
+            items=len(batch),
+            tokens=total_tokens,
+            latency_s=time.monotonic() - started,
+            failed=error is not None,
+            rate_limited=isinstance(error, RateLimitedError),
+        )
+
+    async def get_embedding(self, text: str) -> EmbeddingVector:
         """Get embedding for a single text."""
         # Validate input
         if not text or not isinstance(text, str) or not text.strip():
@@ -352,7 +497,7 @@ class EmbeddingService:
             self._execute_single_embedding_request, "single embedding", text=clean_text
         )
 
-    async def _execute_single_embedding_request(self, text: str) -> list[float]:
+    async def _execute_single_embedding_request(self, text: str) -> EmbeddingVector:
         """Execute a single embedding request (used by retry logic).
 
         Args:
@@ -362,7 +507,6 @@ class EmbeddingService:
             The embedding vector
         """
         try:
-            await self._apply_rate_limit()
             embeddings_client = self.provider.embeddings()
             vectors = await embeddings_client.embed([text])
             return vectors[0]
@@ -374,16 +518,51 @@ class EmbeddingService:
             )
             raise  # Let the retry logic handle it
 
+    def _encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode many texts, using tiktoken's thread pool for large batches."""
+        if len(texts) < _PARALLEL_TOKENIZE_THRESHOLD:
+            return [self.encoding.encode_ordinary(text) for text in texts]
+        return self.encoding.encode_ordinary_batch(
+            texts, num_threads=_TOKENIZER_THREADS
+        )
+
+    async def _tokenize(self, texts: list[str]) -> list[list[int]] | None:
+        """Tokenize texts in a single pass, off the event loop for large batches.
+
+        Returns:
+            Token arrays for each text, or None if no tokenizer is configured
+        """
+        if self.encoding is None:
+            return None
+        if len(texts) < _PARALLEL_TOKENIZE_THRESHOLD:
+            return self._encode_batch(texts)
+        return await asyncio.to_thread(self._encode_batch, texts)
+
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in a text string."""
         if self.encoding is None:
             # Fallback to character count if no tokenizer is available
             return len(text)
-        return len(self.encoding.encode(text))
+        return len(self.encoding.encode_ordinary(text))
 
     def count_tokens_batch(self, texts: list[str]) -> list[int]:
         """Count the number of tokens in a list of text strings."""
-        return [self.count_tokens(text) for text in texts]
+        if self.encoding is None or len(texts) < _PARALLEL_TOKENIZE_THRESHOLD:
+            return [self.count_tokens(text) for text in texts]
+        return [len(tokens) for tokens in self._encode_batch(texts)]
+
+    def close(self) -> None:
+        """Release resources held by the service."""
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    async def aclose(self) -> None:
+        """Release the cache and the provider's pooled connections."""
+        self.close()
+        aclose = getattr(self.provider, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
     def get_embedding_dimension(self) -> int:
         """Get the dimension of the embedding vectors."""
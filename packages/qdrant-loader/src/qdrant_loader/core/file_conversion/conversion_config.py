@@ -41,6 +41,28 @@ class FileConversionConfig(BaseModel):
         le=3600,  # 1 hour
     )
 
+    worker_processes: int = Field(
+        default=0,
+        description=(
+            "Worker processes converting files in parallel; "
+            "0 converts files in the loading process"
+        ),
+        ge=0,
+        le=32,
+    )
+
+    max_files_per_worker: int = Field(
+        default=50,
+        description="Files a worker process converts before it is replaced",
+        gt=0,
+    )
+
+    worker_memory_limit: int | None = Field(
+        default=None,
+        description="Maximum memory of a worker process (in bytes, POSIX only)",
+        gt=0,
+    )
+
     markitdown: MarkItDownConfig = Field(
         default_factory=MarkItDownConfig, description="MarkItDown specific settings"
     )
@@ -22,6 +22,7 @@ from qdrant_loader.core.file_conversion.exceptions import (
     UnsupportedFileTypeError,
 )
 from qdrant_loader.core.file_conversion.file_detector import FileDetector
+from qdrant_loader.core.file_conversion.worker_pool import get_worker_pool
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -393,6 +394,16 @@ class FileConverter:
                     Exception("No LLM client available for MarkItDown")
                 )
 
+    @property
+    def uses_worker_processes(self) -> bool:
+        """Whether files are converted in worker processes.
+
+        Conversions in worker processes may be run from any thread, while
+        in-process conversions must run on the main thread, as their timeout
+        relies on ``SIGALRM``.
+        """
+        return self.config.worker_processes > 0
+
     def convert_file(self, file_path: str) -> str:
         """Convert a file to Markdown format with timeout support."""
         # Normalize path for consistent logging (Windows compatibility)
@@ -401,17 +412,10 @@ class FileConverter:
 
         try:
             self._validate_file(file_path)
-            markitdown = self._get_markitdown()
-
-            # Apply timeout wrapper and warning capture for conversion
-            with TimeoutHandler(self.config.conversion_timeout, file_path):
-                with capture_openpyxl_warnings(self.logger, file_path):
-                    result = markitdown.convert(file_path)
-
-            if hasattr(result, "text_content"):
-                markdown_content = result.text_content
+            if self.uses_worker_processes:
+                markdown_content = get_worker_pool(self.config).convert(file_path)
             else:
-                markdown_content = str(result)
+                markdown_content = self.convert_in_process(file_path)
 
             self.logger.info(
                 "File conversion completed",
@@ -435,6 +439,19 @@ class FileConverter:
             )
             raise MarkItDownError(e, file_path) from e
 
+    def convert_in_process(self, file_path: str) -> str:
+        """Convert a file with MarkItDown in the current process."""
+        markitdown = self._get_markitdown()
+
+        # Apply timeout wrapper and warning capture for conversion
+        with TimeoutHandler(self.config.conversion_timeout, file_path):
+            with capture_openpyxl_warnings(self.logger, file_path):
+                result = markitdown.convert(file_path)
+
+        if hasattr(result, "text_content"):
+            return result.text_content
+        return str(result)
+
     def _validate_file(self, file_path: str) -> None:
         """Validate file for conversion."""
         if not os.path.exists(file_path):
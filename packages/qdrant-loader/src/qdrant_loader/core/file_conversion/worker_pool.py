@@ -0,0 +1,245 @@
+"""Worker processes that convert files with MarkItDown.
+
+Each worker converts one file at a time. A worker that does not answer
+within the conversion timeout is killed, so a pathological document cannot
+pin a core or block ingestion, and workers are replaced after a set number
+of files to contain memory leaks in the converters.
+"""
+
+import atexit
+import multiprocessing
+import queue
+import threading
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext, SpawnProcess
+from typing import Any
+
+from qdrant_loader.core.file_conversion.conversion_config import FileConversionConfig
+from qdrant_loader.core.file_conversion.exceptions import (
+    ConversionTimeoutError,
+    MarkItDownError,
+)
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+# Time for a worker to import and initialize MarkItDown
+_STARTUP_TIMEOUT = 120
+# Extra time for a worker's own timeout to fire before it is killed
+_KILL_GRACE_SECONDS = 5
+_STOP_TIMEOUT = 5
+
+
+class ConversionWorkerError(Exception):
+    """Raised when a worker process fails to convert a file."""
+
+
+def _limit_memory(limit: int) -> None:
+    """Cap the address space of the current process."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        logger.warning("Worker memory limit is not supported on this platform")
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _run_worker(conn: Connection, config_data: dict[str, Any]) -> None:
+    """Entry point of a worker process: convert the files sent over a pipe."""
+    from qdrant_loader.core.file_conversion.file_converter import FileConverter
+
+    LoggingConfig.setup(level="WARNING")
+    config = FileConversionConfig.model_validate({**config_data, "worker_processes": 0})
+    if config.worker_memory_limit:
+        _limit_memory(config.worker_memory_limit)
+
+    converter = FileConverter(config)
+    try:
+        converter._get_markitdown()
+    except Exception as e:
+        conn.send(("error", str(e)))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            file_path = conn.recv()
+        except EOFError:
+            return
+        if file_path is None:
+            return
+        try:
+            conn.send(("ok", converter.convert_in_process(file_path)))
+        except ConversionTimeoutError:
+            conn.send(("timeout", None))
+        except MarkItDownError as e:
+            conn.send(("error", str(e.original_error)))
+        except Exception as e:
+            conn.send(("error", str(e) or type(e).__name__))
+
+
+class _Worker:
+    """A worker process, started on first use and after being stopped."""
+
+    def __init__(self, context: SpawnContext, config: FileConversionConfig):
+        self._context = context
+        self._config = config
+        self._process: SpawnProcess | None = None
+        self._conn: Connection | None = None
+        self._files = 0
+
+    def _start(self) -> tuple[SpawnProcess, Connection]:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_run_worker,
+            args=(child_conn, self._config.model_dump()),
+            name="qdrant-loader-conversion",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn, self._files = process, parent_conn, 0
+
+        try:
+            if not parent_conn.poll(_STARTUP_TIMEOUT):
+                self.stop(kill=True)
+                raise ConversionWorkerError("Conversion worker did not start")
+            status, payload = parent_conn.recv()
+        except (EOFError, OSError) as e:
+            process.join(_STOP_TIMEOUT)
+            exitcode = process.exitcode
+            self.stop(kill=True)
+            raise ConversionWorkerError(
+                f"Conversion worker exited on startup (exit code {exitcode})"
+            ) from e
+        if status != "ready":
+            self.stop(kill=True)
+            raise ConversionWorkerError(payload)
+        return process, parent_conn
+
+    def convert(self, file_path: str) -> str:
+        """Convert a file in the worker process.
+
+        Raises:
+            ConversionTimeoutError: If the conversion timed out
+            ConversionWorkerError: If the conversion failed
+        """
+        if self._process is None or self._conn is None or not self._process.is_alive():
+            self.stop(kill=True)
+            process, conn = self._start()
+        else:
+            process, conn = self._process, self._conn
+
+        timeout = self._config.conversion_timeout
+        try:
+            conn.send(file_path)
+            if not conn.poll(timeout + _KILL_GRACE_SECONDS):
+                logger.warning(
+                    "Killing conversion worker that timed out",
+                    file_path=file_path.replace("\\", "/"),
+                    pid=process.pid,
+                )
+                self.stop(kill=True)
+                raise ConversionTimeoutError(timeout, file_path)
+            status, payload = conn.recv()
+        except (EOFError, OSError) as e:
+            process.join(_STOP_TIMEOUT)
+            exitcode = process.exitcode
+            self.stop(kill=True)
+            raise ConversionWorkerError(
+                f"Conversion worker exited (exit code {exitcode})"
+            ) from e
+
+        self._files += 1
+        if self._files >= self._config.max_files_per_worker:
+            self.stop()
+        if status == "timeout":
+            raise ConversionTimeoutError(timeout, file_path)
+        if status != "ok":
+            raise ConversionWorkerError(payload)
+        return payload
+
+    def stop(self, kill: bool = False) -> None:
+        """Stop the worker process, letting it exit unless killed."""
+        process, conn = self._process, self._conn
+        self._process, self._conn = None, None
+        if process is None:
+            return
+        if not kill and conn is not None:
+            try:
+                conn.send(None)
+                process.join(_STOP_TIMEOUT)
+            except OSError:
+                pass
+        if process.is_alive():
+            process.kill()
+            process.join(_STOP_TIMEOUT)
+        if conn is not None:
+            conn.close()
+
+
+class ConversionWorkerPool:
+    """Pool of worker processes converting files in parallel.
+
+    ``convert`` blocks the calling thread until a worker is free and has
+    converted the file, so up to ``worker_processes`` threads convert files
+    at the same time.
+    """
+
+    def __init__(self, config: FileConversionConfig):
+        """Initialize the pool; worker processes start on first use.
+
+        Args:
+            config: File conversion configuration
+        """
+        self.config = config
+        # Spawned workers do not inherit the loader's threads and locks
+        context = multiprocessing.get_context("spawn")
+        self._workers = [
+            _Worker(context, config) for _ in range(config.worker_processes)
+        ]
+        self._idle: queue.LifoQueue[_Worker] = queue.LifoQueue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def convert(self, file_path: str) -> str:
+        """Convert a file to Markdown in a worker process.
+
+        Raises:
+            ConversionTimeoutError: If the conversion timed out
+            ConversionWorkerError: If the conversion failed
+        """
+        worker = self._idle.get()
+        try:
+            return worker.convert(file_path)
+        finally:
+            self._idle.put(worker)
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        for worker in self._workers:
+            worker.stop()
+
+
+_pools: dict[str, ConversionWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(config: FileConversionConfig) -> ConversionWorkerPool:
+    """Pool for a configuration, shared by all converters using it."""
+    key = config.model_dump_json()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConversionWorkerPool(config)
+        return pool
+
+
+@atexit.register
+def shutdown_worker_pools() -> None:
+    """Stop the worker processes of all pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -19,6 +19,35 @@ EMBEDDING_DURATION = Histogram(
 UPSERT_DURATION = Histogram(
     "qdrant_upsert_duration_seconds", "Time spent upserting to Qdrant"
 )
+EMBEDDING_CACHE_HITS = Counter(
+    "qdrant_embedding_cache_hits_total", "Chunk embeddings served from the cache"
+)
+EMBEDDING_CACHE_MISSES = Counter(
+    "qdrant_embedding_cache_misses_total",
+    "Chunk embeddings not found in the cache",
+)
+EMBEDDING_CACHE_EVICTIONS = Counter(
+    "qdrant_embedding_cache_evictions_total",
+    "Chunk embeddings evicted from the cache",
+)
+EMBEDDING_BATCH_SIZE = Gauge(
+    "qdrant_embedding_batch_size", "Current adaptive embedding batch size"
+)
+EMBEDDING_CONCURRENCY = Gauge(
+    "qdrant_embedding_concurrency", "Current adaptive number of in-flight batches"
+)
+EMBEDDING_REQUEST_LATENCY = Gauge(
+    "qdrant_embedding_request_latency_seconds",
+    "Mean embedding request latency over the last adaptive window",
+)
+EMBEDDING_ERROR_RATE = Gauge(
+    "qdrant_embedding_error_rate",
+    "Failed embedding request ratio over the last adaptive window",
+)
+EMBEDDING_THROUGHPUT = Gauge(
+    "qdrant_embedding_throughput_tokens_per_second",
+    "Embedding token throughput over the last adaptive window",
+)
 CHUNK_QUEUE_SIZE = Gauge("qdrant_chunk_queue_size", "Current size of the chunk queue")
 EMBED_QUEUE_SIZE = Gauge(
     "qdrant_embed_queue_size", "Current size of the embedding queue"
@@ -9,6 +9,7 @@ class PipelineConfig:
 
     max_chunk_workers: int = 10
     max_embed_workers: int = 4
+    preserve_embedding_order: bool = True
     max_upsert_workers: int = 4
     queue_size: int = 1000
     upsert_batch_size: int | None = None
@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
 
 from qdrant_loader.core.document import Document
 from qdrant_loader.utils.logging import LoggingConfig
@@ -25,23 +26,58 @@ class DocumentPipeline:
         self.embedding_worker = embedding_worker
         self.upsert_worker = upsert_worker
 
-    async def process_documents(self, documents: list[Document]) -> PipelineResult:
+    async def process_documents(
+        self,
+        documents: list[Document] | AsyncIterable[Document],
+        on_documents_done: (
+            Callable[[list[Document], dict[str, set[str]]], Awaitable[None]] | None
+        ) = None,
+    ) -> PipelineResult:
         """Process documents through the pipeline.
 
+        Documents can be passed as a list or as an async stream. When streamed,
+        chunking, embedding and upserting start as soon as the first documents
+        arrive, and the one hour pipeline timeout is not applied since the run
+        also includes fetching from the source.
+
         Args:
-            documents: List of documents to process
+            documents: Documents to process
+            on_documents_done: Called during the run with the documents all of
+                whose chunks were upserted, and the point ids of each of them
 
         Returns:
             PipelineResult with processing statistics
         """
-        logger.info(f"⚙️ Processing {len(documents)} documents through pipeline")
+        streamed = isinstance(documents, AsyncIterable)
+        seen_documents = 0
+
+        async def count_documents(
+            stream: AsyncIterable[Document],
+        ) -> AsyncIterator[Document]:
+            nonlocal seen_documents
+            async for document in stream:
+                seen_documents += 1
+                yield document
+
+        if streamed:
+            logger.info("⚙️ Processing streamed documents through pipeline")
+            documents = count_documents(documents)
+        else:
+            logger.info(f"⚙️ Processing {len(documents)} documents through pipeline")
         start_time = time.time()
 
+        def attempted() -> int:
+            return seen_documents if streamed else len(documents)
+
         try:
             # Step 1: Chunk documents
             logger.info("🔄 Starting chunking phase...")
             chunking_start = time.time()
-            chunks_iter = self.chunking_worker.process_documents(documents)
+            # Chunk counts let the upsert worker tell when a document is done
+            chunk_counts: dict[str, int] = {}
+            chunks_iter = self.chunking_worker.process_documents(
+                documents, chunk_counts=chunk_counts
+            )
 
             # Step 2: Generate embeddings
             logger.info("🔄 Chunking completed, transitioning to embedding phase...")
@@ -56,14 +92,22 @@ class DocumentPipeline:
 
             # Add timeout for the entire pipeline to prevent indefinite hanging
             try:
-                result = await asyncio.wait_for(
-                    self.upsert_worker.process_embedded_chunks(embedded_chunks_iter),
-                    timeout=3600.0,  # 1 hour timeout for the entire pipeline
+                upserts = self.upsert_worker.process_embedded_chunks(
+                    embedded_chunks_iter,
+                    chunk_counts=chunk_counts,
+                    on_documents_done=on_documents_done,
                 )
+                if streamed:
+                    result = await upserts
+                else:
+                    result = await asyncio.wait_for(
+                        upserts,
+                        timeout=3600.0,  # 1 hour timeout for the entire pipeline
+                    )
             except TimeoutError:
                 logger.error("❌ Pipeline timed out after 1 hour")
                 result = PipelineResult()
-                result.error_count = len(documents)
+                result.error_count = attempted()
                 result.errors = ["Pipeline timed out after 1 hour"]
                 return result
 
@@ -89,6 +133,6 @@ class DocumentPipeline:
             )
             # Return a result with error information
             result = PipelineResult()
-            result.error_count = len(documents)
+            result.error_count = attempted()
             result.errors = [f"Pipeline failed: {e}"]
             return result
@@ -94,6 +94,7 @@ class PipelineComponentsFactory:
             max_workers=config.max_embed_workers,
             queue_size=config.queue_size,
             shutdown_event=resource_manager.shutdown_event,
+            preserve_order=config.preserve_embedding_order,
         )
 
         upsert_worker = UpsertWorker(
@@ -102,6 +103,11 @@ class PipelineComponentsFactory:
             max_workers=config.max_upsert_workers,
             queue_size=config.queue_size,
             shutdown_event=resource_manager.shutdown_event,
+            wait=(
+                settings.global_config.qdrant.upsert_wait
+                if settings.global_config.qdrant
+                else True
+            ),
         )
 
         # Create document pipeline
@@ -130,6 +136,7 @@ class PipelineComponentsFactory:
             source_processor=source_processor,
             source_filter=source_filter,
             state_manager=state_manager,
+            qdrant_manager=qdrant_manager,
         )
 
         logger.debug("Pipeline components created successfully")
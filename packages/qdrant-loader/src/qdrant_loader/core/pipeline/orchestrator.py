@@ -1,6 +1,12 @@
 """Main orchestrator for the ingestion pipeline."""
 
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
+
 from qdrant_loader.config import Settings, SourcesConfig
+from qdrant_loader.config.state import IngestionStatus
+from qdrant_loader.connectors.base import FetchFilter, SyncTracker
 from qdrant_loader.connectors.confluence import ConfluenceConnector
 from qdrant_loader.connectors.git import GitConnector
 from qdrant_loader.connectors.jira import JiraConnector
@@ -8,6 +14,7 @@ from qdrant_loader.connectors.localfile import LocalFileConnector
 from qdrant_loader.connectors.publicdocs import PublicDocsConnector
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.project_manager import ProjectManager
+from qdrant_loader.core.qdrant_manager import QdrantManager
 from qdrant_loader.core.state.state_change_detector import StateChangeDetector
 from qdrant_loader.core.state.state_manager import StateManager
 from qdrant_loader.utils.logging import LoggingConfig
@@ -18,6 +25,11 @@ from .source_processor import SourceProcessor
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Documents whose points are deleted per Qdrant request
+_DELETE_BATCH_SIZE = 1000
+# Processed documents whose states are written together during a run
+_STATE_BATCH_SIZE = 500
+
 
 class PipelineComponents:
     """Container for pipeline components."""
@@ -28,11 +40,13 @@ class PipelineComponents:
         source_processor: SourceProcessor,
         source_filter: SourceFilter,
         state_manager: StateManager,
+        qdrant_manager: QdrantManager | None = None,
     ):
         self.document_pipeline = document_pipeline
         self.source_processor = source_processor
         self.source_filter = source_filter
         self.state_manager = state_manager
+        self.qdrant_manager = qdrant_manager
 
 
 class PipelineOrchestrator:
@@ -55,7 +69,7 @@ class PipelineOrchestrator:
         source: str | None = None,
         project_id: str | None = None,
         force: bool = False,
-    ) -> list[Document]:
+    ) -> int:
         """Main entry point for document processing.
 
         Args:
@@ -66,7 +80,9 @@ class PipelineOrchestrator:
             force: Force processing of all documents, bypassing change detection
 
         Returns:
-            List of processed documents
+            Number of documents processed, that is whose chunks were all
+            upserted. Their states are written while the run goes on, so the
+            documents are not kept until it ends.
         """
         logger.info("🚀 Starting document ingestion")
 
@@ -124,43 +140,90 @@ class PipelineOrchestrator:
             ):
                 raise ValueError(f"No sources found for type '{source_type}'")
 
-            # Collect documents from all sources
-            documents = await self._collect_documents_from_sources(
-                filtered_config, current_project_id
-            )
-
-            if not documents:
-                logger.info("✅ No documents found from sources")
-                return []
-
-            # Detect changes in documents (bypass if force=True)
+            # Stream documents from all sources so chunking, embedding and
+            # upserting overlap with fetching. Detect changes in documents
+            # (bypass if force=True); without change detection any processed
+            # document may have been updated.
+            deleted_documents: list[Document] = []
+            updated_ids: set[str] | None = None
+            synced_sources: dict[tuple[str, str], datetime] = {}
+            sync_cursors: dict[tuple[str, str], str] = {}
+            documents: AsyncIterator[Document]
             if force:
                 logger.warning(
-                    f"🔄 Force mode enabled: bypassing change detection, processing all {len(documents)} documents"
+                    "🔄 Force mode enabled: bypassing change detection, processing all documents"
+                )
+                documents = self._iter_documents_from_sources(
+                    filtered_config, current_project_id
                 )
             else:
-                documents = await self._detect_document_changes(
-                    documents, filtered_config, current_project_id
+                updated_ids = set()
+                documents = self._iter_document_changes(
+                    filtered_config,
+                    current_project_id,
+                    deleted=deleted_documents,
+                    updated_ids=updated_ids,
+                    synced=synced_sources,
+                    cursors=sync_cursors,
                 )
 
-                if not documents:
-                    logger.info("✅ No new or updated documents to process")
-                    return []
+            # States are written in batches as the pipeline reports documents
+            # done; only per-source counts are kept for the whole run
+            source_errors: list[Exception] = []
+            listed_counts: Counter[tuple[str, str]] = Counter()
+            done_counts: Counter[tuple[str, str]] = Counter()
+            pending_states: list[Document] = []
+
+            async def record_done(
+                done: list[Document], chunk_ids: dict[str, set[str]]
+            ) -> None:
+                # Only updated documents can have points of chunks they no
+                # longer produce
+                await self._delete_stale_chunks(
+                    {
+                        doc.id: chunk_ids[doc.id]
+                        for doc in done
+                        if updated_ids is None or doc.id in updated_ids
+                    }
+                )
+                if updated_ids is not None:
+                    updated_ids.difference_update(doc.id for doc in done)
+                done_counts.update((doc.source_type, doc.source) for doc in done)
+                pending_states.extend(done)
+                if len(pending_states) >= _STATE_BATCH_SIZE:
+                    await self._write_document_states(
+                        pending_states, current_project_id
+                    )
 
-            # Process documents through the pipeline
             result = await self.components.document_pipeline.process_documents(
-                documents
+                self._track_documents(documents, listed_counts, source_errors),
+                on_documents_done=record_done,
             )
+            await self._write_document_states(pending_states, current_project_id)
 
-            # Update document states for successfully processed documents
-            await self._update_document_states(
-                documents, result.successfully_processed_documents, current_project_id
+            # Errors from fetching or change detection abort the run as before,
+            # rather than being reported as pipeline errors
+            if source_errors:
+                raise source_errors[0]
+
+            await self._reconcile_points(deleted_documents)
+
+            # Sources with documents that are not done are listed again next run
+            failed_sources = {
+                key for key, count in listed_counts.items() if done_counts[key] < count
+            }
+            await self._record_synced_sources(
+                synced_sources, failed_sources, current_project_id, sync_cursors
             )
 
+            if not listed_counts:
+                logger.info("✅ No new or updated documents to process")
+                return 0
+
             logger.info(
                 f"✅ Ingestion completed: {result.success_count} chunks processed successfully"
             )
-            return documents
+            return sum(done_counts.values())
 
         except Exception as e:
             logger.error(f"❌ Pipeline orchestration failed: {e}", exc_info=True)
@@ -171,12 +234,12 @@ class PipelineOrchestrator:
         source_type: str | None = None,
         source: str | None = None,
         force: bool = False,
-    ) -> list[Document]:
+    ) -> int:
         """Process documents from all configured projects."""
         if not self.project_manager:
             raise ValueError("Project manager not available")
 
-        all_documents = []
+        total_documents = 0
         project_ids = self.project_manager.list_project_ids()
 
         logger.info(f"Processing {len(project_ids)} projects")
@@ -184,15 +247,15 @@ class PipelineOrchestrator:
         for project_id in project_ids:
             try:
                 logger.debug(f"Processing project: {project_id}")
-                project_documents = await self.process_documents(
+                project_count = await self.process_documents(
                     project_id=project_id,
                     source_type=source_type,
                     source=source,
                     force=force,
                 )
-                all_documents.extend(project_documents)
+                total_documents += project_count
                 logger.debug(
-                    f"Processed {len(project_documents)} documents from project: {project_id}"
+                    f"Processed {project_count} documents from project: {project_id}"
                 )
             except Exception as e:
                 logger.error(
@@ -202,73 +265,82 @@ class PipelineOrchestrator:
                 continue
 
         logger.info(
-            f"Completed processing all projects: {len(all_documents)} total documents"
+            f"Completed processing all projects: {total_documents} total documents"
         )
-        return all_documents
-
-    async def _collect_documents_from_sources(
-        self, filtered_config: SourcesConfig, project_id: str | None = None
-    ) -> list[Document]:
-        """Collect documents from all configured sources."""
-        documents = []
-
-        # Process each source type with project context
-        if filtered_config.confluence:
-            confluence_docs = (
-                await self.components.source_processor.process_source_type(
-                    filtered_config.confluence, ConfluenceConnector, "Confluence"
-                )
-            )
-            documents.extend(confluence_docs)
+        return total_documents
 
-        if filtered_config.git:
-            git_docs = await self.components.source_processor.process_source_type(
-                filtered_config.git, GitConnector, "Git"
-            )
-            documents.extend(git_docs)
-
-        if filtered_config.jira:
-            jira_docs = await self.components.source_processor.process_source_type(
-                filtered_config.jira, JiraConnector, "Jira"
-            )
-            documents.extend(jira_docs)
+    async def _iter_documents_from_sources(
+        self,
+        filtered_config: SourcesConfig,
+        project_id: str | None = None,
+        *,
+        fetch_filter: FetchFilter | None = None,
+        sync_tracker: SyncTracker | None = None,
+        listed_sources: set[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[Document]:
+        """Stream documents from all configured sources.
 
-        if filtered_config.publicdocs:
-            publicdocs_docs = (
-                await self.components.source_processor.process_source_type(
-                    filtered_config.publicdocs, PublicDocsConnector, "PublicDocs"
-                )
-            )
-            documents.extend(publicdocs_docs)
+        Args:
+            filtered_config: Sources to stream
+            project_id: Project being processed
+            fetch_filter: Filter the connectors consult before fetching items
+            sync_tracker: Tracker the connectors report listed items to
+            listed_sources: Collects the sources streamed to the end
+        """
+        source_types = [
+            (filtered_config.confluence, ConfluenceConnector, "Confluence"),
+            (filtered_config.git, GitConnector, "Git"),
+            (filtered_config.jira, JiraConnector, "Jira"),
+            (filtered_config.publicdocs, PublicDocsConnector, "PublicDocs"),
+            (filtered_config.localfile, LocalFileConnector, "LocalFile"),
+        ]
 
-        if filtered_config.localfile:
-            localfile_docs = await self.components.source_processor.process_source_type(
-                filtered_config.localfile, LocalFileConnector, "LocalFile"
-            )
-            documents.extend(localfile_docs)
+        document_count = 0
+        for source_configs, connector_class, source_type in source_types:
+            if not source_configs:
+                continue
 
-        # Inject project metadata into documents if project context is available
-        if project_id and self.project_manager:
-            for document in documents:
-                enhanced_metadata = self.project_manager.inject_project_metadata(
-                    project_id, document.metadata
-                )
-                document.metadata = enhanced_metadata
+            async for document in self.components.source_processor.iter_source_type(
+                source_configs,
+                connector_class,
+                source_type,
+                fetch_filter=fetch_filter,
+                sync_tracker=sync_tracker,
+                listed_sources=listed_sources,
+            ):
+                # Inject project metadata into documents if project context is available
+                if project_id and self.project_manager:
+                    document.metadata = self.project_manager.inject_project_metadata(
+                        project_id, document.metadata
+                    )
+                document_count += 1
+                yield document
 
-        logger.info(f"📄 Collected {len(documents)} documents from all sources")
-        return documents
+        logger.info(f"📄 Collected {document_count} documents from all sources")
 
-    async def _detect_document_changes(
+    async def _iter_document_changes(
         self,
-        documents: list[Document],
         filtered_config: SourcesConfig,
         project_id: str | None = None,
-    ) -> list[Document]:
-        """Detect changes in documents and return only new/updated ones."""
-        if not documents:
-            return []
+        *,
+        deleted: list[Document] | None = None,
+        updated_ids: set[str] | None = None,
+        synced: dict[tuple[str, str], datetime] | None = None,
+        cursors: dict[tuple[str, str], str] | None = None,
+    ) -> AsyncIterator[Document]:
+        """Stream only the new and updated documents from the sources.
 
-        logger.debug(f"Starting change detection for {len(documents)} documents")
+        Args:
+            filtered_config: Sources to stream and compare with their previous
+                states
+            project_id: Project being processed
+            deleted: Collects the documents detected as deleted
+            updated_ids: Collects the ids of the documents detected as updated
+            synced: Collects the sources listed to the end, with the time their
+                listing started
+            cursors: Collects the positions reported by the synced sources
+        """
+        logger.debug("Starting streaming change detection")
 
         try:
             # Ensure state manager is initialized before use
@@ -276,25 +348,163 @@ class PipelineOrchestrator:
                 logger.debug("Initializing state manager for change detection")
                 await self.components.state_manager.initialize()
 
+            counts = {"new": 0, "updated": 0, "deleted": 0}
             async with StateChangeDetector(
-                self.components.state_manager
+                self.components.state_manager, project_id
             ) as change_detector:
-                changes = await change_detector.detect_changes(
-                    documents, filtered_config
+                # Only sources streamed to the end can have documents deleted
+                listed_sources: set[tuple[str, str]] = set()
+                # Connectors consult the detector before fetching each item, so
+                # unchanged items are never downloaded
+                documents = self._iter_documents_from_sources(
+                    filtered_config,
+                    project_id,
+                    fetch_filter=change_detector.should_fetch,
+                    sync_tracker=change_detector,
+                    listed_sources=listed_sources,
                 )
+                async for change_type, document in change_detector.iter_changes(
+                    documents, filtered_config, listed_sources
+                ):
+                    counts[change_type] += 1
+                    if change_type == "deleted":
+                        if deleted is not None:
+                            deleted.append(document)
+                        continue
+                    if change_type == "updated" and updated_ids is not None:
+                        updated_ids.add(document.id)
+                    yield document
+                if synced is not None:
+                    synced.update(change_detector.synced_sources)
+                if cursors is not None:
+                    cursors.update(change_detector.sync_cursors)
 
-                logger.info(
-                    f"🔍 Change detection: {len(changes['new'])} new, "
-                    f"{len(changes['updated'])} updated, {len(changes['deleted'])} deleted"
+            logger.info(
+                f"🔍 Change detection: {counts['new']} new, "
+                f"{counts['updated']} updated, {counts['deleted']} deleted"
+            )
+
+        except Exception as e:
+            logger.error(f"Error during change detection: {e}", exc_info=True)
+            raise
+
+    async def _delete_stale_chunks(self, chunk_ids: dict[str, set[str]]) -> None:
+        """Remove the points of chunks that updated documents no longer produce.
+
+        Called as documents are done, so the point ids of a document are only
+        kept until its chunks are all upserted. Failures are logged only:
+        ``qdrant-loader gc`` removes whatever is left.
+
+        Args:
+            chunk_ids: Point ids of each updated document
+        """
+        qdrant_manager = self.components.qdrant_manager
+        if qdrant_manager is None or not chunk_ids:
+            return
+        try:
+            await qdrant_manager.delete_stale_chunks(chunk_ids)
+            logger.debug(f"Removed stale chunks of {len(chunk_ids)} updated documents")
+        except Exception as e:
+            logger.warning(f"Failed to remove stale chunks: {e}")
+
+    async def _reconcile_points(self, deleted_documents: list[Document]) -> None:
+        """Remove the points of deleted documents and mark their states deleted.
+
+        Failures are logged only: ``qdrant-loader gc`` removes whatever is left.
+
+        Args:
+            deleted_documents: Documents detected as deleted
+        """
+        qdrant_manager = self.components.qdrant_manager
+        if qdrant_manager is None:
+            return
+
+        if not deleted_documents:
+            return
+        try:
+            for i in range(0, len(deleted_documents), _DELETE_BATCH_SIZE):
+                batch = deleted_documents[i : i + _DELETE_BATCH_SIZE]
+                await qdrant_manager.delete_points_by_document_id(
+                    [document.id for document in batch]
                 )
+                await self.components.state_manager.mark_documents_deleted(batch)
+            logger.info(
+                f"🗑️ Removed the points of {len(deleted_documents)} deleted documents"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to remove the points of deleted documents: {e}")
+
+    async def _record_synced_sources(
+        self,
+        synced: dict[tuple[str, str], datetime],
+        failed_sources: set[tuple[str, str]],
+        project_id: str | None,
+        cursors: dict[tuple[str, str], str] | None = None,
+    ) -> None:
+        """Record a successful ingestion of the sources that were listed in full.
 
-                # Return new and updated documents
-                return changes["new"] + changes["updated"]
+        A source is skipped if any of its documents failed, so that the next
+        incremental run lists the failed documents again.
 
+        Args:
+            synced: Sources listed to the end, with the time their listing started
+            failed_sources: Sources with documents that were not processed
+            project_id: Project being processed
+            cursors: Positions the synced sources reported, stored with them
+        """
+        if not synced:
+            return
+        for (source_type, source), started in synced.items():
+            if (source_type, source) in failed_sources:
+                logger.info(
+                    f"Not advancing the last sync time of {source_type}:{source}: "
+                    "some documents failed"
+                )
+                continue
+            try:
+                await self.components.state_manager.update_last_ingestion(
+                    source_type,
+                    source,
+                    status=IngestionStatus.SUCCESS,
+                    project_id=project_id,
+                    ingested_at=started,
+                    sync_cursor=(cursors or {}).get((source_type, source)),
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to record the last sync time of {source_type}:{source}: {e}"
+                )
+
+    async def _track_documents(
+        self,
+        documents: AsyncIterable[Document],
+        counts: Counter[tuple[str, str]],
+        errors: list[Exception],
+    ) -> AsyncIterator[Document]:
+        """Count the documents of each source passed to the pipeline.
+
+        Exceptions raised by the document stream are recorded in ``errors``
+        before being re-raised into the pipeline.
+        """
+        try:
+            async for document in documents:
+                counts[(document.source_type, document.source)] += 1
+                yield document
         except Exception as e:
-            logger.error(f"Error during change detection: {e}", exc_info=True)
+            errors.append(e)
             raise
 
+    async def _write_document_states(
+        self, documents: list[Document], project_id: str | None
+    ) -> None:
+        """Write the states of processed documents and empty ``documents``."""
+        batch = list(documents)
+        documents.clear()
+        if batch:
+            await self._update_document_states(
+                batch, {doc.id for doc in batch}, project_id
+            )
+
     async def _update_document_states(
         self,
         documents: list[Document],
@@ -315,6 +525,22 @@ class PipelineOrchestrator:
             logger.debug("Initializing state manager for document state updates")
             await self.components.state_manager.initialize()
 
+        if not successfully_processed_docs:
+            return
+
+        try:
+            await self.components.state_manager.update_document_states(
+                successfully_processed_docs, project_id
+            )
+            logger.debug(
+                f"Updated document states for {len(successfully_processed_docs)} documents"
+            )
+            return
+        except Exception as e:
+            logger.warning(
+                f"Bulk document state update failed, updating documents one by one: {e}"
+            )
+
         for doc in successfully_processed_docs:
             try:
                 await self.components.state_manager.update_document_state(
@@ -1,10 +1,10 @@
 """Source processor for handling different source types."""
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Mapping
 
 from qdrant_loader.config.source_config import SourceConfig
-from qdrant_loader.connectors.base import BaseConnector
+from qdrant_loader.connectors.base import BaseConnector, FetchFilter, SyncTracker
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import FileConversionConfig
 from qdrant_loader.utils.logging import LoggingConfig
@@ -53,20 +53,9 @@ class SourceProcessor:
             try:
                 logger.debug(f"Processing {source_type} source: {source_name}")
 
-                # Create connector instance and use as async context manager
-                connector = connector_class(source_config)
-
-                # Set file conversion config if available and connector supports it
-                if (
-                    self.file_conversion_config
-                    and hasattr(connector, "set_file_conversion_config")
-                    and hasattr(source_config, "enable_file_conversion")
-                    and source_config.enable_file_conversion
-                ):
-                    logger.debug(
-                        f"Setting file conversion config for {source_type} source: {source_name}"
-                    )
-                    connector.set_file_conversion_config(self.file_conversion_config)
+                connector = self._create_connector(
+                    connector_class, source_config, source_type, source_name
+                )
 
                 # Use the connector as an async context manager to ensure proper initialization
                 async with connector:
@@ -91,3 +80,123 @@ class SourceProcessor:
                 f"📥 {source_type}: {len(all_documents)} documents from {len(source_configs)} sources"
             )
         return all_documents
+
+    async def iter_source_type(
+        self,
+        source_configs: Mapping[str, SourceConfig],
+        connector_class: type[BaseConnector],
+        source_type: str,
+        *,
+        fetch_filter: FetchFilter | None = None,
+        sync_tracker: SyncTracker | None = None,
+        listed_sources: set[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[Document]:
+        """Stream documents from a specific source type.
+
+        Unlike :meth:`process_source_type`, documents are yielded as each
+        connector produces them, so downstream stages can start work while
+        sources are still being fetched.
+
+        Args:
+            source_configs: Mapping of source name to source configuration
+            connector_class: The connector class to use for this source type
+            source_type: The type of source being processed
+            fetch_filter: Filter the connectors consult before fetching items
+            sync_tracker: Tracker the connectors report listed items to
+            listed_sources: Collects the sources streamed to the end, without
+                error or shutdown
+
+        Yields:
+            Documents from all sources of this type
+        """
+        logger.debug(f"Streaming {source_type} sources: {list(source_configs.keys())}")
+
+        total_documents = 0
+
+        for source_name, source_config in source_configs.items():
+            if self.shutdown_event.is_set():
+                logger.info(
+                    f"Shutdown requested, skipping {source_type} source: {source_name}"
+                )
+                break
+
+            source_documents = 0
+            try:
+                logger.debug(f"Streaming {source_type} source: {source_name}")
+
+                connector = self._create_connector(
+                    connector_class, source_config, source_type, source_name
+                )
+                connector.set_fetch_filter(fetch_filter)
+                connector.set_sync_tracker(sync_tracker)
+
+                interrupted = False
+                async with connector:
+                    async for document in connector.iter_documents():
+                        if self.shutdown_event.is_set():
+                            logger.info(
+                                f"Shutdown requested, stopping {source_type} source: {source_name}"
+                            )
+                            interrupted = True
+                            break
+                        source_documents += 1
+                        yield document
+
+                if not interrupted and listed_sources is not None:
+                    listed_sources.add(
+                        (source_config.source_type, source_config.source)
+                    )
+
+                logger.debug(
+                    f"Retrieved {source_documents} documents from {source_type} source: {source_name}"
+                )
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to process {source_type} source {source_name} "
+                    f"after {source_documents} documents: {e}",
+                    exc_info=True,
+                )
+                # Continue processing other sources even if one fails
+                continue
+            finally:
+                total_documents += source_documents
+
+        if total_documents:
+            logger.info(
+                f"📥 {source_type}: {total_documents} documents from {len(source_configs)} sources"
+            )
+
+    def _create_connector(
+        self,
+        connector_class: type[BaseConnector],
+        source_config: SourceConfig,
+        source_type: str,
+        source_name: str,
+    ) -> BaseConnector:
+        """Create a connector instance for a source.
+
+        Args:
+            connector_class: The connector class to instantiate
+            source_config: Configuration of the source
+            source_type: The type of source being processed
+            source_name: Name of the source
+
+        Returns:
+            The configured connector
+        """
+        connector = connector_class(source_config)
+
+        # Set file conversion config if available and connector supports it
+        if (
+            self.file_conversion_config
+            and hasattr(connector, "set_file_conversion_config")
+            and hasattr(source_config, "enable_file_conversion")
+            and source_config.enable_file_conversion
+        ):
+            logger.debug(
+                f"Setting file conversion config for {source_type} source: {source_name}"
+            )
+            connector.set_file_conversion_config(self.file_conversion_config)
+
+        return connector
@@ -2,7 +2,13 @@
 
 import asyncio
 import concurrent.futures
-from collections.abc import AsyncIterator
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Sized,
+)
 
 import psutil
 
@@ -15,6 +21,21 @@ from .base_worker import BaseWorker
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Marks the end of the chunked document stream
+_DONE = object()
+
+
+async def _iterate(
+    documents: Iterable[Document] | AsyncIterable[Document],
+) -> AsyncIterator[Document]:
+    """Iterate a list or an async stream of documents uniformly."""
+    if isinstance(documents, AsyncIterable):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
+
 
 class ChunkingWorker(BaseWorker):
     """Handles document chunking with controlled concurrency."""
@@ -105,99 +126,161 @@ class ChunkingWorker(BaseWorker):
             logger.error(f"Chunking failed for doc {document.url}: {e}")
             raise
 
-    async def process_documents(self, documents: list[Document]) -> AsyncIterator:
+    async def process_documents(
+        self,
+        documents: Iterable[Document] | AsyncIterable[Document],
+        chunk_counts: dict[str, int] | None = None,
+    ) -> AsyncIterator:
         """Process documents into chunks.
 
+        Documents may be a list or an async stream. Documents are pulled from
+        the source only as chunking slots free up, and at most ``queue_size``
+        chunked documents wait for the consumer, so memory stays bounded
+        regardless of how many documents the source produces.
+
         Args:
-            documents: List of documents to process
+            documents: Documents to process
+            chunk_counts: Receives the number of chunks of each document,
+                before its chunks are yielded
 
         Yields:
             Chunks from processed documents
         """
         logger.debug("ChunkingWorker started")
-        logger.info(f"🔄 Processing {len(documents)} documents for chunking...")
-
-        try:
-            # Process documents with controlled concurrency but stream results
-            semaphore = asyncio.Semaphore(self.max_workers)
+        total_docs = len(documents) if isinstance(documents, Sized) else None
+        if total_docs is not None:
+            logger.info(f"🔄 Processing {total_docs} documents for chunking...")
+        else:
+            logger.info("🔄 Streaming documents for chunking...")
 
-            async def process_and_yield(doc, doc_index):
-                """Process a single document and yield its chunks."""
-                try:
-                    async with semaphore:
-                        if self.shutdown_event.is_set():
-                            logger.debug(
-                                f"ChunkingWorker exiting due to shutdown (doc {doc_index})"
-                            )
-                            return
-
-                        logger.debug(
-                            f"🔄 Processing document {doc_index + 1}/{len(documents)}: {doc.id}"
-                        )
-                        chunks = await self.process(doc)
-
-                        if chunks:
-                            logger.debug(
-                                f"✓ Document {doc_index + 1}/{len(documents)} produced {len(chunks)} chunks"
-                            )
-                            return chunks
-                        else:
-                            logger.debug(
-                                f"⚠️ Document {doc_index + 1}/{len(documents)} produced no chunks"
-                            )
-                            return []
-
-                except Exception as e:
-                    logger.error(
-                        f"❌ Chunking failed for document {doc_index + 1}/{len(documents)} ({doc.id}): {e}"
-                    )
-                    return []
+        def progress(count: int) -> str:
+            return f"{count}/{total_docs}" if total_docs is not None else str(count)
 
-            # Create tasks for all documents
-            tasks = [process_and_yield(doc, i) for i, doc in enumerate(documents)]
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        producer = asyncio.create_task(self._chunk_all(documents, results, progress))
 
-            # Process tasks as they complete and yield chunks immediately
+        try:
             chunk_count = 0
             completed_docs = 0
 
-            for coro in asyncio.as_completed(tasks):
+            while True:
+                chunks = await results.get()
+                if chunks is _DONE:
+                    break
                 if self.shutdown_event.is_set():
                     logger.debug("ChunkingWorker exiting due to shutdown")
                     break
 
-                try:
-                    chunks = await coro
-                    completed_docs += 1
-
-                    if chunks:
-                        for chunk in chunks:
-                            if not self.shutdown_event.is_set():
-                                chunk_count += 1
-                                yield chunk
-                            else:
-                                logger.debug("ChunkingWorker exiting due to shutdown")
-                                return
-
-                    # Log progress every 10 documents or at completion
-                    if completed_docs % 10 == 0 or completed_docs == len(documents):
-                        logger.info(
-                            f"🔄 Chunking progress: {completed_docs}/{len(documents)} documents, {chunk_count} chunks generated"
-                        )
+                completed_docs += 1
+                if chunk_counts is not None and chunks:
+                    document_id = chunks[0].metadata["parent_document"].id
+                    previous = chunk_counts.get(document_id, 0)
+                    chunk_counts[document_id] = previous + len(chunks)
+                for chunk in chunks:
+                    if self.shutdown_event.is_set():
+                        logger.debug("ChunkingWorker exiting due to shutdown")
+                        return
+                    chunk_count += 1
+                    yield chunk
+
+                # Log progress every 10 documents or at completion
+                if completed_docs % 10 == 0 or completed_docs == total_docs:
+                    logger.info(
+                        f"🔄 Chunking progress: {progress(completed_docs)} documents, {chunk_count} chunks generated"
+                    )
 
-                except Exception as e:
-                    logger.error(f"❌ Error processing chunking task: {e}")
-                    completed_docs += 1
+            # Surface errors raised by the document source
+            await producer
 
             logger.info(
-                f"✅ Chunking completed: {completed_docs}/{len(documents)} documents processed, {chunk_count} total chunks"
+                f"✅ Chunking completed: {progress(completed_docs)} documents processed, {chunk_count} total chunks"
             )
 
         except asyncio.CancelledError:
             logger.debug("ChunkingWorker cancelled")
             raise
         finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except (asyncio.CancelledError, Exception):
+                    pass
             logger.debug("ChunkingWorker exited")
 
+    async def _chunk_all(
+        self,
+        documents: Iterable[Document] | AsyncIterable[Document],
+        results: asyncio.Queue,
+        progress: Callable[[int], str],
+    ) -> None:
+        """Pull documents from the source and chunk them concurrently.
+
+        A new document is only pulled once one of the ``max_workers`` chunking
+        slots is free. Each document's chunks are put on ``results``, followed
+        by a final ``_DONE`` marker.
+
+        Args:
+            documents: Documents to process
+            results: Queue receiving a list of chunks per document
+            progress: Formats a document index for log messages
+        """
+        slots = asyncio.Semaphore(self.max_workers)
+        tasks: set[asyncio.Task] = set()
+
+        async def chunk_document(doc: Document, doc_index: int) -> None:
+            try:
+                try:
+                    logger.debug(
+                        f"🔄 Processing document {progress(doc_index + 1)}: {doc.id}"
+                    )
+                    chunks = await self.process(doc)
+                    if chunks:
+                        logger.debug(
+                            f"✓ Document {progress(doc_index + 1)} produced {len(chunks)} chunks"
+                        )
+                    else:
+                        logger.debug(
+                            f"⚠️ Document {progress(doc_index + 1)} produced no chunks"
+                        )
+                except Exception as e:
+                    logger.error(
+                        f"❌ Chunking failed for document {progress(doc_index + 1)} ({doc.id}): {e}"
+                    )
+                    chunks = []
+                await results.put(chunks)
+            finally:
+                # Hold the slot until the chunks are handed off
+                slots.release()
+
+        try:
+            doc_index = 0
+            async for doc in _iterate(documents):
+                await slots.acquire()
+                if self.shutdown_event.is_set():
+                    logger.debug(
+                        f"ChunkingWorker exiting due to shutdown (doc {doc_index})"
+                    )
+                    slots.release()
+                    break
+
+                task = asyncio.create_task(chunk_document(doc, doc_index))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                doc_index += 1
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        except Exception:
+            # The source failed; hand over what was already pulled, then the error
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await results.put(_DONE)
+            raise
+        await results.put(_DONE)
+
     def _calculate_adaptive_timeout(self, document: Document) -> float:
         """Calculate adaptive timeout based on document characteristics.
 
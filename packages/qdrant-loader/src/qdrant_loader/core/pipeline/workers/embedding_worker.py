@@ -2,11 +2,13 @@
 
 import asyncio
 import gc
+from collections import deque
 from collections.abc import AsyncIterator
 from typing import Any
 
 import psutil
 
+from qdrant_loader.core.embedding.adaptive_batcher import AdaptiveBatcher
 from qdrant_loader.core.embedding.embedding_service import EmbeddingService
 from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.utils.logging import LoggingConfig
@@ -25,10 +27,20 @@ class EmbeddingWorker(BaseWorker):
         max_workers: int = 4,
         queue_size: int = 1000,
         shutdown_event: asyncio.Event | None = None,
+        preserve_order: bool = True,
     ):
         super().__init__(max_workers, queue_size)
         self.embedding_service = embedding_service
         self.shutdown_event = shutdown_event or asyncio.Event()
+        self.preserve_order = preserve_order
+
+        batcher = getattr(embedding_service, "batcher", None)
+        self.batcher = batcher if isinstance(batcher, AdaptiveBatcher) else None
+        if self.batcher is not None:
+            # The batcher decides how many batches are in flight, starting
+            # from the configured number of workers
+            self.semaphore = asyncio.Semaphore(self.batcher.max_concurrency)
+            self.batcher.reset(concurrency=max_workers)
 
     async def process(self, chunks: list[Any]) -> list[tuple[Any, list[float]]]:
         """Process a batch of chunks into embeddings.
@@ -88,16 +100,23 @@ class EmbeddingWorker(BaseWorker):
     ) -> AsyncIterator[tuple[Any, list[float]]]:
         """Process chunks into embeddings.
 
+        Up to ``max_workers`` embedding batches are kept in flight at once. While
+        that window is full no further chunks are pulled from the upstream
+        iterator, which applies backpressure to the chunking stage. With
+        adaptive batching enabled, the batch size and window follow the
+        embedding service's batcher instead.
+
         Args:
             chunks: AsyncIterator of chunks to process
 
         Yields:
-            (chunk, embedding) tuples
+            (chunk, embedding) tuples, in input order when ``preserve_order`` is
+            set, otherwise in batch completion order
         """
         logger.debug("EmbeddingWorker started")
         logger.info("🔄 Starting embedding generation...")
-        batch_size = self.embedding_service.batch_size
         batch = []
+        in_flight: deque[tuple[list[Any], asyncio.Task]] = deque()
         total_processed = 0
 
         try:
@@ -108,46 +127,44 @@ class EmbeddingWorker(BaseWorker):
 
                 batch.append(chunk)
 
-                # Process batch when it reaches the desired size
-                if len(batch) >= batch_size:
-                    try:
-                        logger.debug(
-                            f"🔄 Processing embedding batch of {len(batch)} chunks..."
-                        )
-                        results = await self.process(batch)
-                        total_processed += len(batch)
+                # Submit batch when it reaches the desired size
+                if len(batch) >= self._batch_size():
+                    logger.debug(
+                        f"🔄 Submitting embedding batch of {len(batch)} chunks..."
+                    )
+                    in_flight.append(self._submit_batch(batch))
+                    batch = []
+
+                    # Wait for a slot in the window before pulling more chunks
+                    while len(in_flight) >= self._max_in_flight():
+                        done_batch, results = await self._collect_next(in_flight)
+                        if results is None:
+                            continue
+                        total_processed += len(done_batch)
                         logger.info(
-                            f"🔗 Generated embeddings: {len(batch)} items in batch, {total_processed} total processed"
+                            f"🔗 Generated embeddings: {len(done_batch)} items in batch, {total_processed} total processed"
                         )
-
                         for result in results:
                             yield result
-                    except Exception as e:
-                        logger.error(f"EmbeddingWorker batch processing failed: {e}")
-                        # Mark chunks as failed but continue processing
-                        for chunk in batch:
-                            logger.error(f"Embedding failed for chunk {chunk.id}: {e}")
-
-                    batch = []
 
-            # Process any remaining chunks in the final batch
+            # Submit any remaining chunks as the final batch
             if batch and not self.shutdown_event.is_set():
-                try:
-                    logger.debug(
-                        f"🔄 Processing final embedding batch of {len(batch)} chunks..."
-                    )
-                    results = await self.process(batch)
-                    total_processed += len(batch)
-                    logger.info(
-                        f"🔗 Generated embeddings: {len(batch)} items in final batch, {total_processed} total processed"
-                    )
-
-                    for result in results:
-                        yield result
-                except Exception as e:
-                    logger.error(f"EmbeddingWorker final batch processing failed: {e}")
-                    for chunk in batch:
-                        logger.error(f"Embedding failed for chunk {chunk.id}: {e}")
+                logger.debug(
+                    f"🔄 Submitting final embedding batch of {len(batch)} chunks..."
+                )
+                in_flight.append(self._submit_batch(batch))
+
+            # Drain the window
+            while in_flight and not self.shutdown_event.is_set():
+                done_batch, results = await self._collect_next(in_flight)
+                if results is None:
+                    continue
+                total_processed += len(done_batch)
+                logger.info(
+                    f"🔗 Generated embeddings: {len(done_batch)} items in batch, {total_processed} total processed"
+                )
+                for result in results:
+                    yield result
 
             logger.info(f"✅ Embedding completed: {total_processed} chunks processed")
 
@@ -155,4 +172,63 @@ class EmbeddingWorker(BaseWorker):
             logger.debug("EmbeddingWorker cancelled")
             raise
         finally:
+            # Abandon outstanding requests on shutdown, cancellation or early close
+            for _, task in in_flight:
+                task.cancel()
             logger.debug("EmbeddingWorker exited")
+
+    def _batch_size(self) -> int:
+        """Number of chunks per embedding batch."""
+        if self.batcher is not None:
+            return self.batcher.batch_size
+        return self.embedding_service.batch_size
+
+    def _max_in_flight(self) -> int:
+        """Number of embedding batches allowed in flight."""
+        if self.batcher is not None:
+            return self.batcher.concurrency
+        return self.max_workers
+
+    def _submit_batch(self, batch: list[Any]) -> tuple[list[Any], asyncio.Task]:
+        """Start embedding a batch in the background.
+
+        Args:
+            batch: List of chunks to embed
+
+        Returns:
+            (batch, task) entry for the in-flight window
+        """
+        return batch, asyncio.create_task(self.process_with_semaphore(batch))
+
+    async def _collect_next(
+        self, in_flight: deque[tuple[list[Any], asyncio.Task]]
+    ) -> tuple[list[Any], list[tuple[Any, list[float]]] | None]:
+        """Wait for the next batch in the window and remove it.
+
+        Args:
+            in_flight: Window of (batch, task) entries
+
+        Returns:
+            Tuple of (batch, results); results is None if the batch failed
+        """
+        if self.preserve_order:
+            batch, task = in_flight.popleft()
+        else:
+            done, _ = await asyncio.wait(
+                [task for _, task in in_flight],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            entry = next(entry for entry in in_flight if entry[1] in done)
+            in_flight.remove(entry)
+            batch, task = entry
+
+        try:
+            return batch, await task
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"EmbeddingWorker batch processing failed: {e}")
+            # Mark chunks as failed but continue processing
+            for chunk in batch:
+                logger.error(f"Embedding failed for chunk {chunk.id}: {e}")
+            return batch, None
@@ -1,11 +1,12 @@
 """Upsert worker for upserting embedded chunks to Qdrant."""
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 from qdrant_client.http import models
 
+from qdrant_loader.core.document import Document
 from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.core.qdrant_manager import QdrantManager
 from qdrant_loader.utils.logging import LoggingConfig
@@ -14,6 +15,9 @@ from .base_worker import BaseWorker
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Batches upserted with wait=False between two barriers
+_CONFIRM_EVERY_BATCHES = 20
+
 
 class PipelineResult:
     """Result of pipeline processing."""
@@ -36,11 +40,27 @@ class UpsertWorker(BaseWorker):
         max_workers: int = 4,
         queue_size: int = 1000,
         shutdown_event: asyncio.Event | None = None,
+        wait: bool = True,
+        barrier_timeout: float = 60.0,
     ):
         super().__init__(max_workers, queue_size)
         self.qdrant_manager = qdrant_manager
         self.batch_size = batch_size
         self.shutdown_event = shutdown_event or asyncio.Event()
+        self.wait = wait
+        self.barrier_timeout = barrier_timeout
+        # Points, and their parent documents, upserted with wait=False since
+        # the last barrier
+        self._unconfirmed_count = 0
+        self._unconfirmed_documents: set[str] = set()
+        # Documents with a failed upsert
+        self._failed_documents: set[str] = set()
+        # Chunks expected and point ids upserted per document not done yet,
+        # and documents whose chunks were all upserted, with their point ids,
+        # that have not been reported yet
+        self._chunk_counts: dict[str, int] | None = None
+        self._chunk_ids_by_document: dict[str, set[str]] = {}
+        self._done_documents: list[tuple[Document, set[str]]] = []
 
     async def process(
         self, batch: list[tuple[Any, list[float]]]
@@ -66,7 +86,12 @@ class UpsertWorker(BaseWorker):
                 points = [
                     models.PointStruct(
                         id=chunk.id,
-                        vector=embedding,
+                        # Decoded embeddings are float32 arrays; Qdrant takes lists
+                        vector=(
+                            embedding.tolist()
+                            if hasattr(embedding, "tolist")
+                            else embedding
+                        ),
                         payload={
                             "content": chunk.content,
                             "metadata": {
@@ -88,15 +113,19 @@ class UpsertWorker(BaseWorker):
                                 chunk, "title", chunk.metadata.get("title", "")
                             ),
                             "url": getattr(chunk, "url", chunk.metadata.get("url", "")),
-                            "document_id": chunk.metadata.get(
-                                "parent_document_id", chunk.id
+                            # The source document, so its points can be
+                            # found again when it is updated or deleted
+                            "document_id": (
+                                chunk.metadata["parent_document"].id
+                                if chunk.metadata.get("parent_document")
+                                else chunk.metadata.get("parent_document_id", chunk.id)
                             ),
                         },
                     )
                     for chunk, embedding in batch
                 ]
 
-                await self.qdrant_manager.upsert_points(points)
+                await self.qdrant_manager.upsert_points(points, wait=self.wait)
                 prometheus_metrics.INGESTED_DOCUMENTS.inc(len(points))
                 success_count = len(points)
 
@@ -105,6 +134,12 @@ class UpsertWorker(BaseWorker):
                     parent_doc = chunk.metadata.get("parent_document")
                     if parent_doc:
                         successful_doc_ids.add(parent_doc.id)
+                    if not self.wait:
+                        self._unconfirmed_count += 1
+                        if parent_doc:
+                            self._unconfirmed_documents.add(parent_doc.id)
+                    if parent_doc:
+                        self._count_upserted(parent_doc, str(chunk.id))
 
         except Exception as e:
             for chunk, _ in batch:
@@ -113,18 +148,39 @@ class UpsertWorker(BaseWorker):
                 parent_doc = chunk.metadata.get("parent_document")
                 if parent_doc:
                     successful_doc_ids.discard(parent_doc.id)  # Remove if it was added
+                    self._failed_documents.add(parent_doc.id)
                 errors.append(f"Upsert failed for chunk {chunk.id}: {e}")
             error_count = len(batch)
 
         return success_count, error_count, successful_doc_ids, errors
 
     async def process_embedded_chunks(
-        self, embedded_chunks: AsyncIterator[tuple[Any, list[float]]]
+        self,
+        embedded_chunks: AsyncIterator[tuple[Any, list[float]]],
+        chunk_counts: dict[str, int] | None = None,
+        on_documents_done: (
+            Callable[[list[Document], dict[str, set[str]]], Awaitable[None]] | None
+        ) = None,
     ) -> PipelineResult:
         """Upsert embedded chunks to Qdrant.
 
+        Up to ``max_workers`` upsert batches run concurrently. When upserting
+        with ``wait=False``, a barrier confirms the upserts sent so far every
+        ``_CONFIRM_EVERY_BATCHES`` batches and at the end of the run.
+
+        Documents all of whose chunks were upserted are reported to
+        ``on_documents_done`` as upserts complete, so that callers need not
+        keep every document until the run ends. With ``wait=False`` they are
+        reported once a barrier has confirmed their points, and a
+        content-free copy of each is kept until then.
+
         Args:
             embedded_chunks: AsyncIterator of (chunk, embedding) tuples
+            chunk_counts: Number of chunks of each document, filled in before
+                the document's chunks arrive. Entries of reported documents
+                are removed.
+            on_documents_done: Called with documents whose chunks were all
+                upserted, and the point ids of each of them
 
         Returns:
             PipelineResult with processing statistics
@@ -132,6 +188,15 @@ class UpsertWorker(BaseWorker):
         logger.debug("UpsertWorker started")
         result = PipelineResult()
         batch = []
+        in_flight: set[asyncio.Task] = set()
+        # Batches sent with wait=False since the last barrier
+        unconfirmed_batches = 0
+        self._unconfirmed_count = 0
+        self._unconfirmed_documents = set()
+        self._failed_documents = set()
+        self._chunk_counts = chunk_counts if on_documents_done else None
+        self._chunk_ids_by_document = {}
+        self._done_documents = []
 
         try:
             async for chunk_embedding in embedded_chunks:
@@ -141,31 +206,142 @@ class UpsertWorker(BaseWorker):
 
                 batch.append(chunk_embedding)
 
-                # Process batch when it reaches the desired size
+                # Submit batch when it reaches the desired size
                 if len(batch) >= self.batch_size:
-                    success_count, error_count, successful_doc_ids, errors = (
-                        await self.process(batch)
+                    in_flight.add(
+                        asyncio.create_task(self.process_with_semaphore(batch))
                     )
-                    result.success_count += success_count
-                    result.error_count += error_count
-                    result.successfully_processed_documents.update(successful_doc_ids)
-                    result.errors.extend(errors)
                     batch = []
+                    unconfirmed_batches += 1
+
+                    # Wait for a slot before pulling more embedded chunks
+                    while len(in_flight) >= self.max_workers:
+                        in_flight = await self._collect_completed(in_flight, result)
+                    if self.wait:
+                        await self._report_done_documents(on_documents_done)
+                    elif unconfirmed_batches >= _CONFIRM_EVERY_BATCHES:
+                        # The barrier only covers upserts already sent
+                        while in_flight:
+                            in_flight = await self._collect_completed(in_flight, result)
+                        await self._confirm_upserts(result)
+                        await self._report_done_documents(on_documents_done)
+                        unconfirmed_batches = 0
 
             # Process any remaining chunks in the final batch
             if batch and not self.shutdown_event.is_set():
-                success_count, error_count, successful_doc_ids, errors = (
-                    await self.process(batch)
+                in_flight.add(asyncio.create_task(self.process_with_semaphore(batch)))
+
+            # Upserts already sent are always accounted for, even on shutdown
+            while in_flight:
+                in_flight = await self._collect_completed(in_flight, result)
+
+            if self._unconfirmed_count and not self.shutdown_event.is_set():
+                await self._confirm_upserts(result)
+
+            result.failed_document_ids.update(self._failed_documents)
+            if self.wait or not self._unconfirmed_count:
+                await self._report_done_documents(
+                    on_documents_done, result.failed_document_ids
                 )
-                result.success_count += success_count
-                result.error_count += error_count
-                result.successfully_processed_documents.update(successful_doc_ids)
-                result.errors.extend(errors)
 
         except asyncio.CancelledError:
             logger.debug("UpsertWorker cancelled")
             raise
         finally:
+            for task in in_flight:
+                task.cancel()
+            self._chunk_ids_by_document = {}
+            self._done_documents = []
             logger.debug("UpsertWorker exited")
 
         return result
+
+    async def _collect_completed(
+        self, in_flight: set[asyncio.Task], result: PipelineResult
+    ) -> set[asyncio.Task]:
+        """Wait for at least one in-flight upsert and merge its outcome.
+
+        Args:
+            in_flight: Pending upsert tasks
+            result: Result to update
+
+        Returns:
+            The tasks that are still pending
+        """
+        done, pending = await asyncio.wait(
+            in_flight, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+            success_count, error_count, successful_doc_ids, errors = task.result()
+            result.success_count += success_count
+            result.error_count += error_count
+            result.successfully_processed_documents.update(successful_doc_ids)
+            result.errors.extend(errors)
+        return pending
+
+    def _count_upserted(self, document: Document, chunk_id: str) -> None:
+        """Record an upserted chunk of a document, noting when it is done."""
+        if self._chunk_counts is None:
+            return
+        chunk_ids = self._chunk_ids_by_document.setdefault(document.id, set())
+        chunk_ids.add(chunk_id)
+        expected = self._chunk_counts.get(document.id)
+        if expected is None or len(chunk_ids) < expected:
+            return
+        del self._chunk_ids_by_document[document.id]
+        self._chunk_counts.pop(document.id, None)
+        self._done_documents.append(
+            (
+                document if self.wait else document.model_copy(update={"content": ""}),
+                chunk_ids,
+            )
+        )
+
+    async def _report_done_documents(
+        self,
+        on_documents_done: (
+            Callable[[list[Document], dict[str, set[str]]], Awaitable[None]] | None
+        ),
+        failed_document_ids: set[str] | None = None,
+    ) -> None:
+        """Hand the documents whose chunks were all upserted to the caller.
+
+        Documents with a failed or unconfirmed upsert are left out. Errors
+        of the callback are logged, so they do not stop the upserts.
+        """
+        if on_documents_done is None or not self._done_documents:
+            return
+        failed = self._failed_documents | (failed_document_ids or set())
+        done = [(doc, ids) for doc, ids in self._done_documents if doc.id not in failed]
+        self._done_documents = []
+        if not done:
+            return
+        documents = [doc for doc, _ in done]
+        try:
+            await on_documents_done(documents, {doc.id: ids for doc, ids in done})
+        except Exception as e:
+            logger.error(f"Failed to report {len(documents)} processed documents: {e}")
+
+    async def _confirm_upserts(self, result: PipelineResult) -> None:
+        """Wait until the upserts sent with ``wait=False`` are applied.
+
+        When the barrier fails or times out, the documents with points upserted
+        since the previous barrier are moved from successful to failed.
+
+        Args:
+            result: Result to update
+        """
+        count, document_ids = self._unconfirmed_count, self._unconfirmed_documents
+        self._unconfirmed_count = 0
+        self._unconfirmed_documents = set()
+        logger.debug(f"🔄 Confirming {count} unacknowledged upserts...")
+        try:
+            await self.qdrant_manager.wait_for_updates(timeout=self.barrier_timeout)
+        except Exception as e:
+            logger.error(f"Failed to confirm {count} upserts: {e!r}")
+            for doc_id in document_ids:
+                result.successfully_processed_documents.discard(doc_id)
+                self._failed_documents.add(doc_id)
+            result.errors.append(f"Upserts of {count} chunks not confirmed: {e!r}")
+            result.success_count -= count
+            result.error_count += count
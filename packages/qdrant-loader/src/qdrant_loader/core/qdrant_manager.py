@@ -1,8 +1,9 @@
 import asyncio
-from typing import cast
+from collections.abc import AsyncIterator
+from typing import Any, cast
 from urllib.parse import urlparse
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import (
     Distance,
@@ -10,6 +11,7 @@ from qdrant_client.http.models import (
 )
 
 from ..config import Settings, get_global_config, get_settings
+from ..config.qdrant import QdrantConfig
 from ..utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -36,6 +38,7 @@ class QdrantManager:
         """
         self.settings = settings or get_settings()
         self.client = None
+        self.async_client: AsyncQdrantClient | None = None
         self.collection_name = self.settings.qdrant_collection_name
         self.logger = LoggingConfig.get_logger(__name__)
         self.batch_size = get_global_config().embedding.batch_size
@@ -51,6 +54,12 @@ class QdrantManager:
             return False
         return api_key.lower() not in ["none", "null"]
 
+    def _get_qdrant_config(self) -> QdrantConfig | None:
+        """Return the Qdrant configuration block if one is available."""
+        global_config = getattr(self.settings, "global_config", None)
+        qdrant_config = getattr(global_config, "qdrant", None)
+        return qdrant_config if isinstance(qdrant_config, QdrantConfig) else None
+
     def connect(self) -> None:
         """Establish connection to qDrant server."""
         try:
@@ -75,6 +84,14 @@ class QdrantManager:
                     api_key=api_key,
                     timeout=60,  # 60 seconds timeout
                 )
+                qdrant_config = self._get_qdrant_config()
+                if qdrant_config and qdrant_config.use_async_client:
+                    # Native async client avoids a thread hop per upsert
+                    self.async_client = AsyncQdrantClient(
+                        url=url,
+                        api_key=api_key,
+                        timeout=60,
+                    )
                 self.logger.debug("Successfully connected to qDrant")
             except Exception as e:
                 raise QdrantConnectionError(
@@ -209,11 +226,15 @@ class QdrantManager:
             self.logger.error("Failed to create collection", error=str(e))
             raise
 
-    async def upsert_points(self, points: list[models.PointStruct]) -> None:
+    async def upsert_points(
+        self, points: list[models.PointStruct], wait: bool = True
+    ) -> None:
         """Upsert points into the collection.
 
         Args:
             points: List of points to upsert
+            wait: Whether to wait until Qdrant has applied the update. With
+                ``wait=False`` the call returns once the update is queued.
         """
         self.logger.debug(
             "Upserting points",
@@ -221,9 +242,11 @@ class QdrantManager:
         )
 
         try:
-            client = self._ensure_client_connected()
-            await asyncio.to_thread(
-                client.upsert, collection_name=self.collection_name, points=points
+            await self._call(
+                "upsert",
+                collection_name=self.collection_name,
+                points=points,
+                wait=wait,
             )
             self.logger.debug(
                 "Successfully upserted points",
@@ -240,6 +263,38 @@ class QdrantManager:
             )
             raise
 
+    async def wait_for_updates(self, timeout: float = 60.0) -> None:
+        """Wait until the updates sent to the collection so far are applied.
+
+        Used as a barrier after upserting with ``wait=False``. Qdrant applies
+        the updates of a collection in the order they were received, so a
+        delete that matches no point, sent with ``wait=True``, only returns
+        once every update queued before it has been applied. Checking that
+        points exist would not do: chunk IDs are deterministic, so the points
+        of an updated document exist before its new version is applied.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Raises:
+            TimeoutError: If the updates were not applied in time
+        """
+        await asyncio.wait_for(
+            self._call(
+                "delete",
+                collection_name=self.collection_name,
+                points_selector=models.Filter(must=[models.HasIdCondition(has_id=[])]),
+                wait=True,
+            ),
+            timeout=timeout,
+        )
+
+    async def close(self) -> None:
+        """Close the async client if one was created."""
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+
     def search(
         self, query_vector: list[float], limit: int = 5
     ) -> list[models.ScoredPoint]:
@@ -338,6 +393,194 @@ class QdrantManager:
             logger.error("Failed to delete collection", error=str(e))
             raise
 
+    async def _call(self, method: str, **kwargs: Any) -> Any:
+        """Call a client method, on the async client when one is available."""
+        if self.async_client is not None:
+            return await getattr(self.async_client, method)(**kwargs)
+        client = self._ensure_client_connected()
+        return await asyncio.to_thread(getattr(client, method), **kwargs)
+
+    async def delete_points(self, point_ids: list[str]) -> None:
+        """Delete points from the collection by point ID.
+
+        Args:
+            point_ids: IDs of the points to delete
+        """
+        try:
+            await self._call(
+                "delete",
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(points=point_ids),  # type: ignore[arg-type]
+            )
+            self.logger.debug(
+                "Successfully deleted points",
+                extra={
+                    "point_count": len(point_ids),
+                    "collection": self.collection_name,
+                },
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to delete points",
+                extra={
+                    "error": str(e),
+                    "point_count": len(point_ids),
+                    "collection": self.collection_name,
+                },
+            )
+            raise
+
+    async def delete_stale_chunks(
+        self, chunk_ids_by_document: dict[str, set[str]], batch_size: int = 100
+    ) -> None:
+        """Delete the points of documents that are not among their current chunks.
+
+        Left over when a re-ingested document produces fewer or different
+        chunks than before. One delete request covers ``batch_size`` documents.
+
+        Args:
+            chunk_ids_by_document: Current point IDs of each document
+            batch_size: Number of documents per delete request
+        """
+        documents = list(chunk_ids_by_document.items())
+        for i in range(0, len(documents), batch_size):
+            batch = documents[i : i + batch_size]
+            try:
+                await self._call(
+                    "delete",
+                    collection_name=self.collection_name,
+                    points_selector=models.Filter(
+                        should=[
+                            models.Filter(
+                                must=[
+                                    models.FieldCondition(
+                                        key="document_id",
+                                        match=models.MatchValue(value=document_id),
+                                    )
+                                ],
+                                must_not=[models.HasIdCondition(has_id=list(chunk_ids))],  # type: ignore[arg-type]
+                            )
+                            for document_id, chunk_ids in batch
+                        ]
+                    ),
+                )
+            except Exception as e:
+                self.logger.error(
+                    "Failed to delete stale chunks",
+                    extra={
+                        "error": str(e),
+                        "document_count": len(batch),
+                        "collection": self.collection_name,
+                    },
+                )
+                raise
+
+    async def iter_point_sources(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[
+        list[tuple[str, str | None, str | None, str | None, str | None]]
+    ]:
+        """Scroll through the collection, yielding pages of point origins.
+
+        Args:
+            batch_size: Number of points per page
+
+        Yields:
+            Lists of (point ID, source type, source, document URL, document ID)
+            tuples
+        """
+        offset = None
+        while True:
+            records, offset = await self._call(
+                "scroll",
+                collection_name=self.collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=["source_type", "source", "url", "document_id"],
+                with_vectors=False,
+            )
+            yield [
+                (
+                    str(record.id),
+                    (record.payload or {}).get("source_type"),
+                    (record.payload or {}).get("source"),
+                    (record.payload or {}).get("url"),
+                    (record.payload or {}).get("document_id"),
+                )
+                for record in records
+            ]
+            if offset is None:
+                return
+
+    async def get_document_points(
+        self, source_type: str, source: str, url: str, batch_size: int = 1000
+    ) -> list[tuple[str, str | None]]:
+        """Return the points of a document, found by source and URL.
+
+        Args:
+            source_type: Source type of the document
+            source: Source of the document
+            url: URL of the document
+            batch_size: Number of points per scroll request
+
+        Returns:
+            (point ID, payload document ID) of each point
+        """
+        points: list[tuple[str, str | None]] = []
+        offset = None
+        while True:
+            records, offset = await self._call(
+                "scroll",
+                collection_name=self.collection_name,
+                scroll_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key=key, match=models.MatchValue(value=value)
+                        )
+                        for key, value in (
+                            ("source_type", source_type),
+                            ("source", source),
+                            ("url", url),
+                        )
+                    ]
+                ),
+                limit=batch_size,
+                offset=offset,
+                with_payload=["document_id"],
+                with_vectors=False,
+            )
+            points.extend(
+                (str(record.id), (record.payload or {}).get("document_id"))
+                for record in records
+            )
+            if offset is None:
+                return points
+
+    async def set_document_id(self, point_ids: list[str], document_id: str) -> None:
+        """Set the ``document_id`` payload field of points.
+
+        Args:
+            point_ids: IDs of the points to update
+            document_id: ID of the source document of the points
+        """
+        try:
+            await self._call(
+                "set_payload",
+                collection_name=self.collection_name,
+                payload={"document_id": document_id},
+                points=point_ids,
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to set the document ID of points",
+                extra={
+                    "error": str(e),
+                    "point_count": len(point_ids),
+                    "collection": self.collection_name,
+                },
+            )
+            raise
+
     async def delete_points_by_document_id(self, document_ids: list[str]) -> None:
         """Delete points from the collection by document ID.
 
@@ -353,9 +596,8 @@ class QdrantManager:
         )
 
         try:
-            client = self._ensure_client_connected()
-            await asyncio.to_thread(
-                client.delete,
+            await self._call(
+                "delete",
                 collection_name=self.collection_name,
                 points_selector=models.Filter(
                     must=[
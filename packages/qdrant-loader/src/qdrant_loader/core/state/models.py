@@ -11,7 +11,10 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    MetaData,
+    PrimaryKeyConstraint,
     String,
+    Table,
     Text,
     TypeDecorator,
     UniqueConstraint,
@@ -134,6 +137,10 @@ class IngestionHistory(Base):
     attachments_processed_count = Column(Integer, default=0)
     total_conversion_time = Column(Float, default=0.0)
 
+    sync_cursor = Column(
+        String, nullable=True
+    )  # Source position of the last successful run, e.g. a git commit SHA
+
     # Relationships
     project = relationship("Project", back_populates="ingestion_histories")
 
@@ -163,6 +170,9 @@ class DocumentStateRecord(Base):
     is_deleted = Column(Boolean, default=False)
     created_at = Column(UTCDateTime(timezone=True), nullable=False)
     updated_at = Column(UTCDateTime(timezone=True), nullable=False)
+    fingerprint = Column(
+        String, nullable=True
+    )  # Source fingerprint (version, blob SHA, ETag...) used to skip fetching
 
     # File conversion metadata
     is_converted = Column(Boolean, default=False)
@@ -206,9 +216,30 @@ class DocumentStateRecord(Base):
             name="uix_project_document",
         ),
         Index("ix_document_url", "url"),
+        Index("ix_document_source_url", "source_type", "source", "url"),
         Index("ix_document_converted", "is_converted"),
         Index("ix_document_attachment", "is_attachment"),
         Index("ix_document_parent", "parent_document_id"),
         Index("ix_document_conversion_method", "conversion_method"),
         Index("ix_document_project_id", "project_id"),
     )
+
+
+# Documents seen during a change detection scan, keyed by URL without trailing
+# slashes. A temporary table lives on the connection of the (single connection)
+# state engine; unseen document states are found with an anti-join against it.
+# The table is only visible on that one connection, so the engine keeps its
+# StaticPool and every session goes through SerializedSessionFactory, which
+# opens them one at a time: a session closing on the shared connection would
+# otherwise roll back statements of another session, marks included.
+scan_metadata = MetaData()
+
+seen_documents = Table(
+    "seen_documents",
+    scan_metadata,
+    Column("source_type", String, nullable=False),
+    Column("source", String, nullable=False),
+    Column("url", String, nullable=False),
+    PrimaryKeyConstraint("source_type", "source", "url"),
+    prefixes=["TEMPORARY"],
+)
@@ -1,19 +1,75 @@
 from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import StaticPool
 
 from qdrant_loader.config.state import StateManagementConfig
 from qdrant_loader.core.state.models import Base
 from qdrant_loader.core.state.utils import generate_sqlite_aiosqlite_url as _gen_url
 
+# Connection settings for the state database: NORMAL sync is durable under WAL
+# (a crash may only lose the last transactions), and a larger page cache keeps
+# document state lookups off the disk.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=30000",
+)
+
+
+def _configure_sqlite_connection(dbapi_connection, in_memory: bool) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        if not in_memory:
+            # Readers no longer block the writer and commits append to the WAL
+            cursor.execute("PRAGMA journal_mode=WAL")
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+class SerializedSessionFactory:
+    """Session factory that opens one session at a time.
+
+    Every session of the state database uses the single connection of the
+    engine's ``StaticPool``, which also holds the connection-local
+    ``seen_documents`` table of change detection. Closing a session rolls
+    back whatever is uncommitted on that connection, including the
+    statements of another session interleaved with it, so a session is only
+    opened once the previous one is closed. Sessions must therefore not be
+    nested.
+    """
+
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]):
+        self._sessionmaker = sessionmaker
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[AsyncSession]:
+        async with self._lock:
+            async with self._sessionmaker() as session:
+                yield session
+
 
 def initialize_engine_and_session(
     config: StateManagementConfig,
-) -> tuple[AsyncEngine, async_sessionmaker]:
+) -> tuple[AsyncEngine, SerializedSessionFactory]:
     """Create the async engine and session factory for state DB.
 
-    Uses the same engine configuration as StateManager did previously.
+    Uses the same engine configuration as StateManager did previously, with
+    sessions serialized by :class:`SerializedSessionFactory`.
     """
     database_url = _gen_url(config.database_path)
     engine = create_async_engine(
@@ -22,14 +78,58 @@ def initialize_engine_and_session(
         connect_args={"check_same_thread": False},
         echo=False,
     )
+    in_memory = database_url.endswith(":memory:")
+    event.listen(
+        engine.sync_engine,
+        "connect",
+        lambda dbapi_connection, _record: _configure_sqlite_connection(
+            dbapi_connection, in_memory
+        ),
+    )
     session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    return engine, session_factory
+    return engine, SerializedSessionFactory(session_factory)
+
+
+def _add_missing_columns(connection) -> None:
+    """Add nullable columns introduced after a table was first created.
+
+    ``create_all`` never alters existing tables, so columns added to the
+    models later (all nullable) are appended with ``ALTER TABLE``.
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.exec_driver_sql(
+                f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+            )
+
+
+def _add_missing_indexes(connection) -> None:
+    """Create indexes introduced after a table was first created."""
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(connection)
 
 
 async def create_tables(engine: AsyncEngine) -> None:
     """Create database tables if they do not exist."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_add_missing_indexes)
 
 
 async def dispose_engine(engine: AsyncEngine) -> None:
@@ -1,16 +1,32 @@
 """Base classes for connectors and change detectors."""
 
-from datetime import datetime
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Collection,
+    Iterator,
+    Sequence,
+)
+from datetime import UTC, datetime
 from urllib.parse import quote, unquote
 
 from pydantic import BaseModel, ConfigDict
 
+from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.config.sources import SourcesConfig
+from qdrant_loader.config.state import IngestionStatus
+from qdrant_loader.connectors.base import FetchItem
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.state.exceptions import InvalidDocumentStateError
 from qdrant_loader.core.state.state_manager import DocumentStateRecord, StateManager
 from qdrant_loader.utils.logging import LoggingConfig
 
+# Seen documents and refreshed fingerprints written per state database round trip
+_FLUSH_BATCH_SIZE = 500
+# Stored states kept for items the fetch filter let through, until their
+# documents arrive; items beyond it are looked up again when they do
+_MAX_FETCHED_RECORDS = 4 * _FLUSH_BATCH_SIZE
+
 
 class DocumentState(BaseModel):
     """Standardized document state representation.
@@ -33,13 +49,39 @@ class StateChangeDetector:
     all sources with minimal overhead and simplified logic.
     """
 
-    def __init__(self, state_manager: StateManager):
-        """Initialize the change detector."""
+    def __init__(self, state_manager: StateManager, project_id: str | None = None):
+        """Initialize the change detector.
+
+        Args:
+            state_manager: State manager holding the previous document states
+            project_id: Project whose states are refreshed with new fingerprints
+        """
         self.logger = LoggingConfig.get_logger(
             f"qdrant_loader.{self.__class__.__name__}"
         )
         self._initialized = False
         self.state_manager = state_manager
+        self.project_id = project_id
+        self._scanning = False
+        self._pending_seen: list[tuple[str, str, str]] = []
+        self._pending_parents: list[tuple[str, str, str]] = []
+        self._fingerprint_updates: list[Document] = []
+        # Stored states of the items should_fetch let through, by URL key, so
+        # their documents are classified without another lookup
+        self._fetched_records: dict[
+            tuple[str, str, str], DocumentStateRecord | None
+        ] = {}
+        self._sync_started: dict[tuple[str, str], datetime] = {}
+        self._kept_unlisted: set[tuple[str, str]] = set()
+        self._reported_deleted: dict[tuple[str, str], list[str]] = {}
+        # Sources with failed items, and those with failures not tied to an item
+        self._failed_sources: set[tuple[str, str]] = set()
+        self._incomplete_sources: set[tuple[str, str]] = set()
+        # Sources listed in full or incrementally, with the time listing started
+        self.synced_sources: dict[tuple[str, str], datetime] = {}
+        # Positions reported by synced sources, such as a commit SHA
+        self.sync_cursors: dict[tuple[str, str], str] = {}
+        self.skipped_count = 0
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -66,52 +108,357 @@ class StateChangeDetector:
 
         self.logger.info("Starting change detection", document_count=len(documents))
 
-        # Get current and previous states
-        current_states = [self._get_document_state(doc) for doc in documents]
-        previous_states = await self._get_previous_states(filtered_config)
-
-        # Create lookup sets/dicts for efficient comparison
-        previous_uris: set[str] = {state.uri for state in previous_states}
-        previous_states_dict: dict[str, DocumentState] = {
-            state.uri: state for state in previous_states
-        }
-        current_uris: set[str] = {state.uri for state in current_states}
-
-        # Find changes efficiently
-        new_docs = [
-            doc
-            for state, doc in zip(current_states, documents, strict=False)
-            if state.uri not in previous_uris
-        ]
-
-        updated_docs = [
-            doc
-            for state, doc in zip(current_states, documents, strict=False)
-            if state.uri in previous_states_dict
-            and self._is_document_updated(state, previous_states_dict[state.uri])
-        ]
-
-        deleted_docs = [
-            self._create_deleted_document(state)
-            for state in previous_states
-            if state.uri not in current_uris
-        ]
-
-        changes = {
-            "new": new_docs,
-            "updated": updated_docs,
-            "deleted": deleted_docs,
-        }
+        async def _documents() -> AsyncIterator[Document]:
+            for document in documents:
+                yield document
+
+        changes: dict[str, list[Document]] = {"new": [], "updated": [], "deleted": []}
+        async for change_type, document in self.iter_changes(
+            _documents(), filtered_config
+        ):
+            changes[change_type].append(document)
 
         self.logger.info(
             "Change detection completed",
-            new_count=len(new_docs),
-            updated_count=len(updated_docs),
-            deleted_count=len(deleted_docs),
+            new_count=len(changes["new"]),
+            updated_count=len(changes["updated"]),
+            deleted_count=len(changes["deleted"]),
         )
 
         return changes
 
+    async def iter_changes(
+        self,
+        documents: AsyncIterable[Document],
+        filtered_config: SourcesConfig,
+        listed_sources: Collection[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[tuple[str, Document]]:
+        """Classify documents as they arrive from a document stream.
+
+        Incoming documents are classified one at a time, as they arrive, and
+        yielded as ``("new", doc)`` or ``("updated", doc)``; unchanged
+        documents are dropped. Documents of items that went through
+        :meth:`should_fetch` reuse the states looked up with their batch,
+        other documents are looked up by URL. Seen documents are recorded in the
+        database, and once the stream is exhausted the stored documents that
+        were not seen are found with an anti-join and yielded as
+        ``("deleted", doc)``. Previous states are never loaded as a whole.
+
+        Connectors given :meth:`should_fetch` as their fetch filter skip
+        items whose fingerprint is unchanged; those items count as seen.
+        Unchanged documents that carry a new fingerprint get their state
+        refreshed so the next run can skip them.
+
+        The detector is also the connectors' sync tracker: sources
+        listed incrementally keep their unlisted documents, except the ones
+        they report as deleted, and the sources listed to the end are
+        collected in :attr:`synced_sources`.
+
+        Only the sources in ``listed_sources`` have documents reported as
+        deleted: a source that failed or was interrupted part way did not
+        list all its documents, so its unseen documents are kept. Items a
+        connector reports as failed count as seen, and a source that reports
+        a failure it cannot tie to an item keeps all its unseen documents.
+
+        Args:
+            documents: Async iterable of current documents
+            filtered_config: Sources whose previous states are compared
+            listed_sources: Sources whose listing finished, once ``documents``
+                is exhausted; all configured sources if None
+
+        Yields:
+            Tuples of (change type, document)
+        """
+        if not self._initialized:
+            raise RuntimeError(
+                "StateChangeDetector not initialized. Use as async context manager."
+            )
+
+        await self.state_manager.reset_seen_documents()
+        self._pending_seen = []
+        self._pending_parents = []
+        self._fingerprint_updates = []
+        self._fetched_records = {}
+        self._sync_started = {}
+        self._kept_unlisted = set()
+        self._reported_deleted = {}
+        self._failed_sources = set()
+        self._incomplete_sources = set()
+        self.synced_sources = {}
+        self.sync_cursors = {}
+        self.skipped_count = 0
+        self._scanning = True
+        try:
+            async for document in documents:
+                change_type = await self._classify(document)
+                if change_type is not None:
+                    yield change_type, document
+                await self._flush(force=False)
+
+            await self._flush(force=True)
+            for source_config in self._iter_source_configs(filtered_config):
+                key = (source_config.source_type, source_config.source)
+                if (
+                    listed_sources is not None and key not in listed_sources
+                ) or key in self._incomplete_sources:
+                    self.logger.warning(
+                        "Source was not listed in full, keeping its unseen documents",
+                        source_type=key[0],
+                        source=key[1],
+                    )
+                    continue
+                if key in self._kept_unlisted:
+                    async for document in self._iter_reported_deleted(key):
+                        yield "deleted", document
+                    continue
+                unseen = self.state_manager.iter_unseen_document_state_records(
+                    source_config
+                )
+                async for record in unseen:
+                    yield "deleted", self._create_deleted_document(
+                        self._record_to_state(record), record.document_id  # type: ignore[arg-type]
+                    )
+        finally:
+            self._scanning = False
+            self._fetched_records = {}
+
+        if self.skipped_count:
+            self.logger.info(
+                "Skipped fetching unchanged documents",
+                skipped_count=self.skipped_count,
+            )
+
+    async def should_fetch(
+        self, source_type: str, source: str, items: Sequence[FetchItem]
+    ) -> list[bool]:
+        """Decide from source fingerprints whether items must be fetched.
+
+        Implements :class:`~qdrant_loader.connectors.base.FetchFilter`. The
+        stored states of the items are looked up together. An item whose
+        fingerprint matches its stored state is unchanged: it is marked as
+        seen, together with the attachments stored under its ``parent_id``,
+        so neither is reported as deleted.
+
+        Returns:
+            For each item, True if it is new or changed and must be fetched
+        """
+        if not self._scanning:
+            return [True] * len(items)
+        url_keys = [self._url_key(url) for url, _, _ in items]
+        records = await self.state_manager.get_document_state_records_by_url(
+            source_type, source, url_keys
+        )
+        records_by_key: dict[tuple[str, str], DocumentStateRecord] = {}
+        # Several records may share a URI; the last one wins, as it always has
+        latest_records: dict[str, DocumentStateRecord] = {}
+        for record in records:
+            url_key = self._url_key(record.url)  # type: ignore[arg-type]
+            records_by_key.setdefault((url_key, record.fingerprint), record)  # type: ignore[arg-type]
+            latest_records[url_key] = record
+
+        decisions = []
+        for url_key, (_, fingerprint, parent_id) in zip(url_keys, items, strict=True):
+            record = records_by_key.get((url_key, fingerprint))
+            decisions.append(record is None)
+            if record is None:
+                self._keep_fetched_record(
+                    (source_type, source, url_key), latest_records.get(url_key)
+                )
+                continue
+            self._pending_seen.append((source_type, source, url_key))
+            # Attachments reference their parent by source id or document id
+            for parent in (parent_id, record.document_id):
+                if parent is not None:
+                    self._pending_parents.append((source_type, source, parent))  # type: ignore[arg-type]
+            self.skipped_count += 1
+        await self._flush(force=False)
+        return decisions
+
+    async def last_synced_at(self, source_type: str, source: str) -> datetime | None:
+        """Start of the last run of a source that was ingested successfully.
+
+        Implements :class:`~qdrant_loader.connectors.base.SyncTracker`. The
+        call marks the start of this run's listing of the source.
+        """
+        if not self._scanning:
+            return None
+        self._sync_started[(source_type, source)] = datetime.now(UTC)
+        history = await self.state_manager.get_last_ingestion(
+            source_type, source, self.project_id
+        )
+        if history is None or history.status != IngestionStatus.SUCCESS:
+            return None
+        return history.last_successful_ingestion  # type: ignore[return-value]
+
+    async def last_sync_cursor(self, source_type: str, source: str) -> str | None:
+        """Source position recorded by the last successful run of a source.
+
+        Implements :class:`~qdrant_loader.connectors.base.SyncTracker`. Like
+        :meth:`last_synced_at`, the call marks the start of this run's listing.
+        """
+        if not self._scanning:
+            return None
+        self._sync_started[(source_type, source)] = datetime.now(UTC)
+        history = await self.state_manager.get_last_ingestion(
+            source_type, source, self.project_id
+        )
+        if history is None or history.status != IngestionStatus.SUCCESS:
+            return None
+        return history.sync_cursor  # type: ignore[return-value]
+
+    def keep_unlisted(self, source_type: str, source: str) -> None:
+        """Do not report the documents a source did not list as deleted."""
+        if self._scanning:
+            self._kept_unlisted.add((source_type, source))
+
+    async def mark_listed(
+        self, source_type: str, source: str, url: str, parent_id: str | None = None
+    ) -> None:
+        """Record an item as seen without comparing it to its stored state.
+
+        The attachments stored under the item, by source id or document id,
+        are marked as seen with it.
+        """
+        if not self._scanning:
+            return
+        self._pending_seen.append((source_type, source, self._url_key(url)))
+        for parent in (parent_id, Document.generate_id(source_type, source, url)):
+            if parent is not None:
+                self._pending_parents.append((source_type, source, parent))
+        await self._flush(force=False)
+
+    async def mark_failed(
+        self,
+        source_type: str,
+        source: str,
+        url: str | None = None,
+        parent_id: str | None = None,
+    ) -> None:
+        """Record an item that failed to be fetched or processed.
+
+        The item is kept as if it was listed, and the source is not recorded
+        as synced, so the next run tries it again. Without a URL, none of the
+        source's unseen documents are reported as deleted.
+        """
+        if not self._scanning:
+            return
+        key = (source_type, source)
+        self._failed_sources.add(key)
+        self.synced_sources.pop(key, None)
+        self.sync_cursors.pop(key, None)
+        if url is None:
+            self._incomplete_sources.add(key)
+            return
+        self._fetched_records.pop((source_type, source, self._url_key(url)), None)
+        await self.mark_listed(source_type, source, url, parent_id)
+
+    def mark_deleted(self, source_type: str, source: str, url: str) -> None:
+        """Record an item the source reported as deleted since its last run."""
+        if self._scanning:
+            self._reported_deleted.setdefault((source_type, source), []).append(
+                self._url_key(url)
+            )
+
+    def mark_synced(
+        self, source_type: str, source: str, cursor: str | None = None
+    ) -> None:
+        """Record that a source listed all its new and changed items.
+
+        Sources that reported a failed item are not recorded.
+
+        Args:
+            source_type: Type of the source
+            source: Name of the source
+            cursor: Position of the source the next run starts from, if any
+        """
+        started = self._sync_started.get((source_type, source))
+        if (
+            self._scanning
+            and started is not None
+            and (source_type, source) not in self._failed_sources
+        ):
+            self.synced_sources[(source_type, source)] = started
+            if cursor is not None:
+                self.sync_cursors[(source_type, source)] = cursor
+
+    async def _iter_reported_deleted(
+        self, key: tuple[str, str]
+    ) -> AsyncIterator[Document]:
+        """Yield the stored documents a source reported as deleted."""
+        url_keys = self._reported_deleted.get(key)
+        if not url_keys:
+            return
+        records = await self.state_manager.get_document_state_records_by_url(
+            key[0], key[1], url_keys
+        )
+        for record in records:
+            yield self._create_deleted_document(
+                self._record_to_state(record), record.document_id  # type: ignore[arg-type]
+            )
+
+    def _keep_fetched_record(
+        self, key: tuple[str, str, str], record: DocumentStateRecord | None
+    ) -> None:
+        """Keep the stored state of an item to fetch until its document arrives."""
+        self._fetched_records.pop(key, None)
+        self._fetched_records[key] = record
+        if len(self._fetched_records) > _MAX_FETCHED_RECORDS:
+            # Items never fetched, such as failed ones, go first
+            del self._fetched_records[next(iter(self._fetched_records))]
+
+    async def _classify(self, document: Document) -> str | None:
+        """Compare a document with its stored state and record it as seen."""
+        state = self._get_document_state(document)
+        key = (document.source_type, document.source, self._url_key(document.url))
+        self._pending_seen.append(key)
+
+        if key in self._fetched_records:
+            previous_record = self._fetched_records.pop(key)
+        else:
+            records = await self.state_manager.get_document_state_records_by_url(
+                document.source_type, document.source, [key[2]]
+            )
+            # Several records may share a URI; the last one wins, as it always has
+            previous_record = records[-1] if records else None
+
+        if previous_record is None:
+            return "new"
+        if self._is_document_updated(state, self._record_to_state(previous_record)):
+            return "updated"
+        if document.fingerprint and document.fingerprint != previous_record.fingerprint:
+            # Unchanged content: only record the fingerprint so the next
+            # run can skip fetching this document
+            self._fingerprint_updates.append(
+                document.model_copy(update={"content": ""})
+            )
+        return None
+
+    async def _flush(self, force: bool) -> None:
+        """Write pending seen keys and fingerprints once a batch has built up."""
+        pending = len(self._pending_seen) + len(self._fingerprint_updates)
+        if not pending or (not force and pending < _FLUSH_BATCH_SIZE):
+            return
+        seen, parents = self._pending_seen, self._pending_parents
+        updates = self._fingerprint_updates
+        self._pending_seen, self._pending_parents = [], []
+        self._fingerprint_updates = []
+        await self.state_manager.mark_documents_seen(seen, parents)
+        if updates:
+            await self.state_manager.update_document_states(updates, self.project_id)
+
+    @staticmethod
+    def _iter_source_configs(filtered_config: SourcesConfig) -> Iterator[SourceConfig]:
+        """Yield the configured sources whose previous states are compared."""
+        for source_configs in (
+            filtered_config.git,
+            filtered_config.confluence,
+            filtered_config.jira,
+            filtered_config.publicdocs,
+            filtered_config.localfile,
+        ):
+            if source_configs:
+                yield from source_configs.values()
+
     def _get_document_state(self, document: Document) -> DocumentState:
         """Get the standardized state of a document."""
         try:
@@ -132,12 +479,20 @@ class StateChangeDetector:
             or current_state.updated_at > previous_state.updated_at
         )
 
-    def _create_deleted_document(self, document_state: DocumentState) -> Document:
-        """Create a minimal document for a deleted item."""
+    def _create_deleted_document(
+        self, document_state: DocumentState, document_id: str | None = None
+    ) -> Document:
+        """Create a minimal document for a deleted item.
+
+        Args:
+            document_state: Stored state of the item
+            document_id: Stored document id, which the item's points carry
+        """
         source_type, source, url = document_state.uri.split(":", 2)
         url = unquote(url)
 
         return Document(
+            id=document_id,
             content="",
             content_type="md",
             source=source,
@@ -152,45 +507,24 @@ class StateChangeDetector:
             },
         )
 
-    async def _get_previous_states(
-        self, filtered_config: SourcesConfig
-    ) -> list[DocumentState]:
-        """Get previous document states from the state manager efficiently."""
-        previous_states_records: list[DocumentStateRecord] = []
-
-        # Define source type mappings for cleaner iteration
-        source_mappings = [
-            ("git", filtered_config.git),
-            ("confluence", filtered_config.confluence),
-            ("jira", filtered_config.jira),
-            ("publicdocs", filtered_config.publicdocs),
-            ("localfile", filtered_config.localfile),
-        ]
-
-        # Process each source type
-        for _source_name, source_configs in source_mappings:
-            if source_configs:
-                for config in source_configs.values():
-                    records = await self.state_manager.get_document_state_records(
-                        config
-                    )
-                    previous_states_records.extend(records)
-
-        # Convert records to states efficiently
-        return [
-            DocumentState(
-                uri=self._generate_uri(
-                    record.url, record.source, record.source_type, record.document_id  # type: ignore
-                ),
-                content_hash=record.content_hash,  # type: ignore
-                updated_at=record.updated_at,  # type: ignore
-            )
-            for record in previous_states_records
-        ]
+    def _record_to_state(self, record: DocumentStateRecord) -> DocumentState:
+        """Convert a state record to a standardized document state."""
+        return DocumentState(
+            uri=self._generate_uri(
+                record.url, record.source, record.source_type, record.document_id  # type: ignore
+            ),
+            content_hash=record.content_hash,  # type: ignore
+            updated_at=record.updated_at,  # type: ignore
+        )
 
     def _normalize_url(self, url: str) -> str:
         """Normalize a URL for consistent hashing."""
-        return quote(url.rstrip("/"), safe="")
+        return quote(self._url_key(url), safe="")
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        """URL as stored in the seen documents: without trailing slashes."""
+        return url.rstrip("/")
 
     def _generate_uri_from_document(self, document: Document) -> str:
         """Generate a URI from a document."""
@@ -2,6 +2,7 @@
 State management service for tracking document ingestion state.
 """
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -12,6 +13,7 @@ from qdrant_loader.config.state import IngestionStatus, StateManagementConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.state import transitions as _transitions
 from qdrant_loader.core.state.models import DocumentStateRecord, IngestionHistory
+from qdrant_loader.core.state.session import SerializedSessionFactory
 from qdrant_loader.core.state.session import create_tables as _create_tables
 from qdrant_loader.core.state.session import dispose_engine as _dispose_engine
 from qdrant_loader.core.state.session import (
@@ -21,7 +23,7 @@ from qdrant_loader.core.state.utils import generate_sqlite_aiosqlite_url as _gen
 from qdrant_loader.utils.logging import LoggingConfig
 
 if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 logger = LoggingConfig.get_logger(__name__)
 
@@ -34,7 +36,8 @@ class StateManager:
         self.config = config
         self._initialized = False
         self._engine: AsyncEngine | None = None
-        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        # Sessions are opened one at a time, see SerializedSessionFactory
+        self._session_factory: SerializedSessionFactory | None = None
         self.logger = LoggingConfig.get_logger(__name__)
 
     @property
@@ -138,8 +141,16 @@ class StateManager:
         error_message: str | None = None,
         document_count: int = 0,
         project_id: str | None = None,
+        ingested_at: datetime | None = None,
+        sync_cursor: str | None = None,
     ) -> None:
-        """Update and get the last successful ingestion time for a source."""
+        """Update and get the last successful ingestion time for a source.
+
+        ``ingested_at`` is recorded as the successful ingestion time instead of
+        the current time, e.g. the time at which the run started.
+        ``sync_cursor`` is the source's position at the end of a successful
+        run, such as the commit a repository was ingested at.
+        """
         self.logger.debug(
             f"Updating last ingestion for {source_type}:{source} (project: {project_id})"
         )
@@ -152,6 +163,8 @@ class StateManager:
                 error_message=error_message,
                 document_count=document_count,
                 project_id=project_id,
+                ingested_at=ingested_at,
+                sync_cursor=sync_cursor,
             )
         except Exception as e:
             self.logger.error(
@@ -264,6 +277,39 @@ class StateManager:
             )
             raise
 
+    async def mark_documents_deleted(self, documents: Sequence[Document]) -> None:
+        """Mark the states of many documents as deleted."""
+        if not documents:
+            return
+        try:
+            await _transitions.mark_documents_deleted(
+                self._session_factory,  # type: ignore[arg-type]
+                documents=[
+                    (document.source_type, document.source, document.id)
+                    for document in documents
+                ],
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error marking {len(documents)} documents as deleted: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    async def get_live_document_ids(
+        self, source_type: str, source: str, urls: Sequence[str]
+    ) -> dict[str, str]:
+        """Return the document IDs of the URLs of a source that have a live state.
+
+        States marked as deleted are left out.
+        """
+        return await _transitions.get_live_document_ids(
+            self._session_factory,  # type: ignore[arg-type]
+            source_type=source_type,
+            source=source,
+            urls=urls,
+        )
+
     async def get_document_state_record(
         self,
         source_type: str,
@@ -311,6 +357,76 @@ class StateManager:
             )
             raise
 
+    async def get_document_state_records_by_url(
+        self, source_type: str, source: str, url_keys: Sequence[str]
+    ) -> list[DocumentStateRecord]:
+        """Get the live document states of a source for URLs without trailing slashes."""
+        try:
+            return await _transitions.get_document_state_records_by_url(
+                self._session_factory,  # type: ignore[arg-type]
+                source_type=source_type,
+                source=source,
+                url_keys=url_keys,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error looking up document states for {source_type}:{source}: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    async def reset_seen_documents(self) -> None:
+        """Start a change detection scan with no documents seen."""
+        await _transitions.reset_seen_documents(
+            self._session_factory  # type: ignore[arg-type]
+        )
+
+    async def mark_documents_seen(
+        self,
+        keys: Sequence[tuple[str, str, str]],
+        parent_keys: Sequence[tuple[str, str, str]] = (),
+    ) -> None:
+        """Record documents, and the attachments of parent documents, as seen.
+
+        Args:
+            keys: (source_type, source, URL without trailing slashes) tuples
+            parent_keys: (source_type, source, parent_document_id) tuples
+        """
+        try:
+            await _transitions.mark_documents_seen(
+                self._session_factory,  # type: ignore[arg-type]
+                keys=keys,
+                parent_keys=parent_keys,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error marking {len(keys)} documents as seen: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    async def iter_unseen_document_state_records(
+        self, source_config: SourceConfig, batch_size: int = 1000
+    ) -> AsyncIterator[DocumentStateRecord]:
+        """Yield the live document states of a source not seen since the last reset.
+
+        Records are read ``batch_size`` at a time, each page in its own session.
+        """
+        after_id = 0
+        while True:
+            records = await _transitions.get_unseen_document_state_records(
+                self._session_factory,  # type: ignore[arg-type]
+                source_type=source_config.source_type,
+                source=source_config.source,
+                after_id=after_id,
+                limit=batch_size,
+            )
+            for record in records:
+                yield record
+            if len(records) < batch_size:
+                return
+            after_id = records[-1].id  # type: ignore[assignment]
+
     async def update_document_state(
         self, document: Document, project_id: str | None = None
     ) -> DocumentStateRecord:
@@ -339,6 +455,39 @@ class StateManager:
             )
             raise
 
+    async def update_document_states(
+        self,
+        documents: list[Document],
+        project_id: str | None = None,
+        batch_size: int = _transitions.DEFAULT_BULK_BATCH_SIZE,
+    ) -> int:
+        """Update the states of many documents, thousands of rows per transaction.
+
+        Returns:
+            Number of document states written
+        """
+        if not self._initialized:
+            raise RuntimeError("StateManager not initialized. Call initialize() first.")
+        if not documents:
+            return 0
+
+        self.logger.debug(
+            f"Bulk updating {len(documents)} document states (project: {project_id})"
+        )
+        try:
+            return await _transitions.bulk_update_document_states(
+                self._session_factory,  # type: ignore[arg-type]
+                documents=documents,
+                project_id=project_id,
+                batch_size=batch_size,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error bulk updating {len(documents)} document states: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
     async def update_conversion_metrics(
         self,
         source_type: str,
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
+from qdrant_loader.config.state import IngestionStatus
 from qdrant_loader.core.document import Document
-from qdrant_loader.core.state.models import DocumentStateRecord, IngestionHistory
+from qdrant_loader.core.state.models import (
+    DocumentStateRecord,
+    IngestionHistory,
+    seen_documents,
+)
 
 AsyncSessionFactory = Callable[[], Awaitable[Any]]
 
+# Rows written per transaction by bulk_update_document_states
+DEFAULT_BULK_BATCH_SIZE = 2000
+
+# Columns identifying a document state row; never changed by an update
+_DOCUMENT_KEY_COLUMNS = ("project_id", "source_type", "source", "document_id")
+
+# Kept from the existing row on update, as in update_document_state
+_PRESERVED_ON_UPDATE = {*_DOCUMENT_KEY_COLUMNS, "created_at", "url"}
+
+# Values bound per IN clause, well below SQLite's host parameter limit
+_URL_LOOKUP_BATCH_SIZE = 400
+
+# Stored URLs compared without trailing slashes, like change detection URIs
+_URL_KEY = func.rtrim(DocumentStateRecord.url, "/")
+
 
 async def update_last_ingestion(
     session_factory: AsyncSessionFactory,
@@ -21,9 +42,12 @@ async def update_last_ingestion(
     error_message: str | None,
     document_count: int,
     project_id: str | None,
+    ingested_at: datetime | None = None,
+    sync_cursor: str | None = None,
 ) -> None:
     async with session_factory() as session:  # type: ignore
         now = datetime.now(UTC)
+        succeeded_at = ingested_at or now
         query = (
             select(IngestionHistory)
             .filter(IngestionHistory.source_type == source_type)
@@ -35,7 +59,9 @@ async def update_last_ingestion(
         ingestion = result.scalar_one_or_none()
         if ingestion:
             ingestion.last_successful_ingestion = (
-                now if status == "SUCCESS" else ingestion.last_successful_ingestion
+                succeeded_at
+                if status == IngestionStatus.SUCCESS
+                else ingestion.last_successful_ingestion
             )  # type: ignore
             ingestion.status = status  # type: ignore
             ingestion.document_count = (
@@ -43,17 +69,22 @@ async def update_last_ingestion(
             )  # type: ignore
             ingestion.updated_at = now  # type: ignore
             ingestion.error_message = error_message  # type: ignore
+            if status == IngestionStatus.SUCCESS and sync_cursor is not None:
+                ingestion.sync_cursor = sync_cursor  # type: ignore
         else:
             ingestion = IngestionHistory(
                 project_id=project_id,
                 source_type=source_type,
                 source=source,
-                last_successful_ingestion=now,
+                last_successful_ingestion=succeeded_at,
                 status=status,
                 document_count=document_count,
                 error_message=error_message,
                 created_at=now,
                 updated_at=now,
+                sync_cursor=(
+                    sync_cursor if status == IngestionStatus.SUCCESS else None
+                ),
             )
             session.add(ingestion)
         await session.commit()
@@ -103,6 +134,62 @@ async def mark_document_deleted(
             await session.commit()
 
 
+async def mark_documents_deleted(
+    session_factory: AsyncSessionFactory,
+    *,
+    documents: Sequence[tuple[str, str, str]],
+) -> None:
+    """Mark many document states as deleted, one UPDATE per source.
+
+    Args:
+        documents: (source_type, source, document_id) of the deleted documents
+    """
+    by_source: dict[tuple[str, str], list[str]] = {}
+    for source_type, source, document_id in documents:
+        by_source.setdefault((source_type, source), []).append(document_id)
+    async with session_factory() as session:  # type: ignore
+        now = datetime.now(UTC)
+        for (source_type, source), document_ids in by_source.items():
+            for start in range(0, len(document_ids), _URL_LOOKUP_BATCH_SIZE):
+                await session.execute(
+                    update(DocumentStateRecord)
+                    .where(
+                        DocumentStateRecord.source_type == source_type,
+                        DocumentStateRecord.source == source,
+                        DocumentStateRecord.document_id.in_(
+                            document_ids[start : start + _URL_LOOKUP_BATCH_SIZE]
+                        ),
+                    )
+                    .values(is_deleted=True, updated_at=now)
+                )
+        await session.commit()
+
+
+async def get_live_document_ids(
+    session_factory: AsyncSessionFactory,
+    *,
+    source_type: str,
+    source: str,
+    urls: Sequence[str],
+) -> dict[str, str]:
+    """Return the document IDs of the given URLs of a source that have a live state."""
+    live: dict[str, str] = {}
+    async with session_factory() as session:  # type: ignore
+        for start in range(0, len(urls), _URL_LOOKUP_BATCH_SIZE):
+            result = await session.execute(
+                select(DocumentStateRecord.url, DocumentStateRecord.document_id).filter(
+                    DocumentStateRecord.source_type == source_type,
+                    DocumentStateRecord.source == source,
+                    DocumentStateRecord.url.in_(
+                        urls[start : start + _URL_LOOKUP_BATCH_SIZE]
+                    ),
+                    DocumentStateRecord.is_deleted.is_not(True),
+                )
+            )
+            live.update(result.tuples().all())
+    return live
+
+
 async def get_document_state_record(
     session_factory: AsyncSessionFactory,
     *,
@@ -144,6 +231,130 @@ async def get_document_state_records(
         return list(result.scalars().all())
 
 
+async def get_document_state_records_by_url(
+    session_factory: AsyncSessionFactory,
+    *,
+    source_type: str,
+    source: str,
+    url_keys: Sequence[str],
+) -> list[DocumentStateRecord]:
+    """Get the live state records of a source for URLs without trailing slashes.
+
+    Uses the (source_type, source, url) index; a stored URL matches its key
+    with or without a single trailing slash.
+    """
+    records: list[DocumentStateRecord] = []
+    async with session_factory() as session:  # type: ignore
+        for start in range(0, len(url_keys), _URL_LOOKUP_BATCH_SIZE):
+            batch = url_keys[start : start + _URL_LOOKUP_BATCH_SIZE]
+            urls = {url for key in batch for url in (key, f"{key}/")}
+            result = await session.execute(
+                select(DocumentStateRecord).filter(
+                    DocumentStateRecord.source_type == source_type,
+                    DocumentStateRecord.source == source,
+                    DocumentStateRecord.url.in_(urls),
+                    DocumentStateRecord.is_deleted.is_not(True),
+                )
+            )
+            records.extend(result.scalars().all())
+    return records
+
+
+async def reset_seen_documents(session_factory: AsyncSessionFactory) -> None:
+    """Create the temporary table of seen documents, or empty it.
+
+    The table is connection-local: it relies on the single ``StaticPool``
+    connection of the state engine and on sessions being opened one at a time
+    by ``SerializedSessionFactory``, so marks are never rolled back by another
+    session closing on the same connection.
+    """
+    async with session_factory() as session:  # type: ignore
+        connection = await session.connection()
+        await connection.run_sync(
+            lambda sync_connection: seen_documents.create(
+                sync_connection, checkfirst=True
+            )
+        )
+        await session.execute(seen_documents.delete())
+        await session.commit()
+
+
+async def mark_documents_seen(
+    session_factory: AsyncSessionFactory,
+    *,
+    keys: Sequence[tuple[str, str, str]],
+    parent_keys: Sequence[tuple[str, str, str]] = (),
+) -> None:
+    """Record documents, and the attachments of parents, as seen.
+
+    Args:
+        keys: (source_type, source, URL without trailing slashes) of documents
+        parent_keys: (source_type, source, parent_document_id) whose attachment
+            states are marked as seen
+    """
+    async with session_factory() as session:  # type: ignore
+        if keys:
+            await session.execute(
+                sqlite_insert(seen_documents).on_conflict_do_nothing(),
+                [
+                    {"source_type": source_type, "source": source, "url": url}
+                    for source_type, source, url in set(keys)
+                ],
+            )
+        for source_type, source, parent_id in set(parent_keys):
+            await session.execute(
+                sqlite_insert(seen_documents)
+                .from_select(
+                    ["source_type", "source", "url"],
+                    select(
+                        DocumentStateRecord.source_type,
+                        DocumentStateRecord.source,
+                        _URL_KEY,
+                    ).filter(
+                        DocumentStateRecord.source_type == source_type,
+                        DocumentStateRecord.source == source,
+                        DocumentStateRecord.parent_document_id == parent_id,
+                    ),
+                )
+                .on_conflict_do_nothing()
+            )
+        await session.commit()
+
+
+async def get_unseen_document_state_records(
+    session_factory: AsyncSessionFactory,
+    *,
+    source_type: str,
+    source: str,
+    after_id: int,
+    limit: int,
+) -> list[DocumentStateRecord]:
+    """Get live state records of a source missing from the seen documents.
+
+    An anti-join against ``seen_documents``, paged by primary key.
+    """
+    async with session_factory() as session:  # type: ignore
+        seen = (
+            exists()
+            .where(seen_documents.c.source_type == DocumentStateRecord.source_type)
+            .where(seen_documents.c.source == DocumentStateRecord.source)
+            .where(seen_documents.c.url == _URL_KEY)
+        )
+        result = await session.execute(
+            select(DocumentStateRecord)
+            .filter(
+                DocumentStateRecord.source_type == source_type,
+                DocumentStateRecord.source == source,
+                DocumentStateRecord.is_deleted.is_not(True),
+                DocumentStateRecord.id > after_id,
+                ~seen,
+            )
+            .order_by(DocumentStateRecord.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+
 async def update_document_state(
     session_factory: AsyncSessionFactory,
     *,
@@ -175,6 +386,7 @@ async def update_document_state(
         if document_state_record:
             document_state_record.title = document.title  # type: ignore
             document_state_record.content_hash = document.content_hash  # type: ignore
+            document_state_record.fingerprint = document.fingerprint  # type: ignore
             document_state_record.is_deleted = False  # type: ignore
             document_state_record.updated_at = now  # type: ignore
 
@@ -230,6 +442,7 @@ async def update_document_state(
                 url=document.url,
                 title=document.title,
                 content_hash=document.content_hash,
+                fingerprint=document.fingerprint,
                 is_deleted=False,
                 created_at=now,
                 updated_at=now,
@@ -256,6 +469,143 @@ async def update_document_state(
         return document_state_record
 
 
+def _parse_attachment_created_at(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return None
+
+
+def _document_state_values(
+    document: Document, project_id: str | None, now: datetime
+) -> dict[str, Any]:
+    """Column values of the state row for a document."""
+    metadata = document.metadata
+    conversion_method = metadata.get("conversion_method")
+    return {
+        "project_id": project_id,
+        "document_id": document.id,
+        "source_type": document.source_type,
+        "source": document.source,
+        "url": document.url,
+        "title": document.title,
+        "content_hash": document.content_hash,
+        "fingerprint": document.fingerprint,
+        "is_deleted": False,
+        "created_at": now,
+        "updated_at": now,
+        "is_converted": conversion_method is not None,
+        "conversion_method": conversion_method,
+        "original_file_type": metadata.get("original_file_type"),
+        "original_filename": metadata.get("original_filename"),
+        "file_size": metadata.get("file_size"),
+        "conversion_failed": metadata.get("conversion_failed", False),
+        "conversion_error": metadata.get("conversion_error"),
+        "conversion_time": metadata.get("conversion_time"),
+        "is_attachment": metadata.get("is_attachment", False),
+        "parent_document_id": metadata.get("parent_document_id"),
+        "attachment_id": metadata.get("attachment_id"),
+        "attachment_filename": metadata.get("attachment_filename"),
+        "attachment_mime_type": metadata.get("attachment_mime_type"),
+        "attachment_download_url": metadata.get("attachment_download_url"),
+        "attachment_author": metadata.get("attachment_author"),
+        "attachment_created_at": _parse_attachment_created_at(
+            metadata.get("attachment_created_at")
+        ),
+    }
+
+
+async def bulk_update_document_states(
+    session_factory: AsyncSessionFactory,
+    *,
+    documents: Sequence[Document],
+    project_id: str | None,
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+) -> int:
+    """Insert or update the state rows of many documents.
+
+    Rows are written ``batch_size`` at a time, one transaction per batch. With
+    a project, each batch is a single ``INSERT ... ON CONFLICT DO UPDATE``
+    executed for all rows. Rows without a project cannot use the unique
+    constraint (NULLs never conflict in SQLite), so existing rows are looked
+    up in one query and updated by primary key.
+
+    Returns:
+        Number of documents written
+    """
+    written = 0
+    for start in range(0, len(documents), batch_size):
+        now = datetime.now(UTC)
+        # A document listed twice in a batch is written once (last wins)
+        rows = list(
+            {
+                (document.source_type, document.source, document.id): (
+                    _document_state_values(document, project_id, now)
+                )
+                for document in documents[start : start + batch_size]
+            }.values()
+        )
+        async with session_factory() as session:  # type: ignore
+            if project_id is not None:
+                await _upsert_rows(session, rows)
+            else:
+                await _update_or_insert_rows(session, rows)
+            await session.commit()
+        written += len(rows)
+    return written
+
+
+async def _upsert_rows(session: Any, rows: list[dict[str, Any]]) -> None:
+    table = DocumentStateRecord.__table__
+    statement = sqlite_insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(_DOCUMENT_KEY_COLUMNS),
+        set_={
+            column: statement.excluded[column]
+            for column in rows[0]
+            if column not in _PRESERVED_ON_UPDATE
+        },
+    )
+    await session.execute(statement, rows)
+
+
+async def _update_or_insert_rows(session: Any, rows: list[dict[str, Any]]) -> None:
+    result = await session.execute(
+        select(
+            DocumentStateRecord.id,
+            DocumentStateRecord.source_type,
+            DocumentStateRecord.source,
+            DocumentStateRecord.document_id,
+        ).filter(
+            DocumentStateRecord.document_id.in_({row["document_id"] for row in rows})
+        )
+    )
+    existing = {
+        (source_type, source, document_id): row_id
+        for row_id, source_type, source, document_id in result.all()
+    }
+
+    updates: list[dict[str, Any]] = []
+    inserts: list[dict[str, Any]] = []
+    for row in rows:
+        row_id = existing.get((row["source_type"], row["source"], row["document_id"]))
+        if row_id is None:
+            inserts.append(row)
+        else:
+            values = {k: v for k, v in row.items() if k not in _PRESERVED_ON_UPDATE}
+            updates.append({"id": row_id, **values})
+
+    if updates:
+        # ORM bulk UPDATE by primary key (executemany)
+        await session.execute(update(DocumentStateRecord), updates)
+    if inserts:
+        await session.execute(insert(DocumentStateRecord), inserts)
+
+
 async def update_conversion_metrics(
     session_factory: AsyncSessionFactory,
     *,
@@ -0,0 +1,74 @@
+"""Process-wide cache for heavy NLP resources.
+
+spaCy pipelines and tokenizer encodings are expensive to build and safe to
+share for inference, so they are created once per process and reused by every
+chunking strategy. Objects with mutable per-call state (such as tree-sitter
+parsers) are cached per thread instead.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+_lock = threading.Lock()
+_key_locks: dict[Hashable, threading.Lock] = {}
+_resources: dict[Hashable, Any] = {}
+_generation = 0
+_thread_local = threading.local()
+
+
+def get_shared_resource(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the process-wide resource for ``key``, creating it on first use.
+
+    Concurrent callers asking for the same key wait for a single construction;
+    different keys are built independently. Factory errors are not cached.
+
+    Args:
+        key: Cache key identifying the resource
+        factory: Callable that builds the resource
+
+    Returns:
+        The cached resource
+    """
+    try:
+        return _resources[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        if key not in _resources:
+            _resources[key] = factory()
+        return _resources[key]
+
+
+def get_thread_local_resource(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the calling thread's resource for ``key``, creating it on first use.
+
+    Args:
+        key: Cache key identifying the resource
+        factory: Callable that builds the resource
+
+    Returns:
+        The cached resource
+    """
+    cache = getattr(_thread_local, "resources", None)
+    if cache is None or getattr(_thread_local, "generation", None) != _generation:
+        cache = {}
+        _thread_local.resources = cache
+        _thread_local.generation = _generation
+
+    if key not in cache:
+        cache[key] = factory()
+    return cache[key]
+
+
+def clear_resource_cache() -> None:
+    """Drop all cached resources, including thread-local ones."""
+    global _generation
+    with _lock:
+        _resources.clear()
+        _key_locks.clear()
+        _generation += 1
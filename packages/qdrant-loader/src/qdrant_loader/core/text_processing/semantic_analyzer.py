@@ -8,6 +8,7 @@ import spacy
 from gensim import corpora
 from gensim.models import LdaModel
 from gensim.parsing.preprocessing import preprocess_string
+from qdrant_loader.core.text_processing.resource_cache import get_shared_resource
 from spacy.cli.download import download as spacy_download
 from spacy.tokens import Doc
 
@@ -47,12 +48,9 @@ class SemanticAnalyzer:
         self.logger = logging.getLogger(__name__)
 
         # Initialize spaCy
-        try:
-            self.nlp = spacy.load(spacy_model)
-        except OSError:
-            self.logger.info(f"Downloading spaCy model {spacy_model}...")
-            spacy_download(spacy_model)
-            self.nlp = spacy.load(spacy_model)
+        self.nlp = get_shared_resource(
+            ("spacy", spacy_model, "full"), lambda: self._load_spacy_model(spacy_model)
+        )
 
         # Initialize LDA parameters
         self.num_topics = num_topics
@@ -66,6 +64,15 @@ class SemanticAnalyzer:
         # Cache for processed documents
         self._doc_cache = {}
 
+    def _load_spacy_model(self, spacy_model: str) -> spacy.language.Language:
+        """Load a spaCy model, downloading it if needed."""
+        try:
+            return spacy.load(spacy_model)
+        except OSError:
+            self.logger.info(f"Downloading spaCy model {spacy_model}...")
+            spacy_download(spacy_model)
+            return spacy.load(spacy_model)
+
     def analyze_text(
         self, text: str, doc_id: str | None = None
     ) -> SemanticAnalysisResult:
@@ -454,27 +461,8 @@ class SemanticAnalyzer:
             except Exception as e:
                 logger.warning(f"Error releasing dictionary: {e}")
 
-        # Release spaCy model resources
-        if hasattr(self, "nlp") and self.nlp is not None:
-            try:
-                # Clear spaCy caches and release memory
-                if hasattr(self.nlp, "vocab") and hasattr(self.nlp.vocab, "strings"):
-                    # Try different methods to clear spaCy caches
-                    if hasattr(self.nlp.vocab.strings, "_map") and hasattr(
-                        self.nlp.vocab.strings._map, "clear"
-                    ):
-                        self.nlp.vocab.strings._map.clear()
-                    elif hasattr(self.nlp.vocab.strings, "clear"):
-                        self.nlp.vocab.strings.clear()
-                    # Additional cleanup for different spaCy versions
-                    if hasattr(self.nlp.vocab, "_vectors") and hasattr(
-                        self.nlp.vocab._vectors, "clear"
-                    ):
-                        self.nlp.vocab._vectors.clear()
-                # Note: We don't set nlp to None as it might be needed for other operations
-                # but we clear its internal caches
-            except Exception as e:
-                logger.debug(f"spaCy cache clearing skipped (version-specific): {e}")
+        # The spaCy pipeline is shared process-wide (see resource_cache), so its
+        # vocabulary and vectors are left untouched here.
 
         logger.debug("Semantic analyzer resources cleared")
 
@@ -489,7 +477,7 @@ class SemanticAnalyzer:
         # More aggressive cleanup for shutdown
         if hasattr(self, "nlp"):
             try:
-                # Release the spaCy model completely
+                # Drop this analyzer's reference to the shared spaCy model
                 del self.nlp
             except Exception as e:
                 logger.warning(f"Error releasing spaCy model: {e}")
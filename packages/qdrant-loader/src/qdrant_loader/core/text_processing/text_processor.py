@@ -4,6 +4,7 @@ import nltk
 import spacy
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from qdrant_loader.config import Settings
+from qdrant_loader.core.text_processing.resource_cache import get_shared_resource
 from qdrant_loader.utils.logging import LoggingConfig
 from spacy.cli.download import download
 
@@ -15,6 +16,44 @@ MAX_ENTITIES_TO_EXTRACT = 50  # Limit number of entities
 MAX_POS_TAGS_TO_EXTRACT = 200  # Limit number of POS tags
 
 
+def _ensure_nltk_data() -> bool:
+    """Download the NLTK data used by the text processor if it is missing."""
+    try:
+        nltk.data.find("tokenizers/punkt")
+    except LookupError:
+        nltk.download("punkt")
+    try:
+        nltk.data.find("corpora/stopwords")
+    except LookupError:
+        nltk.download("stopwords")
+    return True
+
+
+def _load_spacy_model(spacy_model: str) -> spacy.language.Language:
+    """Load a spaCy model without the dependency parser, downloading it if needed.
+
+    Args:
+        spacy_model: Name of the spaCy model
+
+    Returns:
+        The loaded spaCy pipeline
+    """
+    try:
+        nlp = spacy.load(spacy_model)
+    except OSError:
+        logger.info(f"Downloading spaCy model {spacy_model}...")
+        download(spacy_model)
+        nlp = spacy.load(spacy_model)
+
+    # Optimize spaCy pipeline for speed
+    # Select only essential components for faster processing
+    if "parser" in nlp.pipe_names:
+        # Keep only essential components: tokenizer, tagger, ner (exclude parser)
+        essential_pipes = [pipe for pipe in nlp.pipe_names if pipe != "parser"]
+        nlp.select_pipes(enable=essential_pipes)
+    return nlp
+
+
 class TextProcessor:
     """Text processing service integrating multiple NLP libraries."""
 
@@ -26,38 +65,15 @@ class TextProcessor:
         """
         self.settings = settings
 
-        # Download required NLTK data
-        try:
-            nltk.data.find("tokenizers/punkt")
-        except LookupError:
-            nltk.download("punkt")
-        try:
-            nltk.data.find("corpora/stopwords")
-        except LookupError:
-            nltk.download("stopwords")
+        # Download required NLTK data (checked once per process)
+        get_shared_resource(("nltk", "punkt", "stopwords"), _ensure_nltk_data)
 
-        # Load spaCy model with optimized settings
+        # Load spaCy model with optimized settings, shared across instances
         spacy_model = settings.global_config.semantic_analysis.spacy_model
-        try:
-            self.nlp = spacy.load(spacy_model)
-            # Optimize spaCy pipeline for speed
-            # Select only essential components for faster processing
-            if "parser" in self.nlp.pipe_names:
-                # Keep only essential components: tokenizer, tagger, ner (exclude parser)
-                essential_pipes = [
-                    pipe for pipe in self.nlp.pipe_names if pipe != "parser"
-                ]
-                self.nlp.select_pipes(enable=essential_pipes)
-        except OSError:
-            logger.info(f"Downloading spaCy model {spacy_model}...")
-            download(spacy_model)
-            self.nlp = spacy.load(spacy_model)
-            if "parser" in self.nlp.pipe_names:
-                # Keep only essential components: tokenizer, tagger, ner (exclude parser)
-                essential_pipes = [
-                    pipe for pipe in self.nlp.pipe_names if pipe != "parser"
-                ]
-                self.nlp.select_pipes(enable=essential_pipes)
+        self.nlp = get_shared_resource(
+            ("spacy", spacy_model, "without_parser"),
+            lambda: _load_spacy_model(spacy_model),
+        )
 
         # Initialize LangChain text splitter with configuration from settings
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -4,6 +4,7 @@ from typing import Any
 
 import spacy
 from gensim import corpora, models
+from qdrant_loader.core.text_processing.resource_cache import get_shared_resource
 from qdrant_loader.utils.logging import LoggingConfig
 from spacy.cli.download import download
 
@@ -32,12 +33,18 @@ class TopicModeler:
         self._processed_texts = set()  # Track processed texts
 
         # Initialize spaCy for text preprocessing
+        self.nlp = get_shared_resource(
+            ("spacy", spacy_model, "full"), lambda: self._load_spacy_model(spacy_model)
+        )
+
+    def _load_spacy_model(self, spacy_model: str) -> spacy.language.Language:
+        """Load a spaCy model, downloading it if needed."""
         try:
-            self.nlp = spacy.load(spacy_model)
+            return spacy.load(spacy_model)
         except OSError:
             logger.info(f"Downloading spaCy model {spacy_model}...")
             download(spacy_model)
-            self.nlp = spacy.load(spacy_model)
+            return spacy.load(spacy_model)
 
     def _preprocess_text(self, text: str) -> list[str]:
         """Preprocess text for topic modeling.
@@ -60,6 +60,18 @@ def setup_test_environment():
         shutil.rmtree(data_dir)
 
 
+@pytest.fixture(autouse=True)
+def clear_nlp_resource_cache():
+    """Reset shared NLP resources so patched model loaders apply per test."""
+    from qdrant_loader.core.text_processing.resource_cache import (
+        clear_resource_cache,
+    )
+
+    clear_resource_cache()
+    yield
+    clear_resource_cache()
+
+
 @pytest.fixture(scope="session")
 def test_settings():
     """Get test settings."""
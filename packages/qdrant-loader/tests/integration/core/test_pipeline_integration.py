@@ -13,7 +13,6 @@ from qdrant_loader.config.qdrant import QdrantConfig
 from qdrant_loader.config.sources import SourcesConfig
 from qdrant_loader.connectors.git.config import GitRepoConfig
 from qdrant_loader.core.async_ingestion_pipeline import AsyncIngestionPipeline
-from qdrant_loader.core.document import Document
 from qdrant_loader.core.qdrant_manager import QdrantManager
 from qdrant_loader.core.state.state_manager import StateManager
 
@@ -186,21 +185,8 @@ async def test_pipeline_project_specific_processing(
     )
 
     # Mock the orchestrator's process_documents method
-    mock_documents = [
-        Document(
-            id="doc-1",
-            title="Test Document 1",
-            content="Test content 1",
-            content_type="text/plain",
-            url="http://test.com/doc1",
-            source_type="git",
-            source="repo-1",
-            metadata={"test": "metadata"},
-        )
-    ]
-
     with patch.object(
-        pipeline.orchestrator, "process_documents", return_value=mock_documents
+        pipeline.orchestrator, "process_documents", return_value=1
     ) as mock_process:
         # Process documents for a specific project
         result = await pipeline.process_documents(project_id="project-1")
@@ -215,8 +201,7 @@ async def test_pipeline_project_specific_processing(
         )
 
         # Verify result
-        assert len(result) == 1
-        assert result[0].title == "Test Document 1"
+        assert result == 1
 
 
 @pytest.mark.asyncio
@@ -245,38 +230,14 @@ async def test_pipeline_all_projects_processing(
         enable_metrics=False,
     )
 
-    # Mock the orchestrator's process_documents method to return different documents for each project
+    # Mock the orchestrator's process_documents method to return a count for each project
     def mock_process_documents(**kwargs):
         project_id = kwargs.get("project_id")
-        if project_id == "project-1":
-            return [
-                Document(
-                    id="doc-1",
-                    title="Project 1 Document",
-                    content="Project 1 content",
-                    content_type="text/plain",
-                    url="http://test.com/project1/doc1",
-                    source_type="git",
-                    source="repo-1",
-                    metadata={"project": "1"},
-                )
-            ]
-        elif project_id == "project-2":
-            return [
-                Document(
-                    id="doc-2",
-                    title="Project 2 Document",
-                    content="Project 2 content",
-                    content_type="text/plain",
-                    url="http://test.com/project2/doc2",
-                    source_type="git",
-                    source="repo-2",
-                    metadata={"project": "2"},
-                )
-            ]
+        if project_id in ("project-1", "project-2"):
+            return 1
         else:
             # This is the call for all projects
-            return []
+            return 0
 
     with patch.object(
         pipeline.orchestrator, "process_documents", side_effect=mock_process_documents
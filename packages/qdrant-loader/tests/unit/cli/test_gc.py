@@ -0,0 +1,129 @@
+"""Tests for the gc command helper."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from qdrant_loader.cli.commands import run_garbage_collection
+from qdrant_loader.config.state import StateManagementConfig
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.state.state_manager import StateManager
+
+LIVE_ID = Document.generate_id("git", "repo", "http://test.com/live")
+
+
+@pytest_asyncio.fixture
+async def settings(tmp_path):
+    """Settings with a state database holding one live document."""
+    config = StateManagementConfig(database_path=str(tmp_path / "state.db"))
+    state_manager = StateManager(config)
+    await state_manager.initialize()
+    await state_manager.update_document_states(
+        [
+            Document(
+                title="Live",
+                content="Live content",
+                content_type="text/plain",
+                source_type="git",
+                source="repo",
+                url="http://test.com/live",
+                metadata={},
+            )
+        ],
+        "project-a",
+    )
+    await state_manager.dispose()
+
+    settings = Mock()
+    settings.global_config.state_management = config
+    return settings
+
+
+def _qdrant_manager(document_points=()):
+    async def iter_point_sources(batch_size):
+        yield [
+            ("p1", "git", "repo", "http://test.com/live", LIVE_ID),
+            ("p2", "git", "repo", "http://test.com/gone", "gone-id"),
+            ("p3", "git", "removed-repo", "http://test.com/live", LIVE_ID),
+            ("p4", None, None, None, None),
+        ]
+
+    qdrant_manager = Mock()
+    qdrant_manager.iter_point_sources = iter_point_sources
+    qdrant_manager.delete_points = AsyncMock()
+    qdrant_manager.get_document_points = AsyncMock(return_value=list(document_points))
+    qdrant_manager.set_document_id = AsyncMock()
+    return qdrant_manager
+
+
+def _legacy_qdrant_manager(document_points):
+    """Collection whose live document has points written before the upgrade."""
+    qdrant_manager = _qdrant_manager(document_points)
+
+    async def iter_point_sources(batch_size):
+        yield [("p1", "git", "repo", "http://test.com/live", "p1")]
+        yield [("p5", "git", "repo", "http://test.com/live", "parent-id")]
+
+    qdrant_manager.iter_point_sources = iter_point_sources
+    return qdrant_manager
+
+
+@pytest.mark.asyncio
+async def test_run_garbage_collection_deletes_orphaned_points(settings):
+    """Points without a live document state are deleted."""
+    qdrant_manager = _qdrant_manager()
+
+    scanned, orphaned, migrated = await run_garbage_collection(
+        settings, qdrant_manager, dry_run=False
+    )
+
+    assert (scanned, orphaned, migrated) == (4, 2, 0)
+    qdrant_manager.delete_points.assert_awaited_once()
+    assert sorted(qdrant_manager.delete_points.call_args[0][0]) == ["p2", "p3"]
+    qdrant_manager.get_document_points.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_garbage_collection_dry_run(settings):
+    """A dry run counts orphaned points without deleting them."""
+    qdrant_manager = _qdrant_manager()
+
+    scanned, orphaned, migrated = await run_garbage_collection(
+        settings, qdrant_manager, dry_run=True
+    )
+
+    assert (scanned, orphaned, migrated) == (4, 2, 0)
+    qdrant_manager.delete_points.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_garbage_collection_migrates_legacy_points(settings):
+    """Points of a document not ingested since the upgrade get its document ID."""
+    qdrant_manager = _legacy_qdrant_manager([("p1", "p1"), ("p5", "parent-id")])
+
+    scanned, orphaned, migrated = await run_garbage_collection(
+        settings, qdrant_manager, dry_run=False
+    )
+
+    assert (scanned, orphaned, migrated) == (2, 0, 2)
+    qdrant_manager.get_document_points.assert_awaited_once_with(
+        "git", "repo", "http://test.com/live"
+    )
+    qdrant_manager.set_document_id.assert_awaited_once_with(["p1", "p5"], LIVE_ID)
+    qdrant_manager.delete_points.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_garbage_collection_deletes_stale_legacy_points(settings):
+    """Legacy points of a document ingested again since the upgrade are stale."""
+    qdrant_manager = _legacy_qdrant_manager(
+        [("p1", "p1"), ("p5", "parent-id"), ("p6", LIVE_ID)]
+    )
+
+    scanned, orphaned, migrated = await run_garbage_collection(
+        settings, qdrant_manager, dry_run=False
+    )
+
+    assert (scanned, orphaned, migrated) == (2, 2, 0)
+    qdrant_manager.delete_points.assert_awaited_once_with(["p1", "p5"])
+    qdrant_manager.set_document_id.assert_not_awaited()
@@ -1,8 +1,11 @@
 """Unit tests for the Confluence connector."""
 
+import asyncio
 import os
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 import requests
 from pydantic import HttpUrl
@@ -198,23 +201,56 @@ class TestConfluenceConnector:
     @pytest.mark.asyncio
     async def test_make_request_success(self, connector):
         """Test successful API request."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"test": "data"}
-        mock_response.raise_for_status.return_value = None
+        requests_seen = []
 
-        with patch("requests.Session.request", return_value=mock_response):
-            result = await connector._make_request("GET", "content/search")
-            assert result == {"test": "data"}
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"test": "data"})
+
+        connector._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            auth=("test@example.com", "test-token"),
+        )
+        result = await connector._make_request(
+            "GET", "content/search", params={"cql": "space = TEST"}
+        )
+
+        assert result == {"test": "data"}
+        (request,) = requests_seen
+        assert request.url.params["cql"] == "space = TEST"
+        assert request.headers["Authorization"].startswith("Basic ")
 
     @pytest.mark.asyncio
     async def test_make_request_failure(self, connector):
         """Test failed API request."""
-        with patch(
-            "requests.Session.request",
-            side_effect=requests.exceptions.RequestException("API Error"),
+
+        def handler(request):
+            raise httpx.ConnectError("API Error", request=request)
+
+        connector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with (
+            patch(
+                "qdrant_loader.connectors.shared.http.client.asyncio.sleep",
+                new=AsyncMock(),
+            ),
+            pytest.raises(httpx.ConnectError, match="API Error"),
         ):
-            with pytest.raises(requests.exceptions.RequestException, match="API Error"):
-                await connector._make_request("GET", "content/search")
+            await connector._make_request("GET", "content/search")
+
+    @pytest.mark.asyncio
+    async def test_async_client_pooled_and_closed(self, connector):
+        """API requests share one pooled client, sized and closed by the connector."""
+        connector.config.max_concurrent_requests = 3
+
+        async with connector:
+            client = connector._get_client()
+            assert connector._get_client() is client
+            pool = client._transport._pool
+            assert pool._max_connections == 3
+            assert client.auth is not None
+
+        assert client.is_closed
+        assert connector._client is None
 
     @pytest.mark.asyncio
     async def test_rate_limiting_configurable(self, config):
@@ -230,7 +266,7 @@ class TestConfluenceConnector:
 
         with (
             patch(
-                "qdrant_loader.connectors.shared.http.policy.make_request_with_retries_async",
+                "qdrant_loader.connectors.shared.http.policy.httpx_request_with_retries",
                 new=AsyncMock(return_value=fake_response),
             ) as _mock_retry,
             patch(
@@ -326,6 +362,254 @@ class TestConfluenceConnector:
             assert documents[0].content == "Test content"
             assert documents[0].source_type == SourceType.CONFLUENCE
 
+    @pytest.mark.asyncio
+    async def test_content_items_processed_concurrently(self, connector):
+        """Items are processed a bounded number at a time and yielded in order."""
+        connector.config.include_labels = []
+        connector.config.exclude_labels = []
+        connector.config.max_concurrent_requests = 2
+
+        def content(content_id):
+            return {
+                "id": content_id,
+                "title": f"Page {content_id}",
+                "type": "page",
+                "space": {"key": "TEST"},
+                "body": {"storage": {"value": f"Content {content_id}"}},
+                "version": {"number": 1, "when": "2024-01-01T00:00:00Z"},
+                "history": {"createdDate": "2024-01-01T00:00:00Z"},
+                "metadata": {"labels": {"results": []}},
+                "children": {"comment": {"results": []}},
+            }
+
+        listing = {"results": [content(str(i)) for i in range(4)], "_links": {}}
+        active = 0
+        max_active = 0
+
+        async def process_attachments(content, document):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01 * (4 - int(content["id"])))
+            active -= 1
+            return []
+
+        with (
+            patch.object(
+                connector,
+                "_get_space_content_cloud",
+                AsyncMock(return_value=listing),
+            ),
+            patch.object(
+                connector, "_process_attachments_for_document", process_attachments
+            ),
+        ):
+            documents = await connector.get_documents()
+
+        assert [doc.title for doc in documents] == [f"Page {i}" for i in range(4)]
+        assert max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_next_page_prefetched(self, connector):
+        """The next result page is requested before the current one is consumed."""
+        first = {
+            "results": [{"id": "1"}],
+            "_links": {"next": "/rest/api/content/search?cursor=abc"},
+        }
+        second = {"results": [{"id": "2"}], "_links": {}}
+        list_content = AsyncMock(side_effect=[first, second])
+
+        with patch.object(connector, "_get_space_content_cloud", list_content):
+            contents = connector._iter_space_content()
+            assert await anext(contents) == {"id": "1"}
+            await asyncio.sleep(0)
+            assert list_content.call_count == 2
+            assert list_content.call_args.args == ("abc",)
+            assert [item async for item in contents] == [{"id": "2"}]
+
+    @pytest.mark.asyncio
+    async def test_fetch_filter_fetches_only_changed_content(self, connector):
+        """Content is listed without bodies and only changed items are fetched."""
+        connector.config.include_labels = []
+        connector.config.exclude_labels = []
+
+        def listed(content_id, version):
+            return {
+                "id": content_id,
+                "title": f"Page {content_id}",
+                "type": "page",
+                "space": {"key": "TEST"},
+                "version": {"number": version},
+                "metadata": {"labels": {"results": []}},
+            }
+
+        listing = {"results": [listed("1", 4), listed("2", 7)], "_links": {}}
+        full_content = {
+            "results": [
+                {
+                    **listed("2", 7),
+                    "version": {"number": 7, "when": "2024-01-02T00:00:00Z"},
+                    "body": {"storage": {"value": "Changed content"}},
+                    "history": {"createdDate": "2024-01-01T00:00:00Z"},
+                    "children": {"comment": {"results": []}},
+                }
+            ]
+        }
+        stored_versions = {
+            "https://test.atlassian.net/spaces/TEST/pages/1": "4",
+            "https://test.atlassian.net/spaces/TEST/pages/2": "6",
+        }
+
+        async def fetch_filter(source_type, source, items):
+            return [
+                stored_versions[url] != fingerprint for url, fingerprint, _ in items
+            ]
+
+        connector.set_fetch_filter(fetch_filter)
+
+        list_content = AsyncMock(return_value=listing)
+        fetch = AsyncMock(return_value=full_content)
+        with (
+            patch.object(connector, "_get_space_content_cloud", list_content),
+            patch.object(connector, "_make_request", fetch),
+        ):
+            documents = await connector.get_documents()
+
+        assert [doc.content for doc in documents] == ["Changed content"]
+        assert documents[0].fingerprint == "7"
+        assert list_content.call_args.kwargs["expand"] == (
+            "version,space,metadata.labels"
+        )
+        assert fetch.call_args.kwargs["params"]["cql"] == "id in (2)"
+
+    @pytest.mark.asyncio
+    async def test_content_not_returned_by_id_is_reported_failed(self, connector):
+        """Listed content missing from the fetch by id is kept, not deleted."""
+        tracker = MagicMock()
+        tracker.mark_failed = AsyncMock()
+        connector.set_sync_tracker(tracker)
+        listed = [
+            {"id": "1", "type": "page", "space": {"key": "TEST"}},
+            {"id": "2", "type": "blogpost", "space": {"key": "TEST"}},
+        ]
+
+        with patch.object(
+            connector,
+            "_make_request",
+            AsyncMock(return_value={"results": [{"id": "1"}]}),
+        ):
+            results = await connector._get_contents_by_id(listed)
+
+        assert results == [{"id": "1"}]
+        tracker.mark_failed.assert_awaited_once_with(
+            "confluence",
+            "test-confluence",
+            "https://test.atlassian.net/spaces/TEST/blog/2",
+            "2",
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_attachments_keep_item_unskipped(self, connector):
+        """A page whose attachments failed is kept and loses its fingerprint."""
+        tracker = MagicMock()
+        tracker.mark_failed = AsyncMock()
+        connector.set_sync_tracker(tracker)
+        connector.config.download_attachments = True
+        connector.attachment_downloader = MagicMock()
+        content = {
+            "id": "1",
+            "title": "Page 1",
+            "type": "page",
+            "space": {"key": "TEST"},
+            "version": {"number": 3, "when": "2024-01-02T00:00:00Z"},
+            "body": {"storage": {"value": "Content"}},
+            "history": {"createdDate": "2024-01-01T00:00:00Z"},
+        }
+
+        with patch.object(
+            connector,
+            "_get_content_attachments",
+            AsyncMock(side_effect=httpx.ConnectError("Connection reset")),
+        ):
+            documents = await connector._process_content_item(content)
+
+        assert [doc.content for doc in documents] == ["Content"]
+        assert documents[0].fingerprint is None
+        tracker.mark_failed.assert_awaited_once_with(
+            "confluence",
+            "test-confluence",
+            "https://test.atlassian.net/spaces/TEST/pages/1",
+            "1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_lists_modified_content_and_ids(self, connector):
+        """Only recently modified content is listed with versions; ids detect deletions."""
+        connector.config.include_labels = []
+        connector.config.exclude_labels = []
+        connector.config.track_last_sync = True
+        connector.config.sync_overlap_minutes = 10
+
+        modified = {
+            "results": [
+                {
+                    "id": "2",
+                    "title": "Page 2",
+                    "type": "page",
+                    "space": {"key": "TEST"},
+                    "version": {"number": 7},
+                    "metadata": {"labels": {"results": []}},
+                }
+            ],
+            "_links": {},
+        }
+        ids = {
+            "results": [{"id": "1", "type": "page"}, {"id": "2", "type": "page"}],
+            "_links": {},
+        }
+        tracker = MagicMock()
+        tracker.last_synced_at = AsyncMock(
+            return_value=datetime.now(UTC) - timedelta(minutes=49, seconds=30)
+        )
+        tracker.mark_listed = AsyncMock()
+        connector.set_fetch_filter(
+            AsyncMock(
+                side_effect=lambda source_type, source, items: [False] * len(items)
+            )
+        )
+        connector.set_sync_tracker(tracker)
+
+        list_content = AsyncMock(side_effect=[modified, ids])
+        with patch.object(connector, "_get_space_content_cloud", list_content):
+            documents = await connector.get_documents()
+
+        assert documents == []
+        listing, id_listing = list_content.call_args_list
+        assert listing.kwargs["modified_within_minutes"] == 60
+        assert id_listing.kwargs == {"expand": "", "limit": 200}
+        assert [call.args[2] for call in tracker.mark_listed.call_args_list] == [
+            "https://test.atlassian.net/spaces/TEST/pages/1",
+            "https://test.atlassian.net/spaces/TEST/pages/2",
+        ]
+        tracker.keep_unlisted.assert_not_called()
+        tracker.mark_synced.assert_called_once_with("confluence", "test-confluence")
+
+    def test_search_params_modified_since(self):
+        """The modified-since clause is relative and ids-only listings drop expand."""
+        from qdrant_loader.connectors.confluence.pagination import (
+            build_cloud_search_params,
+            build_dc_search_params,
+        )
+
+        params = build_cloud_search_params(
+            "TEST", ["page"], None, expand="", limit=200, modified_within_minutes=60
+        )
+        assert params == {
+            "limit": 200,
+            "cql": 'space = "TEST" and type in ("page") and lastmodified >= now("-60m")',
+        }
+        assert "lastmodified" not in build_dc_search_params("TEST", None, 0)["cql"]
+
     @pytest.mark.asyncio
     async def test_change_tracking_version_comparison(self, connector):
         """Test version comparison for change tracking."""
@@ -4,8 +4,9 @@ Tests for the Git connector implementation.
 
 import os
 import tempfile
+import threading
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from git import Repo
@@ -52,6 +53,10 @@ class TestGitConnector:
             os.path.join(temp_dir, "test.md"),
             os.path.join(temp_dir, "test.txt"),
         ]
+        git_ops.list_blob_shas.return_value = {
+            path: f"sha-{index}"
+            for index, path in enumerate(git_ops.list_files.return_value)
+        }
         git_ops.get_file_content.return_value = "Test content"
         git_ops.get_last_commit_date.return_value = datetime.now()
         git_ops.get_first_commit_date.return_value = datetime.now()
@@ -119,6 +124,157 @@ class TestGitConnector:
                     assert doc.source_type == SourceType.GIT
                     assert doc.source == mock_config.source
 
+    @pytest.mark.asyncio
+    async def test_unchanged_blobs_are_not_read(self, mock_config, mock_git_ops):
+        """Files whose blob SHA is unchanged are skipped before reading them."""
+        with (
+            patch(
+                "qdrant_loader.connectors.git.connector.GitOperations",
+                return_value=mock_git_ops,
+            ),
+            patch(
+                "qdrant_loader.connectors.git.connector.FileProcessor.should_process_file",
+                return_value=True,
+            ),
+        ):
+            connector = GitConnector(mock_config)
+
+            async def fetch_filter(source_type, source, items):
+                return [fingerprint != "sha-0" for _, fingerprint, _ in items]
+
+            connector.set_fetch_filter(fetch_filter)
+
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.fingerprint for doc in documents] == ["sha-1"]
+        assert documents[0].url.endswith("/blob/main/test.txt")
+        mock_git_ops.get_file_content.assert_called_once()
+        mock_git_ops.get_last_commit_date.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_lists_changed_files(
+        self, mock_config, mock_git_ops
+    ):
+        """Only files changed since the last indexed commit are read."""
+        temp_dir = mock_config.temp_dir or tempfile.gettempdir()
+        mock_git_ops.get_head_commit.return_value = "new-commit"
+        mock_git_ops.diff_files.return_value = (
+            [os.path.join(temp_dir, "test.md")],
+            [os.path.join(temp_dir, "old.md")],
+        )
+        with (
+            patch(
+                "qdrant_loader.connectors.git.connector.GitOperations",
+                return_value=mock_git_ops,
+            ),
+            patch(
+                "qdrant_loader.connectors.git.connector.FileProcessor.should_process_file",
+                return_value=True,
+            ),
+        ):
+            connector = GitConnector(mock_config)
+            sync_tracker = MagicMock()
+            sync_tracker.last_sync_cursor = AsyncMock(
+                return_value=f"old-commit:{connector._listing_fingerprint()}"
+            )
+            connector.set_sync_tracker(sync_tracker)
+
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.url.rsplit("/", 1)[-1] for doc in documents] == ["test.md"]
+        mock_git_ops.diff_files.assert_called_once_with("old-commit", "new-commit")
+        mock_git_ops.list_files.assert_not_called()
+        sync_tracker.keep_unlisted.assert_called_once_with(
+            SourceType.GIT, "test_source"
+        )
+        sync_tracker.mark_deleted.assert_called_once()
+        assert sync_tracker.mark_deleted.call_args.args[2].endswith("/blob/main/old.md")
+        sync_tracker.mark_synced.assert_called_once_with(
+            SourceType.GIT,
+            "test_source",
+            cursor=f"new-commit:{connector._listing_fingerprint()}",
+        )
+
+    @pytest.mark.asyncio
+    async def test_changed_settings_list_all_files(self, mock_config, mock_git_ops):
+        """A cursor recorded with other listing settings is not diffed against."""
+        with patch(
+            "qdrant_loader.connectors.git.connector.GitOperations",
+            return_value=mock_git_ops,
+        ):
+            connector = GitConnector(mock_config)
+            sync_tracker = MagicMock()
+            sync_tracker.last_sync_cursor = AsyncMock(
+                return_value="old-commit:other-settings"
+            )
+            connector.set_sync_tracker(sync_tracker)
+
+            async with connector:
+                await connector.get_documents()
+
+        mock_git_ops.diff_files.assert_not_called()
+        mock_git_ops.list_files.assert_called_once()
+        sync_tracker.keep_unlisted.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mirror_is_fetched_and_kept(self, mock_config, mock_git_ops):
+        """A persistent mirror is cloned once, then fetched into on later runs."""
+        with tempfile.TemporaryDirectory() as mirror_dir:
+            config = mock_config.model_copy(update={"mirror_dir": mirror_dir})
+            with patch(
+                "qdrant_loader.connectors.git.connector.GitOperations",
+                return_value=mock_git_ops,
+            ):
+                connector = GitConnector(config)
+                async with connector:
+                    mirror_path = connector.temp_dir
+                    assert os.path.dirname(mirror_path) == mirror_dir
+                    # Stands in for the clone made by the mocked operations
+                    os.makedirs(os.path.join(mirror_path, ".git"))
+                mock_git_ops.clone.assert_called_once()
+                mock_git_ops.fetch.assert_not_called()
+
+                async with connector:
+                    assert connector.temp_dir == mirror_path
+                mock_git_ops.clone.assert_called_once()
+                mock_git_ops.fetch.assert_called_once()
+                assert mock_git_ops.fetch.call_args.kwargs["to_path"] == mirror_path
+                assert os.path.isdir(mirror_path)
+
+    @pytest.mark.asyncio
+    async def test_files_processed_concurrently(self, mock_config, mock_git_ops):
+        """Files are read in worker threads at the same time, yielded in order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_file_content(file_path):
+            # Only passes if both files are read at the same time
+            barrier.wait()
+            assert threading.current_thread() is not threading.main_thread()
+            return f"content of {os.path.basename(file_path)}"
+
+        mock_git_ops.get_file_content.side_effect = get_file_content
+        config = mock_config.model_copy(update={"max_concurrent_files": 2})
+        with (
+            patch(
+                "qdrant_loader.connectors.git.connector.GitOperations",
+                return_value=mock_git_ops,
+            ),
+            patch(
+                "qdrant_loader.connectors.git.connector.FileProcessor.should_process_file",
+                return_value=True,
+            ),
+        ):
+            connector = GitConnector(config)
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.content for doc in documents] == [
+            "content of test.md",
+            "content of test.txt",
+        ]
+
     @pytest.mark.asyncio
     async def test_error_handling(self, mock_config):
         """Test error handling in the Git connector."""
@@ -13,6 +13,15 @@ from git.exc import GitCommandError
 from qdrant_loader.connectors.git.operations import GitOperations
 
 
+def _log_output(*commits: tuple[str, str, list[str]]) -> str:
+    """Build ``git log -z --name-only`` output for (sha, date, paths) tuples."""
+    return "".join(
+        f"\x1e{sha}\x1f{date}\x1fTest Author\x1fCommit {sha}\0\n"
+        + "".join(f"{path}\0" for path in paths)
+        for sha, date, paths in commits
+    )
+
+
 @pytest.fixture
 def git_operations():
     """Create a GitOperations instance."""
@@ -351,23 +360,24 @@ class TestCommitDateOperations:
         git_operations.repo = mock_repo
         file_path = "/fake/repo/path/test.txt"
 
-        # Mock commit object
-        mock_commit = MagicMock()
-        mock_commit.committed_datetime = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
-
-        mock_repo.iter_commits.return_value = [mock_commit]
+        mock_repo.git.log.return_value = _log_output(
+            ("bbb", "2024-01-15T10:30:00+00:00", ["test.txt"]),
+            ("aaa", "2024-01-10T10:30:00+00:00", ["test.txt"]),
+        )
 
         result = git_operations.get_last_commit_date(file_path)
 
         assert result == datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
-        mock_repo.iter_commits.assert_called_once_with(paths="test.txt", max_count=1)
+        mock_repo.iter_commits.assert_not_called()
 
     def test_get_last_commit_date_no_commits(self, git_operations, mock_repo):
         """Test last commit date retrieval when no commits found."""
         git_operations.repo = mock_repo
         file_path = "/fake/repo/path/test.txt"
 
-        mock_repo.iter_commits.return_value = []
+        mock_repo.git.log.return_value = _log_output(
+            ("aaa", "2024-01-10T10:30:00+00:00", ["other.txt"])
+        )
 
         result = git_operations.get_last_commit_date(file_path)
 
@@ -384,7 +394,7 @@ class TestCommitDateOperations:
         git_operations.repo = mock_repo
         file_path = "/fake/repo/path/test.txt"
 
-        mock_repo.iter_commits.side_effect = GitCommandError("log", "Git error")
+        mock_repo.git.log.side_effect = GitCommandError("log", "Git error")
 
         result = git_operations.get_last_commit_date(file_path)
 
@@ -395,25 +405,22 @@ class TestCommitDateOperations:
         git_operations.repo = mock_repo
         file_path = "/fake/repo/path/test.txt"
 
-        # Mock commit objects - iter_commits with reverse=True and max_count=1 returns the first commit
-        mock_commit1 = MagicMock()
-        mock_commit1.committed_datetime = datetime(2024, 1, 10, 10, 30, 0, tzinfo=UTC)
-
-        mock_repo.iter_commits.return_value = [mock_commit1]
+        mock_repo.git.log.return_value = _log_output(
+            ("ccc", "2024-01-20T10:30:00+00:00", ["test.txt"]),
+            ("bbb", "2024-01-15T10:30:00+00:00", ["other.txt"]),
+            ("aaa", "2024-01-10T10:30:00+00:00", ["test.txt", "other.txt"]),
+        )
 
         result = git_operations.get_first_commit_date(file_path)
 
         assert result == datetime(2024, 1, 10, 10, 30, 0, tzinfo=UTC)
-        mock_repo.iter_commits.assert_called_once_with(
-            paths="test.txt", reverse=True, max_count=1
-        )
 
     def test_get_first_commit_date_no_commits(self, git_operations, mock_repo):
         """Test first commit date retrieval when no commits found."""
         git_operations.repo = mock_repo
         file_path = "/fake/repo/path/test.txt"
 
-        mock_repo.iter_commits.return_value = []
+        mock_repo.git.log.return_value = ""
 
         result = git_operations.get_first_commit_date(file_path)
 
@@ -425,6 +432,30 @@ class TestCommitDateOperations:
         result = git_operations.get_first_commit_date("/some/file.txt")
         assert result is None
 
+    def test_file_history_read_once_per_head(self, git_operations, mock_repo):
+        """History is read in one walk and reused until HEAD moves."""
+        git_operations.repo = mock_repo
+        mock_repo.head.commit.hexsha = "head-1"
+        mock_repo.git.log.return_value = _log_output(
+            ("bbb", "2024-01-15T10:30:00+00:00", ["a.md", "docs/b é.md"]),
+            ("aaa", "2024-01-10T10:30:00+00:00", ["a.md"]),
+        )
+
+        last = git_operations.get_last_commit("/fake/repo/path/docs/b é.md")
+        first = git_operations.get_first_commit("a.md")
+        git_operations.get_last_commit_date("/fake/repo/path/a.md")
+
+        assert last is not None and last.hexsha == "bbb"
+        assert last.author == "Test Author"
+        assert last.summary == "Commit bbb"
+        assert first is not None and first.hexsha == "aaa"
+        mock_repo.git.log.assert_called_once()
+        assert "--name-only" in mock_repo.git.log.call_args.args
+
+        mock_repo.head.commit.hexsha = "head-2"
+        git_operations.get_last_commit("a.md")
+        assert mock_repo.git.log.call_count == 2
+
 
 class TestListFiles:
     """Test file listing operations."""
@@ -472,6 +503,64 @@ class TestListFiles:
         with pytest.raises(GitCommandError):
             git_operations.list_files()
 
+    def test_list_blob_shas(self, git_operations, mock_repo):
+        """Test mapping files to blob SHAs, ignoring submodules."""
+        git_operations.repo = mock_repo
+        mock_repo.git.ls_tree.return_value = (
+            "100644 blob aaa111\tREADME.md\n"
+            "100644 blob bbb222\tdocs/guide name.md\n"
+            "160000 commit ccc333\tvendor/lib"
+        )
+
+        result = git_operations.list_blob_shas()
+
+        assert result == {
+            os.path.join("/fake/repo/path", "README.md"): "aaa111",
+            os.path.join("/fake/repo/path", "docs/guide name.md"): "bbb222",
+        }
+        mock_repo.git.ls_tree.assert_called_once_with("-r", "HEAD")
+
+    def test_diff_files(self, git_operations, mock_repo):
+        """Test listing changed files, reporting renames as deletes and adds."""
+        git_operations.repo = mock_repo
+        mock_repo.git.diff.return_value = (
+            "M\0a.md\0R100\0old name.md\0docs/new.md\0D\0gone.md\0A\0added.md\0"
+        )
+
+        changed, deleted = git_operations.diff_files("old", "new")
+
+        assert changed == [
+            os.path.join("/fake/repo/path", path)
+            for path in ("a.md", "docs/new.md", "added.md")
+        ]
+        assert deleted == [
+            os.path.join("/fake/repo/path", path) for path in ("old name.md", "gone.md")
+        ]
+        mock_repo.git.diff.assert_called_once_with(
+            "--name-status", "-z", "-M", "old", "new"
+        )
+
+    def test_fetch_updates_existing_clone(self, git_operations, mock_repo):
+        """Test fetching a branch into an existing clone and checking it out."""
+        with patch("git.Repo", return_value=mock_repo):
+            git_operations.fetch(
+                url="https://github.com/test/repo.git",
+                to_path="/fake/repo/path",
+                branch="main",
+                depth=1,
+                auth_token="token",
+            )
+
+        assert git_operations.repo is mock_repo
+        mock_repo.git.fetch.assert_called_once_with(
+            "https://token@github.com/test/repo.git",
+            "+refs/heads/main:refs/remotes/origin/main",
+            "--depth=1",
+        )
+        mock_repo.git.checkout.assert_called_once_with(
+            "--force", "-B", "main", "refs/remotes/origin/main"
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -154,6 +154,25 @@ print("Hello")
             assert metadata["last_commit_author"] == "Test Author"
             assert metadata["last_commit_message"] == "Test commit message"
 
+    def test_metadata_read_once_per_repository(self, base_config, mock_repo):
+        """Repository config and file history are read once for all files."""
+        mock_repo.git.log.return_value = (
+            "\x1eabc\x1f2024-02-01T12:00:00+00:00\x1fFile Author\x1fEdit docs\0\n"
+            "docs/a.md\0docs/b.md\0"
+        )
+        with patch("git.Repo", return_value=mock_repo) as repo_class:
+            extractor = GitMetadataExtractor(base_config)
+            for name in ("a.md", "b.md"):
+                metadata = extractor.extract_all_metadata(f"docs/{name}", "# Doc")
+                assert metadata["last_commit_author"] == "File Author"
+                assert metadata["last_commit_message"] == "Edit docs"
+                assert metadata["repository_description"] == "Test repository"
+
+        repo_class.assert_called_once()
+        mock_repo.config_reader.assert_called_once()
+        mock_repo.git.log.assert_called_once()
+        mock_repo.iter_commits.assert_not_called()
+
     def test_error_handling(self, base_config):
         """Test error handling in metadata extraction."""
         extractor = GitMetadataExtractor(base_config)
@@ -1,8 +1,10 @@
 """Unit tests for Jira connector."""
 
+import asyncio
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from pydantic import HttpUrl
 from qdrant_loader.config.types import SourceType
@@ -203,31 +205,27 @@ class TestJiraConnector:
         # Mock the actual HTTP request to avoid network calls but keep rate limiting logic
         call_times = []
 
-        def mock_session_request(*args, **kwargs):
+        def handler(request):
             import time
 
             call_times.append(time.time())
-            # Create a mock response
-            mock_response = MagicMock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.return_value = {"issues": [], "total": 0}
-            return mock_response
+            return httpx.Response(200, json={"issues": [], "total": 0})
 
-        with patch.object(
-            connector.session, "request", side_effect=mock_session_request
-        ):
-            async with connector:
-                # Make multiple requests quickly
-                for _ in range(3):
-                    await connector._make_request(
-                        "GET", "search", params={"jql": 'project = "TEST"'}
-                    )
-
-                # Check that rate limiting was applied
-                if len(call_times) >= 2:
-                    time_diff = call_times[1] - call_times[0]
-                    min_interval = 60.0 / connector.config.requests_per_minute
-                    assert time_diff >= min_interval * 0.9  # Allow some tolerance
+        async with connector:
+            connector._client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            # Make multiple requests quickly
+            for _ in range(3):
+                await connector._make_request(
+                    "GET", "search", params={"jql": 'project = "TEST"'}
+                )
+
+            # Check that rate limiting was applied
+            if len(call_times) >= 2:
+                time_diff = call_times[1] - call_times[0]
+                min_interval = 60.0 / connector.config.requests_per_minute
+                assert time_diff >= min_interval * 0.9  # Allow some tolerance
 
     @pytest.mark.asyncio
     async def test_get_documents(self, jira_cloud_config, mock_issue_data):
@@ -262,6 +260,50 @@ class TestJiraConnector:
                 assert document.metadata["issue_type"] == "Bug"
                 assert document.metadata["status"] == "Open"
 
+    @pytest.mark.asyncio
+    async def test_fetch_filter_fetches_only_changed_issues(
+        self, jira_cloud_config, mock_issue_data
+    ):
+        """Issue timestamps are listed first and only changed issues are fetched."""
+        connector = JiraConnector(jira_cloud_config)
+        listing = {
+            "issues": [
+                {
+                    "id": "10001",
+                    "key": "TEST-1",
+                    "fields": {"updated": "2024-01-02T00:00:00.000+0000"},
+                },
+                {
+                    "id": "10002",
+                    "key": "TEST-2",
+                    "fields": {"updated": "2024-01-01T00:00:00.000+0000"},
+                },
+            ],
+            "total": 2,
+        }
+        requests_made = []
+
+        async def mock_make_request(method, endpoint, params):
+            requests_made.append(params)
+            if params["fields"] == "updated":
+                return listing
+            return {"issues": [mock_issue_data], "total": 1}
+
+        unchanged = {"https://test.atlassian.net/browse/TEST-2"}
+
+        async def fetch_filter(source_type, source, items):
+            return [url not in unchanged for url, _, _ in items]
+
+        connector.set_fetch_filter(fetch_filter)
+        with patch.object(connector, "_make_request", side_effect=mock_make_request):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.metadata["key"] for doc in documents] == ["TEST-1"]
+        assert documents[0].fingerprint == "2024-01-02T00:00:00+00:00"
+        assert len(requests_made) == 2
+        assert requests_made[1]["jql"].endswith(" AND id in (10001)")
+
     @pytest.mark.asyncio
     async def test_pagination(self, jira_cloud_config, mock_issue_data):
         """Test pagination handling."""
@@ -335,3 +377,183 @@ class TestJiraConnector:
         )
         connector = JiraConnector(datacenter_config)
         assert connector._auto_detect_deployment_type() == JiraDeploymentType.DATACENTER
+
+    @pytest.mark.asyncio
+    async def test_failed_issues_reported_to_sync_tracker(
+        self, jira_cloud_config, mock_issue_data
+    ):
+        """Issues that fail to parse or are not returned by id are kept."""
+        connector = JiraConnector(jira_cloud_config)
+
+        async def mock_make_request(method, endpoint, params):
+            if params["fields"] == "updated":
+                return {
+                    "issues": [
+                        {"id": issue_id, "key": key, "fields": {"updated": None}}
+                        for issue_id, key in (
+                            ("12345", "TEST-1"),
+                            ("10002", "TEST-2"),
+                            ("10003", "TEST-3"),
+                        )
+                    ],
+                    "total": 3,
+                }
+            malformed = {"id": "10002", "key": "TEST-2", "fields": {}}
+            return {"issues": [mock_issue_data, malformed], "total": 2}
+
+        sync_tracker = MagicMock()
+        sync_tracker.last_synced_at = AsyncMock(return_value=None)
+        sync_tracker.mark_failed = AsyncMock()
+        connector.set_fetch_filter(
+            AsyncMock(
+                side_effect=lambda source_type, source, items: [True] * len(items)
+            )
+        )
+        connector.set_sync_tracker(sync_tracker)
+        with patch.object(connector, "_make_request", side_effect=mock_make_request):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.metadata["key"] for doc in documents] == ["TEST-1"]
+        failed = {call.args[2:] for call in sync_tracker.mark_failed.await_args_list}
+        assert failed == {
+            ("https://test.atlassian.net/browse/TEST-2", "10002"),
+            ("https://test.atlassian.net/browse/TEST-3", "10003"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_track_last_sync_lists_issues_updated_since_last_sync(
+        self, jira_cloud_config, mock_issue_data
+    ):
+        """Only issues updated since the last sync, less the overlap, are listed."""
+        from datetime import UTC, datetime, timedelta
+
+        config = jira_cloud_config.model_copy(
+            update={"track_last_sync": True, "sync_overlap_minutes": 10}
+        )
+        connector = JiraConnector(config)
+        requests_made = []
+
+        async def mock_make_request(method, endpoint, params):
+            requests_made.append(params)
+            if params["fields"] == "updated":
+                return {
+                    "issues": [
+                        {
+                            "id": "12345",
+                            "key": "TEST-1",
+                            "fields": {"updated": "2024-01-02T00:00:00.000+0000"},
+                        }
+                    ],
+                    "total": 1,
+                }
+            return {"issues": [mock_issue_data], "total": 1}
+
+        async def fetch_filter(source_type, source, items):
+            return [True] * len(items)
+
+        sync_tracker = MagicMock()
+        sync_tracker.last_synced_at = AsyncMock(
+            return_value=datetime.now(UTC) - timedelta(minutes=50)
+        )
+        connector.set_fetch_filter(fetch_filter)
+        connector.set_sync_tracker(sync_tracker)
+        with patch.object(connector, "_make_request", side_effect=mock_make_request):
+            async with connector:
+                documents = await connector.get_documents()
+
+        assert [doc.metadata["key"] for doc in documents] == ["TEST-1"]
+        assert requests_made[0]["jql"] in (
+            'project = "TEST" AND updated >= "-60m"',
+            'project = "TEST" AND updated >= "-61m"',
+        )
+        assert "changelog" not in requests_made[1].get("expand", "")
+        assert requests_made[1]["fields"] == ",".join(config.issue_fields)
+        sync_tracker.keep_unlisted.assert_called_once_with(SourceType.JIRA, "test-jira")
+        sync_tracker.mark_synced.assert_called_once_with(SourceType.JIRA, "test-jira")
+
+    @pytest.mark.asyncio
+    async def test_without_track_last_sync_all_issues_are_listed(
+        self, jira_cloud_config
+    ):
+        """The last sync time is ignored unless track_last_sync is enabled."""
+        from datetime import UTC, datetime
+
+        connector = JiraConnector(jira_cloud_config)
+        requests_made = []
+
+        async def mock_make_request(method, endpoint, params):
+            requests_made.append(params)
+            return {"issues": [], "total": 0}
+
+        async def fetch_filter(source_type, source, items):
+            return [True] * len(items)
+
+        sync_tracker = MagicMock()
+        sync_tracker.last_synced_at = AsyncMock(return_value=datetime.now(UTC))
+        connector.set_fetch_filter(fetch_filter)
+        connector.set_sync_tracker(sync_tracker)
+        with patch.object(connector, "_make_request", side_effect=mock_make_request):
+            async with connector:
+                await connector.get_documents()
+
+        assert requests_made[0]["jql"] == 'project = "TEST"'
+        sync_tracker.keep_unlisted.assert_not_called()
+        sync_tracker.mark_synced.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_pages_are_fetched_concurrently(self, jira_cloud_config):
+        """Pages after the first are requested concurrently and yielded in order."""
+        config = jira_cloud_config.model_copy(update={"max_concurrent_requests": 3})
+        connector = JiraConnector(config)
+        in_flight = 0
+        max_in_flight = 0
+        start_ats = []
+
+        async def mock_make_request(method, endpoint, params):
+            nonlocal in_flight, max_in_flight
+            start_ats.append(params["startAt"])
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later pages answer first
+            await asyncio.sleep(0.01 * (10 - params["startAt"]))
+            in_flight -= 1
+            return {
+                "issues": [{"id": str(params["startAt"])}],
+                "maxResults": 1,
+                "total": 5,
+            }
+
+        with patch.object(connector, "_make_request", side_effect=mock_make_request):
+            pages = [page async for page in connector._iter_search_pages({})]
+
+        assert [page["issues"][0]["id"] for page in pages] == ["0", "1", "2", "3", "4"]
+        assert sorted(start_ats) == [0, 1, 2, 3, 4]
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_enhanced_search_prefetches_next_page(self, jira_cloud_config):
+        """With token pagination the next page is requested before yielding."""
+        config = jira_cloud_config.model_copy(update={"enhanced_search": True})
+        connector = JiraConnector(config)
+        requests_made = []
+        pages = {
+            None: {"issues": [{"id": "1"}], "nextPageToken": "t1", "isLast": False},
+            "t1": {"issues": [{"id": "2"}], "isLast": True},
+        }
+
+        async def mock_make_request(method, endpoint, params):
+            requests_made.append((endpoint, params.get("nextPageToken")))
+            return pages[params.get("nextPageToken")]
+
+        with patch.object(connector, "_make_request", side_effect=mock_make_request):
+            ids = []
+            async for page in connector._iter_search_pages({"jql": "x"}):
+                # Let the prefetch task start before the page is consumed
+                await asyncio.sleep(0)
+                ids.append(page["issues"][0]["id"])
+                if len(ids) == 1:
+                    assert requests_made == [("search/jql", None), ("search/jql", "t1")]
+
+        assert ids == ["1", "2"]
+        assert len(requests_made) == 2
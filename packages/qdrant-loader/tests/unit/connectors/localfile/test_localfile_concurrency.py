@@ -0,0 +1,77 @@
+"""Tests for concurrent file processing in the LocalFile connector."""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from pydantic import AnyUrl
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.connectors.localfile import LocalFileConnector
+from qdrant_loader.connectors.localfile.config import LocalFileConfig
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory with test files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (Path(temp_dir) / name).write_text(f"content of {name}")
+        yield temp_dir
+
+
+def _connector(temp_dir: str, max_concurrent_files: int) -> LocalFileConnector:
+    return LocalFileConnector(
+        LocalFileConfig(
+            base_url=AnyUrl(f"file://{temp_dir}"),
+            source="test-localfile",
+            source_type=SourceType.LOCALFILE,
+            file_types=["*.txt"],
+            include_paths=["*"],
+            exclude_paths=[],
+            max_concurrent_files=max_concurrent_files,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_files_processed_concurrently_off_the_event_loop(temp_dir):
+    """Files are processed in worker threads at the same time, yielded in order."""
+    connector = _connector(temp_dir, max_concurrent_files=3)
+    barrier = threading.Barrier(3, timeout=5)
+    threads = set()
+    extract = connector.metadata_extractor.extract_all_metadata
+
+    def extract_all_metadata(file_path, content):
+        # Only passes if the three files are processed at the same time
+        barrier.wait()
+        threads.add(threading.current_thread().name)
+        return extract(file_path, content)
+
+    connector.metadata_extractor.extract_all_metadata = extract_all_metadata
+    async with connector:
+        documents = await connector.get_documents()
+
+    walk_order = [name for _, _, files in os.walk(temp_dir) for name in files]
+    assert [document.title for document in documents] == walk_order
+    assert len(threads) == 3
+    assert threading.main_thread().name not in threads
+
+
+@pytest.mark.asyncio
+async def test_failed_files_are_skipped(temp_dir):
+    """A file that fails to process is skipped without stopping the others."""
+    connector = _connector(temp_dir, max_concurrent_files=2)
+    extract = connector.metadata_extractor.extract_all_metadata
+
+    def extract_all_metadata(file_path, content):
+        if file_path.endswith("b.txt"):
+            raise RuntimeError("broken file")
+        return extract(file_path, content)
+
+    connector.metadata_extractor.extract_all_metadata = extract_all_metadata
+    async with connector:
+        documents = await connector.get_documents()
+
+    assert sorted(document.title for document in documents) == ["a.txt", "c.txt"]
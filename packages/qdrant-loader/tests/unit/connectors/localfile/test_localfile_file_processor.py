@@ -449,6 +449,24 @@ class TestLocalFileFileProcessor:
 
         assert result is False
 
+    def test_should_prune_directory(self):
+        """Test that directories no file can be included from are pruned."""
+        assert self.processor.should_prune_directory("temp") is True
+        assert self.processor.should_prune_directory("src") is True
+        assert self.processor.should_prune_directory("docs") is False
+        assert self.processor.should_prune_directory("docs/sub") is False
+
+    def test_should_process_file_uses_given_stat_result(self):
+        """Test that a stat result from the directory scan is reused."""
+        file_path = self.create_test_file("test.txt")
+        stat_result = os.stat(file_path)
+
+        with patch("os.path.getsize") as mock_getsize:
+            result = self.processor.should_process_file(file_path, stat_result)
+
+        assert result is True
+        mock_getsize.assert_not_called()
+
     def test_file_logging_debug_calls(self):
         """Test that appropriate debug logging calls are made."""
         file_path = self.create_test_file("test.txt")
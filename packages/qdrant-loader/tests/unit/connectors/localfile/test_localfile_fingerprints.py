@@ -0,0 +1,91 @@
+"""Tests for fingerprint-based fetch skipping in the LocalFile connector."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from pydantic import AnyUrl
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.connectors.localfile import LocalFileConnector
+from qdrant_loader.connectors.localfile.config import LocalFileConfig
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory with test files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        (Path(temp_dir) / "kept.txt").write_text("unchanged")
+        (Path(temp_dir) / "edited.txt").write_text("changed")
+        yield temp_dir
+
+
+@pytest.fixture
+def connector(temp_dir):
+    """Create a LocalFile connector for the temporary directory."""
+    return LocalFileConnector(
+        LocalFileConfig(
+            base_url=AnyUrl(f"file://{temp_dir}"),
+            source="test-localfile",
+            source_type=SourceType.LOCALFILE,
+            file_types=["*.txt"],
+            include_paths=["*"],
+            exclude_paths=[],
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_documents_carry_mtime_and_size_fingerprint(connector, temp_dir):
+    """Every document records the stat-based fingerprint of its file."""
+    async with connector:
+        documents = await connector.get_documents()
+
+    by_title = {document.title: document for document in documents}
+    stat = os.stat(os.path.join(temp_dir, "kept.txt"))
+    assert by_title["kept.txt"].fingerprint == f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+@pytest.mark.asyncio
+async def test_fetch_filter_skips_unchanged_files(connector):
+    """Files the filter reports as unchanged are neither read nor yielded."""
+    calls = []
+
+    async def fetch_filter(source_type, source, items):
+        calls.append((source_type, source, [url for url, _, _ in items]))
+        return [not url.endswith("/kept.txt") for url, _, _ in items]
+
+    connector.set_fetch_filter(fetch_filter)
+    async with connector:
+        documents = await connector.get_documents()
+
+    assert [document.title for document in documents] == ["edited.txt"]
+    # Both files are checked in one call
+    assert len(calls) == 1
+    assert calls[0][:2] == ("localfile", "test-localfile")
+    assert len(calls[0][2]) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_files_reported_to_sync_tracker(connector):
+    """Files that fail to be read are reported, so their documents are kept."""
+    failed = []
+
+    class SyncTracker:
+        async def mark_failed(self, source_type, source, url=None, parent_id=None):
+            failed.append(url)
+
+    connector.set_sync_tracker(SyncTracker())
+    extract = connector.metadata_extractor.extract_all_metadata
+
+    def extract_all_metadata(file_path, content):
+        if file_path.endswith("edited.txt"):
+            raise OSError("Permission denied")
+        return extract(file_path, content)
+
+    connector.metadata_extractor.extract_all_metadata = extract_all_metadata
+    async with connector:
+        documents = await connector.get_documents()
+
+    assert [document.title for document in documents] == ["kept.txt"]
+    assert len(failed) == 1 and failed[0].endswith("/edited.txt")
@@ -443,3 +443,86 @@ class TestPublicDocsConnector:
                 assert documents[0].title == "Test Page"
                 assert documents[1].title == "Page 1"
                 assert all(doc.metadata.get("version") == "1.0.0" for doc in documents)
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_and_parsed_once(
+        self, publicdocs_config: PublicDocsSourceConfig
+    ) -> None:
+        """The base page is not downloaded again and attachments reuse the parse."""
+        from qdrant_loader.connectors.publicdocs import connector as connector_module
+
+        config = publicdocs_config.model_copy(update={"download_attachments": True})
+        connector = PublicDocsConnector(config)
+        base_url = str(config.base_url)
+        html = HTML_CONTENT.replace(
+            "<p>Test content</p>",
+            '<p>Test content</p><a href="https://files.docs.com/guide.pdf">PDF</a>',
+        )
+        bodies = {base_url: html, f"{base_url}docs/page1": LINKED_PAGE_CONTENT}
+
+        def response_for(url: str) -> AsyncMock:
+            response = AsyncMock()
+            response.status = 200
+            response.headers = {}
+            response.text = AsyncMock(return_value=bodies[url])
+            response.raise_for_status = MagicMock()
+            return response
+
+        session = AsyncMock()
+        session.get = AsyncMock(side_effect=lambda url, **kwargs: response_for(url))
+        session.close = AsyncMock()
+        parse_html = MagicMock(side_effect=connector_module.parse_html)
+
+        with (
+            patch("aiohttp.ClientSession", return_value=session),
+            patch.object(connector_module, "parse_html", parse_html),
+        ):
+            async with connector:
+                downloader = MagicMock()
+                downloader.download_and_process_attachments = AsyncMock(return_value=[])
+                connector.attachment_downloader = downloader
+                documents = await connector.get_documents()
+
+        assert [doc.url for doc in documents] == [base_url, f"{base_url}docs/page1"]
+        fetched = [call.args[0] for call in session.get.call_args_list]
+        assert sorted(fetched) == sorted(bodies)
+        # One parse per page, shared by links, title, attachments and content
+        parsed = [c.args[0] for c in parse_html.call_args_list]
+        assert sum(isinstance(html, str) for html in parsed) == 2
+        (attachments, parent), _ = downloader.download_and_process_attachments.call_args
+        assert [a.download_url for a in attachments] == [
+            "https://files.docs.com/guide.pdf"
+        ]
+        assert parent.url == base_url
+
+    @pytest.mark.asyncio
+    async def test_pages_processed_concurrently(
+        self, publicdocs_config: PublicDocsSourceConfig
+    ) -> None:
+        """Pages are crawled a bounded number at a time and yielded in order."""
+        import asyncio
+
+        config = publicdocs_config.model_copy(update={"max_concurrent_requests": 2})
+        connector = PublicDocsConnector(config)
+        pages = [f"{config.base_url}docs/page{i}" for i in range(4)]
+        active = 0
+        max_active = 0
+
+        async def crawl_page(page: str) -> list:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01 * (4 - int(page[-1])))
+            active -= 1
+            return [page]
+
+        with (
+            patch("aiohttp.ClientSession", return_value=AsyncMock()),
+            patch.object(connector, "_get_all_pages", AsyncMock(return_value=pages)),
+            patch.object(connector, "_crawl_page", side_effect=crawl_page),
+        ):
+            async with connector:
+                results = [item async for item in connector.iter_documents()]
+
+        assert results == pages
+        assert max_active == 2
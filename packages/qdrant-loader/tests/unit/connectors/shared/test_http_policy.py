@@ -1,11 +1,16 @@
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import requests
+from qdrant_loader.connectors.shared.http.client import create_async_client_for_session
 from qdrant_loader.connectors.shared.http.policy import (
     aiohttp_request_with_policy,
+    httpx_request_with_policy,
     request_with_policy,
 )
 from qdrant_loader.connectors.shared.http.rate_limit import RateLimiter
+from requests.auth import HTTPBasicAuth
 
 
 @pytest.mark.asyncio
@@ -90,3 +95,47 @@ async def test_aiohttp_request_with_policy_invokes_retries_and_rate_limiter():
         assert isinstance(resp, DummyAiohttpResponse)
         mock_retry_call.assert_awaited()
         mock_acquire.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_httpx_request_with_policy_retries_transient_statuses():
+    statuses = iter([503, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    limiter = RateLimiter.per_minute(600)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with (
+            patch(
+                "qdrant_loader.connectors.shared.http.client.asyncio.sleep",
+                new=AsyncMock(),
+            ) as mock_sleep,
+            patch.object(limiter, "acquire", new=AsyncMock()) as mock_acquire,
+        ):
+            resp = await httpx_request_with_policy(
+                client,
+                "GET",
+                "https://example.com",
+                rate_limiter=limiter,
+                overall_timeout=2.0,
+            )
+
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True}
+    mock_sleep.assert_awaited_once()
+    mock_acquire.assert_awaited_once()
+
+
+def test_create_async_client_for_session_reuses_credentials():
+    session = requests.Session()
+    session.auth = HTTPBasicAuth("user@example.com", "token")
+    client = create_async_client_for_session(session, max_connections=2)
+    assert isinstance(client.auth, httpx.BasicAuth)
+    assert "Authorization" not in client.headers
+
+    session = requests.Session()
+    session.headers["Authorization"] = "Bearer pat"
+    client = create_async_client_for_session(session)
+    assert client.auth is None
+    assert client.headers["Authorization"] == "Bearer pat"
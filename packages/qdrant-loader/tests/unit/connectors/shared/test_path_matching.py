@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+
+from qdrant_loader.connectors.shared.paths import (
+    PathMatcher,
+    compile_path_matcher,
+    walk_files,
+)
+
+
+def test_exclude_patterns():
+    matcher = PathMatcher((), ("temp/**", "build/", "*.log", "**/node_modules/**"))
+    assert matcher.is_excluded("temp/a.txt")
+    assert matcher.is_excluded("temp/sub/a.txt")
+    assert matcher.is_excluded("build/a.txt")
+    assert matcher.is_excluded("docs/debug.log")
+    assert matcher.is_excluded("node_modules/pkg/index.md")
+    assert matcher.is_excluded("web/node_modules/pkg/index.md")
+    assert not matcher.is_excluded("temp.txt")
+    assert not matcher.is_excluded("docs/temp/a.txt")
+
+
+def test_include_patterns():
+    matcher = PathMatcher(("/", "docs/**/*", "src/", "*.md"), ())
+    assert matcher.is_included("README.txt")
+    assert matcher.is_included("docs/a/b.txt")
+    assert matcher.is_included("src/main.py")
+    assert matcher.is_included("notes/todo.md")
+    assert not matcher.is_included("notes/todo.txt")
+    assert PathMatcher((), ()).is_included("any/path.txt")
+
+
+def test_prunes_directories():
+    matcher = PathMatcher(("docs/**/*",), ("docs/private/**", "**/.venv/**"))
+    assert matcher.prunes("docs/private")
+    assert matcher.prunes("docs/private/keys")
+    assert matcher.prunes("docs/.venv")
+    assert matcher.prunes("src")
+    assert not matcher.prunes("docs")
+    assert not matcher.prunes("docs/public")
+
+    # Globs over the whole path may match below any directory
+    matcher = PathMatcher(("*.md",), ("*.log",))
+    assert not matcher.prunes("any/dir")
+
+
+def test_compile_path_matcher_is_cached():
+    assert compile_path_matcher(("a/",), ("b/",)) is compile_path_matcher(
+        ("a/",), ("b/",)
+    )
+
+
+def test_walk_files_prunes_and_matches_os_walk(tmp_path):
+    for rel_path in (
+        "a.txt",
+        "docs/b.txt",
+        "docs/sub/c.txt",
+        "node_modules/pkg/d.txt",
+        "z/e.txt",
+    ):
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    expected = [
+        os.path.join(root, name)
+        for root, _, files in os.walk(tmp_path)
+        for name in files
+    ]
+    assert [path for path, _ in walk_files(str(tmp_path))] == expected
+
+    visited: list[str] = []
+
+    def prune(rel_dir: str) -> bool:
+        visited.append(rel_dir)
+        return rel_dir == "node_modules"
+
+    files = dict(walk_files(str(tmp_path), prune))
+    assert str(tmp_path / "node_modules" / "pkg" / "d.txt") not in files
+    assert "node_modules/pkg" not in visited
+    assert "docs/sub" in visited
+    assert files[str(tmp_path / "a.txt")].st_size == 1
@@ -50,6 +50,27 @@ class TestBaseConnector:
         """Create a BaseConnector instance."""
         return concrete_connector_class(mock_config)
 
+    @pytest.mark.asyncio
+    async def test_iter_documents_defaults_to_get_documents(self, connector):
+        """Test that iter_documents falls back to get_documents."""
+        documents = [
+            Document(
+                title=f"Doc {i}",
+                content=f"Content {i}",
+                content_type="text",
+                metadata={},
+                source_type="test",
+                source="test-source",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(2)
+        ]
+        connector.set_test_documents(documents)
+
+        result = [document async for document in connector.iter_documents()]
+
+        assert result == documents
+
     def test_initialization(self, connector, mock_config):
         """Test the connector initialization."""
         assert connector.config == mock_config
@@ -1,5 +1,6 @@
 """Tests for the ChunkingService."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -284,6 +285,48 @@ class TestChunkingService:
             strategy = service._get_strategy(doc)
             assert isinstance(strategy, MarkdownChunkingStrategy)
 
+    def test_get_strategy_reuses_instances_per_thread(
+        self, mock_global_config, mock_settings
+    ):
+        """Test that strategies are built once per thread and reused."""
+        with (
+            patch("qdrant_loader.core.chunking.chunking_service.Path"),
+            patch("qdrant_loader.core.chunking.chunking_service.IngestionMonitor"),
+            patch("qdrant_loader.core.chunking.chunking_service.LoggingConfig"),
+            patch(
+                "qdrant_loader.core.chunking.chunking_service.DefaultChunkingStrategy"
+            ),
+            patch(
+                "qdrant_loader.core.chunking.chunking_service.MarkdownChunkingStrategy"
+            ) as mock_markdown_strategy,
+        ):
+            mock_markdown_strategy.side_effect = lambda settings: Mock()
+            mock_markdown_strategy.__name__ = "MarkdownChunkingStrategy"
+            service = ChunkingService(mock_global_config, mock_settings)
+
+            docs = [
+                Document(
+                    content=f"# Test {i}",
+                    url=f"http://example.com/test{i}.md",
+                    content_type="md",
+                    source_type="test",
+                    source="test_source",
+                    title=f"Test {i}",
+                    metadata={"source": "test"},
+                )
+                for i in range(3)
+            ]
+
+            strategies = [service._get_strategy(doc) for doc in docs]
+            assert strategies[0] is strategies[1] is strategies[2]
+            assert mock_markdown_strategy.call_count == 1
+
+            # Another thread gets its own instance
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                other = executor.submit(service._get_strategy, docs[0]).result()
+            assert other is not strategies[0]
+            assert mock_markdown_strategy.call_count == 2
+
     def test_get_strategy_html(self, mock_global_config, mock_settings):
         """Test strategy selection for HTML documents."""
         with (
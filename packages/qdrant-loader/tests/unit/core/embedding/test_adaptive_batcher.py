@@ -0,0 +1,141 @@
+"""Unit tests for the adaptive embedding batcher."""
+
+import pytest
+from qdrant_loader.config.embedding import AdaptiveBatchingConfig
+from qdrant_loader.core.embedding.adaptive_batcher import AdaptiveBatcher
+from qdrant_loader.core.monitoring import prometheus_metrics
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _batcher(clock=None, max_tokens_per_request=None, **options):
+    config = AdaptiveBatchingConfig(enabled=True, window=2, **options)
+    return AdaptiveBatcher(
+        config,
+        batch_size=32,
+        max_tokens_per_request=max_tokens_per_request,
+        clock=clock or _Clock(),
+    )
+
+
+def _record_window(batcher, clock, *, tokens=1000, latency_s=1.0, **kwargs):
+    for _ in range(batcher.config.window):
+        clock.now += latency_s
+        batcher.record(items=10, tokens=tokens, latency_s=latency_s, **kwargs)
+
+
+def test_healthy_window_grows_batch_size_and_concurrency():
+    """Fast, successful requests increase both knobs additively."""
+    clock = _Clock()
+    batcher = _batcher(clock)
+    batcher.reset(concurrency=2)
+
+    _record_window(batcher, clock)
+
+    assert batcher.batch_size == 40
+    assert batcher.concurrency == 3
+
+
+def test_rate_limit_backs_off_immediately():
+    """A 429 halves batch size and concurrency without waiting for a window."""
+    batcher = _batcher()
+    batcher.reset(concurrency=8)
+
+    batcher.record(items=10, tokens=1000, latency_s=0.5, failed=True, rate_limited=True)
+
+    assert batcher.batch_size == 16
+    assert batcher.concurrency == 4
+
+
+def test_error_rate_above_limit_backs_off():
+    """Windows with too many failures cut both knobs multiplicatively."""
+    clock = _Clock()
+    batcher = _batcher(clock, max_error_rate=0.4)
+    batcher.reset(concurrency=4)
+
+    _record_window(batcher, clock, failed=True)
+
+    assert batcher.batch_size == 16
+    assert batcher.concurrency == 2
+
+
+def test_slow_requests_shrink_batch_size_only():
+    """Latency above the target reduces the batch size but keeps concurrency."""
+    clock = _Clock()
+    batcher = _batcher(clock, target_latency_s=2.0)
+    batcher.reset(concurrency=4)
+
+    _record_window(batcher, clock, latency_s=5.0)
+
+    assert batcher.batch_size == 16
+    assert batcher.concurrency == 4
+
+
+def test_throughput_drop_reduces_concurrency():
+    """Adding batches in flight stops once throughput no longer improves."""
+    clock = _Clock()
+    batcher = _batcher(clock)
+    batcher.reset(concurrency=2)
+
+    _record_window(batcher, clock, tokens=1000)
+    assert batcher.concurrency == 3
+
+    _record_window(batcher, clock, tokens=200)
+    assert batcher.concurrency == 2
+
+
+def test_limits_are_respected():
+    """Batch size and concurrency never leave the configured bounds."""
+    clock = _Clock()
+    batcher = _batcher(clock, max_batch_size=36, max_concurrency=3)
+    batcher.reset(concurrency=10)
+    assert batcher.concurrency == 3
+
+    for _ in range(5):
+        _record_window(batcher, clock)
+    assert batcher.batch_size == 36
+
+    for _ in range(10):
+        batcher.record(items=1, tokens=1, latency_s=0.1, rate_limited=True)
+    assert batcher.batch_size == 1
+    assert batcher.concurrency == 1
+
+
+def test_batch_size_is_capped_by_request_token_limit():
+    """Batches stay within one provider request once text sizes are known."""
+    clock = _Clock()
+    batcher = _batcher(clock, max_tokens_per_request=2000)
+
+    # 10 texts of 100 tokens each: at most 20 texts fit in a request
+    _record_window(batcher, clock, tokens=1000)
+
+    assert batcher.batch_size == 20
+
+
+def test_decisions_are_exported_as_gauges():
+    """Current decisions are published to Prometheus."""
+    clock = _Clock()
+    batcher = _batcher(clock)
+    batcher.reset(concurrency=2)
+
+    _record_window(batcher, clock, tokens=500, latency_s=0.5)
+
+    assert prometheus_metrics.EMBEDDING_BATCH_SIZE._value.get() == 40
+    assert prometheus_metrics.EMBEDDING_CONCURRENCY._value.get() == 3
+    assert prometheus_metrics.EMBEDDING_REQUEST_LATENCY._value.get() == 0.5
+    assert prometheus_metrics.EMBEDDING_ERROR_RATE._value.get() == 0
+    assert prometheus_metrics.EMBEDDING_THROUGHPUT._value.get() == pytest.approx(1000)
+
+
+def test_config_rejects_inverted_bounds():
+    """Lower limits above upper limits are configuration errors."""
+    with pytest.raises(ValueError):
+        AdaptiveBatchingConfig(min_batch_size=10, max_batch_size=5)
+    with pytest.raises(ValueError):
+        AdaptiveBatchingConfig(min_concurrency=4, max_concurrency=2)
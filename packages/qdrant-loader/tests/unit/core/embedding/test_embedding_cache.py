@@ -0,0 +1,218 @@
+"""Unit tests for the persistent embedding cache."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from qdrant_loader.core.embedding.embedding_cache import (
+    DEFAULT_CACHE_FILENAME,
+    EmbeddingCache,
+    default_cache_path,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a file-backed cache."""
+    cache = EmbeddingCache(
+        path=str(tmp_path / "cache.db"),
+        model="text-embedding-3-small",
+        tokenizer="cl100k_base",
+        vector_size=3,
+    )
+    yield cache
+    cache.close()
+
+
+def test_get_many_returns_none_for_misses(cache):
+    """Unknown texts are misses."""
+    assert cache.get_many(["alpha", "beta"]) == [None, None]
+    assert cache.misses == 2
+    assert cache.hits == 0
+
+
+def test_put_and_get_round_trip(cache):
+    """Stored embeddings are returned as float32 values."""
+    cache.put_many(["alpha", "beta"], [[0.5, 0.25, 1.0], [0.1, 0.2, 0.3]])
+
+    result = cache.get_many(["beta", "gamma", "alpha"])
+
+    assert result[0] == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
+    assert result[1] is None
+    assert result[2] == [0.5, 0.25, 1.0]
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert cache.entry_count == 2
+
+
+def test_key_normalises_text(cache):
+    """Line endings, surrounding whitespace and Unicode form do not matter."""
+    cache.put_many(["line one\r\nline two  "], [[1.0, 2.0, 3.0]])
+
+    assert cache.get_many(["line one\nline two"]) == [[1.0, 2.0, 3.0]]
+    assert cache.make_key("café") == cache.make_key("café")
+
+
+def test_key_includes_model_and_tokenizer(tmp_path):
+    """Caches for different models do not share entries."""
+    path = str(tmp_path / "cache.db")
+    first = EmbeddingCache(path=path, model="model-a", tokenizer="cl100k_base")
+    first.put_many(["alpha"], [[1.0, 2.0]])
+    first.close()
+
+    other_model = EmbeddingCache(path=path, model="model-b", tokenizer="cl100k_base")
+    other_tokenizer = EmbeddingCache(path=path, model="model-a", tokenizer="none")
+    try:
+        assert other_model.get_many(["alpha"]) == [None]
+        assert other_tokenizer.get_many(["alpha"]) == [None]
+    finally:
+        other_model.close()
+        other_tokenizer.close()
+
+
+def test_key_includes_provider_and_endpoint(tmp_path):
+    """Endpoints serving the same model name do not share entries."""
+    path = str(tmp_path / "cache.db")
+    first = EmbeddingCache(
+        path=path,
+        model="m",
+        tokenizer="t",
+        provider="openai_compat",
+        endpoint="http://localhost:11434/v1",
+    )
+    first.put_many(["alpha"], [[1.0, 2.0]])
+    first.close()
+
+    same_endpoint = EmbeddingCache(
+        path=path,
+        model="m",
+        tokenizer="t",
+        provider="openai_compat",
+        endpoint="http://localhost:11434/v1/",
+    )
+    other_endpoint = EmbeddingCache(
+        path=path,
+        model="m",
+        tokenizer="t",
+        provider="openai_compat",
+        endpoint="http://gpu-host:8000/v1",
+    )
+    other_provider = EmbeddingCache(
+        path=path,
+        model="m",
+        tokenizer="t",
+        provider="ollama",
+        endpoint="http://localhost:11434/v1",
+    )
+    try:
+        assert same_endpoint.get_many(["alpha"]) == [[1.0, 2.0]]
+        assert other_endpoint.get_many(["alpha"]) == [None]
+        assert other_provider.get_many(["alpha"]) == [None]
+    finally:
+        same_endpoint.close()
+        other_endpoint.close()
+        other_provider.close()
+
+
+def test_entries_persist_across_instances(tmp_path):
+    """Embeddings survive reopening the cache file."""
+    path = str(tmp_path / "cache.db")
+    first = EmbeddingCache(path=path, model="m", tokenizer="t")
+    first.put_many(["alpha", "beta"], [[1.0], [2.0]])
+    first.close()
+
+    reopened = EmbeddingCache(path=path, model="m", tokenizer="t")
+    try:
+        assert reopened.entry_count == 2
+        assert reopened.size_bytes == 8
+        assert reopened.get_many(["alpha"]) == [[1.0]]
+    finally:
+        reopened.close()
+
+
+def test_duplicate_put_is_counted_once(cache):
+    """Storing the same text twice keeps a single entry."""
+    cache.put_many(["alpha"], [[1.0, 2.0, 3.0]])
+    cache.put_many(["alpha"], [[1.0, 2.0, 3.0]])
+
+    assert cache.entry_count == 1
+    assert cache.size_bytes == 12
+
+
+def test_evicts_least_recently_used_over_entry_limit(tmp_path):
+    """The least recently used entries are evicted first."""
+    cache = EmbeddingCache(
+        path=str(tmp_path / "cache.db"), model="m", tokenizer="t", max_entries=10
+    )
+    try:
+        texts = [f"text {i}" for i in range(10)]
+        cache.put_many(texts, [[float(i)] for i in range(10)])
+
+        # Touch the oldest entry so it becomes recently used
+        cache.get_many(["text 0"])
+        cache.put_many(["text 10"], [[10.0]])
+
+        assert cache.entry_count <= 9
+        assert cache.evictions >= 2
+        assert cache.get_many(["text 0"]) == [[0.0]]
+        assert cache.get_many(["text 1"]) == [None]
+        assert cache.get_many(["text 10"]) == [[10.0]]
+    finally:
+        cache.close()
+
+
+def test_evicts_over_size_limit(tmp_path):
+    """Entries are evicted once the vector size limit is exceeded."""
+    # Each vector is 256 float32 values = 1 KiB
+    cache = EmbeddingCache(
+        path=str(tmp_path / "cache.db"),
+        model="m",
+        tokenizer="t",
+        max_size_mb=8 / 1024,
+    )
+    try:
+        for i in range(12):
+            cache.put_many([f"text {i}"], [[float(i)] * 256])
+
+        assert cache.size_bytes <= 8 * 1024
+        assert cache.get_many(["text 11"]) == [[11.0] * 256]
+        assert cache.get_many(["text 0"]) == [None]
+    finally:
+        cache.close()
+
+
+def test_concurrent_access(cache):
+    """The cache can be used from several threads."""
+    barrier = threading.Barrier(4)
+
+    def worker(n):
+        barrier.wait()
+        texts = [f"worker {n} text {i}" for i in range(20)]
+        cache.put_many(texts, [[float(n), float(i), 0.0] for i in range(20)])
+        return cache.get_many(texts)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(worker, range(4)))
+
+    assert all(embedding is not None for result in results for embedding in result)
+    assert cache.entry_count == 80
+
+
+@pytest.mark.parametrize(
+    "state_path", [":memory:", "sqlite:///:memory:", "sqlite://:memory:"]
+)
+def test_default_cache_path_in_memory(state_path):
+    """In-memory state databases get an in-memory cache."""
+    assert default_cache_path(state_path) == ":memory:"
+
+
+def test_default_cache_path_next_to_state_db(tmp_path):
+    """The cache is placed next to the state database."""
+    state_db = tmp_path / "state" / "qdrant-loader.db"
+
+    assert default_cache_path(str(state_db)) == str(
+        tmp_path / "state" / DEFAULT_CACHE_FILENAME
+    )
+    assert default_cache_path(f"sqlite:///{state_db}") == str(
+        tmp_path / "state" / DEFAULT_CACHE_FILENAME
+    )
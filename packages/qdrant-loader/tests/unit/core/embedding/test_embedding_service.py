@@ -2,7 +2,7 @@
 
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from qdrant_loader.config import Settings
@@ -232,25 +232,52 @@ async def test_get_embeddings_batch_provider(mock_settings):
 
 
 @pytest.mark.asyncio
-async def test_rate_limiting():
-    """Test rate limiting between requests."""
-    # Create proper mock settings structure
-    global_config = MagicMock()
-    embedding_config = MagicMock()
-    embedding_config.endpoint = "http://localhost:8000"
-    global_config.embedding = embedding_config
-
-    settings = MagicMock(spec=Settings)
-    settings.global_config = global_config
-
-    service = EmbeddingService(settings)
+async def test_consecutive_requests_are_not_throttled(mock_settings):
+    """Pacing is left to the provider's rate limiter; no fixed delay is added."""
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: _fake_provider(3)),
+    ):
+        service = EmbeddingService(mock_settings)
 
     start_time = asyncio.get_event_loop().time()
-    await service._apply_rate_limit()
-    await service._apply_rate_limit()
+    for _ in range(5):
+        await service.get_embedding("test text")
     end_time = asyncio.get_event_loop().time()
 
-    assert end_time - start_time >= 0.5  # Minimum interval is 500ms
+    assert end_time - start_time < 0.5
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_is_retried_after_retry_after(mock_settings):
+    """A 429 is retried after the delay requested by the provider."""
+    from qdrant_loader_core.llm.errors import RateLimitedError
+
+    attempts = []
+
+    class _Emb:
+        async def embed(self, inputs):  # type: ignore[no-untyped-def]
+            attempts.append(inputs)
+            if len(attempts) == 1:
+                raise RateLimitedError("429", retry_after=0.01)
+            return [[0.5] * 3 for _ in inputs]
+
+    provider = SimpleNamespace(embeddings=lambda: _Emb())
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(mock_settings)
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.asyncio.sleep",
+        wraps=asyncio.sleep,
+    ) as sleep:
+        result = await service.get_embeddings(["test text"])
+
+    assert result == [[0.5, 0.5, 0.5]]
+    assert len(attempts) == 2
+    sleep.assert_any_call(0.01)
 
 
 def test_count_tokens_with_tokenizer(mock_settings):
@@ -263,15 +290,16 @@ def test_count_tokens_with_tokenizer(mock_settings):
         ),
     ):
         mock_encoding = MagicMock()
-        mock_encoding.encode.return_value = [1, 2, 3]  # 3 tokens
+        mock_encoding.encode_ordinary.return_value = [1, 2, 3]  # 3 tokens
         mock_get_encoding.return_value = mock_encoding
 
         service = EmbeddingService(mock_settings)
         count = service.count_tokens("test text")
 
-        # Our mock encode returns [1,2,3]; but service wraps tiktoken.encode length directly
+        # Counted like the batcher, without special-token handling
         assert count == 3
-        mock_encoding.encode.assert_called_once()
+        mock_encoding.encode_ordinary.assert_called_once()
+        mock_encoding.encode.assert_not_called()
 
 
 def test_count_tokens_fallback():
@@ -311,7 +339,7 @@ def test_count_tokens_batch(mock_settings):
         ),
     ):
         mock_encoding = MagicMock()
-        mock_encoding.encode.side_effect = lambda x: [1] * len(x)
+        mock_encoding.encode_ordinary.side_effect = lambda x: [1] * len(x)
         mock_get_encoding.return_value = mock_encoding
 
         service = EmbeddingService(mock_settings)
@@ -352,3 +380,211 @@ async def test_provider_error_propagates(mock_settings):
         service = EmbeddingService(mock_settings)
         with pytest.raises(RuntimeError, match="provider failure"):
             await service.get_embedding("test text")
+
+
+def _settings_with_cache(tmp_path, **cache_options):
+    """Create settings with a real embedding cache configuration."""
+    from qdrant_loader.config.embedding import EmbeddingCacheConfig
+
+    embedding_config = MagicMock()
+    embedding_config.tokenizer = "none"
+    embedding_config.batch_size = 10
+    embedding_config.max_tokens_per_request = 8000
+    embedding_config.max_tokens_per_chunk = 8000
+    embedding_config.cache = EmbeddingCacheConfig(
+        path=str(tmp_path / "embedding_cache.db"), **cache_options
+    )
+    global_config = MagicMock()
+    global_config.embedding = embedding_config
+    settings = MagicMock(spec=Settings)
+    settings.global_config = global_config
+    settings.llm_settings = SimpleNamespace(
+        provider="openai_compat",
+        base_url="http://localhost:11434/v1",
+        api_key=None,
+        models={"embeddings": "nomic-embed-text"},
+        tokenizer="none",
+        embeddings=SimpleNamespace(vector_size=3),
+    )
+    return settings
+
+
+def _counting_provider():
+    calls = []
+
+    class _Emb:
+        async def embed(self, inputs):  # type: ignore[no-untyped-def]
+            calls.append(list(inputs))
+            return [[float(len(text)), 0.0, 1.0] for text in inputs]
+
+    class _Prov:
+        def embeddings(self):
+            return _Emb()
+
+    return _Prov(), calls
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_only_embeds_cache_misses(tmp_path):
+    """Unchanged chunks are served from the cache."""
+    settings = _settings_with_cache(tmp_path)
+    provider, calls = _counting_provider()
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(settings)
+
+    try:
+        first = await service.get_embeddings(["one", "three"])
+        second = await service.get_embeddings(["three", "seventeen", "one"])
+    finally:
+        service.close()
+
+    assert calls == [["one", "three"], ["seventeen"]]
+    assert first == [[3.0, 0.0, 1.0], [5.0, 0.0, 1.0]]
+    assert second == [[5.0, 0.0, 1.0], [9.0, 0.0, 1.0], [3.0, 0.0, 1.0]]
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_all_cached_skips_provider(tmp_path):
+    """A fully cached batch does not call the provider at all."""
+    settings = _settings_with_cache(tmp_path)
+    provider, calls = _counting_provider()
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(settings)
+    service.cache.put_many(["cached"], [[1.0, 2.0, 3.0]])
+
+    try:
+        result = await service.get_embeddings(["cached"])
+    finally:
+        service.close()
+
+    assert calls == []
+    assert result == [[1.0, 2.0, 3.0]]
+
+
+def test_cache_disabled(tmp_path):
+    """No cache is opened when it is disabled."""
+    settings = _settings_with_cache(tmp_path, enabled=False)
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: _fake_provider(3)),
+    ):
+        service = EmbeddingService(settings)
+
+    assert service.cache is None
+    assert not (tmp_path / "embedding_cache.db").exists()
+
+
+class _WordEncoding:
+    """Whitespace tokenizer standing in for a tiktoken encoding."""
+
+    def encode(self, text):  # type: ignore[no-untyped-def]
+        return text.split()
+
+    def encode_ordinary(self, text):  # type: ignore[no-untyped-def]
+        return text.split()
+
+    def encode_ordinary_batch(self, texts, num_threads=8):  # type: ignore[no-untyped-def]
+        return [text.split() for text in texts]
+
+    def decode(self, tokens):  # type: ignore[no-untyped-def]
+        return " ".join(tokens)
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_tokenizes_each_text_once(mock_settings):
+    """Token counts from a single encode pass drive truncation and batching."""
+    mock_settings.global_config.embedding.max_tokens_per_chunk = 5
+    mock_settings.global_config.embedding.max_tokens_per_request = 7
+    provider, calls = _counting_provider()
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(mock_settings)
+
+    service.encoding = MagicMock(wraps=_WordEncoding())
+
+    long_text = "one two three four five six seven eight"
+    await service.get_embeddings(["alpha beta", long_text, "gamma"])
+
+    assert service.encoding.encode_ordinary.call_count == 3
+    service.encoding.encode.assert_not_called()
+    # "alpha beta" (2 tokens) + truncated text (5 tokens) fit in one request
+    assert calls == [["alpha beta", "one two three four five"], ["gamma"]]
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_large_batch_uses_batch_encoding(mock_settings):
+    """Large batches are tokenized with tiktoken's parallel batch API."""
+    provider, calls = _counting_provider()
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(mock_settings)
+    service.encoding = MagicMock(wraps=_WordEncoding())
+
+    texts = [f"text number {i}" for i in range(100)]
+    result = await service.get_embeddings(texts)
+
+    assert len(result) == 100
+    service.encoding.encode_ordinary_batch.assert_called_once()
+    service.encoding.encode_ordinary.assert_not_called()
+    assert [text for call in calls for text in call] == texts
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_provider(tmp_path):
+    """Closing the service releases the cache and the provider's connections."""
+    settings = _settings_with_cache(tmp_path)
+    provider = MagicMock()
+    provider.aclose = AsyncMock()
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(settings)
+
+    await service.aclose()
+
+    assert service.cache is None
+    provider.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_embedding_requests_feed_adaptive_batcher(tmp_path):
+    """Each provider request is reported to the adaptive batcher."""
+    from qdrant_loader.config.embedding import AdaptiveBatchingConfig
+
+    settings = _settings_with_cache(tmp_path, enabled=False)
+    settings.global_config.embedding.adaptive_batching = AdaptiveBatchingConfig(
+        enabled=True
+    )
+    provider, _ = _counting_provider()
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(settings)
+    service.batcher.record = MagicMock()
+
+    await service.get_embeddings(["one", "three"])
+
+    service.batcher.record.assert_called_once()
+    kwargs = service.batcher.record.call_args.kwargs
+    assert kwargs["items"] == 2
+    assert kwargs["tokens"] == len("one") + len("three")
+    assert kwargs["failed"] is False
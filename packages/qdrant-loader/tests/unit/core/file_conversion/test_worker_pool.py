@@ -0,0 +1,138 @@
+"""
+Unit tests for the conversion worker pool.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from qdrant_loader.core.file_conversion.conversion_config import FileConversionConfig
+from qdrant_loader.core.file_conversion.exceptions import (
+    ConversionTimeoutError,
+    MarkItDownError,
+)
+from qdrant_loader.core.file_conversion.file_converter import FileConverter
+from qdrant_loader.core.file_conversion.worker_pool import (
+    ConversionWorkerError,
+    _Worker,
+    shutdown_worker_pools,
+)
+
+
+def _worker(config: FileConversionConfig, conn: MagicMock) -> tuple[_Worker, MagicMock]:
+    """Worker with a running process replaced by mocks."""
+    worker = _Worker(MagicMock(), config)
+    process = MagicMock()
+    process.is_alive.return_value = True
+    worker._process, worker._conn = process, conn
+    return worker, process
+
+
+class TestWorker:
+    """Test cases for a conversion worker."""
+
+    def test_convert_returns_worker_result(self):
+        """Test that the converted text is returned from the worker."""
+        conn = MagicMock()
+        conn.poll.return_value = True
+        conn.recv.return_value = ("ok", "# Converted")
+        worker, _ = _worker(FileConversionConfig(), conn)
+
+        assert worker.convert("/tmp/test.pdf") == "# Converted"
+        conn.send.assert_called_once_with("/tmp/test.pdf")
+
+    def test_convert_kills_worker_on_timeout(self):
+        """Test that a worker that does not answer in time is killed."""
+        conn = MagicMock()
+        conn.poll.return_value = False
+        worker, process = _worker(FileConversionConfig(conversion_timeout=10), conn)
+
+        with pytest.raises(ConversionTimeoutError):
+            worker.convert("/tmp/test.pdf")
+
+        process.kill.assert_called_once()
+        assert worker._process is None
+
+    def test_convert_reports_worker_exit(self):
+        """Test that a worker exiting mid-conversion, e.g. out of memory, fails the file."""
+        conn = MagicMock()
+        conn.poll.return_value = True
+        conn.recv.side_effect = EOFError
+        worker, process = _worker(FileConversionConfig(), conn)
+        process.exitcode = -9
+
+        with pytest.raises(ConversionWorkerError, match="exit code -9"):
+            worker.convert("/tmp/test.pdf")
+        assert worker._process is None
+
+    def test_worker_recycled_after_max_files(self):
+        """Test that a worker is stopped after converting its quota of files."""
+        conn = MagicMock()
+        conn.poll.return_value = True
+        conn.recv.return_value = ("ok", "# Converted")
+        worker, _ = _worker(FileConversionConfig(max_files_per_worker=2), conn)
+
+        worker.convert("/tmp/a.pdf")
+        assert worker._process is not None
+        worker.convert("/tmp/b.pdf")
+
+        conn.send.assert_called_with(None)
+        assert worker._process is None
+
+
+class TestFileConverterWorkerProcesses:
+    """Test cases for converting files in worker processes."""
+
+    def test_convert_file_uses_worker_pool(self, tmp_path):
+        """Test that conversions go to the worker pool when enabled."""
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"%PDF-1.4")
+        converter = FileConverter(FileConversionConfig(worker_processes=2))
+        pool = MagicMock()
+        pool.convert.return_value = "# Converted"
+
+        with (
+            patch(
+                "qdrant_loader.core.file_conversion.file_converter.get_worker_pool",
+                return_value=pool,
+            ),
+            patch.object(converter, "_validate_file"),
+            patch.object(converter, "_get_markitdown") as mock_get_markitdown,
+        ):
+            assert converter.convert_file(str(file_path)) == "# Converted"
+
+        assert converter.uses_worker_processes
+        pool.convert.assert_called_once_with(str(file_path))
+        mock_get_markitdown.assert_not_called()
+
+    def test_worker_error_raises_markitdown_error(self, tmp_path):
+        """Test that worker failures surface as conversion errors."""
+        converter = FileConverter(FileConversionConfig(worker_processes=1))
+        pool = MagicMock()
+        pool.convert.side_effect = ConversionWorkerError("Bad file")
+
+        with (
+            patch(
+                "qdrant_loader.core.file_conversion.file_converter.get_worker_pool",
+                return_value=pool,
+            ),
+            patch.object(converter, "_validate_file"),
+        ):
+            with pytest.raises(MarkItDownError, match="Bad file"):
+                converter.convert_file(str(tmp_path / "test.pdf"))
+
+    def test_convert_file_in_worker_process(self, tmp_path):
+        """Test a conversion end to end in a spawned worker process."""
+        openpyxl = pytest.importorskip("openpyxl")
+        pytest.importorskip("markitdown")
+        file_path = tmp_path / "test.xlsx"
+        workbook = openpyxl.Workbook()
+        workbook.active["A1"] = "converted in a worker"
+        workbook.save(file_path)
+        converter = FileConverter(
+            FileConversionConfig(worker_processes=1, conversion_timeout=60)
+        )
+
+        try:
+            assert "converted in a worker" in converter.convert_file(str(file_path))
+        finally:
+            shutdown_worker_pools()
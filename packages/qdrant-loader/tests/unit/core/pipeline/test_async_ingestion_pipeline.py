@@ -247,7 +247,7 @@ class TestAsyncIngestionPipeline:
 
             # Setup mocks
             mock_orchestrator = Mock()
-            mock_orchestrator.process_documents = AsyncMock(return_value=[])
+            mock_orchestrator.process_documents = AsyncMock(return_value=0)
             mock_orchestrator_class.return_value = mock_orchestrator
 
             mock_monitor = Mock()
@@ -284,7 +284,7 @@ class TestAsyncIngestionPipeline:
             mock_monitor.start_operation.assert_called_once()
             mock_monitor.end_operation.assert_called_once()
 
-            assert result == []
+            assert result == 0
 
     @pytest.mark.asyncio
     async def test_process_documents_with_documents(
@@ -311,7 +311,7 @@ class TestAsyncIngestionPipeline:
             # Setup mocks
             mock_orchestrator = Mock()
             mock_orchestrator.process_documents = AsyncMock(
-                return_value=sample_documents
+                return_value=len(sample_documents)
             )
             mock_orchestrator_class.return_value = mock_orchestrator
 
@@ -348,7 +348,7 @@ class TestAsyncIngestionPipeline:
             )
             mock_monitor.end_batch.assert_called_once_with("document_batch", 2, 0, [])
 
-            assert result == sample_documents
+            assert result == len(sample_documents)
 
     @pytest.mark.asyncio
     async def test_process_documents_error_handling(
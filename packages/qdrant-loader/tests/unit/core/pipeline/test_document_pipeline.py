@@ -87,10 +87,17 @@ class TestDocumentPipeline:
         result = await document_pipeline.process_documents(sample_documents)
 
         # Verify the chain was called correctly
-        chunking_worker.process_documents.assert_called_once_with(sample_documents)
+        chunking_worker.process_documents.assert_called_once_with(
+            sample_documents, chunk_counts={}
+        )
         embedding_worker.process_chunks.assert_called_once_with(chunks_iter)
         upsert_worker.process_embedded_chunks.assert_called_once_with(
-            embedded_chunks_iter
+            embedded_chunks_iter, chunk_counts={}, on_documents_done=None
+        )
+        # Both workers share the chunk counts
+        assert (
+            chunking_worker.process_documents.call_args.kwargs["chunk_counts"]
+            is upsert_worker.process_embedded_chunks.call_args.kwargs["chunk_counts"]
         )
 
         # Verify result
@@ -241,7 +248,7 @@ class TestDocumentPipeline:
         result = await document_pipeline.process_documents([])
 
         # Verify the chain was called
-        chunking_worker.process_documents.assert_called_once_with([])
+        chunking_worker.process_documents.assert_called_once_with([], chunk_counts={})
 
         # Verify result
         assert result.success_count == 0
@@ -429,3 +436,67 @@ class TestDocumentPipeline:
 
         # Verify call order
         assert call_order == ["chunking", "embedding", "upsert"]
+
+    @pytest.mark.asyncio
+    async def test_process_streamed_documents(
+        self, document_pipeline, mock_workers, sample_documents
+    ):
+        """Test that streamed documents skip the overall pipeline timeout."""
+        chunking_worker, embedding_worker, upsert_worker = mock_workers
+
+        async def stream():
+            for document in sample_documents:
+                yield document
+
+        async def consume(documents):
+            return [document async for document in documents]
+
+        consumed = {}
+
+        async def process_embedded_chunks(embedded_chunks, **_):
+            consumed["documents"] = await embedded_chunks
+            result = PipelineResult()
+            result.success_count = len(consumed["documents"])
+            return result
+
+        chunking_worker.process_documents.side_effect = lambda documents, **_: documents
+        embedding_worker.process_chunks.side_effect = consume
+        upsert_worker.process_embedded_chunks = AsyncMock(
+            side_effect=process_embedded_chunks
+        )
+
+        with patch(
+            "qdrant_loader.core.pipeline.document_pipeline.asyncio.wait_for"
+        ) as mock_wait_for:
+            result = await document_pipeline.process_documents(stream())
+
+        mock_wait_for.assert_not_called()
+        assert consumed["documents"] == sample_documents
+        assert result.success_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_streamed_documents_error_counts_seen_documents(
+        self, document_pipeline, mock_workers, sample_documents
+    ):
+        """Test that a failed streamed run reports the documents it received."""
+        chunking_worker, embedding_worker, upsert_worker = mock_workers
+
+        async def stream():
+            for document in sample_documents:
+                yield document
+
+        async def fail_after_consuming(documents, **_):
+            async for _ in documents:
+                pass
+            raise RuntimeError("upsert failed")
+
+        chunking_worker.process_documents.side_effect = lambda documents, **_: documents
+        embedding_worker.process_chunks.side_effect = lambda chunks: chunks
+        upsert_worker.process_embedded_chunks = AsyncMock(
+            side_effect=fail_after_consuming
+        )
+
+        result = await document_pipeline.process_documents(stream())
+
+        assert result.error_count == 2
+        assert "Pipeline failed: upsert failed" in result.errors
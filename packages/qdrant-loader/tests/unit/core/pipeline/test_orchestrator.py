@@ -1,9 +1,11 @@
 """Tests for PipelineOrchestrator module."""
 
+import asyncio
 from typing import cast
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+import pytest_asyncio
 from qdrant_loader.config import Settings, SourcesConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.pipeline.document_pipeline import DocumentPipeline
@@ -80,17 +82,61 @@ class TestPipelineOrchestrator:
         assert self.orchestrator.settings == self.settings
         assert self.orchestrator.components == self.components
 
+    @staticmethod
+    def _make_document(doc_id: str) -> Document:
+        """Create a real document with a fixed id."""
+        return Document(
+            id=doc_id,
+            title=f"Document {doc_id}",
+            content_type="md",
+            content=f"Content of {doc_id}",
+            metadata={},
+            source_type="git",
+            source="my-repo",
+            url=f"https://example.com/{doc_id}",
+        )
+
+    @staticmethod
+    async def _stream(items):
+        """Turn a list into an async iterator."""
+        for item in items:
+            yield item
+
+    def _all_documents_changed(self):
+        """Make change detection pass every document from the sources on."""
+        return Mock(
+            side_effect=lambda filtered_config, project_id, **_: (
+                self.orchestrator._iter_documents_from_sources(
+                    filtered_config, project_id
+                )
+            )
+        )
+
+    def _consume_in_pipeline(self, result):
+        """Make the document pipeline drain the stream it is given.
+
+        Documents in the successful set of ``result`` are reported done.
+        """
+        self.consumed_documents = []
+
+        async def process_documents(documents, on_documents_done=None):
+            async for document in documents:
+                self.consumed_documents.append(document)
+            done = [
+                document
+                for document in self.consumed_documents
+                if document.id in result.successfully_processed_documents
+            ]
+            if on_documents_done and done:
+                await on_documents_done(done, {document.id: set() for document in done})
+            return result
+
+        self.document_pipeline.process_documents.side_effect = process_documents
+
     @pytest.mark.asyncio
     async def test_process_documents_success(self):
         """Test successful document processing."""
-        # Setup mock documents
-        mock_documents = cast(
-            list[Document],
-            [
-                Mock(spec=Document, id="doc1"),
-                Mock(spec=Document, id="doc2"),
-            ],
-        )
+        mock_documents = [self._make_document("doc1"), self._make_document("doc2")]
 
         # Setup mock filtered config
         filtered_config = Mock(spec=SourcesConfig)
@@ -107,13 +153,12 @@ class TestPipelineOrchestrator:
 
         # Configure mocks
         self.source_filter.filter_sources.return_value = filtered_config
-        self.orchestrator._collect_documents_from_sources = AsyncMock(
-            return_value=mock_documents
-        )
-        self.orchestrator._detect_document_changes = AsyncMock(
-            return_value=mock_documents
+        source_stream = self._stream(mock_documents)
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=source_stream
         )
-        self.document_pipeline.process_documents.return_value = mock_result
+        self.orchestrator._iter_document_changes = self._all_documents_changed()
+        self._consume_in_pipeline(mock_result)
         self.orchestrator._update_document_states = AsyncMock()
 
         # Execute - pass sources_config parameter
@@ -122,41 +167,83 @@ class TestPipelineOrchestrator:
         )
 
         # Verify
-        assert result == mock_documents
+        assert result == 2
+        assert self.consumed_documents == mock_documents
         self.source_filter.filter_sources.assert_called_once_with(
             self.mock_sources_config, None, None
         )
-        self.orchestrator._collect_documents_from_sources.assert_called_once_with(
+        self.orchestrator._iter_documents_from_sources.assert_called_once_with(
             filtered_config, None
         )
-        self.orchestrator._detect_document_changes.assert_called_once_with(
-            mock_documents, filtered_config, None
+        self.orchestrator._iter_document_changes.assert_called_once_with(
+            filtered_config,
+            None,
+            deleted=[],
+            updated_ids=set(),
+            synced={},
+            cursors={},
         )
-        self.document_pipeline.process_documents.assert_called_once_with(mock_documents)
-        self.orchestrator._update_document_states.assert_called_once_with(
-            mock_documents, {"doc1", "doc2"}, None
+        self.document_pipeline.process_documents.assert_called_once()
+        self.orchestrator._update_document_states.assert_awaited_once()
+        states_call = self.orchestrator._update_document_states.call_args[0]
+        assert [doc.id for doc in states_call[0]] == ["doc1", "doc2"]
+        assert states_call[1:] == ({"doc1", "doc2"}, None)
+
+    @pytest.mark.asyncio
+    async def test_process_documents_writes_states_in_batches(self):
+        """Test that states are written as documents are done, not at the end."""
+        documents = [self._make_document(f"doc{i}") for i in range(5)]
+        filtered_config = Mock(spec=SourcesConfig)
+
+        self.source_filter.filter_sources.return_value = filtered_config
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=self._stream(documents)
         )
+        self.orchestrator._iter_document_changes = self._all_documents_changed()
+        self.orchestrator._update_document_states = AsyncMock()
+        written_during_run = []
+
+        async def process_documents(documents, on_documents_done=None):
+            async for document in documents:
+                await on_documents_done([document], {document.id: set()})
+                written_during_run.append(
+                    self.orchestrator._update_document_states.await_count
+                )
+            return Mock(successfully_processed_documents=set(), success_count=5)
+
+        self.document_pipeline.process_documents.side_effect = process_documents
+
+        with patch("qdrant_loader.core.pipeline.orchestrator._STATE_BATCH_SIZE", 2):
+            result = await self.orchestrator.process_documents(
+                sources_config=self.mock_sources_config
+            )
+
+        assert result == 5
+        assert written_during_run == [0, 1, 1, 2, 2]
+        batches = [
+            [doc.id for doc in call.args[0]]
+            for call in self.orchestrator._update_document_states.call_args_list
+        ]
+        assert batches == [["doc0", "doc1"], ["doc2", "doc3"], ["doc4"]]
 
     @pytest.mark.asyncio
     async def test_process_documents_with_custom_sources_config(self):
         """Test document processing with custom sources config."""
         custom_sources_config = Mock(spec=SourcesConfig)
         filtered_config = Mock(spec=SourcesConfig)
-        mock_documents = [Mock(spec=Document, id="doc1")]
+        mock_documents = [self._make_document("doc1")]
 
         # Setup mocks
         self.source_filter.filter_sources.return_value = filtered_config
-        self.orchestrator._collect_documents_from_sources = AsyncMock(
-            return_value=mock_documents
-        )
-        self.orchestrator._detect_document_changes = AsyncMock(
-            return_value=mock_documents
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=self._stream(mock_documents)
         )
+        self.orchestrator._iter_document_changes = self._all_documents_changed()
 
         mock_result = Mock()
         mock_result.successfully_processed_documents = {"doc1"}
         mock_result.success_count = 1
-        self.document_pipeline.process_documents.return_value = mock_result
+        self._consume_in_pipeline(mock_result)
         self.orchestrator._update_document_states = AsyncMock()
 
         # Execute
@@ -165,7 +252,7 @@ class TestPipelineOrchestrator:
         )
 
         # Verify
-        assert result == mock_documents
+        assert result == 1
         self.source_filter.filter_sources.assert_called_once_with(
             custom_sources_config, None, None
         )
@@ -180,21 +267,19 @@ class TestPipelineOrchestrator:
         filtered_config.publicdocs = None
         filtered_config.localfile = None
 
-        mock_documents = [Mock(spec=Document, id="doc1")]
+        mock_documents = [self._make_document("doc1")]
 
         # Setup mocks
         self.source_filter.filter_sources.return_value = filtered_config
-        self.orchestrator._collect_documents_from_sources = AsyncMock(
-            return_value=mock_documents
-        )
-        self.orchestrator._detect_document_changes = AsyncMock(
-            return_value=mock_documents
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=self._stream(mock_documents)
         )
+        self.orchestrator._iter_document_changes = self._all_documents_changed()
 
         mock_result = Mock()
         mock_result.successfully_processed_documents = {"doc1"}
         mock_result.success_count = 1
-        self.document_pipeline.process_documents.return_value = mock_result
+        self._consume_in_pipeline(mock_result)
         self.orchestrator._update_document_states = AsyncMock()
 
         # Execute - pass sources_config parameter
@@ -203,21 +288,40 @@ class TestPipelineOrchestrator:
         )
 
         # Verify
-        assert result == mock_documents
+        assert result == 1
         self.source_filter.filter_sources.assert_called_once_with(
             self.mock_sources_config, "git", "my-repo"
         )
-        self.orchestrator._collect_documents_from_sources.assert_called_once_with(
+        self.orchestrator._iter_documents_from_sources.assert_called_once_with(
             filtered_config, None
         )
-        self.orchestrator._detect_document_changes.assert_called_once_with(
-            mock_documents, filtered_config, None
+        self.orchestrator._update_document_states.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_process_documents_force_bypasses_change_detection(self):
+        """Test that force mode streams all documents without change detection."""
+        filtered_config = Mock(spec=SourcesConfig)
+        mock_documents = [self._make_document("doc1"), self._make_document("doc2")]
+
+        self.source_filter.filter_sources.return_value = filtered_config
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=self._stream(mock_documents)
         )
-        self.document_pipeline.process_documents.assert_called_once_with(mock_documents)
-        self.orchestrator._update_document_states.assert_called_once_with(
-            mock_documents, {"doc1"}, None
+        self.orchestrator._iter_document_changes = Mock()
+
+        mock_result = Mock()
+        mock_result.successfully_processed_documents = {"doc1", "doc2"}
+        mock_result.success_count = 2
+        self._consume_in_pipeline(mock_result)
+        self.orchestrator._update_document_states = AsyncMock()
+
+        result = await self.orchestrator.process_documents(
+            sources_config=self.mock_sources_config, force=True
         )
 
+        assert result == 2
+        self.orchestrator._iter_document_changes.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_process_documents_no_sources_found(self):
         """Test document processing when no sources are found for the specified type."""
@@ -251,7 +355,12 @@ class TestPipelineOrchestrator:
 
         # Setup mocks
         self.source_filter.filter_sources.return_value = filtered_config
-        self.orchestrator._collect_documents_from_sources = AsyncMock(return_value=[])
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=self._stream([])
+        )
+        self.orchestrator._iter_document_changes = self._all_documents_changed()
+        self._consume_in_pipeline(Mock())
+        self.orchestrator._update_document_states = AsyncMock()
 
         # Execute
         result = await self.orchestrator.process_documents(
@@ -259,23 +368,27 @@ class TestPipelineOrchestrator:
         )
 
         # Verify
-        assert result == []
-        self.orchestrator._collect_documents_from_sources.assert_called_once_with(
+        assert result == 0
+        self.orchestrator._iter_documents_from_sources.assert_called_once_with(
             filtered_config, None
         )
+        self.orchestrator._update_document_states.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_documents_no_changes_detected(self):
         """Test document processing when no changes are detected."""
-        mock_documents = [Mock(spec=Document, id="doc1")]
+        mock_documents = [self._make_document("doc1")]
         filtered_config = Mock(spec=SourcesConfig)
+        source_stream = self._stream(mock_documents)
 
         # Setup mocks
         self.source_filter.filter_sources.return_value = filtered_config
-        self.orchestrator._collect_documents_from_sources = AsyncMock(
-            return_value=mock_documents
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=source_stream
         )
-        self.orchestrator._detect_document_changes = AsyncMock(return_value=[])
+        self.orchestrator._iter_document_changes = Mock(return_value=self._stream([]))
+        self._consume_in_pipeline(Mock())
+        self.orchestrator._update_document_states = AsyncMock()
 
         # Execute
         result = await self.orchestrator.process_documents(
@@ -283,19 +396,26 @@ class TestPipelineOrchestrator:
         )
 
         # Verify
-        assert result == []
-        self.orchestrator._detect_document_changes.assert_called_once_with(
-            mock_documents, filtered_config, None
+        assert result == 0
+        self.orchestrator._iter_document_changes.assert_called_once_with(
+            filtered_config,
+            None,
+            deleted=[],
+            updated_ids=set(),
+            synced={},
+            cursors={},
         )
+        self.orchestrator._update_document_states.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_documents_exception_handling(self):
         """Test document processing exception handling."""
         filtered_config = make_rich_compatible_mock(spec=SourcesConfig)
         self.source_filter.filter_sources.return_value = filtered_config
-        self.orchestrator._collect_documents_from_sources = AsyncMock(
+        self.orchestrator._iter_documents_from_sources = Mock(
             side_effect=Exception("Collection failed")
         )
+        self.orchestrator._iter_document_changes = self._all_documents_changed()
 
         # Patch the logger to prevent Rich formatting issues during exception logging
         with patch("qdrant_loader.core.pipeline.orchestrator.logger"):
@@ -306,8 +426,43 @@ class TestPipelineOrchestrator:
                 )
 
     @pytest.mark.asyncio
-    async def test_collect_documents_from_sources_all_types(self):
-        """Test collecting documents from all source types."""
+    async def test_process_documents_stream_error_is_raised(self):
+        """Test that errors raised while streaming documents abort the run."""
+        filtered_config = make_rich_compatible_mock(spec=SourcesConfig)
+        self.source_filter.filter_sources.return_value = filtered_config
+
+        async def failing_stream():
+            yield self._make_document("doc1")
+            raise RuntimeError("Change detection failed")
+
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=failing_stream()
+        )
+        self.orchestrator._iter_document_changes = self._all_documents_changed()
+
+        async def process_documents(documents, on_documents_done=None):
+            # Mirror DocumentPipeline, which reports errors in its result
+            try:
+                async for _ in documents:
+                    pass
+            except Exception:
+                pass
+            return Mock(successfully_processed_documents=set(), success_count=0)
+
+        self.document_pipeline.process_documents.side_effect = process_documents
+        self.orchestrator._update_document_states = AsyncMock()
+
+        with patch("qdrant_loader.core.pipeline.orchestrator.logger"):
+            with pytest.raises(RuntimeError, match="Change detection failed"):
+                await self.orchestrator.process_documents(
+                    sources_config=self.mock_sources_config
+                )
+
+        self.orchestrator._update_document_states.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_iter_documents_from_sources_all_types(self):
+        """Test streaming documents from all source types."""
         # Setup filtered config with all source types
         filtered_config = Mock(spec=SourcesConfig)
         filtered_config.confluence = ["confluence_source"]
@@ -324,29 +479,34 @@ class TestPipelineOrchestrator:
         localfile_docs = [Mock(spec=Document, id="localfile_doc")]
 
         # Configure source processor mock
-        self.source_processor.process_source_type.side_effect = [
-            confluence_docs,
-            git_docs,
-            jira_docs,
-            publicdocs_docs,
-            localfile_docs,
-        ]
+        self.source_processor.iter_source_type = Mock(
+            side_effect=[
+                self._stream(confluence_docs),
+                self._stream(git_docs),
+                self._stream(jira_docs),
+                self._stream(publicdocs_docs),
+                self._stream(localfile_docs),
+            ]
+        )
 
         # Execute
-        result = await self.orchestrator._collect_documents_from_sources(
-            filtered_config, None
-        )
+        result = [
+            doc
+            async for doc in self.orchestrator._iter_documents_from_sources(
+                filtered_config, None
+            )
+        ]
 
         # Verify
         expected_docs = (
             confluence_docs + git_docs + jira_docs + publicdocs_docs + localfile_docs
         )
         assert result == expected_docs
-        assert self.source_processor.process_source_type.call_count == 5
+        assert self.source_processor.iter_source_type.call_count == 5
 
     @pytest.mark.asyncio
-    async def test_collect_documents_from_sources_selective(self):
-        """Test collecting documents from selective source types."""
+    async def test_iter_documents_from_sources_selective(self):
+        """Test streaming documents from selective source types."""
         # Setup filtered config with only git and confluence
         filtered_config = Mock(spec=SourcesConfig)
         filtered_config.confluence = ["confluence_source"]
@@ -359,24 +519,26 @@ class TestPipelineOrchestrator:
         confluence_docs = [Mock(spec=Document, id="confluence_doc")]
         git_docs = [Mock(spec=Document, id="git_doc")]
 
-        self.source_processor.process_source_type.side_effect = [
-            confluence_docs,
-            git_docs,
-        ]
+        self.source_processor.iter_source_type = Mock(
+            side_effect=[self._stream(confluence_docs), self._stream(git_docs)]
+        )
 
         # Execute
-        result = await self.orchestrator._collect_documents_from_sources(
-            filtered_config, None
-        )
+        result = [
+            doc
+            async for doc in self.orchestrator._iter_documents_from_sources(
+                filtered_config, None
+            )
+        ]
 
         # Verify
         expected_docs = confluence_docs + git_docs
         assert result == expected_docs
-        assert self.source_processor.process_source_type.call_count == 2
+        assert self.source_processor.iter_source_type.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_collect_documents_from_sources_empty(self):
-        """Test collecting documents when no sources are configured."""
+    async def test_iter_documents_from_sources_empty(self):
+        """Test streaming documents when no sources are configured."""
         # Setup filtered config with no sources
         filtered_config = Mock(spec=SourcesConfig)
         filtered_config.confluence = None
@@ -384,68 +546,149 @@ class TestPipelineOrchestrator:
         filtered_config.jira = None
         filtered_config.publicdocs = None
         filtered_config.localfile = None
+        self.source_processor.iter_source_type = Mock()
 
         # Execute
-        result = await self.orchestrator._collect_documents_from_sources(
-            filtered_config, None
-        )
+        result = [
+            doc
+            async for doc in self.orchestrator._iter_documents_from_sources(
+                filtered_config, None
+            )
+        ]
 
         # Verify
         assert result == []
-        self.source_processor.process_source_type.assert_not_called()
+        self.source_processor.iter_source_type.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_detect_document_changes_success(self):
-        """Test successful document change detection."""
-        mock_documents = cast(
-            list[Document],
-            [
-                Mock(spec=Document, id="doc1"),
-                Mock(spec=Document, id="doc2"),
-            ],
+    async def test_iter_documents_from_sources_injects_project_metadata(self):
+        """Test that project metadata is injected into streamed documents."""
+        filtered_config = Mock(spec=SourcesConfig)
+        filtered_config.confluence = None
+        filtered_config.git = ["git_source"]
+        filtered_config.jira = None
+        filtered_config.publicdocs = None
+        filtered_config.localfile = None
+
+        document = self._make_document("doc1")
+        self.source_processor.iter_source_type = Mock(
+            return_value=self._stream([document])
         )
+        project_manager = Mock()
+        project_manager.inject_project_metadata.return_value = {"project_id": "p1"}
+        self.orchestrator.project_manager = project_manager
+
+        result = [
+            doc
+            async for doc in self.orchestrator._iter_documents_from_sources(
+                filtered_config, "p1"
+            )
+        ]
+
+        assert result[0].metadata == {"project_id": "p1"}
+        project_manager.inject_project_metadata.assert_called_once_with("p1", {})
+
+    @pytest.mark.asyncio
+    async def test_iter_document_changes_success(self):
+        """Test streaming change detection yields new and updated documents."""
+        mock_documents = [
+            Mock(spec=Document, id="doc1"),
+            Mock(spec=Document, id="doc2"),
+        ]
+        deleted_document = Mock(spec=Document, id="doc3")
         filtered_config = Mock(spec=SourcesConfig)
+        source_stream = self._stream(mock_documents)
 
         # Setup state manager
         self.state_manager._initialized = False
 
         # Setup change detector mock
-        mock_change_detector = AsyncMock()
-        mock_changes = {
-            "new": [mock_documents[0]],
-            "updated": [mock_documents[1]],
-            "deleted": [],
-        }
-        mock_change_detector.detect_changes.return_value = mock_changes
+        mock_change_detector = Mock()
+        mock_change_detector.iter_changes.return_value = self._stream(
+            [
+                ("new", mock_documents[0]),
+                ("updated", mock_documents[1]),
+                ("deleted", deleted_document),
+            ]
+        )
 
         with patch(
             "qdrant_loader.core.pipeline.orchestrator.StateChangeDetector"
         ) as mock_detector_class:
-            mock_detector_class.return_value.__aenter__.return_value = (
-                mock_change_detector
+            mock_detector_class.return_value.__aenter__ = AsyncMock(
+                return_value=mock_change_detector
             )
+            mock_detector_class.return_value.__aexit__ = AsyncMock(return_value=None)
 
             # Execute
-            result = await self.orchestrator._detect_document_changes(
-                mock_documents, filtered_config, None
+            self.orchestrator._iter_documents_from_sources = Mock(
+                return_value=source_stream
             )
+            result = [
+                doc
+                async for doc in self.orchestrator._iter_document_changes(
+                    filtered_config, None
+                )
+            ]
 
             # Verify
             assert result == mock_documents  # new + updated
             self.state_manager.initialize.assert_called_once()
-            mock_change_detector.detect_changes.assert_called_once_with(
-                mock_documents, filtered_config
+            mock_change_detector.iter_changes.assert_called_once_with(
+                source_stream, filtered_config, set()
             )
 
     @pytest.mark.asyncio
-    async def test_detect_document_changes_empty_documents(self):
-        """Test document change detection with empty document list."""
-        result = await self.orchestrator._detect_document_changes([], Mock(), None)
-        assert result == []
+    async def test_iter_document_changes_passes_detector_to_sources(self):
+        """Test that connectors consult the detector while documents stream."""
+        document = Mock(spec=Document, id="doc1")
+        filtered_config = Mock(spec=SourcesConfig)
+        source_stream = self._stream([document])
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=source_stream
+        )
+
+        mock_change_detector = Mock()
+        mock_change_detector.iter_changes.return_value = self._stream(
+            [("new", document)]
+        )
+
+        with patch(
+            "qdrant_loader.core.pipeline.orchestrator.StateChangeDetector"
+        ) as mock_detector_class:
+            mock_detector_class.return_value.__aenter__ = AsyncMock(
+                return_value=mock_change_detector
+            )
+            mock_detector_class.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            result = [
+                doc
+                async for doc in self.orchestrator._iter_document_changes(
+                    filtered_config, "p1"
+                )
+            ]
+
+        assert result == [document]
+        mock_detector_class.assert_called_once_with(self.state_manager, "p1")
+        self.orchestrator._iter_documents_from_sources.assert_called_once_with(
+            filtered_config,
+            "p1",
+            fetch_filter=mock_change_detector.should_fetch,
+            sync_tracker=mock_change_detector,
+            listed_sources=set(),
+        )
+        # The detector is given the set the sources streamed to the end fill in
+        listed_sources = mock_change_detector.iter_changes.call_args.args[2]
+        assert (
+            listed_sources
+            is self.orchestrator._iter_documents_from_sources.call_args.kwargs[
+                "listed_sources"
+            ]
+        )
 
     @pytest.mark.asyncio
-    async def test_detect_document_changes_state_manager_initialized(self):
-        """Test document change detection when state manager is already initialized."""
+    async def test_iter_document_changes_state_manager_initialized(self):
+        """Test change detection when state manager is already initialized."""
         mock_documents = [Mock(spec=Document, id="doc1")]
         filtered_config = Mock(spec=SourcesConfig)
 
@@ -453,44 +696,60 @@ class TestPipelineOrchestrator:
         self.state_manager._initialized = True
 
         # Setup change detector mock
-        mock_change_detector = AsyncMock()
-        mock_changes = {"new": mock_documents, "updated": [], "deleted": []}
-        mock_change_detector.detect_changes.return_value = mock_changes
+        mock_change_detector = Mock()
+        mock_change_detector.iter_changes.return_value = self._stream(
+            [("new", mock_documents[0])]
+        )
 
         with patch(
             "qdrant_loader.core.pipeline.orchestrator.StateChangeDetector"
         ) as mock_detector_class:
-            mock_detector_class.return_value.__aenter__.return_value = (
-                mock_change_detector
+            mock_detector_class.return_value.__aenter__ = AsyncMock(
+                return_value=mock_change_detector
             )
+            mock_detector_class.return_value.__aexit__ = AsyncMock(return_value=None)
 
             # Execute
-            result = await self.orchestrator._detect_document_changes(mock_documents, filtered_config, None)  # type: ignore
+            self.orchestrator._iter_documents_from_sources = Mock(
+                return_value=self._stream(mock_documents)
+            )
+            result = [
+                doc
+                async for doc in self.orchestrator._iter_document_changes(
+                    filtered_config, None
+                )
+            ]
 
             # Verify
             assert result == mock_documents
             self.state_manager.initialize.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_detect_document_changes_exception_handling(self):
-        """Test document change detection exception handling."""
+    async def test_iter_document_changes_exception_handling(self):
+        """Test change detection exception handling."""
         mock_documents = [make_rich_compatible_mock(spec=Document, id="doc1")]
         filtered_config = make_rich_compatible_mock(spec=SourcesConfig)
+        self.orchestrator._iter_documents_from_sources = Mock(
+            return_value=self._stream(mock_documents)
+        )
 
         self.state_manager._initialized = True
 
         with patch(
             "qdrant_loader.core.pipeline.orchestrator.StateChangeDetector"
         ) as mock_detector_class:
-            mock_detector_class.return_value.__aenter__.side_effect = Exception(
-                "Change detection failed"
+            mock_detector_class.return_value.__aenter__ = AsyncMock(
+                side_effect=Exception("Change detection failed")
             )
 
             # Patch the logger to prevent Rich formatting issues during exception logging
             with patch("qdrant_loader.core.pipeline.orchestrator.logger"):
                 # Execute and verify exception
                 with pytest.raises(Exception, match="Change detection failed"):
-                    await self.orchestrator._detect_document_changes(mock_documents, filtered_config, None)  # type: ignore
+                    async for _ in self.orchestrator._iter_document_changes(
+                        filtered_config, None
+                    ):
+                        pass
 
     @pytest.mark.asyncio
     async def test_update_document_states_success(self):
@@ -515,14 +774,14 @@ class TestPipelineOrchestrator:
 
         # Verify
         self.state_manager.initialize.assert_called_once()
-        # Should update states for doc1 and doc3 only
-        assert self.state_manager.update_document_state.call_count == 2
-        updated_docs = [
-            call.args[0]
-            for call in self.state_manager.update_document_state.call_args_list
-        ]
-        updated_doc_ids = {doc.id for doc in updated_docs}
-        assert updated_doc_ids == {"doc1", "doc3"}
+        # Should update states for doc1 and doc3 only, in one bulk call
+        self.state_manager.update_document_states.assert_called_once()
+        updated_docs, project_id = (
+            self.state_manager.update_document_states.call_args.args
+        )
+        assert {doc.id for doc in updated_docs} == {"doc1", "doc3"}
+        assert project_id is None
+        self.state_manager.update_document_state.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_document_states_state_manager_initialized(self):
@@ -538,13 +797,13 @@ class TestPipelineOrchestrator:
 
         # Verify
         self.state_manager.initialize.assert_not_called()
-        self.state_manager.update_document_state.assert_called_once_with(
-            mock_documents[0], None
+        self.state_manager.update_document_states.assert_called_once_with(
+            mock_documents, None
         )
 
     @pytest.mark.asyncio
     async def test_update_document_states_partial_failure(self):
-        """Test document state updates with partial failures."""
+        """Test per-document fallback with partial failures after a bulk failure."""
         mock_documents = [
             Mock(spec=Document, id="doc1"),
             Mock(spec=Document, id="doc2"),
@@ -553,6 +812,9 @@ class TestPipelineOrchestrator:
 
         # Setup state manager
         self.state_manager._initialized = True
+        self.state_manager.update_document_states.side_effect = Exception(
+            "Bulk update failed"
+        )
 
         # Configure one update to fail
         self.state_manager.update_document_state.side_effect = [
@@ -580,4 +842,276 @@ class TestPipelineOrchestrator:
 
         # Verify no updates were attempted (but initialization was called)
         self.state_manager.update_document_state.assert_not_called()
+        self.state_manager.update_document_states.assert_not_called()
         self.state_manager.initialize.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_process_documents_deletes_stale_chunks_as_documents_finish(self):
+        """Stale chunks of updated documents are removed as each one is done."""
+        documents = [self._make_document("new"), self._make_document("updated")]
+        filtered_config = Mock(spec=SourcesConfig)
+        self.source_filter.filter_sources.return_value = filtered_config
+        qdrant_manager = AsyncMock()
+        self.components.qdrant_manager = qdrant_manager
+        self.orchestrator._update_document_states = AsyncMock()
+
+        def iter_document_changes(filtered_config, project_id, updated_ids, **_):
+            updated_ids.add("updated")
+            return self._stream(documents)
+
+        self.orchestrator._iter_document_changes = Mock(
+            side_effect=iter_document_changes
+        )
+        deleted_during_run = []
+
+        async def process_documents(documents, on_documents_done=None):
+            async for document in documents:
+                await on_documents_done([document], {document.id: {f"{document.id}-0"}})
+                deleted_during_run.append(
+                    qdrant_manager.delete_stale_chunks.await_count
+                )
+            return Mock(successfully_processed_documents=set(), success_count=2)
+
+        self.document_pipeline.process_documents.side_effect = process_documents
+
+        await self.orchestrator.process_documents(
+            sources_config=self.mock_sources_config
+        )
+
+        assert deleted_during_run == [0, 1]
+        qdrant_manager.delete_stale_chunks.assert_awaited_once_with(
+            {"updated": {"updated-0"}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_reconcile_points(self):
+        """Deleted documents lose their points and are marked as deleted."""
+        qdrant_manager = AsyncMock()
+        self.components.qdrant_manager = qdrant_manager
+        deleted = [self._make_document("gone")]
+
+        await self.orchestrator._reconcile_points(deleted)
+
+        qdrant_manager.delete_points_by_document_id.assert_awaited_once_with(["gone"])
+        self.state_manager.mark_documents_deleted.assert_awaited_once_with(deleted)
+
+    @pytest.mark.asyncio
+    async def test_record_synced_sources_skips_sources_with_failures(self):
+        """The last sync time only advances for sources without failed documents."""
+        from datetime import UTC, datetime
+
+        from qdrant_loader.config.state import IngestionStatus
+
+        started = datetime(2024, 1, 1, tzinfo=UTC)
+
+        await self.orchestrator._record_synced_sources(
+            {("git", "my-repo"): started, ("git", "other-repo"): started},
+            {("git", "other-repo")},
+            "project-a",
+            {("git", "my-repo"): "abc123", ("git", "other-repo"): "def456"},
+        )
+
+        self.state_manager.update_last_ingestion.assert_awaited_once_with(
+            "git",
+            "my-repo",
+            status=IngestionStatus.SUCCESS,
+            project_id="project-a",
+            ingested_at=started,
+            sync_cursor="abc123",
+        )
+
+
+class _Connector:
+    """Connector yielding a fixed list of documents, then an optional error."""
+
+    def __init__(self, documents, error=None, on_document=None, failed_urls=()):
+        self.documents = documents
+        self.error = error
+        self.on_document = on_document
+        self.failed_urls = failed_urls
+        self.sync_tracker = None
+
+    def set_fetch_filter(self, fetch_filter):
+        pass
+
+    def set_sync_tracker(self, sync_tracker):
+        self.sync_tracker = sync_tracker
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def iter_documents(self):
+        for document in self.documents:
+            if self.on_document:
+                self.on_document()
+            yield document
+        for url in self.failed_urls:
+            await self.sync_tracker.mark_failed("git", "repo1", url)
+        if self.error:
+            raise self.error
+
+
+class TestDeletionReconciliation:
+    """Unseen documents are only deleted for sources listed to the end."""
+
+    @pytest_asyncio.fixture
+    async def state_manager(self):
+        """Create a state manager backed by an in-memory database."""
+        from qdrant_loader.config.state import StateManagementConfig
+
+        config = Mock(spec=StateManagementConfig)
+        config.database_path = ":memory:"
+        manager = StateManager(config)
+        await manager.initialize()
+        yield manager
+        await manager.dispose()
+
+    @staticmethod
+    def _document(name: str) -> Document:
+        return Document(
+            title=name,
+            content_type="md",
+            content=f"Content of {name}",
+            metadata={},
+            source_type="git",
+            source="repo1",
+            url=f"https://example.com/{name}",
+        )
+
+    async def _run(self, state_manager, connector, shutdown_event=None):
+        """Ingest one git source whose previous run stored three documents."""
+        from qdrant_loader.config.source_config import SourceConfig
+        from qdrant_loader.core.pipeline.workers.upsert_worker import PipelineResult
+
+        await state_manager.update_document_states(
+            [self._document(name) for name in ("a", "b", "c")]
+        )
+
+        source_config = Mock(spec=SourceConfig)
+        source_config.source_type = "git"
+        source_config.source = "repo1"
+        filtered_config = Mock(spec=SourcesConfig)
+        filtered_config.git = {"repo1": source_config}
+        filtered_config.confluence = None
+        filtered_config.jira = None
+        filtered_config.publicdocs = None
+        filtered_config.localfile = None
+        source_filter = Mock(spec=SourceFilter)
+        source_filter.filter_sources.return_value = filtered_config
+
+        source_processor = SourceProcessor(shutdown_event=shutdown_event)
+        source_processor._create_connector = Mock(return_value=connector)
+
+        async def process_documents(documents, on_documents_done=None):
+            result = PipelineResult()
+            async for document in documents:
+                result.successfully_processed_documents.add(document.id)
+                await on_documents_done([document], {document.id: set()})
+            return result
+
+        document_pipeline = AsyncMock(spec=DocumentPipeline)
+        document_pipeline.process_documents.side_effect = process_documents
+        qdrant_manager = AsyncMock()
+        orchestrator = PipelineOrchestrator(
+            Mock(spec=Settings),
+            PipelineComponents(
+                document_pipeline=document_pipeline,
+                source_processor=source_processor,
+                source_filter=source_filter,
+                state_manager=state_manager,
+                qdrant_manager=qdrant_manager,
+            ),
+        )
+        orchestrator._update_document_states = AsyncMock()
+        orchestrator._record_synced_sources = AsyncMock()
+
+        # Patch the logger to prevent Rich formatting issues during exception logging
+        with patch("qdrant_loader.core.pipeline.source_processor.logger"):
+            await orchestrator.process_documents(
+                sources_config=Mock(spec=SourcesConfig)
+            )
+        return qdrant_manager
+
+    async def _live_urls(self, state_manager):
+        records = await state_manager.get_document_state_records_by_url(
+            "git",
+            "repo1",
+            [f"https://example.com/{name}" for name in ("a", "b", "c")],
+        )
+        return sorted(record.url for record in records)
+
+    @pytest.mark.asyncio
+    async def test_connector_failing_part_way_deletes_nothing(self, state_manager):
+        """A source that raises after some documents keeps its unseen documents."""
+        connector = _Connector(
+            [self._document("a")], error=RuntimeError("Authentication failed")
+        )
+
+        qdrant_manager = await self._run(state_manager, connector)
+
+        qdrant_manager.delete_points_by_document_id.assert_not_awaited()
+        assert len(await self._live_urls(state_manager)) == 3
+
+    @pytest.mark.asyncio
+    async def test_all_sources_failing_deletes_nothing(self, state_manager):
+        """A run in which every source fails deletes nothing."""
+        connector = _Connector([], error=RuntimeError("Connection refused"))
+
+        qdrant_manager = await self._run(state_manager, connector)
+
+        qdrant_manager.delete_points_by_document_id.assert_not_awaited()
+        assert len(await self._live_urls(state_manager)) == 3
+
+    @pytest.mark.asyncio
+    async def test_shutdown_part_way_deletes_nothing(self, state_manager):
+        """A source stopped by a shutdown request keeps its unseen documents."""
+        shutdown_event = asyncio.Event()
+        streamed: list[bool] = []
+
+        def on_document():
+            # Shut down once the first document has been streamed
+            if streamed:
+                shutdown_event.set()
+            streamed.append(True)
+
+        connector = _Connector(
+            [self._document("a"), self._document("b")], on_document=on_document
+        )
+
+        qdrant_manager = await self._run(state_manager, connector, shutdown_event)
+
+        qdrant_manager.delete_points_by_document_id.assert_not_awaited()
+        assert len(await self._live_urls(state_manager)) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_item_is_not_deleted(self, state_manager):
+        """An item a connector failed to fetch keeps its points and state."""
+        connector = _Connector(
+            [self._document("a")], failed_urls=["https://example.com/b"]
+        )
+
+        qdrant_manager = await self._run(state_manager, connector)
+
+        deleted_ids = qdrant_manager.delete_points_by_document_id.call_args.args[0]
+        assert deleted_ids == [self._document("c").id]
+        assert await self._live_urls(state_manager) == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_source_listed_to_the_end_deletes_unseen(self, state_manager):
+        """A source listed to the end has its unseen documents deleted."""
+        connector = _Connector([self._document("a")])
+
+        qdrant_manager = await self._run(state_manager, connector)
+
+        qdrant_manager.delete_points_by_document_id.assert_awaited_once()
+        deleted_ids = qdrant_manager.delete_points_by_document_id.call_args.args[0]
+        assert sorted(deleted_ids) == sorted(
+            self._document(name).id for name in ("b", "c")
+        )
+        assert await self._live_urls(state_manager) == ["https://example.com/a"]
@@ -421,3 +421,126 @@ class TestSourceProcessor:
 
         # Check info logging
         assert any("git: 2 documents from 1 sources" in msg for msg in info_calls)
+
+    @pytest.mark.asyncio
+    async def test_iter_source_type_streams_documents(self, sample_documents):
+        """Test streaming documents from multiple sources."""
+        processor = SourceProcessor()
+
+        connectors = []
+
+        def create_connector(config):
+            connector = MockConnector(config)
+            connector._documents = sample_documents
+            connectors.append(connector)
+            return connector
+
+        source_configs = {
+            "source_1": MagicMock(spec=SourceConfig),
+            "source_2": MagicMock(spec=SourceConfig),
+        }
+
+        result = [
+            doc
+            async for doc in processor.iter_source_type(
+                source_configs, MagicMock(side_effect=create_connector), "test_type"
+            )
+        ]
+
+        assert result == sample_documents + sample_documents
+        assert len(connectors) == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_source_type_passes_change_detection_hooks(
+        self, sample_documents
+    ):
+        """Test that connectors receive the fetch filter and sync tracker."""
+        processor = SourceProcessor()
+        fetch_filter = MagicMock(return_value=True)
+        sync_tracker = MagicMock()
+        listed_sources: set[tuple[str, str]] = set()
+        source_config = MagicMock(spec=SourceConfig)
+        source_config.source_type = "test_type"
+        source_config.source = "source_1"
+        connectors = []
+
+        def create_connector(config):
+            connector = MockConnector(config)
+            connector._documents = sample_documents
+            connectors.append(connector)
+            return connector
+
+        async for _ in processor.iter_source_type(
+            {"source_1": source_config},
+            MagicMock(side_effect=create_connector),
+            "test_type",
+            fetch_filter=fetch_filter,
+            sync_tracker=sync_tracker,
+            listed_sources=listed_sources,
+        ):
+            pass
+
+        assert connectors[0]._fetch_filter is fetch_filter
+        assert connectors[0]._sync_tracker is sync_tracker
+        assert listed_sources == {("test_type", "source_1")}
+
+    @pytest.mark.asyncio
+    async def test_iter_source_type_continues_after_failure(self, sample_documents):
+        """Test that a source failing mid-stream does not stop other sources."""
+        processor = SourceProcessor()
+
+        class FailingConnector(MockConnector):
+            async def iter_documents(self):
+                yield sample_documents[0]
+                raise Exception("Connection lost")
+
+        def create_connector(config):
+            if config is failing_config:
+                return FailingConnector(config)
+            connector = MockConnector(config)
+            connector._documents = [sample_documents[1]]
+            return connector
+
+        failing_config = MagicMock(spec=SourceConfig)
+        source_configs = {
+            "bad_source": failing_config,
+            "good_source": MagicMock(spec=SourceConfig),
+        }
+
+        with patch(
+            "qdrant_loader.core.pipeline.source_processor.logger"
+        ) as mock_logger:
+            result = [
+                doc
+                async for doc in processor.iter_source_type(
+                    source_configs,
+                    MagicMock(side_effect=create_connector),
+                    "test_type",
+                )
+            ]
+
+        assert result == sample_documents
+        mock_logger.error.assert_called_once()
+        assert "bad_source" in str(mock_logger.error.call_args[0][0])
+
+    @pytest.mark.asyncio
+    async def test_iter_source_type_stops_on_shutdown(
+        self, mock_source_config, sample_documents
+    ):
+        """Test that streaming stops once shutdown is requested."""
+        shutdown_event = asyncio.Event()
+        processor = SourceProcessor(shutdown_event=shutdown_event)
+
+        connector = MockConnector(mock_source_config)
+        connector._documents = sample_documents
+
+        result = []
+        async for doc in processor.iter_source_type(
+            {"test_source": mock_source_config},
+            MagicMock(return_value=connector),
+            "test_type",
+        ):
+            result.append(doc)
+            shutdown_event.set()
+
+        assert result == sample_documents[:1]
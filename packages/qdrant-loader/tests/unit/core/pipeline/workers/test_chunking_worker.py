@@ -479,3 +479,75 @@ class TestChunkingWorker:
             # but overall trend should be increasing
             if timeouts[i + 1] < 600.0:  # Not at cap (updated to match new max)
                 assert timeouts[i + 1] >= timeouts[i] * 0.8  # Allow some variation
+
+    @pytest.mark.asyncio
+    async def test_process_documents_from_async_stream(self):
+        """Test chunking documents that arrive from an async stream."""
+        docs = [
+            self.create_test_document(doc_id=f"doc{i}", content=f"Content {i}")
+            for i in range(3)
+        ]
+
+        async def stream():
+            for doc in docs:
+                yield doc
+
+        with patch.object(self.worker, "process") as mock_process:
+            mock_process.side_effect = lambda doc: [f"{doc.content} chunk"]
+
+            result_chunks = [
+                chunk async for chunk in self.worker.process_documents(stream())
+            ]
+
+        assert sorted(result_chunks) == [
+            "Content 0 chunk",
+            "Content 1 chunk",
+            "Content 2 chunk",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_process_documents_pulls_source_lazily(self):
+        """Test that a slow consumer stops the source from being drained."""
+        worker = ChunkingWorker(
+            chunking_service=self.chunking_service,
+            chunk_executor=self.chunk_executor,
+            max_workers=2,
+            queue_size=2,
+            shutdown_event=self.shutdown_event,
+        )
+        pulled = 0
+
+        async def stream():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield self.create_test_document(content=f"Content {i}")
+
+        with patch.object(worker, "process") as mock_process:
+            mock_process.side_effect = lambda doc: [doc.content]
+
+            chunks = worker.process_documents(stream())
+            assert await anext(chunks) == "Content 0"
+            await asyncio.sleep(0.05)
+
+            # Bounded by the chunking slots plus the result queue
+            assert pulled <= 2 + 2 + 2
+            await chunks.aclose()
+
+    @pytest.mark.asyncio
+    async def test_process_documents_stream_error_propagates(self):
+        """Test that errors raised by the document source reach the consumer."""
+
+        async def stream():
+            yield self.create_test_document(doc_id="doc1")
+            raise RuntimeError("source failed")
+
+        with patch.object(self.worker, "process") as mock_process:
+            mock_process.return_value = ["chunk"]
+
+            result_chunks = []
+            with pytest.raises(RuntimeError, match="source failed"):
+                async for chunk in self.worker.process_documents(stream()):
+                    result_chunks.append(chunk)
+
+        assert result_chunks == ["chunk"]
@@ -231,6 +231,43 @@ class TestEmbeddingWorker:
         # Verify embedding service was called 3 times (for 3 batches)
         assert self.mock_embedding_service.get_embeddings.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_process_chunks_follows_adaptive_batcher(self):
+        """Batch size comes from the adaptive batcher when it is enabled."""
+        from qdrant_loader.config.embedding import AdaptiveBatchingConfig
+        from qdrant_loader.core.embedding.adaptive_batcher import AdaptiveBatcher
+
+        batcher = AdaptiveBatcher(
+            AdaptiveBatchingConfig(enabled=True, max_concurrency=8), batch_size=3
+        )
+        self.mock_embedding_service.batcher = batcher
+        self.mock_embedding_service.get_embeddings = AsyncMock(
+            side_effect=lambda contents: [[0.1] for _ in contents]
+        )
+        worker = EmbeddingWorker(
+            embedding_service=self.mock_embedding_service,
+            max_workers=4,
+            shutdown_event=self.mock_shutdown_event,
+        )
+        assert batcher.concurrency == 4
+        assert worker.semaphore._value == 8
+
+        chunks = []
+        for i in range(7):
+            chunk = Mock()
+            chunk.content = f"Test content {i}"
+            chunks.append(chunk)
+
+        async def chunk_iterator():
+            for chunk in chunks:
+                yield chunk
+
+        results = [result async for result in worker.process_chunks(chunk_iterator())]
+
+        assert len(results) == 7
+        # 3 + 3 + 1 instead of the service's fixed batch size of 10
+        assert self.mock_embedding_service.get_embeddings.call_count == 3
+
     @pytest.mark.asyncio
     async def test_process_chunks_with_shutdown_during_iteration(self):
         """Test chunk processing with shutdown during iteration."""
@@ -258,11 +295,18 @@ class TestEmbeddingWorker:
         # Set batch size to 1 to process chunks individually
         self.mock_embedding_service.batch_size = 1
 
+        # A window of one request makes each batch complete before the next pull
+        worker = EmbeddingWorker(
+            embedding_service=self.mock_embedding_service,
+            max_workers=1,
+            shutdown_event=self.mock_shutdown_event,
+        )
+
         with patch(
             "qdrant_loader.core.pipeline.workers.embedding_worker.prometheus_metrics"
         ):
             results = []
-            async for result in self.embedding_worker.process_chunks(chunk_iterator()):
+            async for result in worker.process_chunks(chunk_iterator()):
                 results.append(result)
 
         # Should only get result for first chunk before shutdown
@@ -418,3 +462,138 @@ class TestEmbeddingWorker:
 
         # Verify embedding service was not called
         self.mock_embedding_service.get_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_chunks_keeps_batches_in_flight(self):
+        """Test that up to max_workers batches are embedded concurrently."""
+        chunks = []
+        for i in range(8):
+            mock_chunk = Mock()
+            mock_chunk.content = f"Test content {i}"
+            mock_chunk.id = f"chunk{i}"
+            chunks.append(mock_chunk)
+
+        async def chunk_iterator():
+            for chunk in chunks:
+                yield chunk
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_embeddings_side_effect(contents):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[float(c.split()[-1])] for c in contents]
+
+        self.mock_embedding_service.get_embeddings = AsyncMock(
+            side_effect=get_embeddings_side_effect
+        )
+        self.mock_embedding_service.batch_size = 1
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.embedding_worker.prometheus_metrics"
+        ):
+            results = []
+            async for result in self.embedding_worker.process_chunks(chunk_iterator()):
+                results.append(result)
+
+        assert max_in_flight == 4
+        # Results are yielded in input order by default
+        assert [chunk.id for chunk, _ in results] == [c.id for c in chunks]
+        assert [embedding for _, embedding in results] == [[float(i)] for i in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_process_chunks_applies_backpressure(self):
+        """Test that upstream chunks are not pulled while the window is full."""
+        pulled = 0
+
+        async def chunk_iterator():
+            nonlocal pulled
+            for i in range(10):
+                mock_chunk = Mock()
+                mock_chunk.content = f"Test content {i}"
+                mock_chunk.id = f"chunk{i}"
+                pulled += 1
+                yield mock_chunk
+
+        release = asyncio.Event()
+        pulled_when_blocked = None
+
+        async def get_embeddings_side_effect(contents):
+            nonlocal pulled_when_blocked
+            if pulled_when_blocked is None:
+                await asyncio.sleep(0.01)
+                pulled_when_blocked = pulled
+                release.set()
+            await release.wait()
+            return [[0.0] for _ in contents]
+
+        self.mock_embedding_service.get_embeddings = AsyncMock(
+            side_effect=get_embeddings_side_effect
+        )
+        self.mock_embedding_service.batch_size = 1
+
+        worker = EmbeddingWorker(
+            embedding_service=self.mock_embedding_service,
+            max_workers=2,
+            shutdown_event=self.mock_shutdown_event,
+        )
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.embedding_worker.prometheus_metrics"
+        ):
+            results = [
+                result async for result in worker.process_chunks(chunk_iterator())
+            ]
+
+        assert len(results) == 10
+        # Only the two in-flight batches had been pulled while the first was pending
+        assert pulled_when_blocked == 2
+
+    @pytest.mark.asyncio
+    async def test_process_chunks_completion_order(self):
+        """Test yielding results in completion order when order is not preserved."""
+        chunks = []
+        for i in range(3):
+            mock_chunk = Mock()
+            mock_chunk.content = f"Test content {i}"
+            mock_chunk.id = f"chunk{i}"
+            chunks.append(mock_chunk)
+
+        async def chunk_iterator():
+            for chunk in chunks:
+                yield chunk
+
+        delays = {
+            "Test content 0": 0.05,
+            "Test content 1": 0.01,
+            "Test content 2": 0.03,
+        }
+
+        async def get_embeddings_side_effect(contents):
+            await asyncio.sleep(delays[contents[0]])
+            return [[0.0] for _ in contents]
+
+        self.mock_embedding_service.get_embeddings = AsyncMock(
+            side_effect=get_embeddings_side_effect
+        )
+        self.mock_embedding_service.batch_size = 1
+
+        worker = EmbeddingWorker(
+            embedding_service=self.mock_embedding_service,
+            max_workers=4,
+            shutdown_event=self.mock_shutdown_event,
+            preserve_order=False,
+        )
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.embedding_worker.prometheus_metrics"
+        ):
+            results = [
+                result async for result in worker.process_chunks(chunk_iterator())
+            ]
+
+        assert [chunk.id for chunk, _ in results] == ["chunk1", "chunk2", "chunk0"]
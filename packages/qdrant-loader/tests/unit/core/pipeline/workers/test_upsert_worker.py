@@ -243,6 +243,31 @@ class TestUpsertWorker:
         point = points[0]
         assert point.payload["document_id"] == "chunk1"
 
+    @pytest.mark.asyncio
+    async def test_process_float32_array_embedding(self):
+        """Test that float32 array embeddings are sent to Qdrant as lists."""
+        np = pytest.importorskip("numpy")
+        mock_chunk = Mock()
+        mock_chunk.id = "chunk1"
+        mock_chunk.content = "Test content"
+        mock_chunk.source = "test_source"
+        mock_chunk.source_type = "test"
+        mock_chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        mock_chunk.metadata = {}
+
+        embedding = np.array([0.5, -0.25], dtype=np.float32)
+        batch = [(mock_chunk, embedding)]
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            result = await self.upsert_worker.process(batch)
+
+        assert result[0] == 1
+        point = self.mock_qdrant_manager.upsert_points.call_args[0][0][0]
+        assert point.vector == [0.5, -0.25]
+        assert type(point.vector[0]) is float
+
     @pytest.mark.asyncio
     async def test_process_upsert_exception(self):
         """Test processing with upsert exception."""
@@ -586,3 +611,245 @@ class TestUpsertWorker:
 
         # Verify qdrant_manager.upsert_points was called twice (one full batch + one final batch)
         assert self.mock_qdrant_manager.upsert_points.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_concurrent_batches(self):
+        """Test that up to max_workers upsert batches run concurrently."""
+        chunks = []
+        for i in range(8):
+            mock_chunk = Mock()
+            mock_chunk.id = f"chunk{i}"
+            mock_chunk.content = f"Test content {i}"
+            mock_chunk.source = "test_source"
+            mock_chunk.source_type = "test"
+            mock_chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+            mock_chunk.metadata = {"parent_document": Mock(id=f"doc{i}")}
+            chunks.append(mock_chunk)
+
+        async def embedded_chunks_iterator():
+            for chunk in chunks:
+                yield (chunk, [0.1, 0.2, 0.3])
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def upsert_side_effect(points, wait=True):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        self.mock_qdrant_manager.upsert_points.side_effect = upsert_side_effect
+        self.upsert_worker.batch_size = 1
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            result = await self.upsert_worker.process_embedded_chunks(
+                embedded_chunks_iterator()
+            )
+
+        assert max_in_flight == 4
+        assert result.success_count == 8
+        assert result.successfully_processed_documents == {f"doc{i}" for i in range(8)}
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_without_wait_confirms_upserts(self):
+        """Test that upserts sent with wait=False are confirmed by barriers."""
+        chunks = []
+        for chunk_id, doc_id in [("chunk1", "doc1"), ("chunk2", "doc2")]:
+            chunk = Mock()
+            chunk.id = chunk_id
+            chunk.content = "Test content"
+            chunk.source = "test_source"
+            chunk.source_type = "test"
+            chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+            chunk.metadata = {"parent_document": Mock(id=doc_id)}
+            chunks.append(chunk)
+
+        async def embedded_chunks_iterator():
+            for chunk in chunks:
+                yield (chunk, [0.1, 0.2, 0.3])
+
+        # The barrier after the first batch succeeds, the second times out
+        self.mock_qdrant_manager.wait_for_updates = AsyncMock(
+            side_effect=[None, TimeoutError()]
+        )
+        worker = UpsertWorker(
+            qdrant_manager=self.mock_qdrant_manager,
+            batch_size=1,
+            shutdown_event=self.mock_shutdown_event,
+            wait=False,
+        )
+
+        with (
+            patch(
+                "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+            ),
+            patch(
+                "qdrant_loader.core.pipeline.workers.upsert_worker._CONFIRM_EVERY_BATCHES",
+                1,
+            ),
+        ):
+            result = await worker.process_embedded_chunks(embedded_chunks_iterator())
+
+        for call in self.mock_qdrant_manager.upsert_points.call_args_list:
+            assert call.kwargs["wait"] is False
+        assert self.mock_qdrant_manager.wait_for_updates.await_count == 2
+        assert result.success_count == 1
+        assert result.error_count == 1
+        assert result.successfully_processed_documents == {"doc1"}
+        assert result.failed_document_ids == {"doc2"}
+        assert result.errors == ["Upserts of 1 chunks not confirmed: TimeoutError()"]
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_reports_chunk_ids_of_done_documents(self):
+        """Point ids are reported with their document; failed documents are not."""
+        documents = {doc_id: Mock(id=doc_id) for doc_id in ("doc1", "doc2")}
+        chunks = []
+        for chunk_id, doc_id in [("c1", "doc1"), ("c2", "doc1"), ("c3", "doc2")]:
+            chunk = Mock()
+            chunk.id = chunk_id
+            chunk.content = "Test content"
+            chunk.source = "test_source"
+            chunk.source_type = "test"
+            chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+            chunk.metadata = {"parent_document": documents[doc_id]}
+            chunks.append(chunk)
+
+        async def embedded_chunks_iterator():
+            for chunk in chunks:
+                yield (chunk, [0.1, 0.2, 0.3])
+
+        async def upsert_points(points, wait=True):
+            if points[0].id == "c2":
+                raise Exception("Upsert failed")
+
+        reported = {}
+
+        async def on_documents_done(done, chunk_ids):
+            reported.update(chunk_ids)
+
+        self.mock_qdrant_manager.upsert_points.side_effect = upsert_points
+        self.upsert_worker.batch_size = 1
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            result = await self.upsert_worker.process_embedded_chunks(
+                embedded_chunks_iterator(),
+                chunk_counts={"doc1": 2, "doc2": 1},
+                on_documents_done=on_documents_done,
+            )
+
+        assert reported == {"doc2": {"c3"}}
+        assert result.failed_document_ids == {"doc1"}
+        assert self.upsert_worker._chunk_ids_by_document == {}
+        payload_document_ids = {
+            call.args[0][0].payload["document_id"]
+            for call in self.mock_qdrant_manager.upsert_points.call_args_list
+        }
+        assert payload_document_ids == {"doc1", "doc2"}
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_reports_done_documents(self):
+        """Documents are reported once all their chunks are upserted."""
+        documents = {doc_id: Mock(id=doc_id) for doc_id in ("doc1", "doc2", "doc3")}
+        chunks = []
+        for chunk_id, doc_id in [
+            ("c1", "doc1"),
+            ("c2", "doc1"),
+            ("c3", "doc2"),
+            ("c4", "doc3"),
+        ]:
+            chunk = Mock()
+            chunk.id = chunk_id
+            chunk.content = "Test content"
+            chunk.source = "test_source"
+            chunk.source_type = "test"
+            chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+            chunk.metadata = {"parent_document": documents[doc_id]}
+            chunks.append(chunk)
+
+        async def embedded_chunks_iterator():
+            for chunk in chunks:
+                yield (chunk, [0.1, 0.2, 0.3])
+
+        async def upsert_points(points, wait=True):
+            if points[0].id == "c3":
+                raise Exception("Upsert failed")
+
+        reported = []
+
+        async def on_documents_done(done, chunk_ids):
+            assert set(chunk_ids) == {doc.id for doc in done}
+            reported.append([doc.id for doc in done])
+
+        self.mock_qdrant_manager.upsert_points.side_effect = upsert_points
+        self.upsert_worker.batch_size = 1
+        self.upsert_worker.max_workers = 1
+        chunk_counts = {"doc1": 2, "doc2": 1, "doc3": 1}
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            await self.upsert_worker.process_embedded_chunks(
+                embedded_chunks_iterator(),
+                chunk_counts=chunk_counts,
+                on_documents_done=on_documents_done,
+            )
+
+        # doc2 failed; doc1 is reported after its second chunk, not its first
+        assert reported == [["doc1"], ["doc3"]]
+        assert chunk_counts == {"doc2": 1}
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_without_wait_reports_after_barrier(self):
+        """With wait=False, documents are reported once their points are confirmed."""
+        documents = {doc_id: Mock(id=doc_id) for doc_id in ("doc1", "doc2")}
+        for document in documents.values():
+            document.model_copy.return_value = Mock(id=document.id, content="")
+        chunks = []
+        for chunk_id, doc_id in [("c1", "doc1"), ("c2", "doc2")]:
+            chunk = Mock()
+            chunk.id = chunk_id
+            chunk.content = "Test content"
+            chunk.source = "test_source"
+            chunk.source_type = "test"
+            chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+            chunk.metadata = {"parent_document": documents[doc_id]}
+            chunks.append(chunk)
+
+        async def embedded_chunks_iterator():
+            for chunk in chunks:
+                yield (chunk, [0.1, 0.2, 0.3])
+
+        reported = []
+
+        async def on_documents_done(done, chunk_ids):
+            assert self.mock_qdrant_manager.wait_for_updates.await_count == 1
+            reported.extend(done)
+
+        self.mock_qdrant_manager.wait_for_updates = AsyncMock()
+        worker = UpsertWorker(
+            qdrant_manager=self.mock_qdrant_manager,
+            batch_size=1,
+            shutdown_event=self.mock_shutdown_event,
+            wait=False,
+        )
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            await worker.process_embedded_chunks(
+                embedded_chunks_iterator(),
+                chunk_counts={"doc1": 1, "doc2": 1},
+                on_documents_done=on_documents_done,
+            )
+
+        # Only content-free copies are kept until the barrier
+        assert [(doc.id, doc.content) for doc in reported] == [
+            ("doc1", ""),
+            ("doc2", ""),
+        ]
@@ -4,8 +4,11 @@ from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from pydantic import ValidationError
+from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.config.sources import SourcesConfig
+from qdrant_loader.config.state import StateManagementConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.state.exceptions import InvalidDocumentStateError
 from qdrant_loader.core.state.state_change_detector import (
@@ -15,6 +18,24 @@ from qdrant_loader.core.state.state_change_detector import (
 from qdrant_loader.core.state.state_manager import DocumentStateRecord, StateManager
 
 
+def _source_config(source_type: str, source: str) -> MagicMock:
+    config = MagicMock(spec=SourceConfig)
+    config.source_type = source_type
+    config.source = source
+    return config
+
+
+async def _store(state_manager: StateManager, records: list[DocumentStateRecord]):
+    """Store previous document states."""
+    now = datetime(2023, 1, 1, tzinfo=UTC)
+    async with state_manager._session_factory() as session:
+        for record in records:
+            record.title = record.title or record.document_id
+            record.created_at = record.created_at or now
+            session.add(record)
+        await session.commit()
+
+
 class TestDocumentState:
     """Test cases for DocumentState model."""
 
@@ -76,6 +97,16 @@ class TestStateChangeDetector:
         """Create a mock state manager."""
         return MagicMock(spec=StateManager)
 
+    @pytest_asyncio.fixture
+    async def state_manager(self):
+        """Create a state manager backed by an in-memory database."""
+        config = MagicMock(spec=StateManagementConfig)
+        config.database_path = ":memory:"
+        manager = StateManager(config)
+        await manager.initialize()
+        yield manager
+        await manager.dispose()
+
     @pytest.fixture
     def sample_documents(self):
         """Create sample documents for testing."""
@@ -110,7 +141,7 @@ class TestStateChangeDetector:
     def filtered_config(self):
         """Create a filtered config for testing."""
         config = MagicMock(spec=SourcesConfig)
-        config.git = {"repo1": MagicMock()}
+        config.git = {"repo1": _source_config("git", "repo1")}
         config.confluence = None
         config.jira = None
         config.publicdocs = None
@@ -167,14 +198,12 @@ class TestStateChangeDetector:
 
     @pytest.mark.asyncio
     async def test_detect_changes_new_documents(
-        self, mock_state_manager, sample_documents, filtered_config
+        self, state_manager, sample_documents, filtered_config
     ):
         """Test detecting new documents."""
-        detector = StateChangeDetector(mock_state_manager)
-
-        # Mock state manager to return no previous states
-        mock_state_manager.get_document_state_records.return_value = []
+        detector = StateChangeDetector(state_manager)
 
+        # No previous states are stored
         async with detector:
             with patch.object(detector, "logger") as mock_logger:
                 result = await detector.detect_changes(
@@ -192,10 +221,10 @@ class TestStateChangeDetector:
 
     @pytest.mark.asyncio
     async def test_detect_changes_updated_documents(
-        self, mock_state_manager, sample_documents, filtered_config
+        self, state_manager, sample_documents, filtered_config
     ):
         """Test detecting updated documents."""
-        detector = StateChangeDetector(mock_state_manager)
+        detector = StateChangeDetector(state_manager)
 
         # Create previous state with different hash
         previous_record = DocumentStateRecord(
@@ -207,7 +236,7 @@ class TestStateChangeDetector:
             updated_at=datetime(2022, 12, 31, tzinfo=UTC),  # Earlier date
         )
 
-        mock_state_manager.get_document_state_records.return_value = [previous_record]
+        await _store(state_manager, [previous_record])
 
         async with detector:
             result = await detector.detect_changes(sample_documents, filtered_config)
@@ -221,10 +250,10 @@ class TestStateChangeDetector:
 
     @pytest.mark.asyncio
     async def test_detect_changes_deleted_documents(
-        self, mock_state_manager, sample_documents, filtered_config
+        self, state_manager, sample_documents, filtered_config
     ):
         """Test detecting deleted documents."""
-        detector = StateChangeDetector(mock_state_manager)
+        detector = StateChangeDetector(state_manager)
 
         # Create previous state for a document not in current documents
         previous_record = DocumentStateRecord(
@@ -236,7 +265,7 @@ class TestStateChangeDetector:
             updated_at=datetime(2023, 1, 1, tzinfo=UTC),
         )
 
-        mock_state_manager.get_document_state_records.return_value = [previous_record]
+        await _store(state_manager, [previous_record])
 
         async with detector:
             result = await detector.detect_changes(sample_documents, filtered_config)
@@ -250,13 +279,15 @@ class TestStateChangeDetector:
         assert deleted_doc.title == "Deleted Document"
         assert deleted_doc.content == ""
         assert deleted_doc.url == "http://example.com/deleted_doc"
+        # The stored id, so the document's points can be deleted
+        assert deleted_doc.id == "deleted_doc"
 
     @pytest.mark.asyncio
     async def test_detect_changes_no_changes(
-        self, mock_state_manager, sample_documents, filtered_config
+        self, state_manager, sample_documents, filtered_config
     ):
         """Test when no changes are detected."""
-        detector = StateChangeDetector(mock_state_manager)
+        detector = StateChangeDetector(state_manager)
 
         # Get the actual content hashes from the sample documents
         doc1_hash = sample_documents[0].content_hash
@@ -282,7 +313,7 @@ class TestStateChangeDetector:
             ),
         ]
 
-        mock_state_manager.get_document_state_records.return_value = previous_records
+        await _store(state_manager, previous_records)
 
         async with detector:
             result = await detector.detect_changes(sample_documents, filtered_config)
@@ -427,75 +458,71 @@ class TestStateChangeDetector:
         assert uri == "git:repo1:http%3A%2F%2Fexample.com%2Fdoc"
 
     @pytest.mark.asyncio
-    async def test_get_previous_states_multiple_sources(self, mock_state_manager):
-        """Test _get_previous_states with multiple source types."""
-        detector = StateChangeDetector(mock_state_manager)
+    async def test_iter_changes_reports_unseen_states_of_each_source(
+        self, state_manager
+    ):
+        """Deletions are found per configured source with an anti-join."""
+        detector = StateChangeDetector(state_manager)
 
         # Create config with multiple source types
         config = MagicMock(spec=SourcesConfig)
-        config.git = {"repo1": MagicMock()}
-        config.confluence = {"space1": MagicMock()}
+        config.git = {"repo1": _source_config("git", "repo1")}
+        config.confluence = {"space1": _source_config("confluence", "space1")}
         config.jira = None
         config.publicdocs = None
         config.localfile = None
 
-        # Mock different records for each source type
-        git_record = DocumentStateRecord(
+        updated_at = datetime(2023, 1, 1, tzinfo=UTC)
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url="http://git.com/doc/",
+                    source="repo1",
+                    source_type="git",
+                    document_id="git_doc",
+                    content_hash="git_hash",
+                    updated_at=updated_at,
+                ),
+                DocumentStateRecord(
+                    url="http://confluence.com/doc",
+                    source="space1",
+                    source_type="confluence",
+                    document_id="conf_doc",
+                    content_hash="conf_hash",
+                    updated_at=updated_at,
+                ),
+                DocumentStateRecord(
+                    url="http://other.com/doc",
+                    source="other",
+                    source_type="git",
+                    document_id="other_doc",
+                    content_hash="other_hash",
+                    updated_at=updated_at,
+                ),
+            ],
+        )
+        current = Document(
+            content="Git doc",
             url="http://git.com/doc",
-            source="repo1",
+            content_type="md",
             source_type="git",
-            document_id="git_doc",
-            content_hash="git_hash",
-            updated_at=datetime(2023, 1, 1, tzinfo=UTC),
-        )
-
-        confluence_record = DocumentStateRecord(
-            url="http://confluence.com/doc",
-            source="space1",
-            source_type="confluence",
-            document_id="conf_doc",
-            content_hash="conf_hash",
-            updated_at=datetime(2023, 1, 2, tzinfo=UTC),
+            source="repo1",
+            title="Git doc",
+            metadata={},
         )
 
-        mock_state_manager.get_document_state_records.side_effect = [
-            [git_record],  # For git source
-            [confluence_record],  # For confluence source
-        ]
-
         async with detector:
-            states = await detector._get_previous_states(config)
+            result = await detector.detect_changes([current], config)
 
-        assert len(states) == 2
-        assert states[0].uri == "git:repo1:http%3A%2F%2Fgit.com%2Fdoc"
-        assert states[1].uri == "confluence:space1:http%3A%2F%2Fconfluence.com%2Fdoc"
+        # The trailing slash does not matter; unconfigured sources are ignored
+        assert [doc.url for doc in result["updated"]] == ["http://git.com/doc"]
+        assert [doc.url for doc in result["deleted"]] == ["http://confluence.com/doc"]
 
     @pytest.mark.asyncio
-    async def test_get_previous_states_empty_config(self, mock_state_manager):
-        """Test _get_previous_states with empty config."""
-        detector = StateChangeDetector(mock_state_manager)
-
-        config = MagicMock(spec=SourcesConfig)
-        config.git = None
-        config.confluence = None
-        config.jira = None
-        config.publicdocs = None
-        config.localfile = None
-
-        async with detector:
-            states = await detector._get_previous_states(config)
-
-        assert states == []
-        mock_state_manager.get_document_state_records.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_detect_changes_empty_documents(
-        self, mock_state_manager, filtered_config
-    ):
+    async def test_detect_changes_empty_documents(self, state_manager, filtered_config):
         """Test detect_changes with empty document list."""
-        detector = StateChangeDetector(mock_state_manager)
-
-        mock_state_manager.get_document_state_records.return_value = []
+        detector = StateChangeDetector(state_manager)
 
         async with detector:
             with patch.object(detector, "logger") as mock_logger:
@@ -511,12 +538,10 @@ class TestStateChangeDetector:
 
     @pytest.mark.asyncio
     async def test_detect_changes_logging(
-        self, mock_state_manager, sample_documents, filtered_config
+        self, state_manager, sample_documents, filtered_config
     ):
         """Test that detect_changes logs appropriate information."""
-        detector = StateChangeDetector(mock_state_manager)
-
-        mock_state_manager.get_document_state_records.return_value = []
+        detector = StateChangeDetector(state_manager)
 
         async with detector:
             with patch.object(detector, "logger") as mock_logger:
@@ -527,3 +552,528 @@ class TestStateChangeDetector:
 
         assert any("Starting change detection" in msg for msg in info_calls)
         assert any("Change detection completed" in msg for msg in info_calls)
+
+    @pytest.mark.asyncio
+    async def test_iter_changes_yields_as_documents_arrive(
+        self, state_manager, sample_documents, filtered_config
+    ):
+        """Test that changes are yielded before the stream is exhausted."""
+        detector = StateChangeDetector(state_manager)
+
+        previous_records = [
+            DocumentStateRecord(
+                url="http://example.com/doc1",
+                source="repo1",
+                source_type="git",
+                document_id="doc1",
+                content_hash="old_hash",
+                updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+            ),
+            DocumentStateRecord(
+                url="http://example.com/deleted_doc",
+                source="repo1",
+                source_type="git",
+                document_id="deleted_doc",
+                content_hash="deleted_hash",
+                updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+            ),
+        ]
+        await _store(state_manager, previous_records)
+
+        pulled = []
+
+        async def stream():
+            for document in sample_documents:
+                pulled.append(document.id)
+                yield document
+
+        changes = []
+        async with detector:
+            async for change_type, document in detector.iter_changes(
+                stream(), filtered_config
+            ):
+                changes.append((change_type, document.url, len(pulled)))
+
+        assert changes == [
+            ("updated", "http://example.com/doc1", 1),
+            ("new", "http://example.com/doc2", 2),
+            ("deleted", "http://example.com/deleted_doc", 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_iter_changes_not_initialized(
+        self, mock_state_manager, filtered_config
+    ):
+        """Test iter_changes raises error when not initialized."""
+        detector = StateChangeDetector(mock_state_manager)
+
+        async def stream():
+            return
+            yield
+
+        with pytest.raises(RuntimeError, match="StateChangeDetector not initialized"):
+            async for _ in detector.iter_changes(stream(), filtered_config):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_skips_unchanged_items_and_their_attachments(
+        self, state_manager, filtered_config
+    ):
+        """Unchanged fingerprints skip the fetch without reporting deletions."""
+        detector = StateChangeDetector(state_manager)
+        updated_at = datetime(2023, 1, 1, tzinfo=UTC)
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url="http://example.com/page",
+                    source="repo1",
+                    source_type="git",
+                    document_id="page_doc",
+                    content_hash="page_hash",
+                    fingerprint="v3",
+                    updated_at=updated_at,
+                ),
+                DocumentStateRecord(
+                    url="http://example.com/page/file.pdf",
+                    source="repo1",
+                    source_type="git",
+                    document_id="attachment_doc",
+                    content_hash="attachment_hash",
+                    parent_document_id="42",
+                    updated_at=updated_at,
+                ),
+                DocumentStateRecord(
+                    url="http://example.com/changed",
+                    source="repo1",
+                    source_type="git",
+                    document_id="changed_doc",
+                    content_hash="changed_hash",
+                    fingerprint="v1",
+                    updated_at=updated_at,
+                ),
+            ],
+        )
+
+        decisions = []
+
+        async def stream():
+            # Connectors consult the filter while listing, before fetching
+            decisions.extend(
+                await detector.should_fetch(
+                    "git",
+                    "repo1",
+                    [
+                        ("http://example.com/page", "v3", "42"),
+                        ("http://example.com/changed", "v2", None),
+                    ],
+                )
+            )
+            return
+            yield
+
+        async with detector:
+            changes = [
+                (change_type, document.url)
+                async for change_type, document in detector.iter_changes(
+                    stream(), filtered_config
+                )
+            ]
+
+        assert decisions == [False, True]
+        assert detector.skipped_count == 1
+        # The changed item was not yielded by the stream, so it is gone
+        assert changes == [("deleted", "http://example.com/changed")]
+
+    @pytest.mark.asyncio
+    async def test_iter_changes_records_new_fingerprints_of_unchanged_documents(
+        self, state_manager, filtered_config
+    ):
+        """Unchanged documents with a new fingerprint get their state refreshed."""
+        detector = StateChangeDetector(state_manager, project_id="p1")
+        document = Document(
+            content="Content 1",
+            url="http://example.com/doc1",
+            content_type="md",
+            source_type="git",
+            source="repo1",
+            title="Document 1",
+            metadata={},
+            updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+            fingerprint="sha-1",
+        )
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url="http://example.com/doc1",
+                    source="repo1",
+                    source_type="git",
+                    document_id=document.id,
+                    content_hash=document.content_hash,
+                    updated_at=datetime(2023, 1, 2, tzinfo=UTC),
+                    project_id="p1",
+                )
+            ],
+        )
+
+        async def stream():
+            yield document
+
+        async with detector:
+            changes = [
+                change
+                async for change in detector.iter_changes(stream(), filtered_config)
+            ]
+
+        assert changes == []
+        (record,) = await state_manager.get_document_state_records_by_url(
+            "git", "repo1", ["http://example.com/doc1"]
+        )
+        assert record.fingerprint == "sha-1"
+        assert record.project_id == "p1"
+
+    @pytest.mark.asyncio
+    async def test_iter_changes_reuses_fetch_filter_lookups(
+        self, state_manager, filtered_config
+    ):
+        """Documents let through by should_fetch are not looked up again."""
+        detector = StateChangeDetector(state_manager)
+        documents = [
+            Document(
+                content=f"Content {i}",
+                url=f"http://example.com/doc{i}",
+                content_type="md",
+                source_type="git",
+                source="repo1",
+                title=f"Document {i}",
+                metadata={},
+                updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+                fingerprint="v2",
+            )
+            for i in range(4)
+        ]
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url="http://example.com/doc0",
+                    source="repo1",
+                    source_type="git",
+                    document_id=documents[0].id,
+                    content_hash="old_hash",
+                    updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+                    fingerprint="v1",
+                )
+            ],
+        )
+        extra = Document(
+            content="Extra",
+            url="http://example.com/extra",
+            content_type="md",
+            source_type="git",
+            source="repo1",
+            title="Extra",
+            metadata={},
+            updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+        )
+
+        async def stream():
+            items = [(document.url, "v2", None) for document in documents]
+            assert await detector.should_fetch("git", "repo1", items) == [True] * 4
+            for document in documents:
+                yield document
+            # Not listed through the fetch filter: looked up on its own
+            yield extra
+
+        lookup = state_manager.get_document_state_records_by_url
+        with patch.object(
+            state_manager, "get_document_state_records_by_url", wraps=lookup
+        ) as mock_lookup:
+            async with detector:
+                changes = [
+                    (change_type, document.url)
+                    async for change_type, document in detector.iter_changes(
+                        stream(), filtered_config
+                    )
+                ]
+
+        assert [call.args[2] for call in mock_lookup.await_args_list] == [
+            [document.url for document in documents],
+            ["http://example.com/extra"],
+        ]
+        assert changes == [
+            ("updated", "http://example.com/doc0"),
+            *[("new", f"http://example.com/doc{i}") for i in range(1, 4)],
+            ("new", "http://example.com/extra"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_looks_up_items_together(
+        self, state_manager, filtered_config
+    ):
+        """A batch of items is decided with a single lookup."""
+        detector = StateChangeDetector(state_manager)
+        items = [(f"http://example.com/doc{i}", "v1", None) for i in range(5)]
+        lookup = state_manager.get_document_state_records_by_url
+        decisions = []
+
+        async def stream():
+            decisions.extend(await detector.should_fetch("git", "repo1", items))
+            return
+            yield
+
+        with patch.object(
+            state_manager, "get_document_state_records_by_url", wraps=lookup
+        ) as mock_lookup:
+            async with detector:
+                async for _ in detector.iter_changes(stream(), filtered_config):
+                    pass
+
+        assert decisions == [True] * 5
+        mock_lookup.assert_awaited_once_with(
+            "git", "repo1", [url for url, _, _ in items]
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_ignores_deleted_states(
+        self, state_manager, filtered_config
+    ):
+        """A document that was deleted is fetched again even with the same fingerprint."""
+        detector = StateChangeDetector(state_manager)
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url="http://example.com/doc",
+                    source="repo1",
+                    source_type="git",
+                    document_id="doc",
+                    content_hash="hash",
+                    fingerprint="v1",
+                    is_deleted=True,
+                    updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+                )
+            ],
+        )
+
+        async def stream():
+            assert await detector.should_fetch(
+                "git", "repo1", [("http://example.com/doc", "v1", None)]
+            ) == [True]
+            return
+            yield
+
+        async with detector:
+            async for _ in detector.iter_changes(stream(), filtered_config):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_sync_tracking(self, state_manager, filtered_config):
+        """Sources listed incrementally keep unlisted documents and are recorded."""
+        from qdrant_loader.config.state import IngestionStatus
+
+        detector = StateChangeDetector(state_manager)
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url="http://example.com/unlisted",
+                    source="repo1",
+                    source_type="git",
+                    document_id="unlisted",
+                    content_hash="hash",
+                    updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+                )
+            ],
+        )
+        last_run = datetime(2024, 1, 1, tzinfo=UTC)
+        await state_manager.update_last_ingestion(
+            "git", "repo1", status=IngestionStatus.SUCCESS, ingested_at=last_run
+        )
+
+        async def stream():
+            assert await detector.last_synced_at("git", "repo1") == last_run
+            detector.keep_unlisted("git", "repo1")
+            detector.mark_synced("git", "repo1")
+            return
+            yield
+
+        async with detector:
+            changes = [
+                change
+                async for change in detector.iter_changes(stream(), filtered_config)
+            ]
+
+        assert changes == []
+        assert list(detector.synced_sources) == [("git", "repo1")]
+        assert detector.synced_sources[("git", "repo1")] > last_run
+        # Outside a change detection scan nothing is tracked
+        assert await detector.last_synced_at("git", "repo1") is None
+
+    @pytest.mark.asyncio
+    async def test_sync_cursor_and_reported_deletions(
+        self, state_manager, filtered_config
+    ):
+        """Sources resume from their cursor; only reported deletions are deleted."""
+        from qdrant_loader.config.state import IngestionStatus
+
+        detector = StateChangeDetector(state_manager)
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url=f"http://example.com/{name}",
+                    source="repo1",
+                    source_type="git",
+                    document_id=name,
+                    content_hash="hash",
+                    updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+                )
+                for name in ("unlisted", "removed")
+            ],
+        )
+        await state_manager.update_last_ingestion(
+            "git", "repo1", status=IngestionStatus.SUCCESS, sync_cursor="abc123"
+        )
+
+        async def stream():
+            assert await detector.last_sync_cursor("git", "repo1") == "abc123"
+            detector.keep_unlisted("git", "repo1")
+            detector.mark_deleted("git", "repo1", "http://example.com/removed/")
+            detector.mark_synced("git", "repo1", cursor="def456")
+            return
+            yield
+
+        async with detector:
+            changes = [
+                change
+                async for change in detector.iter_changes(stream(), filtered_config)
+            ]
+
+        assert [(kind, doc.id) for kind, doc in changes] == [("deleted", "removed")]
+        assert list(detector.synced_sources) == [("git", "repo1")]
+        assert detector.sync_cursors == {("git", "repo1"): "def456"}
+        # Outside a change detection scan nothing is tracked
+        assert await detector.last_sync_cursor("git", "repo1") is None
+
+    @pytest.mark.asyncio
+    async def test_mark_listed(self, state_manager, filtered_config):
+        """Listed items and their attachments are seen; the others are deleted."""
+        detector = StateChangeDetector(state_manager)
+        listed_url = "http://example.com/listed"
+
+        def record(url, document_id, parent_document_id=None):
+            return DocumentStateRecord(
+                url=url,
+                source="repo1",
+                source_type="git",
+                document_id=document_id,
+                content_hash="hash",
+                parent_document_id=parent_document_id,
+                updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+            )
+
+        await _store(
+            state_manager,
+            [
+                record(listed_url, Document.generate_id("git", "repo1", listed_url)),
+                record(
+                    "http://example.com/attachment",
+                    "attachment",
+                    Document.generate_id("git", "repo1", listed_url),
+                ),
+                record("http://example.com/removed", "removed"),
+            ],
+        )
+
+        async def stream():
+            await detector.mark_listed("git", "repo1", listed_url + "/", "42")
+            return
+            yield
+
+        async with detector:
+            changes = [
+                change
+                async for change in detector.iter_changes(stream(), filtered_config)
+            ]
+
+        assert [(kind, doc.url) for kind, doc in changes] == [
+            ("deleted", "http://example.com/removed")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_mark_failed(self, state_manager, filtered_config):
+        """Failed items are kept and the source is not recorded as synced."""
+        detector = StateChangeDetector(state_manager)
+        failed_url = "http://example.com/failed"
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url=url,
+                    source="repo1",
+                    source_type="git",
+                    document_id=document_id,
+                    content_hash="hash",
+                    parent_document_id=parent_document_id,
+                    updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+                )
+                for url, document_id, parent_document_id in (
+                    (failed_url, "failed", None),
+                    ("http://example.com/attachment", "attachment", "42"),
+                    ("http://example.com/removed", "removed", None),
+                )
+            ],
+        )
+
+        async def stream():
+            await detector.last_synced_at("git", "repo1")
+            detector.mark_synced("git", "repo1")
+            await detector.mark_failed("git", "repo1", failed_url, "42")
+            return
+            yield
+
+        async with detector:
+            changes = [
+                change
+                async for change in detector.iter_changes(stream(), filtered_config)
+            ]
+
+        assert [(kind, doc.url) for kind, doc in changes] == [
+            ("deleted", "http://example.com/removed")
+        ]
+        assert detector.synced_sources == {}
+
+    @pytest.mark.asyncio
+    async def test_mark_failed_without_url_keeps_unseen(
+        self, state_manager, filtered_config
+    ):
+        """A failure not tied to an item keeps all unseen documents of the source."""
+        detector = StateChangeDetector(state_manager)
+        await _store(
+            state_manager,
+            [
+                DocumentStateRecord(
+                    url="http://example.com/unseen",
+                    source="repo1",
+                    source_type="git",
+                    document_id="unseen",
+                    content_hash="hash",
+                    updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+                )
+            ],
+        )
+
+        async def stream():
+            await detector.mark_failed("git", "repo1")
+            return
+            yield
+
+        async with detector:
+            changes = [
+                change
+                async for change in detector.iter_changes(stream(), filtered_config)
+            ]
+
+        assert changes == []
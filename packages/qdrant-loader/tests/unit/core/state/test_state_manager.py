@@ -15,6 +15,7 @@ from qdrant_loader.config.state import IngestionStatus, StateManagementConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.state.exceptions import DatabaseError
 from qdrant_loader.core.state.state_manager import StateManager
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError as SQLAlchemyOperationalError
 
 
@@ -113,6 +114,41 @@ async def test_update_last_ingestion(state_manager):
     assert history.document_count == 10
 
 
+@pytest.mark.asyncio
+async def test_update_last_ingestion_advances_successful_ingestion(state_manager):
+    """A later success moves the last successful ingestion time; a failure does not."""
+    first = datetime(2024, 1, 1, tzinfo=UTC)
+    second = datetime(2024, 1, 2, tzinfo=UTC)
+    for ingested_at, status in (
+        (first, IngestionStatus.SUCCESS),
+        (second, IngestionStatus.SUCCESS),
+        (datetime(2024, 1, 3, tzinfo=UTC), IngestionStatus.FAILED),
+    ):
+        await state_manager.update_last_ingestion(
+            "test", "test-source", status=status, ingested_at=ingested_at
+        )
+
+    history = await state_manager.get_last_ingestion("test", "test-source")
+    assert history.last_successful_ingestion == second
+    assert history.status == IngestionStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_update_last_ingestion_sync_cursor(state_manager):
+    """The sync cursor is stored with successes and kept through failures."""
+    for status, sync_cursor in (
+        (IngestionStatus.SUCCESS, "abc123"),
+        (IngestionStatus.SUCCESS, None),
+        (IngestionStatus.FAILED, "def456"),
+    ):
+        await state_manager.update_last_ingestion(
+            "git", "repo", status=status, sync_cursor=sync_cursor
+        )
+
+    history = await state_manager.get_last_ingestion("git", "repo")
+    assert history.sync_cursor == "abc123"
+
+
 @pytest.mark.asyncio
 async def test_update_last_ingestion_error(state_manager):
     """Test error handling when updating last ingestion."""
@@ -561,3 +597,236 @@ class TestTimezoneHandling:
 
         # Should set to None for invalid format
         assert state_record.attachment_created_at is None
+
+
+def _bulk_documents(count, title="Doc"):
+    return [
+        Document(
+            id=f"bulk-doc-{i}",
+            title=f"{title} {i}",
+            content=f"{title} content {i}",
+            content_type="text/plain",
+            source_type="test",
+            source="test-source",
+            url=f"http://test.com/bulk{i}",
+            metadata={"attachment_created_at": "2024-01-01T00:00:00Z"},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("project_id", ["project-a", None])
+async def test_update_document_states_bulk_upsert(state_manager, project_id):
+    """Bulk updates insert new rows and update existing ones in place."""
+    first = _bulk_documents(5)
+    assert (
+        await state_manager.update_document_states(first, project_id, batch_size=2) == 5
+    )
+    created = await state_manager.get_document_state_record(
+        "test", "test-source", "bulk-doc-3", project_id
+    )
+
+    second = _bulk_documents(5, title="Changed")
+    await state_manager.update_document_states(second, project_id, batch_size=2)
+
+    source_config = MagicMock(spec=SourceConfig)
+    source_config.source_type = "test"
+    source_config.source = "test-source"
+    records = await state_manager.get_document_state_records(source_config)
+    assert len(records) == 5
+    by_id = {record.document_id: record for record in records}
+    updated = by_id["bulk-doc-3"]
+    assert updated.title == "Changed 3"
+    assert updated.content_hash == second[3].content_hash
+    assert updated.created_at == created.created_at
+    assert updated.project_id == project_id
+    assert updated.attachment_created_at == datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_update_document_states_restores_deleted_documents(
+    state_manager, sample_document
+):
+    """A deleted document written again is no longer marked deleted."""
+    await state_manager.update_document_states([sample_document], "project-a")
+    await state_manager.mark_document_deleted(
+        "test", "test-source", sample_document.id, "project-a"
+    )
+
+    await state_manager.update_document_states([sample_document], "project-a")
+
+    record = await state_manager.get_document_state_record(
+        "test", "test-source", sample_document.id, "project-a"
+    )
+    assert record.is_deleted is False
+
+
+@pytest.mark.asyncio
+async def test_file_database_uses_wal_journal(tmp_path):
+    """File-backed state databases are tuned for write throughput."""
+    config = MagicMock(spec=StateManagementConfig)
+    config.database_path = str(tmp_path / "state.db")
+    manager = StateManager(config)
+    await manager.initialize()
+    try:
+        async with await manager.get_session() as session:
+            journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await session.execute(text("PRAGMA synchronous"))).scalar()
+    finally:
+        await manager.dispose()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+
+@pytest.mark.asyncio
+async def test_initialize_adds_columns_missing_from_existing_database(
+    tmp_path, sample_document
+):
+    """Databases created before a column was added are upgraded in place."""
+    database_path = tmp_path / "state.db"
+    config = MagicMock(spec=StateManagementConfig)
+    config.database_path = str(database_path)
+    manager = StateManager(config)
+    await manager.initialize()
+    await manager.dispose()
+    with sqlite3.connect(database_path) as connection:
+        connection.execute("ALTER TABLE document_states DROP COLUMN fingerprint")
+
+    manager = StateManager(config)
+    await manager.initialize()
+    try:
+        sample_document.fingerprint = "v7"
+        await manager.update_document_states([sample_document], "project-a")
+        record = await manager.get_document_state_record(
+            "test", "test-source", sample_document.id, "project-a"
+        )
+    finally:
+        await manager.dispose()
+
+    assert record.fingerprint == "v7"
+
+
+@pytest.mark.asyncio
+async def test_initialize_adds_indexes_missing_from_existing_database(tmp_path):
+    """Indexes added to the models are created on existing databases."""
+    database_path = tmp_path / "state.db"
+    config = MagicMock(spec=StateManagementConfig)
+    config.database_path = str(database_path)
+    manager = StateManager(config)
+    await manager.initialize()
+    await manager.dispose()
+    with sqlite3.connect(database_path) as connection:
+        connection.execute("DROP INDEX ix_document_source_url")
+
+    manager = StateManager(config)
+    await manager.initialize()
+    await manager.dispose()
+
+    with sqlite3.connect(database_path) as connection:
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM document_states "
+            "WHERE source_type = 'git' AND source = 'repo' AND url = 'u'"
+        ).fetchall()
+    assert "ix_document_source_url" in str(plan)
+
+
+@pytest.mark.asyncio
+async def test_unseen_document_states_are_paged_by_anti_join(state_manager):
+    """Only live states missing from the seen documents are returned."""
+    source_config = MagicMock(spec=SourceConfig)
+    source_config.source_type = "test"
+    source_config.source = "test-source"
+    documents = [
+        Document(
+            title=f"Doc {i}",
+            content=f"Content {i}",
+            content_type="text/plain",
+            source_type="test",
+            source="test-source",
+            url=f"http://test.com/doc{i}/",
+            metadata={},
+        )
+        for i in range(5)
+    ]
+    await state_manager.update_document_states(documents, "project-a")
+
+    await state_manager.reset_seen_documents()
+    await state_manager.mark_documents_seen(
+        [("test", "test-source", "http://test.com/doc0")]
+    )
+    unseen = [
+        record.url
+        async for record in state_manager.iter_unseen_document_state_records(
+            source_config, batch_size=2
+        )
+    ]
+
+    assert sorted(unseen) == [f"http://test.com/doc{i}/" for i in range(1, 5)]
+
+
+@pytest.mark.asyncio
+async def test_mark_documents_deleted_hides_live_urls(state_manager):
+    """Documents marked as deleted no longer count as live."""
+    documents = [
+        Document(
+            title=f"Doc {i}",
+            content=f"Content {i}",
+            content_type="text/plain",
+            source_type="test",
+            source="test-source",
+            url=f"http://test.com/doc{i}",
+            metadata={},
+        )
+        for i in range(3)
+    ]
+    await state_manager.update_document_states(documents, "project-a")
+
+    await state_manager.mark_documents_deleted(documents[:2])
+    live = await state_manager.get_live_document_ids(
+        "test", "test-source", [document.url for document in documents]
+    )
+
+    assert live == {"http://test.com/doc2": documents[2].id}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_keep_all_writes(state_manager):
+    """State rows and seen marks written next to lookups are all kept."""
+    from qdrant_loader.core.state.models import DocumentStateRecord, seen_documents
+    from sqlalchemy import func, select
+
+    documents = _bulk_documents(3000)
+    seen_keys = [
+        ("test", "other-source", f"http://test.com/seen{i}") for i in range(3000)
+    ]
+    await state_manager.reset_seen_documents()
+    writing = True
+
+    async def write():
+        nonlocal writing
+        try:
+            await state_manager.update_document_states(
+                documents, "project-a", batch_size=100
+            )
+            for start in range(0, len(seen_keys), 100):
+                await state_manager.mark_documents_seen(seen_keys[start : start + 100])
+        finally:
+            writing = False
+
+    async def look_up():
+        # Change detection reads states while processed documents are written
+        while writing:
+            await state_manager.get_document_state_records_by_url(
+                "test", "test-source", ["http://test.com/bulk0"]
+            )
+            await asyncio.sleep(0)
+
+    await asyncio.gather(write(), look_up())
+
+    async with await state_manager.get_session() as session:
+        rows = await session.scalar(select(func.count(DocumentStateRecord.id)))
+        seen = await session.scalar(select(func.count()).select_from(seen_documents))
+    assert rows == 3000
+    assert seen == 3000
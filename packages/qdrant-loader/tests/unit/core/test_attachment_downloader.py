@@ -3,6 +3,8 @@ Unit tests for the attachment downloader service.
 """
 
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -564,6 +566,135 @@ class TestDownloadAndProcessAttachments:
             # Cleanup should only be called once (for the successful download)
             mock_cleanup.assert_called_once_with("/tmp/temp1.pdf")
 
+    @pytest.mark.asyncio
+    async def test_download_and_process_attachments_in_worker_processes(
+        self, mock_session
+    ):
+        """Test that attachments converted in worker processes are processed concurrently."""
+        attachment_downloader = AttachmentDownloader(
+            session=mock_session,
+            file_conversion_config=FileConversionConfig(worker_processes=2),
+            enable_file_conversion=True,
+        )
+        parent_document = Document(
+            title="Parent Document",
+            content="Parent content",
+            content_type="html",
+            source_type="confluence",
+            source="test_space",
+            url="https://example.com/parent",
+            metadata={},
+        )
+        attachments = [
+            AttachmentMetadata(
+                id=f"att_00{i}",
+                filename=f"document{i}.pdf",
+                size=1024,
+                mime_type="application/pdf",
+                download_url=f"https://example.com/document{i}.pdf",
+                parent_document_id="doc_456",
+            )
+            for i in range(2)
+        ]
+        # Only passes if both attachments are processed at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def process_attachment(attachment, temp_file_path, parent_document):
+            barrier.wait()
+            return Document(
+                title=attachment.filename,
+                content="PDF content",
+                content_type="md",
+                source_type="confluence",
+                source="test_space",
+                url=attachment.download_url,
+                metadata={},
+            )
+
+        with (
+            patch.object(
+                attachment_downloader,
+                "download_attachment",
+                side_effect=["/tmp/temp0.pdf", "/tmp/temp1.pdf"],
+            ),
+            patch.object(
+                attachment_downloader,
+                "process_attachment",
+                side_effect=process_attachment,
+            ),
+            patch.object(attachment_downloader, "cleanup_temp_file") as mock_cleanup,
+        ):
+            documents = await attachment_downloader.download_and_process_attachments(
+                attachments, parent_document
+            )
+
+        assert [document.title for document in documents] == [
+            "document0.pdf",
+            "document1.pdf",
+        ]
+        assert mock_cleanup.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_temp_files_kept_until_processing_finishes(self, mock_session):
+        """Test that a failure does not delete files still being processed."""
+        attachment_downloader = AttachmentDownloader(
+            session=mock_session,
+            file_conversion_config=FileConversionConfig(worker_processes=2),
+            enable_file_conversion=True,
+        )
+        parent_document = Document(
+            title="Parent Document",
+            content="Parent content",
+            content_type="html",
+            source_type="confluence",
+            source="test_space",
+            url="https://example.com/parent",
+            metadata={},
+        )
+        attachments = [
+            AttachmentMetadata(
+                id=f"att_00{i}",
+                filename=f"document{i}.pdf",
+                size=1024,
+                mime_type="application/pdf",
+                download_url=f"https://example.com/document{i}.pdf",
+                parent_document_id="doc_456",
+            )
+            for i in range(2)
+        ]
+        events = []
+
+        def process_attachment(attachment, temp_file_path, parent_document):
+            time.sleep(0.1)
+            events.append(("processed", temp_file_path))
+
+        with (
+            patch.object(
+                attachment_downloader,
+                "download_attachment",
+                side_effect=["/tmp/temp0.pdf", RuntimeError("Connection reset")],
+            ),
+            patch.object(
+                attachment_downloader,
+                "process_attachment",
+                side_effect=process_attachment,
+            ),
+            patch.object(
+                attachment_downloader,
+                "cleanup_temp_file",
+                side_effect=lambda path: events.append(("cleaned", path)),
+            ),
+        ):
+            with pytest.raises(RuntimeError):
+                await attachment_downloader.download_and_process_attachments(
+                    attachments, parent_document
+                )
+
+        assert events == [
+            ("processed", "/tmp/temp0.pdf"),
+            ("cleaned", "/tmp/temp0.pdf"),
+        ]
+
     @pytest.mark.asyncio
     async def test_download_and_process_empty_attachments(self, attachment_downloader):
         """Test processing empty attachment list."""
@@ -1,5 +1,6 @@
 """Tests for QdrantManager."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -446,8 +447,77 @@ class TestQdrantManager:
                 mock_qdrant_client.upsert,
                 collection_name="test_collection",
                 points=points,
+                wait=True,
             )
 
+    @pytest.mark.asyncio
+    async def test_upsert_points_async_client(self, mock_settings, mock_qdrant_client):
+        """Test upserting through the native async client without a thread hop."""
+        points = [
+            models.PointStruct(
+                id="test_id", vector=[0.1, 0.2, 0.3], payload={"test": "data"}
+            )
+        ]
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread,
+        ):
+            manager = QdrantManager(mock_settings)
+            manager.async_client = Mock()
+            manager.async_client.upsert = AsyncMock()
+            await manager.upsert_points(points, wait=False)
+
+            manager.async_client.upsert.assert_awaited_once_with(
+                collection_name="test_collection", points=points, wait=False
+            )
+            mock_to_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_updates(self, mock_settings, mock_qdrant_client):
+        """Test that the barrier is an empty delete applied with wait=True."""
+        mock_qdrant_client.delete = Mock()
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            await manager.wait_for_updates(timeout=1.0)
+
+        mock_qdrant_client.delete.assert_called_once_with(
+            collection_name="test_collection",
+            points_selector=models.Filter(must=[models.HasIdCondition(has_id=[])]),
+            wait=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_wait_for_updates_timeout(self, mock_settings, mock_qdrant_client):
+        """Test that a barrier not applied in time raises."""
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            manager.async_client = Mock()
+
+            async def delete(**kwargs):
+                await asyncio.sleep(1)
+
+            manager.async_client.delete = AsyncMock(side_effect=delete)
+            with pytest.raises(TimeoutError):
+                await manager.wait_for_updates(timeout=0.01)
+
     @pytest.mark.asyncio
     async def test_upsert_points_error(self, mock_settings, mock_qdrant_client):
         """Test upsert points error handling."""
@@ -592,6 +662,30 @@ class TestQdrantManager:
             points_selector = call_args[1]["points_selector"]
             assert isinstance(points_selector, models.Filter)
 
+    @pytest.mark.asyncio
+    async def test_delete_points_by_document_id_async_client(
+        self, mock_settings, mock_qdrant_client
+    ):
+        """Test deleting by document ID through the native async client."""
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread,
+        ):
+            manager = QdrantManager(mock_settings)
+            manager.async_client = Mock()
+            manager.async_client.delete = AsyncMock()
+            await manager.delete_points_by_document_id(["doc1"])
+
+            manager.async_client.delete.assert_awaited_once()
+            call_kwargs = manager.async_client.delete.call_args.kwargs
+            assert call_kwargs["collection_name"] == "test_collection"
+            assert isinstance(call_kwargs["points_selector"], models.Filter)
+            mock_to_thread.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_delete_points_by_document_id_error(
         self, mock_settings, mock_qdrant_client
@@ -611,3 +705,122 @@ class TestQdrantManager:
 
             with pytest.raises(Exception, match="Delete failed"):
                 await manager.delete_points_by_document_id(document_ids)
+
+    @pytest.mark.asyncio
+    async def test_delete_stale_chunks(self, mock_settings, mock_qdrant_client):
+        """Stale chunks are deleted with one should-clause per document."""
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread,
+        ):
+            manager = QdrantManager(mock_settings)
+            await manager.delete_stale_chunks(
+                {"doc1": {"c1", "c2"}, "doc2": {"c3"}, "doc3": {"c4"}},
+                batch_size=2,
+            )
+
+        assert mock_to_thread.call_count == 2
+        first_call = mock_to_thread.call_args_list[0]
+        assert first_call[0][0] == mock_qdrant_client.delete
+        points_selector = first_call[1]["points_selector"]
+        assert isinstance(points_selector, models.Filter)
+        assert len(points_selector.should) == 2
+        document_filter = points_selector.should[0]
+        assert document_filter.must[0].key == "document_id"
+        assert document_filter.must[0].match.value == "doc1"
+        assert set(document_filter.must_not[0].has_id) == {"c1", "c2"}
+
+    @pytest.mark.asyncio
+    async def test_iter_point_sources(self, mock_settings, mock_qdrant_client):
+        """The collection is scrolled until the offset is exhausted."""
+        pages = [
+            (
+                [
+                    Mock(
+                        id="p1",
+                        payload={
+                            "source_type": "git",
+                            "source": "repo",
+                            "url": "u1",
+                            "document_id": "d1",
+                        },
+                    )
+                ],
+                "p2",
+            ),
+            ([Mock(id="p2", payload=None)], None),
+        ]
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "asyncio.to_thread", new_callable=AsyncMock, side_effect=pages
+            ) as mock_to_thread,
+        ):
+            manager = QdrantManager(mock_settings)
+            result = [page async for page in manager.iter_point_sources(batch_size=1)]
+
+        assert result == [
+            [("p1", "git", "repo", "u1", "d1")],
+            [("p2", None, None, None, None)],
+        ]
+        assert mock_to_thread.call_args_list[1][1]["offset"] == "p2"
+        assert mock_to_thread.call_args_list[0][1]["with_vectors"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_document_points(self, mock_settings, mock_qdrant_client):
+        """The points of a document are found by source and URL."""
+        pages = [
+            ([Mock(id="p1", payload={"document_id": "d1"})], "p2"),
+            ([Mock(id="p2", payload={"document_id": "c2"})], None),
+        ]
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "asyncio.to_thread", new_callable=AsyncMock, side_effect=pages
+            ) as mock_to_thread,
+        ):
+            manager = QdrantManager(mock_settings)
+            points = await manager.get_document_points("git", "repo", "u1")
+
+        assert points == [("p1", "d1"), ("p2", "c2")]
+        scroll_filter = mock_to_thread.call_args_list[0][1]["scroll_filter"]
+        assert [(c.key, c.match.value) for c in scroll_filter.must] == [
+            ("source_type", "git"),
+            ("source", "repo"),
+            ("url", "u1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_set_document_id(self, mock_settings, mock_qdrant_client):
+        """The document ID of points is set in their payload."""
+        mock_qdrant_client.set_payload = Mock()
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            await manager.set_document_id(["p1", "p2"], "d1")
+
+        mock_qdrant_client.set_payload.assert_called_once_with(
+            collection_name="test_collection",
+            payload={"document_id": "d1"},
+            points=["p1", "p2"],
+        )
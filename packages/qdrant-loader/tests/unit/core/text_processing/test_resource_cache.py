@@ -0,0 +1,90 @@
+"""Tests for the shared NLP resource cache."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from qdrant_loader.core.text_processing.resource_cache import (
+    clear_resource_cache,
+    get_shared_resource,
+    get_thread_local_resource,
+)
+from qdrant_loader.core.text_processing.semantic_analyzer import SemanticAnalyzer
+
+
+class TestResourceCache:
+    """Test cases for the resource cache."""
+
+    def test_shared_resource_built_once(self):
+        """Test that a shared resource is constructed only once."""
+        factory = Mock(side_effect=lambda: object())
+
+        first = get_shared_resource(("test", "a"), factory)
+        second = get_shared_resource(("test", "a"), factory)
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_shared_resource_built_once_across_threads(self):
+        """Test that concurrent callers share a single construction."""
+        barrier = threading.Barrier(8)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        def get():
+            barrier.wait()
+            return get_shared_resource(("test", "threads"), factory)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: get(), range(8)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_shared_resource_factory_error_not_cached(self):
+        """Test that a failing factory is retried on the next call."""
+        factory = Mock(side_effect=[OSError("missing"), "model"])
+
+        try:
+            get_shared_resource(("test", "error"), factory)
+        except OSError:
+            pass
+
+        assert get_shared_resource(("test", "error"), factory) == "model"
+
+    def test_thread_local_resource_per_thread(self):
+        """Test that thread-local resources are not shared between threads."""
+        factory = Mock(side_effect=lambda: object())
+
+        main = get_thread_local_resource(("test", "local"), factory)
+        assert get_thread_local_resource(("test", "local"), factory) is main
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(
+                get_thread_local_resource, ("test", "local"), factory
+            ).result()
+
+        assert other is not main
+        assert factory.call_count == 2
+
+    def test_clear_resource_cache(self):
+        """Test that clearing drops shared and thread-local resources."""
+        shared = get_shared_resource(("test", "clear"), object)
+        local = get_thread_local_resource(("test", "clear"), object)
+
+        clear_resource_cache()
+
+        assert get_shared_resource(("test", "clear"), object) is not shared
+        assert get_thread_local_resource(("test", "clear"), object) is not local
+
+    def test_semantic_analyzers_share_spacy_model(self):
+        """Test that analyzers reuse one spaCy pipeline per model."""
+        with patch("spacy.load", return_value=Mock()) as mock_load:
+            first = SemanticAnalyzer(spacy_model="en_core_web_sm")
+            second = SemanticAnalyzer(spacy_model="en_core_web_sm")
+
+        assert first.nlp is second.nlp
+        mock_load.assert_called_once_with("en_core_web_sm")